@@ -88,6 +88,9 @@ class GraphQLView(
     allow_queries_via_get = True
     request_adapter_class = AiohttpHTTPRequestAdapter
     websocket_adapter_class = AiohttpWebSocketAdapter  # type: ignore
+    cancel_on_disconnect = True
+    # The number of seconds between two checks of the connection of a request
+    disconnect_poll_interval: float = 0.5
 
     def __init__(  # noqa: PLR0917
         self,
@@ -166,6 +169,24 @@ class GraphQLView(
 
         return sub_response
 
+    def set_status_code(self, sub_response: web.Response, status_code: int) -> None:
+        sub_response.set_status(status_code)
+
+    async def wait_for_disconnect(self, request: web.Request) -> bool:
+        # AIOHTTP only cancels handlers when the connection is lost with
+        # `handler_cancellation=True`, there is no event to wait for otherwise
+        while (  # noqa: ASYNC110
+            transport := request.transport
+        ) is not None and not transport.is_closing():
+            await asyncio.sleep(self.disconnect_poll_interval)
+
+        return True
+
+    def create_not_modified_response(self, sub_response: web.Response) -> web.Response:
+        self.set_status_code(sub_response, 304)
+
+        return sub_response
+
     async def create_streaming_response(
         self,
         request: web.Request,
@@ -22,6 +22,7 @@ from strawberry.http.async_base_view import (
     AsyncBaseHTTPView,
     AsyncWebSocketAdapter,
 )
+from strawberry.http.disconnect import wait_for_asgi_disconnect
 from strawberry.http.exceptions import (
     NonJsonMessageReceived,
     NonTextMessageReceived,
@@ -100,6 +101,7 @@ class GraphQL(
     allow_queries_via_get = True
     request_adapter_class = StarletteRequestAdapter
     websocket_adapter_class = ASGIWebSocketAdapter  # type: ignore
+    cancel_on_disconnect = True
 
     def __init__(  # noqa: PLR0917
         self,
@@ -184,6 +186,15 @@ class GraphQL(
 
         return response
 
+    async def wait_for_disconnect(self, request: Request) -> bool:
+        return await wait_for_asgi_disconnect(request.receive)
+
+    def create_not_modified_response(self, sub_response: Response) -> Response:
+        response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        response.headers.raw.extend(sub_response.headers.raw)
+
+        return response
+
     async def create_streaming_response(
         self,
         request: Request | WebSocket,
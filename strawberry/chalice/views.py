@@ -70,6 +70,9 @@ class GraphQLView(
             },
         )
 
+    def create_not_modified_response(self, sub_response: TemporalResponse) -> Response:
+        return Response(body="", status_code=304, headers=sub_response.headers)
+
     def execute_request(self, request: Request) -> Response:
         try:
             return self.run(request=request)
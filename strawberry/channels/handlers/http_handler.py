@@ -21,6 +21,7 @@ from django.core.files import uploadhandler
 from django.http.multipartparser import MultiPartParser
 
 from strawberry.http.async_base_view import AsyncBaseHTTPView
+from strawberry.http.disconnect import wait_for_asgi_disconnect
 from strawberry.http.sync_base_view import SyncBaseHTTPView
 from strawberry.http.temporal_response import TemporalResponse
 from strawberry.http.typevars import Context, RootValue
@@ -30,7 +31,7 @@ from strawberry.types.unset import UNSET
 from .base import ChannelsConsumer
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Mapping, Sequence
 
     from strawberry.http import GraphQLHTTPResponse
     from strawberry.http.ides import GraphQL_IDE
@@ -233,6 +234,15 @@ class BaseGraphQLHTTPConsumer(ChannelsConsumer, AsyncHttpConsumer):
             headers={k.encode(): v.encode() for k, v in sub_response.headers.items()},
         )
 
+    def create_not_modified_response(
+        self, sub_response: TemporalResponse
+    ) -> ChannelsResponse:
+        return ChannelsResponse(
+            content=b"",
+            status=304,
+            headers={k.encode(): v.encode() for k, v in sub_response.headers.items()},
+        )
+
     async def handle(self, body: bytes) -> None:
         request = ChannelsRequest(consumer=self, body=body)
         try:
@@ -301,6 +311,21 @@ class GraphQLHTTPConsumer(
 
     allow_queries_via_get: bool = True
     request_adapter_class = ChannelsRequestAdapter
+    cancel_on_disconnect = True
+
+    async def __call__(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[[], Awaitable[dict[str, Any]]],
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        # The consumer reads the next message once `handle` returns, the
+        # disconnect is read here while the operation executes
+        self._receive = receive
+        await super().__call__(scope, receive, send)
+
+    async def wait_for_disconnect(self, request: ChannelsRequest) -> bool:
+        return await wait_for_asgi_disconnect(self._receive)
 
     async def get_root_value(self, request: ChannelsRequest) -> RootValue | None:
         return None  # pragma: no cover
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import dataclasses
+import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from asyncio import create_task, gather, get_event_loop
 from asyncio.futures import Future
 from dataclasses import dataclass
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
     Generic,
+    Protocol,
     TypeVar,
+    cast,
     overload,
 )
 
 from .exceptions import WrongNumberOfResultsReturned
+from .utils.cache import CacheStats, LRUCache
 
 if TYPE_CHECKING:
     from asyncio.events import AbstractEventLoop
@@ -26,11 +34,14 @@ if TYPE_CHECKING:
         Mapping,
         Sequence,
     )
+    from types import TracebackType
 
 
 T = TypeVar("T")
 K = TypeVar("K")
 
+logger = logging.getLogger("strawberry.dataloader")
+
 
 @dataclass
 class LoaderTask(Generic[K, T]):
@@ -45,6 +56,11 @@ class Batch(Generic[K, T]):
     _dispatch_task: asyncio.Task[None] | None = dataclasses.field(
         default=None, repr=False
     )
+    # The pending call of the scheduler that will dispatch the batch
+    _dispatch_handle: asyncio.Handle | None = dataclasses.field(
+        default=None, repr=False
+    )
+    _scheduled_at: float | None = dataclasses.field(default=None, repr=False)
 
     def add_task(self, key: Any, future: Future) -> None:
         task = LoaderTask[K, T](key, future)
@@ -65,6 +81,155 @@ class Batch(Generic[K, T]):
         return len(self.tasks)
 
 
+class BatchScheduler(ABC):
+    """Decides when the batches of a loader are dispatched.
+
+    `schedule` is called when a batch is created and `on_task_added` every time
+    a key is added to it. Schedulers dispatch the batch by calling
+    `dispatch_now`, usually from a callback registered on the event loop, whose
+    handle is stored in `batch._dispatch_handle` so that it can be cancelled
+    when the batch is dispatched earlier (for example when it is full).
+    """
+
+    @abstractmethod
+    def schedule(self, loader: DataLoader, batch: Batch) -> None:
+        pass
+
+    def on_task_added(self, loader: DataLoader, batch: Batch) -> None:  # noqa: B027
+        pass
+
+
+class NextTickScheduler(BatchScheduler):
+    """Dispatch the batch on the next iteration of the event loop.
+
+    This is the default, it batches the keys loaded synchronously by the
+    callbacks that are ready to run.
+    """
+
+    def schedule(self, loader: DataLoader, batch: Batch) -> None:
+        batch._dispatch_handle = loader.loop.call_soon(dispatch_now, loader, batch)
+
+
+class TimeWindowScheduler(BatchScheduler):
+    """Collect keys for a period of time before dispatching the batch.
+
+    Useful when the loads are spread across several awaits, which would produce
+    many small batches with `NextTickScheduler`.
+    """
+
+    def __init__(self, window: float = 0.002, max_wait: float | None = None) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            window: The number of seconds to wait after the first key before
+                dispatching. When `max_wait` is set, the window restarts every
+                time a key is added instead.
+            max_wait: The maximum number of seconds a batch waits for more keys.
+        """
+        self.window = window
+        self.max_wait = max_wait
+
+    def schedule(self, loader: DataLoader, batch: Batch) -> None:
+        batch._scheduled_at = loader.loop.time()
+        batch._dispatch_handle = loader.loop.call_later(
+            self.window, dispatch_now, loader, batch
+        )
+
+    def on_task_added(self, loader: DataLoader, batch: Batch) -> None:
+        handle = batch._dispatch_handle
+
+        if (
+            self.max_wait is None
+            or batch._scheduled_at is None
+            or not isinstance(handle, asyncio.TimerHandle)
+            or handle.cancelled()
+        ):
+            return
+
+        loop = loader.loop
+        when = min(loop.time() + self.window, batch._scheduled_at + self.max_wait)
+
+        if when > handle.when():
+            handle.cancel()
+            batch._dispatch_handle = loop.call_at(when, dispatch_now, loader, batch)
+
+
+class LevelScheduler(BatchScheduler):
+    """Dispatch the batch once no more keys are being added to it.
+
+    The batch is checked on every iteration of the event loop, and dispatched
+    after an iteration that didn't add any key (or after `max_ticks`
+    iterations). When resolvers load data after some awaits, this waits for all
+    the resolvers of the current level of the query before dispatching.
+    """
+
+    def __init__(self, max_ticks: int = 10) -> None:
+        self.max_ticks = max_ticks
+
+    def schedule(self, loader: DataLoader, batch: Batch) -> None:
+        self._check(loader, batch, -1, 0)
+
+    def _check(self, loader: DataLoader, batch: Batch, size: int, ticks: int) -> None:
+        if len(batch) == size or ticks >= self.max_ticks:
+            dispatch_now(loader, batch)
+            return
+
+        batch._dispatch_handle = loader.loop.call_soon(
+            self._check, loader, batch, len(batch), ticks + 1
+        )
+
+
+class BatchSizeHistogram:
+    """Counts the sizes of the batches passed to the load function.
+
+    A histogram can be shared by the loaders of every request to tune
+    `max_batch_size` and the batch scheduler.
+    """
+
+    DEFAULT_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self, buckets: Sequence[int] = DEFAULT_BUCKETS) -> None:
+        """Initialize the histogram.
+
+        Args:
+            buckets: The upper bounds (inclusive) of the buckets, an extra
+                bucket counts the batches larger than the last bound.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0
+        self._lock = threading.Lock()
+
+    def observe(self, size: int) -> None:
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, size)] += 1
+            self.count += 1
+            self.sum += size
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the cumulative count of each bucket, keyed by its upper bound."""
+        result = {}
+        total = 0
+
+        for bound, count in zip(
+            (*map(str, self.buckets), "+Inf"), self.counts, strict=True
+        ):
+            total += count
+            result[bound] = total
+
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts = [0] * (len(self.buckets) + 1)
+            self.count = self.sum = 0
+
+
 class AbstractCache(ABC, Generic[K, T]):
     @abstractmethod
     def get(self, key: K) -> Future[T] | None:
@@ -103,6 +268,137 @@ class DefaultCache(AbstractCache[K, T]):
         self.cache_map.clear()
 
 
+class BoundedCache(AbstractCache[K, T]):
+    """A cache bounded by size and optionally by the age of its entries.
+
+    Unlike `DefaultCache`, which keeps every result for the lifetime of the
+    loader, least recently used results are evicted once `maxsize` is reached
+    and results can expire after `ttl` seconds. This makes it suitable for
+    long-lived loaders, for example loaders shared across subscription events.
+
+    Failed loads are cached like any other result by default; they can be
+    cached for a shorter time with `error_ttl`, or not at all with
+    `cache_errors=False`.
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = 1000,
+        ttl: float | None = None,
+        *,
+        cache_errors: bool = True,
+        error_ttl: float | None = None,
+        cache_key_fn: Callable[[K], Hashable] | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: The maximum number of results to keep, `None` means
+                unbounded.
+            ttl: The number of seconds a result is kept for, counted from the
+                first load of its key. `None` means results don't expire.
+            cache_errors: Whether to keep failed loads, when `False` the key is
+                loaded again on the next call.
+            error_ttl: The number of seconds a failed load is kept for once it
+                failed, defaults to `ttl`.
+            cache_key_fn: A function returning the cache key of a key.
+            timer: The clock used for expiry, mostly useful for testing.
+        """
+        self.cache_key_fn: Callable[[K], Hashable] = (
+            cache_key_fn if cache_key_fn is not None else lambda x: x
+        )
+        self.cache_errors = cache_errors
+        self.error_ttl = error_ttl
+        self.cache_map: LRUCache[Hashable, Future[T]] = LRUCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit, miss and eviction counters of the cache."""
+        return self.cache_map.stats
+
+    def get(self, key: K) -> Future[T] | None:
+        return self.cache_map.get(self.cache_key_fn(key))
+
+    def set(self, key: K, value: Future[T]) -> None:
+        cache_key = self.cache_key_fn(key)
+        self.cache_map.set(cache_key, value)
+
+        if not self.cache_errors or self.error_ttl is not None:
+            value.add_done_callback(partial(self._on_future_done, cache_key))
+
+    def delete(self, key: K) -> None:
+        self.cache_map.delete(self.cache_key_fn(key))
+
+    def clear(self) -> None:
+        self.cache_map.clear()
+
+    def _on_future_done(self, cache_key: Hashable, future: Future[T]) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+
+        # The key might have been cleared or primed with another value since
+        if self.cache_map.peek(cache_key) is not future:
+            return
+
+        if self.cache_errors:
+            self.cache_map.set(cache_key, future, ttl=self.error_ttl)
+        else:
+            self.cache_map.delete(cache_key)
+
+
+class SharedCache(Protocol):
+    """A store shared by the loaders of every request.
+
+    It sits behind the per-request cache of a `DataLoader`: each dispatched batch
+    is looked up with a single `mget`, only the missing keys are passed to the
+    load function and the loaded values are written back with a single `mset`.
+    Keys are the cache keys of the loader (see `cache_key_fn`), a `None` value
+    means the key is missing.
+    """
+
+    async def mget(self, keys: Sequence[Hashable]) -> Sequence[Any | None]: ...
+
+    async def mset(self, items: Mapping[Hashable, Any]) -> None: ...
+
+    async def delete_many(self, keys: Sequence[Hashable]) -> None: ...
+
+
+class InMemorySharedCache:
+    """An in-process `SharedCache`, bounded by size and optionally by age.
+
+    Create it once (for example at module level) and pass it to the loaders
+    created for each request.
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = 1000,
+        ttl: float | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.cache: LRUCache[Hashable, Any] = LRUCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    async def mget(self, keys: Sequence[Hashable]) -> list[Any | None]:
+        return [self.cache.get(key) for key in keys]
+
+    async def mset(self, items: Mapping[Hashable, Any]) -> None:
+        for key, value in items.items():
+            self.cache.set(key, value)
+
+    async def delete_many(self, keys: Sequence[Hashable]) -> None:
+        for key in keys:
+            self.cache.delete(key)
+
+
 class DataLoader(Generic[K, T]):
     batch: Batch[K, T] | None = None
     cache: bool = False
@@ -118,6 +414,11 @@ class DataLoader(Generic[K, T]):
         loop: AbstractEventLoop | None = None,
         cache_map: AbstractCache[K, T] | None = None,
         cache_key_fn: Callable[[K], Hashable] | None = None,
+        shared_cache: SharedCache | None = None,
+        scheduler: BatchScheduler | None = None,
+        batch_size_histogram: BatchSizeHistogram | None = None,
+        split_batches: bool = False,
+        max_concurrent_batches: int | None = None,
     ) -> None: ...
 
     # fallback if load_fn is untyped and there's no other info for inference
@@ -130,6 +431,11 @@ class DataLoader(Generic[K, T]):
         loop: AbstractEventLoop | None = None,
         cache_map: AbstractCache[K, T] | None = None,
         cache_key_fn: Callable[[K], Hashable] | None = None,
+        shared_cache: SharedCache | None = None,
+        scheduler: BatchScheduler | None = None,
+        batch_size_histogram: BatchSizeHistogram | None = None,
+        split_batches: bool = False,
+        max_concurrent_batches: int | None = None,
     ) -> None: ...
 
     def __init__(  # noqa: PLR0917
@@ -140,9 +446,28 @@ class DataLoader(Generic[K, T]):
         loop: AbstractEventLoop | None = None,
         cache_map: AbstractCache[K, T] | None = None,
         cache_key_fn: Callable[[K], Hashable] | None = None,
+        shared_cache: SharedCache | None = None,
+        scheduler: BatchScheduler | None = None,
+        batch_size_histogram: BatchSizeHistogram | None = None,
+        split_batches: bool = False,
+        max_concurrent_batches: int | None = None,
     ):
         self.load_fn = load_fn
         self.max_batch_size = max_batch_size
+        self.shared_cache = shared_cache
+        self.scheduler = scheduler if scheduler is not None else _DEFAULT_SCHEDULER
+        self.batch_size_histogram = batch_size_histogram
+        # When splitting, keys are collected in a single batch which is passed to
+        # the load function in chunks of `max_batch_size` keys
+        self.split_batches = split_batches
+        self._batch_semaphore = (
+            asyncio.Semaphore(max_concurrent_batches)
+            if max_concurrent_batches is not None
+            else None
+        )
+        self.cache_key_fn: Callable[[K], Hashable] = (
+            cache_key_fn if cache_key_fn is not None else lambda x: x
+        )
 
         self._loop = loop
 
@@ -175,6 +500,13 @@ class DataLoader(Generic[K, T]):
         batch = get_current_batch(self)
         batch.add_task(key, future)
 
+        # Full batches are dispatched right away, without waiting for the
+        # scheduler
+        if should_create_new_batch(self, batch):
+            dispatch_now(self, batch)
+        else:
+            self.scheduler.on_task_added(self, batch)
+
         return future
 
     def load_many(self, keys: Iterable[K]) -> Awaitable[list[T]]:
@@ -193,6 +525,23 @@ class DataLoader(Generic[K, T]):
         if self.cache:
             self.cache_map.clear()
 
+    async def invalidate(self, key: K) -> None:
+        """Remove a key from both the per-request and the shared cache."""
+        await self.invalidate_many([key])
+
+    async def invalidate_many(self, keys: Iterable[K]) -> None:
+        """Remove keys from both the per-request and the shared cache."""
+        keys = list(keys)
+
+        if self.cache:
+            for key in keys:
+                self.cache_map.delete(key)
+
+        if self.shared_cache is not None:
+            await self.shared_cache.delete_many(
+                [self.cache_key_fn(key) for key in keys]
+            )
+
     def prime(self, key: K, value: T, force: bool = False) -> None:
         self.prime_many({key: value}, force)
 
@@ -220,10 +569,180 @@ class DataLoader(Generic[K, T]):
                 ]
 
 
+class SyncFuture(Generic[T]):
+    """The result of a `SyncDataLoader` load.
+
+    Resolvers return it as is: the keys loaded by every field of a level of the
+    query are collected and loaded in a single batch before the level below is
+    executed. Calling `result` loads the pending keys right away.
+    """
+
+    __slots__ = ("_done", "_exception", "_exception_tb", "_loader", "_result")
+
+    def __init__(self, loader: SyncDataLoader | None = None) -> None:
+        self._loader = loader
+        self._done = False
+        self._result: T | None = None
+        self._exception: BaseException | None = None
+        self._exception_tb: TracebackType | None = None
+
+    def done(self) -> bool:
+        return self._done
+
+    def set_result(self, result: T) -> None:
+        self._result = result
+        self._done = True
+
+    def set_exception(self, exception: BaseException) -> None:
+        self._exception = exception
+        self._exception_tb = exception.__traceback__
+        self._done = True
+
+    def result(self) -> T:
+        if not self._done and self._loader is not None:
+            self._loader.dispatch()
+
+        if not self._done:
+            raise RuntimeError("The future was never resolved")
+
+        if self._exception is not None:
+            # Every caller raises the same exception, don't let the traceback
+            # grow with each of them
+            raise self._exception.with_traceback(self._exception_tb)
+
+        return cast("T", self._result)
+
+
+class _GatheringSyncFuture(SyncFuture[list[T]]):
+    __slots__ = ("_futures",)
+
+    def __init__(self, futures: list[SyncFuture[T]]) -> None:
+        super().__init__()
+        self._futures = futures
+
+    def done(self) -> bool:
+        return all(future.done() for future in self._futures)
+
+    def result(self) -> list[T]:
+        return [future.result() for future in self._futures]
+
+
+class SyncDataLoader(Generic[K, T]):
+    """A DataLoader for synchronous execution, e.g. `Schema.execute_sync`.
+
+    `load` and `load_many` return a `SyncFuture`, which resolvers return instead
+    of the value. The keys loaded by a level of the query are passed to
+    `load_fn` in a single call before the next level is executed.
+    """
+
+    def __init__(
+        self,
+        load_fn: Callable[[list[K]], Sequence[T | BaseException]],
+        max_batch_size: int | None = None,
+        cache: bool = True,
+        cache_key_fn: Callable[[K], Hashable] | None = None,
+    ) -> None:
+        self.load_fn = load_fn
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self.cache_key_fn: Callable[[K], Hashable] = (
+            cache_key_fn if cache_key_fn is not None else lambda x: x
+        )
+        self.cache_map: dict[Hashable, SyncFuture[T]] = {}
+        self.batch: list[tuple[K, SyncFuture[T]]] = []
+
+    def load(self, key: K) -> SyncFuture[T]:
+        if self.cache:
+            future = self.cache_map.get(self.cache_key_fn(key))
+
+            if future is not None:
+                return future
+
+        future = SyncFuture(self)
+
+        if self.cache:
+            self.cache_map[self.cache_key_fn(key)] = future
+
+        self.batch.append((key, future))
+
+        return future
+
+    def load_many(self, keys: Iterable[K]) -> SyncFuture[list[T]]:
+        return _GatheringSyncFuture([self.load(key) for key in keys])
+
+    def dispatch(self) -> None:
+        """Load the pending keys."""
+        batch, self.batch = self.batch, []
+        size = self.max_batch_size or len(batch) or 1
+
+        for start in range(0, len(batch), size):
+            chunk = batch[start : start + size]
+
+            try:
+                values = list(self.load_fn([key for key, _ in chunk]))
+
+                if len(values) != len(chunk):
+                    raise WrongNumberOfResultsReturned(  # noqa: TRY301
+                        expected=len(chunk), received=len(values)
+                    )
+            except Exception as e:  # noqa: BLE001
+                values = [e] * len(chunk)
+
+            for (_, future), value in zip(chunk, values, strict=True):
+                if isinstance(value, BaseException):
+                    future.set_exception(value)
+                else:
+                    future.set_result(value)
+
+    def clear(self, key: K) -> None:
+        if self.cache:
+            self.cache_map.pop(self.cache_key_fn(key), None)
+
+    def clear_many(self, keys: Iterable[K]) -> None:
+        for key in keys:
+            self.clear(key)
+
+    def clear_all(self) -> None:
+        self.cache_map.clear()
+
+    def prime(self, key: K, value: T, force: bool = False) -> None:
+        self.prime_many({key: value}, force)
+
+    def prime_many(self, data: Mapping[K, T], force: bool = False) -> None:
+        if self.cache:
+            for key, value in data.items():
+                cache_key = self.cache_key_fn(key)
+
+                if cache_key not in self.cache_map or force:
+                    future: SyncFuture[T] = SyncFuture()
+                    future.set_result(value)
+                    self.cache_map[cache_key] = future
+
+        # Resolve the pending keys with the given values, matching them by
+        # cache key like `load` does
+        if self.batch:
+            values = {self.cache_key_fn(key): value for key, value in data.items()}
+            pending = []
+
+            for key, future in self.batch:
+                cache_key = self.cache_key_fn(key)
+
+                if cache_key in values:
+                    future.set_result(values[cache_key])
+                else:
+                    pending.append((key, future))
+
+            self.batch = pending
+
+
 def should_create_new_batch(loader: DataLoader, batch: Batch) -> bool:
     return bool(
         batch.dispatched
-        or (loader.max_batch_size and len(batch) >= loader.max_batch_size)
+        or (
+            not loader.split_batches
+            and loader.max_batch_size
+            and len(batch) >= loader.max_batch_size
+        )
     )
 
 
@@ -239,13 +758,22 @@ def get_current_batch(loader: DataLoader) -> Batch:
 
 
 def dispatch(loader: DataLoader, batch: Batch) -> None:
-    def _schedule() -> None:
-        batch._dispatch_task = create_task(dispatch_batch(loader, batch))
-        batch._dispatch_task.add_done_callback(
-            lambda _: setattr(batch, "_dispatch_task", None)
-        )
+    loader.scheduler.schedule(loader, batch)
+
+
+def dispatch_now(loader: DataLoader, batch: Batch) -> None:
+    """Start dispatching a batch, unless it is already being dispatched."""
+    if batch._dispatch_handle is not None:
+        batch._dispatch_handle.cancel()
+        batch._dispatch_handle = None
 
-    loader.loop.call_soon(_schedule)
+    if batch.dispatched or batch._dispatch_task is not None:
+        return
+
+    batch._dispatch_task = create_task(dispatch_batch(loader, batch))
+    batch._dispatch_task.add_done_callback(
+        lambda _: setattr(batch, "_dispatch_task", None)
+    )
 
 
 async def dispatch_batch(loader: DataLoader, batch: Batch) -> None:
@@ -266,40 +794,139 @@ async def dispatch_batch(loader: DataLoader, batch: Batch) -> None:
 
     # TODO: check if load_fn return an awaitable and it is a list
 
+    tasks = batch.tasks
+    loaded: dict[Hashable, Any] = {}
+
     try:
-        values = await loader.load_fn(keys)
-        values = list(values)
+        if loader.shared_cache is not None:
+            tasks = await load_from_shared_cache(loader, tasks)
 
-        if len(values) != len(batch):
-            raise WrongNumberOfResultsReturned(  # noqa: TRY301
-                expected=len(batch), received=len(values)
-            )
+            if not tasks:
+                return
 
-        for task, value in zip(batch.tasks, values, strict=True):
-            # Trying to set_result in a cancelled future would raise
-            # asyncio.exceptions.InvalidStateError
-            if task.future.cancelled():
-                continue
+        values = await load_values(loader, [task.key for task in tasks])
 
+        for task, value in zip(tasks, values, strict=True):
             if isinstance(value, BaseException):
-                task.future.set_exception(value)
-            else:
+                # Trying to set_exception in a cancelled future would raise
+                # asyncio.exceptions.InvalidStateError
+                if not task.future.cancelled():
+                    task.future.set_exception(value)
+                continue
+
+            if loader.shared_cache is not None:
+                loaded[loader.cache_key_fn(task.key)] = value
+
+            if not task.future.cancelled():
                 task.future.set_result(value)
     except Exception as e:  # noqa: BLE001
         for task in batch.tasks:
-            if task.future.cancelled():
+            # Futures resolved from the shared cache are already done
+            if task.future.done():
                 continue
             task.future.set_exception(e)
 
+        return
+
+    # Errors while writing back are not the callers' errors, their futures are
+    # already resolved; a shared cache outage is only logged.
+    if loaded:
+        assert loader.shared_cache is not None
+
+        try:
+            await loader.shared_cache.mset(loaded)
+        except Exception:
+            logger.exception("Failed to write loaded values to the shared cache")
+
+
+async def load_values(loader: DataLoader, keys: list[Any]) -> list[Any]:
+    """Call the load function, in chunks of `max_batch_size` keys if enabled.
+
+    Chunks are loaded concurrently. Errors raised while loading a chunk are
+    returned as the value of each of its keys, so that they only fail the
+    futures of that chunk.
+    """
+    size = loader.max_batch_size
+
+    if not loader.split_batches or not size or len(keys) <= size:
+        return await call_load_fn(loader, keys)
+
+    chunks = await gather(
+        *(load_chunk(loader, keys[i : i + size]) for i in range(0, len(keys), size))
+    )
+
+    return [value for chunk in chunks for value in chunk]
+
+
+async def load_chunk(loader: DataLoader, keys: list[Any]) -> list[Any]:
+    try:
+        return await call_load_fn(loader, keys)
+    except Exception as e:  # noqa: BLE001
+        return [e] * len(keys)
+
+
+async def call_load_fn(loader: DataLoader, keys: list[Any]) -> list[Any]:
+    if loader.batch_size_histogram is not None:
+        loader.batch_size_histogram.observe(len(keys))
+
+    if loader._batch_semaphore is None:
+        values = list(await loader.load_fn(keys))
+    else:
+        async with loader._batch_semaphore:
+            values = list(await loader.load_fn(keys))
+
+    if len(values) != len(keys):
+        raise WrongNumberOfResultsReturned(expected=len(keys), received=len(values))
+
+    return values
+
+
+async def load_from_shared_cache(
+    loader: DataLoader, tasks: list[LoaderTask]
+) -> list[LoaderTask]:
+    """Resolve the tasks found in the shared cache and return the others."""
+    assert loader.shared_cache is not None
+
+    values = await loader.shared_cache.mget(
+        [loader.cache_key_fn(task.key) for task in tasks]
+    )
+    missing = []
+
+    for task, value in zip(tasks, values, strict=True):
+        if value is None:
+            missing.append(task)
+        elif not task.future.done():
+            task.future.set_result(value)
+
+    return missing
+
+
+_DEFAULT_SCHEDULER = NextTickScheduler()
+
 
 __all__ = [
     "AbstractCache",
     "Batch",
+    "BatchScheduler",
+    "BatchSizeHistogram",
+    "BoundedCache",
     "DataLoader",
     "DefaultCache",
+    "InMemorySharedCache",
+    "LevelScheduler",
     "LoaderTask",
+    "NextTickScheduler",
+    "SharedCache",
+    "SyncDataLoader",
+    "SyncFuture",
+    "TimeWindowScheduler",
+    "call_load_fn",
     "dispatch",
     "dispatch_batch",
+    "dispatch_now",
     "get_current_batch",
+    "load_chunk",
+    "load_from_shared_cache",
+    "load_values",
     "should_create_new_batch",
 ]
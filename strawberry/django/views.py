@@ -18,6 +18,7 @@ from django.http import (
     HttpRequest,
     HttpResponse,
     HttpResponseNotAllowed,
+    HttpResponseNotModified,
     JsonResponse,
     StreamingHttpResponse,
 )
@@ -116,6 +117,20 @@ class BaseView:
 
         return response
 
+    def create_not_modified_response(
+        self, sub_response: HttpResponse
+    ) -> HttpResponseNotModified:
+        response = HttpResponseNotModified()
+
+        for name, value in sub_response.items():
+            if name.lower() != "content-type":
+                response[name] = value
+
+        for name, value in sub_response.cookies.items():
+            response.cookies[name] = value
+
+        return response
+
     async def create_streaming_response(
         self,
         request: HttpRequest,
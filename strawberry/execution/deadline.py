@@ -0,0 +1,125 @@
+"""Execution deadlines.
+
+An operation executed with a timeout, from `StrawberryConfig.execution_timeout`,
+the `timeout` argument of `Schema.execute` or a request header, gets a
+`Deadline`. Once it expires, resolvers that haven't been called yet fail right
+away and awaited resolvers are cancelled, together with the `DataLoader` loads
+they are waiting for. Their fields resolve to `null` with a
+`DeadlineExceededError`, the rest of the result is returned as usual.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import time
+from typing import TYPE_CHECKING, Any
+
+from strawberry.execution.is_awaitable import optimized_is_awaitable
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+__all__ = ["Deadline", "DeadlineExceededError", "deadline_scope", "get_deadline"]
+
+_current_deadline: contextvars.ContextVar[Deadline | None] = contextvars.ContextVar(
+    "strawberry_deadline", default=None
+)
+
+
+class DeadlineExceededError(Exception):
+    """The deadline of the operation expired before the field was resolved."""
+
+    def __init__(self, message: str = "Deadline exceeded") -> None:
+        super().__init__(message)
+        # Copied to the GraphQL error of the field
+        self.extensions = {"code": "DEADLINE_EXCEEDED"}
+
+
+class Deadline:
+    """The point in time, on the monotonic clock, an operation must finish by."""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, timeout: float) -> None:
+        self.expires_at = time.monotonic() + timeout
+
+    @property
+    def remaining(self) -> float:
+        """The number of seconds left, `0` once expired.
+
+        Resolvers can pass it as the timeout of their own I/O.
+        """
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def call(self, resolver: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """Call a resolver, bounding the time its result is awaited."""
+        if self.expired:
+            raise DeadlineExceededError
+
+        result = resolver(*args, **kwargs)
+
+        if optimized_is_awaitable(result):
+            return self._wait(result)
+
+        return result
+
+    async def _wait(self, awaitable: Awaitable[Any]) -> Any:
+        try:
+            # Cancels the resolver, and the futures it awaits, on expiry
+            return await asyncio.wait_for(awaitable, self.remaining)
+        except asyncio.TimeoutError:
+            # Timeouts raised by the resolver itself are its own errors
+            if not self.expired:
+                raise
+
+            raise DeadlineExceededError from None
+
+
+def get_deadline() -> Deadline | None:
+    """Return the deadline of the operation executing, if it has one."""
+    return _current_deadline.get()
+
+
+@contextlib.contextmanager
+def deadline_scope(timeout: float | None) -> Iterator[None]:
+    """Execute the block with a deadline `timeout` seconds from now.
+
+    An enclosing deadline that expires earlier is kept, e.g. for an operation
+    executed by a resolver.
+    """
+    if timeout is None:
+        yield
+        return
+
+    deadline = Deadline(timeout)
+    current = _current_deadline.get()
+
+    if current is not None and current.expires_at <= deadline.expires_at:
+        deadline = current
+
+    token = _current_deadline.set(deadline)
+
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
+
+
+def with_deadline(resolver: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a field resolver so that it respects the deadline of the operation."""
+
+    def _resolver_with_deadline(_source: Any, info: Any, **kwargs: Any) -> Any:
+        deadline = _current_deadline.get()
+
+        if deadline is None:
+            return resolver(_source, info, **kwargs)
+
+        return deadline.call(resolver, _source, info, **kwargs)
+
+    return _resolver_with_deadline
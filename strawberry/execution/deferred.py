@@ -0,0 +1,178 @@
+"""Completion of values returned as `SyncFuture`s, one level at a time.
+
+During synchronous execution a resolver can't wait for a batch to be loaded,
+so the fields resolving to a `SyncFuture` are completed after the rest of the
+result: the futures of a level are resolved together, which loads the keys
+collected by their `SyncDataLoader`s in a single batch, then their values are
+completed and put in place in the result. The futures returned while
+completing them make up the next level.
+
+During asynchronous execution, futures are completed by coroutines instead,
+like any other awaitable.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from inspect import iscoroutine
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from graphql import GraphQLError, is_list_type, is_non_null_type, located_error
+from graphql.execution.collect_fields import collect_fields
+
+from strawberry.utils import IS_GQL_32
+
+if TYPE_CHECKING:
+    from graphql import FieldNode, GraphQLOutputType, GraphQLResolveInfo
+    from graphql.execution import ExecutionContext as GraphQLExecutionContext
+    from graphql.pyutils import Path
+
+    from strawberry.dataloader import SyncFuture
+
+if IS_GQL_32:
+    from graphql.execution.execute import get_field_def
+
+__all__ = ["PendingValue", "complete_pending_values", "executing_synchronously"]
+
+# Set while `Schema.execute_sync` executes the operation
+executing_synchronously: ContextVar[bool] = ContextVar(
+    "executing_synchronously", default=False
+)
+
+
+class PendingValue(NamedTuple):
+    return_type: GraphQLOutputType
+    field_nodes: list[FieldNode]
+    info: GraphQLResolveInfo
+    path: Path
+    future: SyncFuture
+
+
+# Put in the result in place of pending values until they are completed
+PENDING = object()
+
+
+def complete_pending_values(
+    context: GraphQLExecutionContext,
+    data: dict[str, Any] | None,
+    pending: list[PendingValue],
+) -> dict[str, Any] | None:
+    """Complete the pending values of `context`, level by level.
+
+    Values completed for a level can add more pending values to `pending`,
+    which are completed as the next level.
+    """
+    while pending and data is not None:
+        level = pending[:]
+        pending.clear()
+
+        for value in level:
+            keys = value.path.as_list()
+
+            # The value was nulled by an error in one of its parents
+            if data is None or _get_container(data, keys) is None:
+                continue
+
+            try:
+                completed = context.complete_value(
+                    value.return_type,
+                    value.field_nodes,
+                    value.info,
+                    value.path,
+                    value.future.result(),
+                )
+
+                if context.is_awaitable(completed):
+                    if iscoroutine(completed):
+                        completed.close()
+
+                    raise GraphQLError(  # noqa: TRY301
+                        "GraphQL execution failed to complete synchronously."
+                    )
+            except Exception as raw_error:  # noqa: BLE001
+                error = located_error(raw_error, value.field_nodes, keys)
+                data = _null_nearest_nullable_parent(context, data, value, error)
+                continue
+
+            _get_container(data, keys)[keys[-1]] = completed
+
+    return data
+
+
+def _get_container(data: Any, keys: list[str | int]) -> Any:
+    """Return the list or dict holding the value at `keys`, if still in the result."""
+    for key in keys[:-1]:
+        data = data[key]
+
+        if data is None:
+            return None
+
+    return data
+
+
+def _null_nearest_nullable_parent(
+    context: GraphQLExecutionContext,
+    data: dict[str, Any],
+    value: PendingValue,
+    error: GraphQLError,
+) -> dict[str, Any] | None:
+    """Propagate an error like graphql-core does for non null fields."""
+    paths = []
+    path: Path | None = value.path
+
+    while path is not None:
+        paths.append(path)
+        path = path.prev
+
+    paths.reverse()
+    types = _get_path_types(context, paths)
+
+    for index in reversed(range(len(paths))):
+        if not is_non_null_type(types[index]):
+            context.collected_errors.add(error, paths[index])
+            keys = paths[index].as_list()
+            _get_container(data, keys)[keys[-1]] = None
+            return data
+
+    context.collected_errors.add(error, None)
+    return None
+
+
+def _get_path_types(
+    context: GraphQLExecutionContext, paths: list[Path]
+) -> list[GraphQLOutputType]:
+    """Return the type of each position in the result leading to a value.
+
+    Only used when errors propagate, so field types are looked up from the
+    operation instead of being recorded while executing.
+    """
+    schema = context.schema
+    types: list[GraphQLOutputType] = []
+    field_nodes: list[FieldNode] | None = None
+    type_: Any = None
+
+    for path in paths:
+        if isinstance(path.key, int):
+            type_ = type_.of_type if is_non_null_type(type_) else type_
+            assert is_list_type(type_)
+            type_ = type_.of_type
+        else:
+            parent_type: Any = schema.get_type(path.typename or "")
+
+            fields = (
+                collect_fields(
+                    schema,
+                    context.fragments,
+                    context.variable_values,
+                    parent_type,
+                    context.operation.selection_set,
+                )
+                if field_nodes is None
+                else context.collect_subfields(parent_type, field_nodes)
+            )
+            field_nodes = fields[path.key]
+            type_ = get_field_def(schema, parent_type, field_nodes[0]).type
+
+        types.append(type_)
+
+    return types
@@ -0,0 +1,145 @@
+"""Resolver middleware that only wraps the fields extensions ask for.
+
+graphql-core's `MiddlewareManager` wraps the resolver of every field with every
+middleware. Extensions can narrow the fields their `resolve` method is called
+for with a `FieldFilter`; the resolvers matching each filter are computed once
+per schema by `ResolverIndex`, and `StrawberryMiddlewareManager` only chains the
+extensions whose filter matches the resolver being wrapped.
+"""
+
+from __future__ import annotations
+
+from functools import partial, reduce
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from graphql import GraphQLObjectType
+from graphql.execution.middleware import MiddlewareManager
+from graphql.type.introspection import (
+    SchemaMetaFieldDef,
+    TypeMetaFieldDef,
+    TypeNameMetaFieldDef,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from graphql import GraphQLField, GraphQLSchema
+
+    from strawberry.extensions import FieldFilter, SchemaExtension
+
+__all__ = ["ResolverIndex", "StrawberryMiddlewareManager"]
+
+
+class _IndexedField(NamedTuple):
+    type_name: str
+    field_name: str
+    field: GraphQLField
+
+
+class ResolverIndex:
+    """Map the resolvers of a schema to their fields, and filters to resolvers."""
+
+    def __init__(self, schema: GraphQLSchema) -> None:
+        self.schema = schema
+        self._fields: dict[Callable[..., Any], list[_IndexedField]] | None = None
+        self._matches: dict[FieldFilter, frozenset[Callable[..., Any]]] = {}
+
+    @property
+    def fields(self) -> dict[Callable[..., Any], list[_IndexedField]]:
+        if self._fields is None:
+            fields: dict[Callable[..., Any], list[_IndexedField]] = {}
+
+            for type_ in self.schema.type_map.values():
+                if not isinstance(type_, GraphQLObjectType):
+                    continue
+
+                for name, field in type_.fields.items():
+                    if field.resolve is not None:
+                        fields.setdefault(field.resolve, []).append(
+                            _IndexedField(type_.name, name, field)
+                        )
+
+            for name, field in (
+                ("__schema", SchemaMetaFieldDef),
+                ("__type", TypeMetaFieldDef),
+                ("__typename", TypeNameMetaFieldDef),
+            ):
+                if field.resolve is not None:
+                    fields.setdefault(field.resolve, []).append(
+                        _IndexedField("", name, field)
+                    )
+
+            self._fields = fields
+
+        return self._fields
+
+    def matches(self, field_filter: FieldFilter) -> frozenset[Callable[..., Any]]:
+        """Return the resolvers of the fields matching `field_filter`."""
+        matches = self._matches.get(field_filter)
+
+        if matches is None:
+            # A resolver shared by several fields matches if any of them does
+            matches = self._matches[field_filter] = frozenset(
+                resolver
+                for resolver, fields in self.fields.items()
+                if any(
+                    field_filter.matches(field.type_name, field.field_name, field.field)
+                    for field in fields
+                )
+            )
+
+        return matches
+
+    def is_known(self, resolver: Callable[..., Any]) -> bool:
+        return resolver in self.fields
+
+
+class StrawberryMiddlewareManager(MiddlewareManager):
+    """A `MiddlewareManager` honouring the `resolve_filter` of extensions.
+
+    Resolvers the index doesn't know about, like the default field resolver,
+    are wrapped with every extension.
+    """
+
+    def __init__(self, *extensions: SchemaExtension, index: ResolverIndex) -> None:
+        super().__init__(*extensions)
+
+        self.index = index
+        self._filtered = [
+            (extension.resolve, extension.resolve_filter) for extension in extensions
+        ]
+        self._wrapped: dict[Callable[..., Any], Callable[..., Any]] = {}
+
+    def _applies(
+        self, resolver: Callable[..., Any], field_filter: FieldFilter | None
+    ) -> bool:
+        if field_filter is None:
+            return True
+
+        # Resolvers wrapped after the index was built are looked up through
+        # ``__wrapped__``
+        while not self.index.is_known(resolver):
+            resolver = getattr(resolver, "__wrapped__", None)  # type: ignore[assignment]
+
+            if resolver is None:
+                return True
+
+        return resolver in self.index.matches(field_filter)
+
+    def get_field_resolver(
+        self, field_resolver: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        wrapped = self._wrapped.get(field_resolver)
+
+        if wrapped is None:
+            wrapped = self._wrapped[field_resolver] = reduce(
+                lambda chained_fn, next_fn: partial(next_fn, chained_fn),
+                (
+                    resolve
+                    for resolve, field_filter in self._filtered
+                    if self._applies(field_resolver, field_filter)
+                ),
+                field_resolver,
+            )
+
+        return wrapped
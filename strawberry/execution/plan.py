@@ -0,0 +1,273 @@
+"""Reusable execution plans for validated GraphQL documents.
+
+graphql-core re-resolves the operation, the fragments and every selection set
+each time a document is executed. An execution plan does that work once per
+document and operation name and shares the collected fields between requests,
+so hot queries skip field collection entirely.
+
+Collected fields only depend on the document and on the values of variables
+used in ``@skip``/``@include`` conditions, so a plan keeps one set of collected
+fields for each combination of those values.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any, cast
+
+from graphql import (
+    DocumentNode,
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    GraphQLError,
+    GraphQLIncludeDirective,
+    GraphQLSkipDirective,
+    OperationDefinitionNode,
+    OperationType,
+    VariableNode,
+    Visitor,
+    visit,
+)
+from graphql.execution.collect_fields import collect_fields
+from graphql.execution.values import get_variable_values
+
+from strawberry.utils import IS_GQL_32
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from graphql import GraphQLObjectType, GraphQLSchema
+    from graphql.execution import ExecutionContext as GraphQLExecutionContext
+    from graphql.execution.middleware import MiddlewareManager
+    from graphql.pyutils import AwaitableOrValue
+
+if IS_GQL_32:
+    from graphql.execution.execute import (
+        CollectedErrors,
+        default_field_resolver,
+        default_type_resolver,
+    )
+
+__all__ = ["ExecutionPlan", "ExecutionPlanCache"]
+
+_CONDITIONAL_DIRECTIVES = frozenset(
+    {GraphQLSkipDirective.name, GraphQLIncludeDirective.name}
+)
+
+# Each combination of @skip/@include variable values needs its own collected
+# fields; beyond this many we stop storing new combinations.
+MAX_PLAN_VARIANTS = 8
+
+
+class _ConditionalVariablesCollector(Visitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.names: set[str] = set()
+
+    def enter_directive(self, node: Any, *_args: Any) -> None:
+        if node.name.value not in _CONDITIONAL_DIRECTIVES:
+            return
+
+        for argument in node.arguments:
+            if isinstance(argument.value, VariableNode):
+                self.names.add(argument.value.name.value)
+
+
+class _PlanVariant:
+    __slots__ = ("root_fields", "subfields")
+
+    def __init__(self, root_fields: dict[str, list[FieldNode]]) -> None:
+        self.root_fields = root_fields
+        # Shared with every execution context that runs this variant, this is
+        # graphql-core's own per-request `_subfields_cache`.
+        self.subfields: dict[tuple, dict[str, list[FieldNode]]] = {}
+
+
+class ExecutionPlan:
+    """The precompiled parts of a single operation of a document."""
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        operation: OperationDefinitionNode,
+        fragments: dict[str, FragmentDefinitionNode],
+        root_type: GraphQLObjectType,
+        conditional_variables: tuple[str, ...],
+    ) -> None:
+        self.schema = schema
+        self.operation = operation
+        self.fragments = fragments
+        self.root_type = root_type
+        self.conditional_variables = conditional_variables
+        self.is_mutation = operation.operation == OperationType.MUTATION
+        self._variants: dict[tuple, _PlanVariant] = {}
+
+    @classmethod
+    def compile(
+        cls,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        operation_name: str | None,
+    ) -> ExecutionPlan | None:
+        """Compile a plan for the given operation of a document.
+
+        Returns `None` when the operation can't be selected (missing or
+        ambiguous), so that graphql-core reports the error as usual.
+        """
+        operation: OperationDefinitionNode | None = None
+        fragments: dict[str, FragmentDefinitionNode] = {}
+
+        for definition in document.definitions:
+            if isinstance(definition, OperationDefinitionNode):
+                if operation_name is None:
+                    if operation is not None:
+                        return None
+                    operation = definition
+                elif definition.name and definition.name.value == operation_name:
+                    operation = definition
+            elif isinstance(definition, FragmentDefinitionNode):
+                fragments[definition.name.value] = definition
+
+        if operation is None:
+            return None
+
+        root_type = schema.get_root_type(operation.operation)
+        if root_type is None:
+            return None
+
+        collector = _ConditionalVariablesCollector()
+        visit(document, collector)
+
+        return cls(
+            schema,
+            operation,
+            fragments,
+            root_type,
+            tuple(sorted(collector.names)),
+        )
+
+    def _get_variant(self, variable_values: dict[str, Any]) -> _PlanVariant:
+        key = tuple(variable_values.get(name) for name in self.conditional_variables)
+
+        if (variant := self._variants.get(key)) is not None:
+            return variant
+
+        variant = _PlanVariant(
+            collect_fields(
+                self.schema,
+                self.fragments,
+                variable_values,
+                self.root_type,
+                self.operation.selection_set,
+            )
+        )
+
+        if len(self._variants) < MAX_PLAN_VARIANTS:
+            self._variants[key] = variant
+
+        return variant
+
+    def execute(
+        self,
+        *,
+        root_value: Any,
+        context_value: Any,
+        variable_values: dict[str, Any] | None,
+        middleware: MiddlewareManager | None,
+        is_awaitable: Callable[[Any], bool],
+        execution_context_class: type[GraphQLExecutionContext],
+    ) -> AwaitableOrValue[ExecutionResult]:
+        """Execute the plan, this mirrors `graphql.execute`."""
+        coerced_variable_values = get_variable_values(
+            self.schema,
+            self.operation.variable_definitions or (),
+            variable_values or {},
+            max_errors=50,
+        )
+
+        if isinstance(coerced_variable_values, list):
+            return ExecutionResult(data=None, errors=coerced_variable_values)
+
+        variant = self._get_variant(coerced_variable_values)
+
+        exe_context = execution_context_class(
+            self.schema,
+            self.fragments,
+            root_value,
+            context_value,
+            self.operation,
+            coerced_variable_values,
+            default_field_resolver,
+            default_type_resolver,
+            default_field_resolver,
+            CollectedErrors(),
+            middleware,
+            is_awaitable,
+        )
+        exe_context._subfields_cache = variant.subfields
+
+        collected_errors = exe_context.collected_errors
+        build_response = exe_context.build_response
+        execute_fields = (
+            exe_context.execute_fields_serially
+            if self.is_mutation
+            else exe_context.execute_fields
+        )
+
+        try:
+            result = execute_fields(
+                self.root_type, root_value, None, variant.root_fields
+            )
+
+            if exe_context.is_awaitable(result):
+
+                async def await_result() -> ExecutionResult:
+                    try:
+                        data = await cast("Awaitable[dict[str, Any]]", result)
+                        return build_response(data, collected_errors.errors)
+                    except GraphQLError as error:
+                        collected_errors.add(error, None)
+                        return build_response(None, collected_errors.errors)
+
+                return await_result()
+        except GraphQLError as error:
+            collected_errors.add(error, None)
+            return build_response(None, collected_errors.errors)
+
+        return build_response(cast("dict[str, Any]", result), collected_errors.errors)
+
+
+class ExecutionPlanCache:
+    """Execution plans of a schema, keyed by document and operation name.
+
+    Plans live as long as their document does, so documents kept alive by the
+    `ParserCache` extension (or by a persisted query store) keep their plans
+    too. Equal documents parsed separately share the same plans.
+    """
+
+    def __init__(self, schema: GraphQLSchema) -> None:
+        self.schema = schema
+        self._plans: weakref.WeakKeyDictionary[
+            DocumentNode, dict[str | None, ExecutionPlan | None]
+        ] = weakref.WeakKeyDictionary()
+
+    def get(
+        self, document: DocumentNode, operation_name: str | None
+    ) -> ExecutionPlan | None:
+        plans = self._plans.get(document)
+
+        if plans is None:
+            plans = self._plans.setdefault(document, {})
+
+        if operation_name in plans:
+            return plans[operation_name]
+
+        plan = plans[operation_name] = ExecutionPlan.compile(
+            self.schema, document, operation_name
+        )
+
+        return plan
+
+    def clear(self) -> None:
+        self._plans.clear()
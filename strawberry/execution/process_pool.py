@@ -0,0 +1,236 @@
+"""Run CPU-bound resolvers in worker processes.
+
+Resolvers doing pure CPU work hold the GIL, so running them in a thread still
+starves the event loop. Resolvers whose field uses ``executor="process"`` are
+called in a `ResolverProcessPool` instead: their arguments are pickled and sent
+to a worker process, and their result is pickled and sent back.
+
+Only the resolver function runs in the worker, field extensions and
+permissions run in the main process. Under async execution the whole resolver
+runs in the resolver thread pool, which waits for the worker process.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Any
+
+from strawberry.types.base import (
+    StrawberryContainer,
+    StrawberryObjectDefinition,
+    has_object_definition,
+)
+from strawberry.types.enum import has_enum_definition
+from strawberry.types.union import StrawberryUnion
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Future
+    from multiprocessing.context import BaseContext
+
+    from strawberry.types.field import StrawberryField
+
+__all__ = ["ResolverProcessPool", "ResolverResultTooLargeError"]
+
+
+class ResolverResultTooLargeError(Exception):
+    """The pickled result of a resolver is larger than `max_result_size`."""
+
+    def __init__(self, size: int, max_result_size: int) -> None:
+        self.size = size
+        self.max_result_size = max_result_size
+
+        super().__init__(size, max_result_size)
+
+    def __str__(self) -> str:
+        return (
+            f"The result of the resolver is {self.size} bytes, the maximum size"
+            f" is {self.max_result_size} bytes."
+        )
+
+
+def _call_resolver(
+    func: Callable[..., Any],
+    args: list[Any],
+    kwargs: dict[str, Any],
+    max_result_size: int | None,
+) -> bytes:
+    # Runs in the worker process, the result is pickled here so its size can
+    # be checked before it is sent back
+    result = pickle.dumps(func(*args, **kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+
+    if max_result_size is not None and len(result) > max_result_size:
+        raise ResolverResultTooLargeError(len(result), max_result_size)
+
+    return result
+
+
+def _warm_up_worker(modules: list[str]) -> int:
+    for module in modules:
+        importlib.import_module(module)
+
+    return os.getpid()
+
+
+class ResolverProcessPool:
+    """A process pool for CPU-bound synchronous resolvers.
+
+    ```python
+    import strawberry
+    from strawberry.execution.process_pool import ResolverProcessPool
+    from strawberry.schema.config import StrawberryConfig
+
+    process_pool = ResolverProcessPool(max_workers=4, max_result_size=1_000_000)
+
+    schema = strawberry.Schema(
+        Query, config=StrawberryConfig(resolver_process_pool=process_pool)
+    )
+    process_pool.warm_up()
+    ```
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        max_result_size: int | None = None,
+        initializer: Callable[..., object] | None = None,
+        initargs: tuple[Any, ...] = (),
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Initialize the ResolverProcessPool.
+
+        Args:
+            max_workers: The number of worker processes, defaults to the number
+                of CPUs.
+            max_result_size: The maximum size in bytes of the pickled result of
+                a resolver, larger results raise `ResolverResultTooLargeError`.
+            initializer: Called in each worker process when it starts.
+            initargs: The arguments passed to `initializer`.
+            mp_context: The multiprocessing context used to start the workers.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_result_size = max_result_size
+        self.initializer = initializer
+        self.initargs = initargs
+        self.mp_context = mp_context
+        # The modules of the resolvers, imported by `warm_up`
+        self.modules: set[str] = set()
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if (executor := self._executor) is None:
+            with self._executor_lock:
+                if (executor := self._executor) is None:
+                    executor = self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=self.mp_context,
+                        initializer=self.initializer,
+                        initargs=self.initargs,
+                    )
+
+        return executor
+
+    def warm_up(self) -> None:
+        """Start the worker processes and import the modules of the resolvers.
+
+        Otherwise workers are started, and import those modules, the first time
+        they are needed.
+        """
+        executor = self._get_executor()
+        modules = sorted(self.modules)
+
+        wait(
+            [executor.submit(_warm_up_worker, modules) for _ in range(self.max_workers)]
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes, they are started again if the pool is used."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def submit(
+        self, func: Callable[..., Any], args: list[Any], kwargs: dict[str, Any]
+    ) -> Future[bytes]:
+        return self._get_executor().submit(
+            _call_resolver, func, args, kwargs, self.max_result_size
+        )
+
+    def call(
+        self, func: Callable[..., Any], args: list[Any], kwargs: dict[str, Any]
+    ) -> Any:
+        """Call `func` in a worker process and wait for its result."""
+        return pickle.loads(self.submit(func, args, kwargs).result())  # noqa: S301
+
+    def bind(
+        self, field: StrawberryField
+    ) -> Callable[[list[Any], dict[str, Any]], Any]:
+        """Return a function calling the resolver of `field` in a worker process.
+
+        Raises `TypeError` when the resolver, its arguments or its result can't
+        be sent to a worker process.
+        """
+        resolver = field.base_resolver
+        name = field.python_name
+
+        if resolver is None:
+            raise TypeError(f"Field `{name}` needs a resolver to run in a process")
+
+        if resolver.is_async:
+            raise TypeError(f"Async resolver of `{name}` can't run in a process")
+
+        if resolver.info_parameter is not None:
+            raise TypeError(
+                f"Resolver of `{name}` can't use `Info` to run in a process"
+            )
+
+        func = resolver.wrapped_func
+
+        try:
+            pickle.dumps(func)
+        except (pickle.PicklingError, AttributeError, TypeError) as exc:
+            raise TypeError(
+                f"Resolver of `{name}` must be defined at the top level of a module"
+                " to run in a process"
+            ) from exc
+
+        for type_ in (
+            field.type,
+            *(argument.type for argument in field.arguments),
+        ):
+            for cls in _iter_classes(type_):
+                if "<locals>" in cls.__qualname__:
+                    raise TypeError(
+                        f"`{cls.__qualname__}` must be defined at the top level of"
+                        f" a module for `{name}` to run in a process"
+                    )
+
+        self.modules.add(func.__module__)
+
+        def call_in_process(args: list[Any], kwargs: dict[str, Any]) -> Any:
+            return self.call(func, args, kwargs)
+
+        return call_in_process
+
+
+def _iter_classes(type_: Any) -> Iterator[type]:
+    """Yield the classes whose values are pickled for a Strawberry type."""
+    if isinstance(type_, StrawberryContainer):
+        yield from _iter_classes(type_.of_type)
+    elif isinstance(type_, StrawberryUnion):
+        for member in type_.types:
+            yield from _iter_classes(member)
+    elif isinstance(type_, StrawberryObjectDefinition):
+        yield type_.origin
+    elif isinstance(type_, type) and (
+        has_object_definition(type_) or has_enum_definition(type_)
+    ):
+        yield type_
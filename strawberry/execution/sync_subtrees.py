@@ -0,0 +1,283 @@
+"""Execute the selection sets that can only produce synchronous values.
+
+graphql-core checks every resolved and completed value with ``is_awaitable``
+and builds a list of pending awaitables for every selection set and list it
+completes. Most of the fields of a schema are basic fields: they only read an
+attribute of their parent and are never async, so once a selection set only
+contains basic fields whose values are leaves, or objects whose selection sets
+are themselves synchronous, nothing under it can be awaitable.
+
+`get_sync_selection` finds those selection sets once per execution and
+`execute_sync_fields` completes them without any awaitable check, without
+building gather lists and without creating a resolve info for each field.
+Fields with a custom resolver, fields wrapped by an extension's `resolve`
+method and abstract types always go through the regular execution.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from graphql import (
+    GraphQLError,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    get_named_type,
+    is_leaf_type,
+    is_object_type,
+    located_error,
+)
+from graphql.pyutils import Path, Undefined, is_iterable
+from graphql.type.introspection import TypeNameMetaFieldDef
+
+from strawberry.resolvers import is_basic_resolver
+from strawberry.schema.type_resolution import is_class_based_is_type_of
+from strawberry.utils import IS_GQL_32
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from graphql import FieldNode, GraphQLOutputType
+    from graphql.execution import ExecutionContext as GraphQLExecutionContext
+
+if IS_GQL_32:
+    from graphql.execution.execute import invalid_return_type_error
+
+__all__ = [
+    "SyncField",
+    "SyncSelection",
+    "SyncSelectionCache",
+    "execute_sync_field",
+    "execute_sync_fields",
+    "get_sync_selection",
+]
+
+
+class SyncField(NamedTuple):
+    field_nodes: list[FieldNode]
+    parent_type_name: str
+    field_name: str
+    return_type: GraphQLOutputType
+    # ``None`` for ``__typename``, which is resolved from the parent type
+    resolve: Callable[..., Any] | None
+    # Set when the named return type is an object type
+    selection: SyncSelection | None
+    is_type_of: Callable[[Any, Any], Any] | None
+
+
+class SyncSelection(NamedTuple):
+    # The fields in response order, ``SyncField`` when the field is
+    # synchronous, its field nodes when it needs the regular execution
+    fields: list[tuple[str, list[FieldNode], SyncField | None]]
+    is_sync: bool
+    has_sync_fields: bool
+
+
+SyncSelectionCache = dict[int, tuple[dict[str, list["FieldNode"]], SyncSelection]]
+
+
+def get_sync_selection(
+    context: GraphQLExecutionContext,
+    parent_type: GraphQLObjectType,
+    fields: dict[str, list[FieldNode]],
+    cache: SyncSelectionCache,
+) -> SyncSelection:
+    """Return which of the collected `fields` of `parent_type` are synchronous.
+
+    `cache` maps the identity of collected fields, which are themselves cached
+    by `collect_subfields`, to their selection for one execution.
+    """
+    if (cached := cache.get(id(fields))) is not None:
+        return cached[1]
+
+    planned = [
+        (
+            response_name,
+            field_nodes,
+            _get_sync_field(context, parent_type, field_nodes, cache),
+        )
+        for response_name, field_nodes in fields.items()
+    ]
+    selection = SyncSelection(
+        planned,
+        is_sync=all(field is not None for _, _, field in planned),
+        has_sync_fields=any(field is not None for _, _, field in planned),
+    )
+
+    # Keep the fields alive so their id can't be reused during the execution
+    cache[id(fields)] = (fields, selection)
+
+    return selection
+
+
+def _get_sync_field(
+    context: GraphQLExecutionContext,
+    parent_type: GraphQLObjectType,
+    field_nodes: list[FieldNode],
+    cache: SyncSelectionCache,
+) -> SyncField | None:
+    field_name = field_nodes[0].name.value
+
+    if field_name == "__typename":
+        field_def = TypeNameMetaFieldDef
+        resolve = None
+    else:
+        field_def = parent_type.fields.get(field_name)
+
+        if field_def is None or not is_basic_resolver(field_def.resolve):
+            return None
+
+        resolve = field_def.resolve
+
+    middleware_manager = context.middleware_manager
+
+    if (
+        middleware_manager is not None
+        and middleware_manager.get_field_resolver(field_def.resolve)
+        is not field_def.resolve
+    ):
+        return None
+
+    named_type = get_named_type(field_def.type)
+    selection = None
+    is_type_of = None
+
+    if is_object_type(named_type):
+        assert isinstance(named_type, GraphQLObjectType)
+
+        # Other `is_type_of` methods may use the resolve info, or be async
+        if not is_class_based_is_type_of(named_type.is_type_of):
+            return None
+
+        is_type_of = named_type.is_type_of
+
+        selection = get_sync_selection(
+            context,
+            named_type,
+            context.collect_subfields(named_type, field_nodes),
+            cache,
+        )
+
+        if not selection.is_sync:
+            return None
+    elif not is_leaf_type(named_type):
+        return None
+
+    return SyncField(
+        field_nodes,
+        parent_type.name,
+        field_name,
+        field_def.type,
+        resolve,
+        selection,
+        is_type_of,
+    )
+
+
+def execute_sync_fields(
+    context: GraphQLExecutionContext,
+    selection: SyncSelection,
+    source: Any,
+    path: Path | None,
+) -> dict[str, Any]:
+    """Execute a synchronous selection, see `get_sync_selection`."""
+    return {
+        response_name: execute_sync_field(
+            context, field, source, Path(path, response_name, field.parent_type_name)
+        )
+        for response_name, _, field in selection.fields
+        if field is not None
+    }
+
+
+def execute_sync_field(
+    context: GraphQLExecutionContext,
+    field: SyncField,
+    source: Any,
+    path: Path,
+) -> Any:
+    try:
+        # Basic fields don't use the resolve info
+        result = (
+            field.parent_type_name
+            if field.resolve is None
+            else field.resolve(source, None)
+        )
+
+        return _complete_value(context, field, field.return_type, path, result)
+    except Exception as raw_error:  # noqa: BLE001
+        error = located_error(raw_error, field.field_nodes, path.as_list())
+        context.handle_field_error(error, field.return_type, path)
+        return None
+
+
+def _complete_value(
+    context: GraphQLExecutionContext,
+    field: SyncField,
+    return_type: GraphQLOutputType,
+    path: Path,
+    result: Any,
+) -> Any:
+    # This mirrors `ExecutionContext.complete_value`
+    if isinstance(result, Exception):
+        raise result
+
+    if isinstance(return_type, GraphQLNonNull):
+        completed = _complete_value(context, field, return_type.of_type, path, result)
+
+        if completed is None:
+            raise TypeError(
+                "Cannot return null for non-nullable field"
+                f" {field.parent_type_name}.{field.field_name}."
+            )
+
+        return completed
+
+    if result is None or result is Undefined:
+        return None
+
+    if isinstance(return_type, GraphQLList):
+        return _complete_list_value(context, field, return_type, path, result)
+
+    if field.selection is None:
+        return context.complete_leaf_value(return_type, result)  # type: ignore[arg-type]
+
+    if field.is_type_of is not None and not field.is_type_of(result, None):
+        raise invalid_return_type_error(
+            return_type,  # type: ignore[arg-type]
+            result,
+            field.field_nodes,
+        )
+
+    return execute_sync_fields(context, field.selection, result, path)
+
+
+def _complete_list_value(
+    context: GraphQLExecutionContext,
+    field: SyncField,
+    return_type: GraphQLList[GraphQLOutputType],
+    path: Path,
+    result: Any,
+) -> list[Any]:
+    if not is_iterable(result):
+        raise GraphQLError(
+            "Expected Iterable, but did not find one for field"
+            f" '{field.parent_type_name}.{field.field_name}'."
+        )
+
+    item_type = return_type.of_type
+    completed_results: list[Any] = []
+    append_result = completed_results.append
+
+    for index, item in enumerate(result):
+        item_path = path.add_key(index, None)
+
+        try:
+            append_result(_complete_value(context, field, item_type, item_path, item))
+        except Exception as raw_error:  # noqa: BLE001
+            error = located_error(raw_error, field.field_nodes, item_path.as_list())
+            context.handle_field_error(error, item_type, item_path)
+            append_result(None)
+
+    return completed_results
@@ -0,0 +1,205 @@
+"""Run blocking synchronous resolvers in a thread pool.
+
+Under async execution a synchronous resolver runs on the event loop, so a
+resolver doing blocking I/O (a legacy ORM query, a ``requests`` call...)
+blocks every other request handled by the same worker. Resolvers whose field
+uses ``executor="thread"``, or every synchronous resolver when the schema sets
+``default_resolver_executor="thread"``, are called in a `ResolverThreadPool`
+instead, while the event loop keeps running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import os
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias
+
+from strawberry.utils.await_maybe import await_maybe
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ["ResolverExecutor", "ResolverThreadPool", "ResolverThreadPoolStats"]
+
+ResolverExecutor: TypeAlias = Literal["inline", "thread", "process"]
+
+
+@dataclasses.dataclass(frozen=True)
+class ResolverThreadPoolStats:
+    """A snapshot of the activity of a `ResolverThreadPool`."""
+
+    max_workers: int
+    max_pending: int
+    # Calls running in a thread
+    running: int
+    # Calls submitted to the pool, waiting for a free thread
+    queued: int
+    # Calls waiting for the number of pending calls to go below `max_pending`
+    waiting: int
+    completed: int
+
+
+class ResolverThreadPool:
+    """A bounded thread pool for synchronous resolvers.
+
+    At most `max_pending` calls are submitted to the pool at once, running or
+    queued, further calls wait on the event loop until a call completes.
+    Resolvers are called in a copy of the context of the caller, so context
+    variables set by extensions or by the integration are visible to them.
+
+    ```python
+    import strawberry
+    from strawberry.execution.thread_pool import ResolverThreadPool
+    from strawberry.schema.config import StrawberryConfig
+
+    thread_pool = ResolverThreadPool(max_workers=8)
+
+    schema = strawberry.Schema(
+        Query,
+        config=StrawberryConfig(
+            default_resolver_executor="thread",
+            resolver_thread_pool=thread_pool,
+        ),
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        thread_name_prefix: str = "strawberry-resolver",
+    ) -> None:
+        """Initialize the ResolverThreadPool.
+
+        Args:
+            max_workers: The number of threads, defaults to the same number as
+                `concurrent.futures.ThreadPoolExecutor`.
+            max_pending: The maximum number of calls submitted to the pool at
+                once, defaults to `max_workers`.
+            thread_name_prefix: The prefix of the names of the threads.
+        """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_pending = max_pending or self.max_workers
+
+        if self.max_pending < self.max_workers:
+            raise ValueError("`max_pending` can't be lower than `max_workers`")
+
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        # Semaphores are bound to the event loop they are first used with
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self._counters_lock = threading.Lock()
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+        self._waiting = 0
+
+    def stats(self) -> ResolverThreadPoolStats:
+        with self._counters_lock:
+            return ResolverThreadPoolStats(
+                max_workers=self.max_workers,
+                max_pending=self.max_pending,
+                running=self._started - self._completed,
+                queued=self._submitted - self._started,
+                waiting=self._waiting,
+                completed=self._completed,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut the threads down, a new pool is started if the pool is used again."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if (executor := self._executor) is None:
+            with self._executor_lock:
+                if (executor := self._executor) is None:
+                    executor = self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self.thread_name_prefix,
+                    )
+
+        return executor
+
+    def _get_semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        if (semaphore := self._semaphores.get(loop)) is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_pending)
+
+        return semaphore
+
+    def _call(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        with self._counters_lock:
+            self._started += 1
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._counters_lock:
+                self._completed += 1
+
+    async def run(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """Call `func` in a thread of the pool and return its result.
+
+        An awaitable returned by `func` is awaited on the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._get_semaphore(loop)
+
+        with self._counters_lock:
+            self._waiting += 1
+
+        try:
+            await semaphore.acquire()
+        finally:
+            with self._counters_lock:
+                self._waiting -= 1
+
+        with self._counters_lock:
+            self._submitted += 1
+
+        try:
+            future = self._get_executor().submit(
+                contextvars.copy_context().run, self._call, func, *args, **kwargs
+            )
+        except BaseException:
+            with self._counters_lock:
+                self._submitted -= 1
+            semaphore.release()
+            raise
+
+        # The slot is only freed once the call is done, even when the caller
+        # is cancelled while the resolver is still running in its thread
+        future.add_done_callback(
+            functools.partial(self._call_done, loop=loop, semaphore=semaphore)
+        )
+
+        return await await_maybe(await asyncio.wrap_future(future, loop=loop))
+
+    def _call_done(
+        self,
+        future: Future[Any],
+        *,
+        loop: asyncio.AbstractEventLoop,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        if future.cancelled():
+            # Cancelled before a thread picked it up
+            with self._counters_lock:
+                self._submitted -= 1
+
+        with contextlib.suppress(RuntimeError):  # The loop is closed
+            loop.call_soon_threadsafe(semaphore.release)
@@ -26,6 +26,7 @@ from strawberry.experimental.pydantic.utils import (
     get_default_factory_for_field,
     get_private_fields,
 )
+from strawberry.schema.type_resolution import mark_class_based_is_type_of
 from strawberry.types.auto import StrawberryAuto
 from strawberry.types.cast import get_strawberry_type_cast
 from strawberry.types.field import StrawberryField
@@ -217,6 +218,7 @@ def type(
         # Implicitly define `is_type_of` to support interfaces/unions that use
         # pydantic objects (not the corresponding strawberry type)
         @classmethod  # type: ignore
+        @mark_class_based_is_type_of
         def is_type_of(cls: builtins.type, obj: Any, _info: GraphQLResolveInfo) -> bool:
             if (type_cast := get_strawberry_type_cast(obj)) is not None:
                 return type_cast is cls
@@ -2,28 +2,52 @@ from .add_validation_rules import AddValidationRules
 from .base_extension import LifecycleStep, SchemaExtension
 from .disable_introspection import DisableIntrospection
 from .disable_validation import DisableValidation
+from .document_cache import DocumentCache
+from .field_cache import CachePolicy, InMemoryResolverCache, ResolverCacheStore
 from .field_extension import FieldExtension
+from .field_filter import FieldFilter
 from .mask_errors import MaskErrors
 from .max_aliases import MaxAliasesLimiter
 from .max_tokens import MaxTokensLimiter
+from .metrics import MetricsExtension, MetricsRegistry
 from .parser_cache import ParserCache
+from .persisted_queries import PersistedQueries, PersistedQueriesSync
 from .pydantic_error_extension import PydanticErrorExtension
+from .query_cost import QueryCostLimiter
 from .query_depth_limiter import IgnoreContext, QueryDepthLimiter
+from .query_limiter import QueryLimiter
+from .response_cache import ResponseCache, ResponseCacheSync
+from .single_flight import SingleFlight, SingleFlightSync
 from .validation_cache import ValidationCache
 
 __all__ = [
     "AddValidationRules",
+    "CachePolicy",
     "DisableIntrospection",
     "DisableValidation",
+    "DocumentCache",
     "FieldExtension",
+    "FieldFilter",
     "IgnoreContext",
+    "InMemoryResolverCache",
     "LifecycleStep",
     "MaskErrors",
     "MaxAliasesLimiter",
     "MaxTokensLimiter",
+    "MetricsExtension",
+    "MetricsRegistry",
     "ParserCache",
+    "PersistedQueries",
+    "PersistedQueriesSync",
     "PydanticErrorExtension",
+    "QueryCostLimiter",
     "QueryDepthLimiter",
+    "QueryLimiter",
+    "ResolverCacheStore",
+    "ResponseCache",
+    "ResponseCacheSync",
     "SchemaExtension",
+    "SingleFlight",
+    "SingleFlightSync",
     "ValidationCache",
 ]
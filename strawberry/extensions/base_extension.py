@@ -10,6 +10,7 @@ from strawberry.utils.await_maybe import AsyncIteratorOrIterator, AwaitableOrVal
 if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
 
+    from strawberry.extensions.field_filter import FieldFilter
     from strawberry.types import ExecutionContext
 
 
@@ -23,6 +24,9 @@ class LifecycleStep(Enum):
 class SchemaExtension:
     execution_context: ExecutionContext
 
+    # The fields `resolve` is called for, every field when `None`
+    resolve_filter: FieldFilter | None = None
+
     # to support extensions that still use the old signature
     # we have an optional argument here for ease of initialization.
     def __init__(
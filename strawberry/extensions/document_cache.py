@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import dataclasses
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from graphql import specified_rules
+from graphql.language.parser import parse
+
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.utils.cache import CacheStats, LRUCache
+from strawberry.utils.operation import DocumentOperations
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator
+
+    from graphql import ASTValidationRule, DocumentNode, GraphQLError, GraphQLSchema
+
+    from strawberry.schema import Schema
+    from strawberry.types.execution import ParseOptions
+
+
+# The number of (schema, validation rules) pairs a document keeps results for
+MAX_VALIDATIONS_PER_DOCUMENT = 8
+
+
+@dataclasses.dataclass(frozen=True)
+class CachedDocument:
+    """Everything derived from a query string that can be reused between requests.
+
+    Validation results depend on the schema and on the validation rules that are
+    active for the request, so they are memoized per schema and rule set. Only
+    the most recently used rule sets are kept, in case rules are created for
+    every request.
+
+    The built-in limiters reuse the same rule for the same limits, so limiters
+    created for every request still share these results. Limiters given a
+    `callback` or `should_ignore` function create a new rule each time, which
+    keeps validation, and the callback, running for every request.
+    """
+
+    query: str
+    document: DocumentNode
+    operations: DocumentOperations
+    parse_options: tuple[tuple[str, Any], ...] = ()
+    validation_errors: LRUCache[
+        tuple[GraphQLSchema, tuple[type[ASTValidationRule], ...]],
+        list[GraphQLError],
+    ] = dataclasses.field(
+        default_factory=lambda: LRUCache(maxsize=MAX_VALIDATIONS_PER_DOCUMENT),
+        compare=False,
+        repr=False,
+    )
+
+    @classmethod
+    def from_query(cls, query: str, **parse_options: Any) -> CachedDocument:
+        document = parse(query, **parse_options)
+
+        return cls(
+            query=query,
+            document=document,
+            operations=DocumentOperations(document),
+            parse_options=tuple(sorted(parse_options.items())),
+        )
+
+    def validate(
+        self,
+        schema: GraphQLSchema,
+        validation_rules: tuple[type[ASTValidationRule], ...],
+    ) -> list[GraphQLError]:
+        # ``validate_document`` is imported lazily to break the circular import
+        # with ``strawberry.schema.schema``.
+        from strawberry.schema.schema import validate_document
+
+        key = (schema, validation_rules)
+        errors = self.validation_errors.get(key)
+
+        if errors is None:
+            errors = validate_document(schema, self.document, validation_rules)
+            self.validation_errors.set(key, errors)
+
+        return errors
+
+
+@cache
+def _get_document_cache(
+    maxsize: int | None, ttl: float | None
+) -> LRUCache[Hashable, CachedDocument]:
+    # Shared caches keyed by ``maxsize`` and ``ttl``, so that ``DocumentCache``
+    # instances constructed per request reuse the same records.
+    return LRUCache(maxsize=maxsize, ttl=ttl)
+
+
+class DocumentCache(SchemaExtension):
+    """Cache parsing, validation and operation lookup of query strings.
+
+    Each query string is mapped to a single record holding the parsed document,
+    its operations indexed by name and the validation errors for every schema
+    and set of validation rules it was validated against. This replaces using
+    both `ParserCache` and `ValidationCache`.
+
+    Pass it as a factory; the cache lives at module level and is keyed by
+    ``maxsize`` and ``ttl``, so it is shared across every request and every
+    schema that constructs a ``DocumentCache`` with the same arguments.
+
+    ```python
+    import strawberry
+    from strawberry.extensions import DocumentCache
+
+    schema = strawberry.Schema(
+        Query,
+        extensions=[lambda: DocumentCache(maxsize=1000, ttl=3600)],
+    )
+    ```
+    """
+
+    def __init__(self, maxsize: int | None = None, ttl: float | None = None) -> None:
+        """Initialize the DocumentCache.
+
+        Args:
+            maxsize: The maximum number of documents to keep, least recently used
+                documents are evicted first. If `maxsize` is set to `None` then the
+                cache will grow without bound.
+            ttl: The number of seconds a document is kept for. If `ttl` is set to
+                `None` documents don't expire.
+        """
+        super().__init__()
+        self.cache = _get_document_cache(maxsize, ttl)
+        self._cached_document: CachedDocument | None = None
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit and miss counters of the (shared) document cache."""
+        return self.cache.stats
+
+    def get_document(
+        self, query: str, parse_options: ParseOptions | None = None
+    ) -> CachedDocument:
+        """Return the record for a query, parsing it on a cache miss.
+
+        Syntax errors are raised and never cached.
+        """
+        parse_options = parse_options or {}
+        key: Hashable = (
+            (query, tuple(sorted(parse_options.items()))) if parse_options else query
+        )
+
+        cached_document = self.cache.get(key)
+
+        if cached_document is None:
+            cached_document = CachedDocument.from_query(query, **parse_options)
+            self.cache.set(key, cached_document)
+
+        return cached_document
+
+    def warm_up(
+        self,
+        schema: Schema,
+        queries: Iterable[str],
+        validation_rules: Iterable[type[ASTValidationRule]] | None = None,
+    ) -> list[CachedDocument]:
+        """Parse and validate known queries ahead of the first request.
+
+        Args:
+            schema: The schema the queries will be executed against.
+            queries: The query strings to cache.
+            validation_rules: The validation rules to validate against, defaults
+                to graphql-core's specified rules (which is what requests use
+                unless an extension changes them).
+        """
+        rules = tuple(specified_rules if validation_rules is None else validation_rules)
+        cached_documents = []
+
+        for query in queries:
+            cached_document = self.get_document(query)
+            cached_document.validate(schema._schema, rules)
+            cached_documents.append(cached_document)
+
+        return cached_documents
+
+    def on_parse(self) -> Iterator[None]:
+        execution_context = self.execution_context
+
+        if execution_context.graphql_document is None and execution_context.query:
+            cached_document = self.get_document(
+                execution_context.query, execution_context.parse_options
+            )
+            self._cached_document = cached_document
+
+            execution_context.graphql_document = cached_document.document
+            execution_context._document_operations = cached_document.operations
+
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        cached_document = self._cached_document
+
+        if (
+            cached_document is not None
+            and cached_document.document is execution_context.graphql_document
+            and execution_context.validation_rules
+            and execution_context.pre_execution_errors is None
+        ):
+            execution_context.pre_execution_errors = cached_document.validate(
+                execution_context.schema._schema,
+                execution_context.validation_rules,
+            )
+
+        yield
+
+
+__all__ = ["CachedDocument", "DocumentCache"]
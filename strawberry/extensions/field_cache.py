@@ -0,0 +1,253 @@
+"""Cache the results of resolvers.
+
+Fields declared with ``cache=CachePolicy(...)`` store the result of their
+resolver in the resolver cache of the schema, keyed by the field, the identity
+of the parent object, the arguments and, for private data, the principal the
+result belongs to. Within one request identical calls, for example through
+aliases, are resolved once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import inspect
+from contextvars import ContextVar
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal
+from typing_extensions import Protocol
+
+from strawberry.extensions.field_extension import FieldExtension
+from strawberry.utils.await_maybe import await_maybe
+from strawberry.utils.cache import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterator
+
+    from strawberry.extensions.field_extension import (
+        AsyncExtensionResolver,
+        SyncExtensionResolver,
+    )
+    from strawberry.types import Info
+    from strawberry.utils.await_maybe import AwaitableOrValue
+    from strawberry.utils.cache import CacheStats
+
+
+@dataclasses.dataclass(frozen=True)
+class CachePolicy:
+    """How the result of a resolver is cached.
+
+    Attributes:
+        ttl: The number of seconds a result stays in the resolver cache.
+        scope: `"public"` results are shared by every request, `"private"`
+            results are only shared by the requests of the same principal.
+        key: Returns a value identifying the variant of the result from the
+            `Info` of the request, for example the current user. Required for
+            private results, a `None` key skips the resolver cache.
+    """
+
+    ttl: float
+    scope: Literal["public", "private"] = "public"
+    key: Callable[[Info], Hashable | None] | None = None
+
+    def __post_init__(self) -> None:
+        if self.scope == "private" and self.key is None:
+            raise ValueError("A private `CachePolicy` needs a `key`")
+
+
+class ResolverCacheStore(Protocol):
+    """Stores the results of resolvers, shared between requests.
+
+    Methods can either be plain or async functions, async stores can't be used
+    by synchronous execution. `get` returns `None` for a missing key.
+    """
+
+    def get(self, key: str) -> AwaitableOrValue[Any | None]: ...
+
+    def set(self, key: str, value: Any, ttl: float) -> AwaitableOrValue[None]: ...
+
+
+class InMemoryResolverCache:
+    """A size bounded, in-process LRU store."""
+
+    def __init__(self, maxsize: int | None = 1000) -> None:
+        self.cache: LRUCache[str, Any] = LRUCache(maxsize=maxsize)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    def get(self, key: str) -> Any | None:
+        return self.cache.get(key)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self.cache.set(key, value, ttl=ttl)
+
+
+# Results of the cached fields of the request being executed, by cache key.
+# Async results are stored as tasks, so that concurrent identical calls share
+# them.
+_request_results: ContextVar[dict[str, Any] | None] = ContextVar(
+    "strawberry_request_results", default=None
+)
+
+
+@contextlib.contextmanager
+def request_results_scope() -> Iterator[None]:
+    """Share the results of cached fields between the calls of one request."""
+    token = _request_results.set({})
+
+    try:
+        yield
+    finally:
+        _request_results.reset(token)
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(
+            (name, _normalize(item))
+            for name, item in sorted(value.items(), key=lambda item: item[0])
+        )
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(item) for item in value)
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value).__qualname__,
+            tuple(
+                (field.name, _normalize(getattr(value, field.name)))
+                for field in dataclasses.fields(value)
+            ),
+        )
+
+    return value
+
+
+class ResolverCacheExtension(FieldExtension):
+    """Look results up in the resolver cache before calling the resolver.
+
+    Assembled by the schema for fields with a `CachePolicy`. Without other
+    field extensions it runs before the arguments are converted, so a cached
+    result skips both the conversion and the resolver.
+    """
+
+    def __init__(self, policy: CachePolicy, store: ResolverCacheStore) -> None:
+        self.policy = policy
+        self.store = store
+
+    def get_cache_keys(
+        self, source: Any, info: Info, kwargs: dict[str, Any]
+    ) -> tuple[str, str | None]:
+        """Return the key of the result within the request and in the store.
+
+        The store key is `None` when the result can't be shared between
+        requests, because the parent object has no `id` or the policy has no
+        key for this request.
+        """
+        path = info.path
+
+        if path.prev is None:
+            # Root fields, their parent is the root value
+            parent: Hashable = None
+            shared_parent = True
+        else:
+            parent_id = getattr(source, "id", None)
+            shared_parent = parent_id is not None
+            parent = parent_id if shared_parent else id(source)
+
+        variant = None if self.policy.key is None else self.policy.key(info)
+        shareable = shared_parent and not (
+            variant is None and self.policy.scope == "private"
+        )
+
+        digest = hashlib.sha256(
+            repr((parent, _normalize(kwargs), variant)).encode()
+        ).hexdigest()
+        key = f"{path.typename}.{info.field_name}:{self.policy.scope}:{digest}"
+
+        return key, key if shareable else None
+
+    def resolve(
+        self, next_: SyncExtensionResolver, source: Any, info: Info, **kwargs: Any
+    ) -> Any:
+        request_results = _request_results.get()
+        key, store_key = self.get_cache_keys(source, info, kwargs)
+
+        if request_results is not None and key in request_results:
+            return request_results[key]
+
+        call_next = partial(next_, source, info, **kwargs)
+
+        def resolve() -> Any:
+            if store_key is None:
+                return call_next()
+
+            cached = self.store.get(store_key)
+
+            if inspect.isawaitable(cached):
+                return self._resolve_async(cached, store_key, call_next)
+
+            if cached is not None:
+                return cached[0]
+
+            result = call_next()
+
+            if inspect.isawaitable(result):
+                return self._store_async(result, store_key)
+
+            stored = self.store.set(store_key, (result,), self.policy.ttl)
+
+            if inspect.isawaitable(stored):
+                return self._return_after(stored, result)
+
+            return result
+
+        result = resolve()
+
+        if request_results is not None:
+            if inspect.isawaitable(result):
+                result = asyncio.ensure_future(result)
+
+            request_results[key] = result
+
+        return result
+
+    async def resolve_async(
+        self, next_: AsyncExtensionResolver, source: Any, info: Info, **kwargs: Any
+    ) -> Any:
+        return await await_maybe(self.resolve(next_, source, info, **kwargs))
+
+    async def _resolve_async(
+        self,
+        cached: AwaitableOrValue[Any | None],
+        store_key: str,
+        call_next: Callable[[], Any],
+    ) -> Any:
+        if (value := await await_maybe(cached)) is not None:
+            return value[0]
+
+        return await self._store_async(call_next(), store_key)
+
+    async def _store_async(self, result: AwaitableOrValue[Any], store_key: str) -> Any:
+        value = await await_maybe(result)
+        await await_maybe(self.store.set(store_key, (value,), self.policy.ttl))
+
+        return value
+
+    async def _return_after(self, stored: AwaitableOrValue[None], result: Any) -> Any:
+        await await_maybe(stored)
+
+        return result
+
+
+__all__ = [
+    "CachePolicy",
+    "InMemoryResolverCache",
+    "ResolverCacheExtension",
+    "ResolverCacheStore",
+    "request_results_scope",
+]
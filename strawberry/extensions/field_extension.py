@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import itertools
 from collections.abc import Awaitable, Callable
-from functools import cached_property
+from functools import cached_property, partial, reduce
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -182,4 +182,20 @@ def build_field_extension_resolvers(
     )
 
 
+def compose_field_extension_resolvers(
+    resolvers: list[SyncExtensionResolver | AsyncExtensionResolver],
+    get_result: Callable[..., Any],
+) -> Callable[..., Any]:
+    """Chain the extension resolvers of a field around `get_result`.
+
+    This is done once per field when the schema is created, each extension
+    receives the rest of the chain as its `next_` argument.
+    """
+    return reduce(
+        lambda chained_fn, next_fn: partial(next_fn, chained_fn),
+        resolvers,
+        get_result,
+    )
+
+
 __all__ = ["FieldExtension"]
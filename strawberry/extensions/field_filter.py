@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING
+
+from strawberry.resolvers import is_default_resolver
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from collections.abc import Set as AbstractSet
+
+    from graphql import GraphQLField
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldFilter:
+    """Select the fields a `SchemaExtension.resolve` method is called for.
+
+    Extensions set it as their `resolve_filter` attribute. Fields that don't
+    match are resolved without going through the extension at all.
+
+    Example:
+
+    ```python
+    from strawberry.extensions import FieldFilter, SchemaExtension
+
+
+    class TraceResolvers(SchemaExtension):
+        resolve_filter = FieldFilter(skip_basic_fields=True, types={"Query"})
+
+        def resolve(self, _next, root, info, *args, **kwargs):
+            return _next(root, info, *args, **kwargs)
+    ```
+
+    Args:
+        skip_basic_fields: Skip fields without a custom resolver, which only
+            read an attribute of their parent.
+        skip_introspection: Skip the fields of introspection types and meta
+            fields like `__typename`.
+        types: Only include the fields of these GraphQL types.
+        fields: Only include these fields, as `TypeName.fieldName`.
+        directives: Only include fields with one of these schema directives.
+    """
+
+    skip_basic_fields: bool = False
+    skip_introspection: bool = False
+    types: AbstractSet[str] | None = None
+    fields: AbstractSet[str] | None = None
+    directives: Sequence[type] | None = None
+
+    def __post_init__(self) -> None:
+        # Accept any iterable, but keep the filter hashable
+        for name in ("types", "fields"):
+            if (value := getattr(self, name)) is not None:
+                object.__setattr__(self, name, frozenset(value))
+
+        if self.directives is not None:
+            object.__setattr__(self, "directives", tuple(self.directives))
+
+    def matches(self, type_name: str, field_name: str, field: GraphQLField) -> bool:
+        if self.skip_introspection and (
+            type_name.startswith("__") or field_name.startswith("__")
+        ):
+            return False
+
+        if self.skip_basic_fields and (
+            field.resolve is None or is_default_resolver(field.resolve)
+        ):
+            return False
+
+        if self.types is not None and type_name not in self.types:
+            return False
+
+        if self.fields is not None and f"{type_name}.{field_name}" not in self.fields:
+            return False
+
+        if self.directives is not None:
+            # Imported here to avoid a circular import
+            from strawberry.schema.schema_converter import GraphQLCoreConverter
+
+            definition = (field.extensions or {}).get(
+                GraphQLCoreConverter.DEFINITION_BACKREF
+            )
+            directives = getattr(definition, "directives", None) or ()
+
+            if not any(isinstance(d, tuple(self.directives)) for d in directives):
+                return False
+
+        return True
+
+
+__all__ = ["FieldFilter"]
@@ -1,3 +1,4 @@
+import functools
 from collections.abc import Mapping
 
 from graphql import (
@@ -33,10 +34,15 @@ class MaxAliasesLimiter(AddValidationRules):
         Args:
             max_alias_count: The maximum number of aliases allowed in a GraphQL document.
         """
-        validator = create_validator(max_alias_count)
+        validator = _get_validator(max_alias_count)
         super().__init__([validator])
 
 
+@functools.lru_cache(maxsize=128)
+def _get_validator(max_alias_count: int) -> type[ValidationRule]:
+    return create_validator(max_alias_count)
+
+
 def create_validator(max_alias_count: int) -> type[ValidationRule]:
     """Create a validator that checks the number of aliases in a document.
 
@@ -0,0 +1,407 @@
+"""In-process resolver and operation metrics, exported in Prometheus text format.
+
+`MetricsExtension` times resolvers in its `resolve` method, whose filter skips
+fields without a custom resolver, so they are left untouched. Resolvers are
+only timed while an operation sampled by the extension is executing.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from strawberry.execution import optimized_is_awaitable
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.extensions.field_filter import FieldFilter
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator, Sequence
+
+    from graphql import GraphQLResolveInfo
+
+__all__ = ["Histogram", "MetricsExtension", "MetricsRegistry", "default_registry"]
+
+# Every power of two is split in ``2 ** _SUB_BUCKET_BITS`` buckets, which bounds
+# the relative error of recorded values to about 6%.
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+# Durations are recorded in nanoseconds, up to ~73 minutes.
+_MAX_VALUE = (1 << 42) - 1
+_BUCKET_COUNT = (_MAX_VALUE.bit_length() - _SUB_BUCKET_BITS + 1) * _SUB_BUCKETS
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PHASES = ("parse", "validate", "execute")
+
+# Resolvers of fields above ``max_fields`` are recorded under this label
+OVERFLOW_FIELD = "__other__"
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return max(value, 0)
+
+    value = min(value, _MAX_VALUE)
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+
+    return (shift + 1) * _SUB_BUCKETS + (value >> shift) - _SUB_BUCKETS
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """Return the largest value counted by the bucket at `index`."""
+    if index < _SUB_BUCKETS:
+        return index
+
+    shift = index // _SUB_BUCKETS - 1
+
+    return ((index % _SUB_BUCKETS + _SUB_BUCKETS + 1) << shift) - 1
+
+
+class Histogram:
+    """A log-linear histogram of durations in nanoseconds, like an HDR histogram.
+
+    Buckets are allocated once, so recording a value doesn't allocate.
+    """
+
+    __slots__ = ("_lock", "count", "counts", "sum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.sum = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: int) -> None:
+        index = _bucket_index(value)
+
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def percentile(self, percentile: float) -> int:
+        """Return the value below which `percentile`% of the values fall."""
+        if not self.count:
+            return 0
+
+        target = max(1, round(self.count * percentile / 100))
+        seen = 0
+
+        for index, count in enumerate(self.counts):
+            seen += count
+
+            if seen >= target:
+                return _bucket_upper_bound(index)
+
+        return _MAX_VALUE  # pragma: no cover
+
+    def cumulative_counts(self, bounds: Sequence[int]) -> Iterator[int]:
+        """Yield the number of values up to each of the sorted `bounds`."""
+        counts = self.counts
+        seen = 0
+        index = 0
+
+        for bound in bounds:
+            last = _bucket_index(bound)
+
+            while index <= last:
+                seen += counts[index]
+                index += 1
+
+            yield seen
+
+
+class MetricsRegistry:
+    """Resolver and operation metrics shared by every request.
+
+    Args:
+        sample_rate: The fraction of operations whose resolvers are timed.
+            Phase timings and error counts are recorded for every operation.
+        max_fields: The maximum number of fields with their own resolver
+            histogram. Fields above the limit are recorded as `__other__`.
+        buckets: The upper bounds, in seconds, of the exported histogram
+            buckets.
+        namespace: The prefix of the exported metric names.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: float = 1.0,
+        max_fields: int = 1000,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        namespace: str = "strawberry",
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.max_fields = max_fields
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+
+        self.resolvers: dict[str, Histogram] = {}
+        self.resolver_errors: dict[str, int] = {}
+        self.phases: dict[str, Histogram] = {phase: Histogram() for phase in PHASES}
+        self.errors: dict[str, int] = dict.fromkeys(PHASES, 0)
+        # Operations run by `SingleFlight`, executed or sharing a result
+        self.single_flight: dict[str, int] = {"executed": 0, "coalesced": 0}
+        self._lock = threading.Lock()
+
+    def should_sample(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate  # noqa: S311
+
+    def _get_field_key(self, key: str) -> str:
+        if key in self.resolvers:
+            return key
+
+        with self._lock:
+            if key not in self.resolvers:
+                if len(self.resolvers) >= self.max_fields:
+                    key = OVERFLOW_FIELD
+
+                self.resolvers.setdefault(key, Histogram())
+                self.resolver_errors.setdefault(key, 0)
+
+        return key
+
+    def observe_resolver(self, key: str, duration: int, error: bool = False) -> None:
+        """Record a resolver call of the field `key`, e.g. `Query.user`."""
+        key = self._get_field_key(key)
+        self.resolvers[key].observe(duration)
+
+        if error:
+            with self._lock:
+                self.resolver_errors[key] += 1
+
+    def observe_phase(self, phase: str, duration: int) -> None:
+        self.phases[phase].observe(duration)
+
+    def count_errors(self, phase: str, count: int) -> None:
+        with self._lock:
+            self.errors[phase] += count
+
+    def count_single_flight(self, coalesced: bool) -> None:
+        with self._lock:
+            self.single_flight["coalesced" if coalesced else "executed"] += 1
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """The fraction of `SingleFlight` operations that shared a result."""
+        total = sum(self.single_flight.values())
+
+        return self.single_flight["coalesced"] / total if total else 0.0
+
+    def render(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        bounds = [int(bucket * 1e9) for bucket in self.buckets]
+        labels = [_format_float(bucket) for bucket in self.buckets]
+        lines: list[str] = []
+
+        def add_histogram(
+            name: str, help_: str, label: str, histograms: dict[str, Histogram]
+        ) -> None:
+            lines.append(f"# HELP {name} {help_}")
+            lines.append(f"# TYPE {name} histogram")
+
+            for value, histogram in sorted(histograms.items()):
+                label_value = f'{label}="{_escape(value)}"'
+
+                for le, count in zip(
+                    labels, histogram.cumulative_counts(bounds), strict=True
+                ):
+                    lines.append(f'{name}_bucket{{{label_value},le="{le}"}} {count}')
+
+                total = _format_float(histogram.sum / 1e9)
+                lines.extend(
+                    (
+                        f'{name}_bucket{{{label_value},le="+Inf"}} {histogram.count}',
+                        f"{name}_sum{{{label_value}}} {total}",
+                        f"{name}_count{{{label_value}}} {histogram.count}",
+                    )
+                )
+
+        def add_counter(
+            name: str, help_: str, label: str, counters: dict[str, int]
+        ) -> None:
+            lines.append(f"# HELP {name} {help_}")
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(
+                f'{name}{{{label}="{_escape(value)}"}} {count}'
+                for value, count in sorted(counters.items())
+            )
+
+        add_histogram(
+            f"{self.namespace}_resolver_duration_seconds",
+            "Time spent in field resolvers.",
+            "field",
+            self.resolvers,
+        )
+        add_counter(
+            f"{self.namespace}_resolver_errors_total",
+            "Errors raised by field resolvers.",
+            "field",
+            self.resolver_errors,
+        )
+        add_histogram(
+            f"{self.namespace}_operation_phase_duration_seconds",
+            "Time spent parsing, validating and executing operations.",
+            "phase",
+            self.phases,
+        )
+        add_counter(
+            f"{self.namespace}_operation_errors_total",
+            "Errors returned by operations, by phase.",
+            "phase",
+            self.errors,
+        )
+        add_counter(
+            f"{self.namespace}_single_flight_operations_total",
+            "Operations run by SingleFlight, executed or coalesced.",
+            "result",
+            self.single_flight,
+        )
+
+        return "\n".join(lines) + "\n"
+
+    def asgi_app(self) -> Callable[..., Awaitable[None]]:
+        """Return an ASGI application serving the metrics, e.g. on `/metrics`."""
+
+        async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+            if scope["type"] != "http":
+                return
+
+            body = self.render().encode()
+
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"text/plain; version=0.0.4; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+
+        return app
+
+
+default_registry = MetricsRegistry()
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsExtension(SchemaExtension):
+    """Record resolver latencies, phase timings and error counts.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.extensions import MetricsExtension, MetricsRegistry
+
+    metrics = MetricsRegistry(sample_rate=0.1)
+
+    schema = strawberry.Schema(
+        Query,
+        extensions=[lambda: MetricsExtension(metrics)],
+    )
+
+    # Serve the metrics on /metrics, e.g. with Starlette
+    app.mount("/metrics", metrics.asgi_app())
+    ```
+    """
+
+    resolve_filter = FieldFilter(skip_basic_fields=True, skip_introspection=True)
+
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        super().__init__()
+        self.registry = registry if registry is not None else default_registry
+        self.sampled = False
+
+    def _count_errors(self, phase: str) -> None:
+        if errors := self.execution_context.pre_execution_errors:
+            self.registry.count_errors(phase, len(errors))
+
+    def on_parse(self) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        yield
+        self.registry.observe_phase("parse", time.perf_counter_ns() - start)
+        self._count_errors("parse")
+
+    def on_validate(self) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        yield
+        self.registry.observe_phase("validate", time.perf_counter_ns() - start)
+        self._count_errors("validate")
+
+    def on_execute(self) -> Iterator[None]:
+        self.sampled = self.registry.should_sample()
+        start = time.perf_counter_ns()
+        yield
+        self.registry.observe_phase("execute", time.perf_counter_ns() - start)
+        self._count_errors("execute")
+
+    async def _await_result(self, result: Awaitable[Any], key: str, start: int) -> Any:
+        try:
+            value = await result
+        except Exception:
+            self.registry.observe_resolver(
+                key, time.perf_counter_ns() - start, error=True
+            )
+            raise
+
+        self.registry.observe_resolver(key, time.perf_counter_ns() - start)
+
+        return value
+
+    def resolve(
+        self,
+        _next: Callable,
+        root: Any,
+        info: GraphQLResolveInfo,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        if not self.sampled or info.parent_type is info.schema.subscription_type:
+            return _next(root, info, *args, **kwargs)
+
+        key = f"{info.parent_type.name}.{info.field_name}"
+        start = time.perf_counter_ns()
+
+        try:
+            result = _next(root, info, *args, **kwargs)
+        except Exception:
+            self.registry.observe_resolver(
+                key, time.perf_counter_ns() - start, error=True
+            )
+            raise
+
+        if optimized_is_awaitable(result):
+            return self._await_result(result, key, start)
+
+        self.registry.observe_resolver(key, time.perf_counter_ns() - start)
+
+        return result
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import hashlib
+from functools import cache
+from inspect import isawaitable, iscoroutine
+from typing import TYPE_CHECKING, Any
+from typing_extensions import Protocol
+
+from graphql import GraphQLError
+
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.extensions.document_cache import CachedDocument
+from strawberry.utils.await_maybe import await_maybe
+from strawberry.utils.cache import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+    from strawberry.utils.await_maybe import AwaitableOrValue
+
+# The only version of the persisted query protocol that exists.
+SUPPORTED_VERSION = 1
+
+
+class PersistedQueryNotFound(GraphQLError):
+    """The hash sent by the client isn't known.
+
+    Clients are expected to retry with the full query.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(
+            "PersistedQueryNotFound",
+            extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+        )
+
+
+class InvalidPersistedQuery(GraphQLError):
+    def __init__(self, message: str) -> None:
+        super().__init__(message, extensions={"code": "BAD_REQUEST"})
+
+
+class PersistedQueryStore(Protocol):
+    """Maps sha256 hashes to query strings.
+
+    Methods can either be plain or async functions, the sync extension only
+    works with plain functions.
+    """
+
+    def get(self, sha256_hash: str) -> AwaitableOrValue[str | None]: ...
+
+    def set(self, sha256_hash: str, query: str) -> AwaitableOrValue[None]: ...
+
+
+class InMemoryPersistedQueryStore:
+    """A size bounded, in-process LRU store."""
+
+    def __init__(self, maxsize: int | None = 1000) -> None:
+        self.cache: LRUCache[str, str] = LRUCache(maxsize=maxsize)
+
+    def get(self, sha256_hash: str) -> str | None:
+        return self.cache.get(sha256_hash)
+
+    def set(self, sha256_hash: str, query: str) -> None:
+        self.cache.set(sha256_hash, query)
+
+
+@cache
+def _get_default_store(maxsize: int | None) -> InMemoryPersistedQueryStore:
+    # Extensions are constructed per request, the default store is shared
+    # between them (keyed by ``maxsize``) so that queries persist across
+    # requests.
+    return InMemoryPersistedQueryStore(maxsize=maxsize)
+
+
+@cache
+def _get_document_cache(maxsize: int | None) -> LRUCache[str, CachedDocument]:
+    # Hashes are linked to their parsed (and validated) documents in-process,
+    # independently of the store, so that a hit skips the store lookup, parsing
+    # and validation.
+    return LRUCache(maxsize=maxsize)
+
+
+class _PersistedQueriesBase(SchemaExtension):
+    def __init__(
+        self,
+        store: PersistedQueryStore | None = None,
+        maxsize: int | None = 1000,
+    ) -> None:
+        """Initialize the extension.
+
+        Args:
+            store: Where to keep the queries, defaults to an in-memory LRU store
+                shared by every instance with the same `maxsize`.
+            maxsize: The number of queries the default store keeps, and the
+                number of parsed documents kept in memory.
+        """
+        super().__init__()
+        self.store = store if store is not None else _get_default_store(maxsize)
+        self.documents = _get_document_cache(maxsize)
+        self._sha256_hash: str | None = None
+        self._cached_document: CachedDocument | None = None
+        self._should_persist = False
+
+    def _get_sha256_hash(self) -> str | None:
+        """Return the hash of the query if the request uses persisted queries."""
+        operation_extensions = self.execution_context.operation_extensions or {}
+        persisted_query = operation_extensions.get("persistedQuery")
+
+        if persisted_query is None:
+            return None
+
+        if not isinstance(persisted_query, dict):
+            raise InvalidPersistedQuery("Invalid persisted query extension")
+
+        if persisted_query.get("version") != SUPPORTED_VERSION:
+            raise InvalidPersistedQuery("Unsupported persisted query version")
+
+        sha256_hash = persisted_query.get("sha256Hash")
+
+        if not isinstance(sha256_hash, str):
+            raise InvalidPersistedQuery("Invalid persisted query hash")
+
+        return sha256_hash
+
+    def _start_operation(self) -> str | None:
+        """Return the hash to look up in the store, if any.
+
+        A hash only needs a lookup when its document isn't cached yet.
+        """
+        execution_context = self.execution_context
+        sha256_hash = self._sha256_hash = self._get_sha256_hash()
+
+        if sha256_hash is None:
+            return None
+
+        if execution_context.query:
+            digest = hashlib.sha256(execution_context.query.encode()).hexdigest()
+
+            if digest != sha256_hash:
+                raise InvalidPersistedQuery("provided sha does not match query")
+
+            self._should_persist = True
+            return None
+
+        cached_document = self.documents.get(sha256_hash)
+
+        if cached_document is None:
+            return sha256_hash
+
+        self._cached_document = cached_document
+        execution_context.query = cached_document.query
+        return None
+
+    def _set_query(self, query: str | None) -> None:
+        if query is None:
+            raise PersistedQueryNotFound
+
+        self.execution_context.query = query
+
+    def _parse(self) -> None:
+        execution_context = self.execution_context
+
+        if self._sha256_hash is None or execution_context.graphql_document:
+            return
+
+        parse_options = execution_context.parse_options
+        cached_document = self._cached_document
+
+        # Parse options (like the token limit) can differ between schemas
+        # sharing the cache, documents are only reused with the same options.
+        if cached_document is None or cached_document.parse_options != tuple(
+            sorted(parse_options.items())
+        ):
+            assert execution_context.query is not None
+
+            cached_document = self._cached_document = CachedDocument.from_query(
+                execution_context.query, **parse_options
+            )
+            self.documents.set(self._sha256_hash, cached_document)
+
+        execution_context.graphql_document = cached_document.document
+        execution_context._document_operations = cached_document.operations
+
+    def _validate(self) -> None:
+        execution_context = self.execution_context
+        cached_document = self._cached_document
+
+        if (
+            cached_document is not None
+            and cached_document.document is execution_context.graphql_document
+            and execution_context.validation_rules
+            and execution_context.pre_execution_errors is None
+        ):
+            execution_context.pre_execution_errors = cached_document.validate(
+                execution_context.schema._schema,
+                execution_context.validation_rules,
+            )
+
+    def _get_query_to_persist(self) -> str | None:
+        execution_context = self.execution_context
+
+        if not self._should_persist or execution_context.pre_execution_errors:
+            return None
+
+        self._should_persist = False
+        return execution_context.query
+
+
+class PersistedQueries(_PersistedQueriesBase):
+    """Add support for automatic persisted queries (APQ).
+
+    Clients send the sha256 hash of their query in the
+    `extensions.persistedQuery.sha256Hash` field of the request. Unknown hashes
+    are answered with a `PersistedQueryNotFound` error, in which case the client
+    retries with both the query and its hash so that it can be stored.
+
+    Hashes are linked to their parsed and validated documents, so requests
+    using a known hash skip parsing and validation.
+
+    ```python
+    import strawberry
+    from strawberry.extensions import PersistedQueries
+
+    schema = strawberry.Schema(
+        Query,
+        extensions=[PersistedQueries],
+    )
+    ```
+    """
+
+    async def on_operation(self) -> AsyncIterator[None]:
+        if sha256_hash := self._start_operation():
+            self._set_query(await await_maybe(self.store.get(sha256_hash)))
+
+        yield
+
+    def on_parse(self) -> Iterator[None]:
+        self._parse()
+        yield
+
+    async def on_validate(self) -> AsyncIterator[None]:
+        self._validate()
+        yield
+
+        if query := self._get_query_to_persist():
+            assert self._sha256_hash is not None
+            await await_maybe(self.store.set(self._sha256_hash, query))
+
+
+class PersistedQueriesSync(_PersistedQueriesBase):
+    """Synchronous version of `PersistedQueries`, for `Schema.execute_sync`.
+
+    The store must be synchronous.
+    """
+
+    def on_operation(self) -> Iterator[None]:
+        if sha256_hash := self._start_operation():
+            self._set_query(_ensure_sync(self.store.get(sha256_hash)))
+
+        yield
+
+    def on_parse(self) -> Iterator[None]:
+        self._parse()
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        self._validate()
+        yield
+
+        if query := self._get_query_to_persist():
+            assert self._sha256_hash is not None
+            _ensure_sync(self.store.set(self._sha256_hash, query))
+
+
+def _ensure_sync(value: Any) -> Any:
+    if isawaitable(value):
+        if iscoroutine(value):
+            value.close()
+
+        raise RuntimeError(
+            "PersistedQueriesSync requires a synchronous store, "
+            "use PersistedQueries with async stores"
+        )
+
+    return value
+
+
+__all__ = [
+    "InMemoryPersistedQueryStore",
+    "InvalidPersistedQuery",
+    "PersistedQueries",
+    "PersistedQueriesSync",
+    "PersistedQueryNotFound",
+    "PersistedQueryStore",
+]
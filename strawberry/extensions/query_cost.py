@@ -0,0 +1,585 @@
+"""Static cost analysis of GraphQL operations.
+
+The cost of an operation is the sum of the costs of its fields, a field costs
+its weight plus the cost of its selection set, multiplied by the number of
+items it returns when it is a list. The number of items comes from slicing
+arguments such as ``first``/``last``, see the `ListSize` schema directive.
+
+Costs only depend on the document, the operation and the values of a few
+variables, so they are computed once per document and cached for each
+combination of those values.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from graphql import (
+    ExecutionResult as GraphQLExecutionResult,
+)
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    GraphQLError,
+    GraphQLIncludeDirective,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSkipDirective,
+    OperationDefinitionNode,
+    OperationType,
+    VariableNode,
+    Visitor,
+    get_named_type,
+    is_abstract_type,
+    is_composite_type,
+    visit,
+)
+from graphql.execution.collect_fields import collect_fields
+from graphql.execution.values import get_argument_values, get_variable_values
+
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.extensions.utils import get_schema_directive, get_strawberry_definition
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from graphql import (
+        DocumentNode,
+        GraphQLField,
+        GraphQLNamedType,
+        GraphQLOutputType,
+        GraphQLSchema,
+    )
+
+# The `Cost` and `ListSize` schema directives, or their federation version
+_COST_DIRECTIVE = "cost"
+_LIST_SIZE_DIRECTIVE = "listSize"
+
+_CONDITIONAL_DIRECTIVES = frozenset(
+    {GraphQLSkipDirective.name, GraphQLIncludeDirective.name}
+)
+
+# Each combination of the values of the variables a cost depends on is cached
+# separately; beyond this many we stop storing new combinations.
+MAX_COST_VARIANTS = 8
+
+
+class CostOptions(NamedTuple):
+    default_object_cost: int
+    default_scalar_cost: int
+    default_list_size: int
+    slicing_arguments: tuple[str, ...]
+
+
+class _FieldCost(NamedTuple):
+    weight: int
+    weight_by_type: bool
+    is_list: bool
+    named_type: GraphQLNamedType
+    slicing_arguments: tuple[str, ...]
+    assumed_size: int | None
+    sized_fields: frozenset[str] | None
+
+
+class _CostVariablesCollector(Visitor):
+    """Find the variables used by conditions and by slicing arguments."""
+
+    def __init__(self, slicing_arguments: frozenset[str]) -> None:
+        super().__init__()
+        self.slicing_arguments = slicing_arguments
+        self.names: set[str] = set()
+
+    def enter_directive(self, node: Any, *_args: Any) -> None:
+        if node.name.value in _CONDITIONAL_DIRECTIVES:
+            self._add_variables(node.arguments)
+
+    def enter_field(self, node: Any, *_args: Any) -> None:
+        self._add_variables(
+            argument
+            for argument in node.arguments
+            if argument.name.value in self.slicing_arguments
+        )
+
+    def _add_variables(self, arguments: Iterable[Any]) -> None:
+        for argument in arguments:
+            if isinstance(argument.value, VariableNode):
+                self.names.add(argument.value.name.value)
+
+
+class _DocumentCosts:
+    __slots__ = ("costs", "variables")
+
+    def __init__(self, variables: tuple[str, ...]) -> None:
+        self.variables = variables
+        self.costs: dict[tuple, int | None] = {}
+
+
+class QueryCostAnalysis:
+    """Compute and cache the cost of the operations run against a schema."""
+
+    def __init__(self, schema: GraphQLSchema, options: CostOptions) -> None:
+        self.schema = schema
+        self.options = options
+        self._fields: dict[tuple[str, str], _FieldCost] = {}
+        self._types: dict[str, int] = {}
+        self._documents: weakref.WeakKeyDictionary[DocumentNode, _DocumentCosts] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._slicing_arguments = self._get_slicing_arguments()
+
+    def _get_slicing_arguments(self) -> frozenset[str]:
+        names = set(self.options.slicing_arguments)
+
+        for type_ in self.schema.type_map.values():
+            if not isinstance(type_, GraphQLObjectType):
+                continue
+
+            for field in type_.fields.values():
+                list_size = get_schema_directive(
+                    get_strawberry_definition(field), _LIST_SIZE_DIRECTIVE
+                )
+
+                if list_size is not None and list_size.slicing_arguments:
+                    names.update(list_size.slicing_arguments)
+
+        return frozenset(names)
+
+    def get_cost(
+        self,
+        document: DocumentNode,
+        operation_name: str | None,
+        variables: dict[str, Any] | None,
+    ) -> int | None:
+        """Return the cost of an operation of a validated document.
+
+        Returns `None` when the operation can't be selected or when its
+        variables are invalid, execution reports those errors.
+        """
+        document_costs = self._documents.get(document)
+
+        if document_costs is None:
+            collector = _CostVariablesCollector(self._slicing_arguments)
+            visit(document, collector)
+
+            document_costs = self._documents[document] = _DocumentCosts(
+                tuple(sorted(collector.names))
+            )
+
+        variables = variables or {}
+        key: tuple | None = (
+            operation_name,
+            *(variables.get(name) for name in document_costs.variables),
+        )
+
+        try:
+            if key in document_costs.costs:
+                return document_costs.costs[key]
+        except TypeError:
+            # Unhashable variable values, these costs aren't cached
+            key = None
+
+        cost = self._compute_cost(document, operation_name, variables)
+
+        if key is not None and len(document_costs.costs) < MAX_COST_VARIANTS:
+            document_costs.costs[key] = cost
+
+        return cost
+
+    def _compute_cost(
+        self,
+        document: DocumentNode,
+        operation_name: str | None,
+        variables: dict[str, Any],
+    ) -> int | None:
+        operation: OperationDefinitionNode | None = None
+        fragments: dict[str, FragmentDefinitionNode] = {}
+
+        for definition in document.definitions:
+            if isinstance(definition, OperationDefinitionNode):
+                if operation_name is None:
+                    if operation is not None:
+                        return None
+                    operation = definition
+                elif definition.name and definition.name.value == operation_name:
+                    operation = definition
+            elif isinstance(definition, FragmentDefinitionNode):
+                fragments[definition.name.value] = definition
+
+        if operation is None:
+            return None
+
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return None
+
+        variable_values = get_variable_values(
+            self.schema, operation.variable_definitions or (), variables
+        )
+
+        if isinstance(variable_values, list):
+            return None
+
+        return _CostCalculator(self, fragments, variable_values).selection_cost(
+            root_type,
+            collect_fields(
+                self.schema,
+                fragments,
+                variable_values,
+                root_type,
+                operation.selection_set,
+            ),
+            None,
+            None,
+        )
+
+    def get_field_cost(
+        self, parent_type: GraphQLObjectType, field_name: str, field: GraphQLField
+    ) -> _FieldCost:
+        key = (parent_type.name, field_name)
+
+        if (field_cost := self._fields.get(key)) is None:
+            field_cost = self._fields[key] = self._build_field_cost(field)
+
+        return field_cost
+
+    def get_type_weight(self, named_type: GraphQLNamedType) -> int:
+        if (weight := self._types.get(named_type.name)) is None:
+            cost = get_schema_directive(
+                get_strawberry_definition(named_type), _COST_DIRECTIVE
+            )
+
+            if cost is not None:
+                weight = cost.weight
+            elif is_composite_type(named_type):
+                weight = self.options.default_object_cost
+            else:
+                weight = self.options.default_scalar_cost
+
+            self._types[named_type.name] = weight
+
+        return weight
+
+    def _build_field_cost(self, field: GraphQLField) -> _FieldCost:
+        definition = get_strawberry_definition(field)
+        named_type = get_named_type(field.type)
+        cost = get_schema_directive(definition, _COST_DIRECTIVE)
+        # The weight of the type each value resolves to is added for
+        # interfaces and unions without a weight of their own
+        weight_by_type = (
+            cost is None
+            and is_abstract_type(named_type)
+            and get_schema_directive(
+                get_strawberry_definition(named_type), _COST_DIRECTIVE
+            )
+            is None
+        )
+
+        if cost is not None:
+            weight = cost.weight
+        elif weight_by_type:
+            weight = 0
+        else:
+            weight = self.get_type_weight(named_type)
+
+        list_size = get_schema_directive(definition, _LIST_SIZE_DIRECTIVE)
+
+        if list_size is not None and list_size.slicing_arguments:
+            slicing_arguments = tuple(list_size.slicing_arguments)
+        else:
+            slicing_arguments = tuple(
+                name for name in self.options.slicing_arguments if name in field.args
+            )
+
+        return _FieldCost(
+            weight=weight,
+            weight_by_type=weight_by_type,
+            is_list=_is_list_type(field.type),
+            named_type=named_type,
+            slicing_arguments=slicing_arguments,
+            assumed_size=(list_size.assumed_size or None) if list_size else None,
+            sized_fields=(
+                frozenset(list_size.sized_fields)
+                if list_size and list_size.sized_fields
+                else None
+            ),
+        )
+
+
+class _CostCalculator:
+    def __init__(
+        self,
+        analysis: QueryCostAnalysis,
+        fragments: dict[str, FragmentDefinitionNode],
+        variable_values: dict[str, Any],
+    ) -> None:
+        self.analysis = analysis
+        self.schema = analysis.schema
+        self.fragments = fragments
+        self.variable_values = variable_values
+        # The cost of the selections of each type, by field nodes: the nodes of
+        # a fragment spread in several places are only costed once
+        self._costs: dict[
+            tuple[str, tuple[int, ...], int | None, frozenset[str] | None], int
+        ] = {}
+
+    def selection_cost(
+        self,
+        parent_type: GraphQLObjectType,
+        fields: dict[str, list[FieldNode]],
+        list_size: int | None,
+        sized_fields: frozenset[str] | None,
+    ) -> int:
+        """Return the cost of the collected `fields` of `parent_type`.
+
+        `list_size` is the size set by the slicing arguments of the parent
+        field, it applies to the list fields in `sized_fields`, or to every
+        list field when `sized_fields` is `None`.
+        """
+        total = 0
+
+        for field_nodes in fields.values():
+            field_name = field_nodes[0].name.value
+
+            # Introspection fields don't have a cost
+            if field_name.startswith("__"):
+                continue
+
+            field = parent_type.fields.get(field_name)
+            if field is None:
+                continue
+
+            field_cost = self.analysis.get_field_cost(parent_type, field_name, field)
+            slice_size = self._get_slice_size(field, field_cost, field_nodes[0])
+
+            if field_cost.is_list:
+                if slice_size is None and (
+                    sized_fields is None or field_name in sized_fields
+                ):
+                    slice_size = list_size
+
+                size = (
+                    slice_size
+                    or field_cost.assumed_size
+                    or self.analysis.options.default_list_size
+                )
+                child_list_size = None
+            else:
+                size = 1
+                child_list_size = slice_size or field_cost.assumed_size
+
+            children = 0
+
+            if is_composite_type(field_cost.named_type):
+                children = self._composite_cost(
+                    field_cost, field_nodes, child_list_size
+                )
+
+            total += size * (field_cost.weight + children)
+
+        return total
+
+    def _composite_cost(
+        self,
+        field_cost: _FieldCost,
+        field_nodes: list[FieldNode],
+        list_size: int | None,
+    ) -> int:
+        named_type = field_cost.named_type
+
+        if is_abstract_type(named_type):
+            possible_types = self.schema.get_possible_types(named_type)  # type: ignore[arg-type]
+        else:
+            possible_types = [named_type]  # type: ignore[list-item]
+
+        node_ids = tuple(id(node) for node in field_nodes)
+
+        # The most expensive of the types the value may resolve to
+        return max(
+            (
+                self._subfields_cost(
+                    runtime_type, field_nodes, node_ids, list_size, field_cost
+                )
+                + (
+                    self.analysis.get_type_weight(runtime_type)
+                    if field_cost.weight_by_type
+                    else 0
+                )
+                for runtime_type in possible_types
+            ),
+            default=0,
+        )
+
+    def _subfields_cost(
+        self,
+        runtime_type: GraphQLObjectType,
+        field_nodes: list[FieldNode],
+        node_ids: tuple[int, ...],
+        list_size: int | None,
+        field_cost: _FieldCost,
+    ) -> int:
+        key = (runtime_type.name, node_ids, list_size, field_cost.sized_fields)
+
+        if (cost := self._costs.get(key)) is None:
+            cost = self._costs[key] = self.selection_cost(
+                runtime_type,
+                self._collect_subfields(runtime_type, field_nodes),
+                list_size,
+                field_cost.sized_fields,
+            )
+
+        return cost
+
+    def _collect_subfields(
+        self, runtime_type: GraphQLObjectType, field_nodes: list[FieldNode]
+    ) -> dict[str, list[FieldNode]]:
+        subfields: dict[str, list[FieldNode]] = {}
+
+        for node in field_nodes:
+            if node.selection_set is None:
+                continue
+
+            for response_name, nodes in collect_fields(
+                self.schema,
+                self.fragments,
+                self.variable_values,
+                runtime_type,
+                node.selection_set,
+            ).items():
+                subfields.setdefault(response_name, []).extend(nodes)
+
+        return subfields
+
+    def _get_slice_size(
+        self, field: GraphQLField, field_cost: _FieldCost, node: FieldNode
+    ) -> int | None:
+        if not field_cost.slicing_arguments or not node.arguments:
+            return None
+
+        arguments = get_argument_values(field, node, self.variable_values)
+        sizes = [
+            value
+            for name in field_cost.slicing_arguments
+            if isinstance(value := arguments.get(name), int)
+            and not isinstance(value, bool)
+        ]
+
+        return max(sizes, default=None)
+
+
+def _is_list_type(type_: GraphQLOutputType) -> bool:
+    if isinstance(type_, GraphQLNonNull):
+        type_ = type_.of_type
+
+    return isinstance(type_, GraphQLList)
+
+
+# Extensions are instantiated for each request, analyses are shared by every
+# limiter with the same options.
+_analyses: weakref.WeakKeyDictionary[
+    GraphQLSchema, dict[CostOptions, QueryCostAnalysis]
+] = weakref.WeakKeyDictionary()
+
+
+def get_query_cost_analysis(
+    schema: GraphQLSchema, options: CostOptions
+) -> QueryCostAnalysis:
+    analyses = _analyses.setdefault(schema, {})
+
+    if (analysis := analyses.get(options)) is None:
+        analysis = analyses[options] = QueryCostAnalysis(schema, options)
+
+    return analysis
+
+
+class QueryCostLimiter(SchemaExtension):
+    """Reject operations whose estimated cost is higher than `max_cost`.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.extensions import QueryCostLimiter
+
+    schema = strawberry.Schema(
+        Query,
+        extensions=[lambda: QueryCostLimiter(max_cost=1000)],
+    )
+    ```
+
+    The cost of the operation is added to the `cost` key of the response
+    extensions. Subscriptions aren't checked.
+    """
+
+    def __init__(
+        self,
+        max_cost: int,
+        *,
+        default_object_cost: int = 1,
+        default_scalar_cost: int = 0,
+        default_list_size: int = 10,
+        slicing_arguments: Iterable[str] = ("first", "last"),
+    ) -> None:
+        """Initialize the QueryCostLimiter.
+
+        Args:
+            max_cost: The maximum allowed cost of an operation.
+            default_object_cost: The weight of fields returning objects,
+                interfaces and unions without a `Cost` directive.
+            default_scalar_cost: The weight of fields returning scalars and
+                enums without a `Cost` directive.
+            default_list_size: The number of items assumed for list fields when
+                no slicing argument is passed and no size is declared with the
+                `ListSize` directive.
+            slicing_arguments: The arguments setting the number of items of
+                list and connection fields without a `ListSize` directive.
+        """
+        self.max_cost = max_cost
+        self.options = CostOptions(
+            default_object_cost=default_object_cost,
+            default_scalar_cost=default_scalar_cost,
+            default_list_size=default_list_size,
+            slicing_arguments=tuple(slicing_arguments),
+        )
+        self.cost: int | None = None
+
+    def on_execute(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+
+        if (
+            document is not None
+            and execution_context.result is None
+            and execution_context.operation_type != OperationType.SUBSCRIPTION
+        ):
+            analysis = get_query_cost_analysis(
+                execution_context.schema._schema, self.options
+            )
+            self.cost = analysis.get_cost(
+                document,
+                execution_context.operation_name,
+                execution_context.variables,
+            )
+
+            if self.cost is not None and self.cost > self.max_cost:
+                execution_context.result = GraphQLExecutionResult(
+                    data=None,
+                    errors=[
+                        GraphQLError(
+                            f"Query cost of {self.cost} exceeds the maximum"
+                            f" cost of {self.max_cost}."
+                        )
+                    ],
+                )
+
+        yield
+
+    def get_results(self) -> dict[str, Any]:
+        if self.cost is None:
+            return {}
+
+        return {"cost": {"requested": self.cost, "maximum": self.max_cost}}
+
+
+__all__ = ["QueryCostAnalysis", "QueryCostLimiter"]
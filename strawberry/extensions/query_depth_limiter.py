@@ -27,6 +27,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -120,10 +121,18 @@ class QueryDepthLimiter(AddValidationRules):
                 "The `should_ignore` argument to "
                 "`QueryDepthLimiter` must be a callable."
             )
-        validator = create_validator(max_depth, should_ignore, callback)
+        if should_ignore is None and callback is None:
+            validator = _get_validator(max_depth)
+        else:
+            validator = create_validator(max_depth, should_ignore, callback)
         super().__init__([validator])
 
 
+@functools.lru_cache(maxsize=128)
+def _get_validator(max_depth: int) -> type[ValidationRule]:
+    return create_validator(max_depth, None)
+
+
 def create_validator(
     max_depth: int,
     should_ignore: ShouldIgnoreType | None,
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    ValidationContext,
+    ValidationRule,
+)
+
+from strawberry.extensions.add_validation_rules import AddValidationRules
+from strawberry.extensions.query_depth_limiter import (
+    IgnoreContext,
+    ShouldIgnoreType,
+    get_field_arguments,
+    get_field_name,
+)
+from strawberry.extensions.utils import is_introspection_key
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from graphql import SelectionSetNode
+
+
+@dataclass
+class OperationMetrics:
+    """The size of an operation, with every fragment spread expanded."""
+
+    depth: int
+    alias_count: int
+    field_count: int
+    root_field_count: int
+    fragment_spread_count: int
+
+
+class _SelectionMetrics(NamedTuple):
+    depth: int
+    alias_count: int
+    field_count: int
+    # Fields of the selection set itself, through fragments
+    top_level_field_count: int
+    fragment_spread_count: int
+
+
+_EMPTY = _SelectionMetrics(0, 0, 0, 0, 0)
+
+
+class QueryLimiter(AddValidationRules):
+    """Add a validator limiting the depth and the size of GraphQL operations.
+
+    The depth, aliases, fields, root fields and fragment spreads of each
+    operation are counted in a single pass over the document, each fragment is
+    analysed once however many times it is spread.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.extensions import QueryLimiter
+
+    schema = strawberry.Schema(
+        Query,
+        extensions=[QueryLimiter(max_depth=10, max_alias_count=15)],
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_depth: int | None = None,
+        max_alias_count: int | None = None,
+        max_field_count: int | None = None,
+        max_root_field_count: int | None = None,
+        max_fragment_spread_count: int | None = None,
+        should_ignore: ShouldIgnoreType | None = None,
+        callback: Callable[[dict[str, OperationMetrics]], None] | None = None,
+    ) -> None:
+        """Initialize the QueryLimiter.
+
+        Each limit applies to every operation of a document, with fragment
+        spreads expanded. Limits set to `None` aren't checked.
+
+        Args:
+            max_depth: The maximum allowed depth of an operation.
+            max_alias_count: The maximum number of aliases in an operation.
+            max_field_count: The maximum number of fields in an operation.
+            max_root_field_count: The maximum number of root fields of an
+                operation.
+            max_fragment_spread_count: The maximum number of fragment spreads
+                in an operation, counting the spreads inside each spread
+                fragment.
+            should_ignore: Stops recursive depth checking based on a field name
+                and arguments, like for `QueryDepthLimiter`.
+            callback: Called each time validation runs. Receives a map of the
+                metrics of each operation.
+        """
+        if should_ignore is not None and not callable(should_ignore):
+            raise TypeError(
+                "The `should_ignore` argument to `QueryLimiter` must be a callable."
+            )
+
+        all_limits = {
+            "operation depth": max_depth,
+            "alias count": max_alias_count,
+            "field count": max_field_count,
+            "root field count": max_root_field_count,
+            "fragment spread count": max_fragment_spread_count,
+        }
+        limits = {
+            name: limit for name, limit in all_limits.items() if limit is not None
+        }
+
+        if should_ignore is None and callback is None:
+            validator = _get_validator(tuple(limits.items()))
+        else:
+            validator = create_validator(limits, should_ignore, callback)
+        super().__init__([validator])
+
+
+@functools.lru_cache(maxsize=128)
+def _get_validator(limits: tuple[tuple[str, int], ...]) -> type[ValidationRule]:
+    return create_validator(dict(limits), None)
+
+
+def create_validator(
+    limits: dict[str, int],
+    should_ignore: ShouldIgnoreType | None,
+    callback: Callable[[dict[str, OperationMetrics]], None] | None = None,
+) -> type[ValidationRule]:
+    class QueryLimitValidator(ValidationRule):
+        def __init__(self, validation_context: ValidationContext) -> None:
+            analyzer = _DocumentAnalyzer(validation_context, should_ignore)
+            operations_metrics = {}
+
+            for definition in validation_context.document.definitions:
+                if not isinstance(definition, OperationDefinitionNode):
+                    continue
+
+                name = definition.name.value if definition.name else "anonymous"
+                metrics = analyzer.analyze_operation(definition)
+                operations_metrics[name] = metrics
+
+                values = {
+                    "operation depth": metrics.depth,
+                    "alias count": metrics.alias_count,
+                    "field count": metrics.field_count,
+                    "root field count": metrics.root_field_count,
+                    "fragment spread count": metrics.fragment_spread_count,
+                }
+
+                for limit_name, limit in limits.items():
+                    if values[limit_name] > limit:
+                        validation_context.report_error(
+                            GraphQLError(
+                                f"'{name}' exceeds maximum {limit_name} of {limit}",
+                                [definition],
+                            )
+                        )
+
+            if callable(callback):
+                callback(operations_metrics)
+
+            super().__init__(validation_context)
+
+    return QueryLimitValidator
+
+
+class _DocumentAnalyzer:
+    def __init__(
+        self,
+        context: ValidationContext,
+        should_ignore: ShouldIgnoreType | None,
+    ) -> None:
+        self.context = context
+        self.should_ignore = should_ignore
+        self.fragments = {
+            definition.name.value: definition
+            for definition in context.document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        # Fragment name -> metrics, `None` while the fragment is being analysed
+        # so that fragment cycles are only followed once
+        self.fragment_metrics: dict[str, _SelectionMetrics | None] = {}
+
+    def analyze_operation(self, operation: OperationDefinitionNode) -> OperationMetrics:
+        metrics = self._analyze_selection_set(operation.selection_set)
+
+        return OperationMetrics(
+            depth=metrics.depth,
+            alias_count=metrics.alias_count,
+            field_count=metrics.field_count,
+            root_field_count=metrics.top_level_field_count,
+            fragment_spread_count=metrics.fragment_spread_count,
+        )
+
+    def _analyze_selection_set(
+        self, selection_set: SelectionSetNode
+    ) -> _SelectionMetrics:
+        depth = alias_count = field_count = top_level_field_count = spreads = 0
+
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                metrics = self._analyze_field(selection)
+                depth = max(depth, metrics.depth)
+                top_level_field_count += 1
+            elif isinstance(selection, FragmentSpreadNode):
+                metrics = self._analyze_fragment(selection.name.value)
+                depth = max(depth, metrics.depth)
+                top_level_field_count += metrics.top_level_field_count
+                spreads += 1
+            elif isinstance(selection, InlineFragmentNode):
+                metrics = self._analyze_selection_set(selection.selection_set)
+                depth = max(depth, metrics.depth)
+                top_level_field_count += metrics.top_level_field_count
+            else:  # pragma: no cover
+                continue
+
+            alias_count += metrics.alias_count
+            field_count += metrics.field_count
+            spreads += metrics.fragment_spread_count
+
+        return _SelectionMetrics(
+            depth, alias_count, field_count, top_level_field_count, spreads
+        )
+
+    def _analyze_field(self, node: FieldNode) -> _SelectionMetrics:
+        alias_count = 1 if node.alias else 0
+
+        if node.selection_set is None:
+            return _SelectionMetrics(0, alias_count, 1, 1, 0)
+
+        metrics = self._analyze_selection_set(node.selection_set)
+
+        # Like `QueryDepthLimiter`, introspection fields and ignored fields
+        # don't count towards the depth of the operation
+        ignored = is_introspection_key(node.name.value) or (
+            self.should_ignore is not None
+            and self.should_ignore(
+                IgnoreContext(
+                    get_field_name(node),
+                    get_field_arguments(node),
+                    node,
+                    self.context,
+                )
+            )
+        )
+
+        return _SelectionMetrics(
+            0 if ignored else metrics.depth + 1,
+            alias_count + metrics.alias_count,
+            metrics.field_count + 1,
+            1,
+            metrics.fragment_spread_count,
+        )
+
+    def _analyze_fragment(self, name: str) -> _SelectionMetrics:
+        if name in self.fragment_metrics:
+            return self.fragment_metrics[name] or _EMPTY
+
+        fragment = self.fragments.get(name)
+        if fragment is None:
+            return _EMPTY
+
+        self.fragment_metrics[name] = None
+        metrics = self.fragment_metrics[name] = self._analyze_selection_set(
+            fragment.selection_set
+        )
+
+        return metrics
+
+
+__all__ = ["OperationMetrics", "QueryLimiter"]
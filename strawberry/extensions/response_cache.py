@@ -0,0 +1,599 @@
+"""Cache the results of whole query operations.
+
+The cache policy of an operation is aggregated from the `CacheControl` hints
+of the fields it selects and of the types they return: its max age is the
+lowest max age of those fields, and it is private as soon as one of them is.
+Policies only depend on the document and the operation, so they are computed
+once per document.
+
+Results of operations with a positive max age are stored, keyed by the
+document, the operation, the variables and, for private results, the
+principal of the request, along with the ETag of the result. The policy is
+added to the `cacheControl` key of the response extensions, from which the
+HTTP views set the `Cache-Control`, `ETag` and `Vary` headers of the response.
+
+HTTP views execute operations in a `conditional_request`. When the
+`If-None-Match` header of the request matches the ETag of the stored result,
+the operation isn't executed and the view answers with `304 Not Modified`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import weakref
+from contextvars import ContextVar
+from inspect import isawaitable, iscoroutine
+from typing import TYPE_CHECKING, Any
+
+from graphql import (
+    ExecutionResult as GraphQLExecutionResult,
+)
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    OperationType,
+    get_named_type,
+    is_abstract_type,
+    is_composite_type,
+)
+
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.extensions.field_cache import InMemoryResolverCache
+from strawberry.extensions.utils import get_schema_directive, get_strawberry_definition
+from strawberry.schema_directives import CacheControlScope
+from strawberry.types.unset import UNSET
+from strawberry.utils.await_maybe import await_maybe
+from strawberry.utils.operation import get_operation_key
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Hashable, Iterator
+
+    from graphql import (
+        DocumentNode,
+        GraphQLField,
+        GraphQLNamedType,
+        GraphQLSchema,
+        SelectionSetNode,
+    )
+
+    from strawberry.extensions.field_cache import ResolverCacheStore
+
+# The `CacheControl` schema directive
+_CACHE_CONTROL_DIRECTIVE = "cacheControl"
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheControlPolicy:
+    """The cache policy of an operation."""
+
+    max_age: int
+    scope: CacheControlScope = CacheControlScope.PUBLIC
+
+    @property
+    def is_private(self) -> bool:
+        return self.scope is CacheControlScope.PRIVATE
+
+
+@dataclasses.dataclass
+class ConditionalRequest:
+    """The `If-None-Match` header of a request and the ETag of its result."""
+
+    if_none_match: str | None = None
+    # Set by `ResponseCache` when the result is stored or found in the store
+    etag: str | None = None
+    # Whether the stored result matched `if_none_match` and wasn't executed
+    not_modified: bool = False
+
+    def matches(self, etag: str) -> bool:
+        if self.if_none_match is None:
+            return False
+
+        return any(
+            tag.strip() in ("*", etag, f"W/{etag}")
+            for tag in self.if_none_match.split(",")
+        )
+
+
+_conditional_request: ContextVar[ConditionalRequest | None] = ContextVar(
+    "strawberry_conditional_request", default=None
+)
+
+
+@contextlib.contextmanager
+def conditional_request(if_none_match: str | None) -> Iterator[ConditionalRequest]:
+    """Execute the block's operation as a request with an `If-None-Match` header.
+
+    Pass `None` for requests without the header, or that aren't GET requests,
+    to only receive the ETag of the result.
+    """
+    request = ConditionalRequest(if_none_match)
+    token = _conditional_request.set(request)
+
+    try:
+        yield request
+    finally:
+        _conditional_request.reset(token)
+
+
+def get_etag(data: Any) -> str:
+    """Return the ETag of the data of a result."""
+    body = json.dumps(data, separators=(",", ":")).encode()
+
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+@dataclasses.dataclass(frozen=True)
+class _CacheHint:
+    max_age: int | None = None
+    private: bool = False
+    inherit_max_age: bool = False
+
+
+_NO_HINT = _CacheHint()
+
+
+class _PolicyCalculator:
+    def __init__(
+        self,
+        analysis: CacheControlAnalysis,
+        fragments: dict[str, FragmentDefinitionNode],
+    ) -> None:
+        self.analysis = analysis
+        self.fragments = fragments
+        self.max_age: int | None = None
+        self.private = False
+        self._visited: set[tuple[str, str, int | None]] = set()
+
+    def visit_selection_set(
+        self,
+        parent_type: GraphQLNamedType,
+        selection_set: SelectionSetNode,
+        parent_max_age: int | None,
+    ) -> None:
+        # `@skip` and `@include` are ignored, the policy covers every field
+        # the operation can select.
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                self.visit_field(parent_type, selection, parent_max_age)
+            elif isinstance(selection, InlineFragmentNode):
+                type_ = parent_type
+
+                if selection.type_condition is not None:
+                    type_ = self.analysis.schema.get_type(
+                        selection.type_condition.name.value
+                    )
+
+                if type_ is not None:
+                    self.visit_selection_set(
+                        type_, selection.selection_set, parent_max_age
+                    )
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                key = (name, parent_type.name, parent_max_age)
+
+                if fragment is None or key in self._visited:
+                    continue
+
+                self._visited.add(key)
+                type_ = self.analysis.schema.get_type(
+                    fragment.type_condition.name.value
+                )
+
+                if type_ is not None:
+                    self.visit_selection_set(
+                        type_, fragment.selection_set, parent_max_age
+                    )
+
+    def visit_field(
+        self,
+        parent_type: GraphQLNamedType,
+        node: FieldNode,
+        parent_max_age: int | None,
+    ) -> None:
+        name = node.name.value
+
+        if name.startswith("__"):
+            return
+
+        fields = getattr(parent_type, "fields", None) or {}
+
+        if (field := fields.get(name)) is None:
+            return
+
+        named_type = get_named_type(field.type)
+        composite = is_composite_type(named_type)
+        field_hint = self.analysis.get_field_hint(parent_type, name, field)
+        type_hint = self.analysis.get_type_hint(named_type)
+        is_root = parent_max_age is None
+
+        if field_hint.max_age is not None:
+            max_age = field_hint.max_age
+        elif field_hint.inherit_max_age and not is_root:
+            max_age = None
+        elif composite and type_hint.max_age is not None:
+            max_age = type_hint.max_age
+        elif composite or is_root:
+            max_age = self.analysis.default_max_age
+        else:
+            # Scalars use the max age of their parent field
+            max_age = None
+
+        if max_age is not None:
+            self.max_age = (
+                max_age if self.max_age is None else min(self.max_age, max_age)
+            )
+
+        self.private = self.private or field_hint.private or type_hint.private
+
+        if composite and node.selection_set is not None:
+            self.visit_selection_set(
+                named_type,
+                node.selection_set,
+                parent_max_age if max_age is None else max_age,
+            )
+
+
+class CacheControlAnalysis:
+    """Compute and cache the cache policy of the operations run against a schema."""
+
+    def __init__(self, schema: GraphQLSchema, default_max_age: int) -> None:
+        self.schema = schema
+        self.default_max_age = default_max_age
+        self._fields: dict[tuple[str, str], _CacheHint] = {}
+        self._types: dict[str, _CacheHint] = {}
+        self._policies: weakref.WeakKeyDictionary[
+            DocumentNode, dict[str | None, CacheControlPolicy | None]
+        ] = weakref.WeakKeyDictionary()
+
+    def get_policy(
+        self, document: DocumentNode, operation_name: str | None
+    ) -> CacheControlPolicy | None:
+        """Return the policy of a query of a validated document.
+
+        Returns `None` for mutations, subscriptions and operations that can't
+        be selected.
+        """
+        policies = self._policies.setdefault(document, {})
+
+        if operation_name not in policies:
+            policies[operation_name] = self._compute_policy(document, operation_name)
+
+        return policies[operation_name]
+
+    def _compute_policy(
+        self, document: DocumentNode, operation_name: str | None
+    ) -> CacheControlPolicy | None:
+        operation: OperationDefinitionNode | None = None
+        fragments: dict[str, FragmentDefinitionNode] = {}
+
+        for definition in document.definitions:
+            if isinstance(definition, OperationDefinitionNode):
+                if operation_name is None:
+                    if operation is not None:
+                        return None
+                    operation = definition
+                elif definition.name and definition.name.value == operation_name:
+                    operation = definition
+            elif isinstance(definition, FragmentDefinitionNode):
+                fragments[definition.name.value] = definition
+
+        if operation is None or operation.operation != OperationType.QUERY:
+            return None
+
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return None
+
+        calculator = _PolicyCalculator(self, fragments)
+        calculator.visit_selection_set(root_type, operation.selection_set, None)
+
+        return CacheControlPolicy(
+            max_age=self.default_max_age
+            if calculator.max_age is None
+            else calculator.max_age,
+            scope=CacheControlScope.PRIVATE
+            if calculator.private
+            else CacheControlScope.PUBLIC,
+        )
+
+    def get_field_hint(
+        self, parent_type: GraphQLNamedType, field_name: str, field: GraphQLField
+    ) -> _CacheHint:
+        key = (parent_type.name, field_name)
+
+        if (hint := self._fields.get(key)) is None:
+            hint = self._fields[key] = _get_hint(get_strawberry_definition(field))
+
+        return hint
+
+    def get_type_hint(self, named_type: GraphQLNamedType) -> _CacheHint:
+        if (hint := self._types.get(named_type.name)) is None:
+            hint = _get_hint(get_strawberry_definition(named_type))
+
+            if is_abstract_type(named_type) and hint.max_age is None:
+                # Without their own hint, interfaces and unions are as
+                # cacheable as their least cacheable implementation.
+                possible_hints = [
+                    self.get_type_hint(possible_type)
+                    for possible_type in self.schema.get_possible_types(named_type)
+                ]
+                max_ages = [
+                    possible_hint.max_age
+                    for possible_hint in possible_hints
+                    if possible_hint.max_age is not None
+                ]
+                hint = _CacheHint(
+                    max_age=min(max_ages) if max_ages else None,
+                    private=hint.private
+                    or any(possible_hint.private for possible_hint in possible_hints),
+                )
+
+            self._types[named_type.name] = hint
+
+        return hint
+
+
+def _get_hint(definition: Any) -> _CacheHint:
+    cache_control = get_schema_directive(definition, _CACHE_CONTROL_DIRECTIVE)
+
+    if cache_control is None:
+        return _NO_HINT
+
+    return _CacheHint(
+        max_age=None
+        if cache_control.max_age in (UNSET, None)
+        else cache_control.max_age,
+        private=cache_control.scope == CacheControlScope.PRIVATE,
+        inherit_max_age=bool(cache_control.inherit_max_age),
+    )
+
+
+# Extensions are instantiated for each request, analyses and default stores
+# are shared by every extension with the same options.
+_analyses: weakref.WeakKeyDictionary[GraphQLSchema, dict[int, CacheControlAnalysis]] = (
+    weakref.WeakKeyDictionary()
+)
+_default_stores: weakref.WeakKeyDictionary[
+    GraphQLSchema, dict[int | None, InMemoryResolverCache]
+] = weakref.WeakKeyDictionary()
+
+
+def get_cache_control_analysis(
+    schema: GraphQLSchema, default_max_age: int
+) -> CacheControlAnalysis:
+    analyses = _analyses.setdefault(schema, {})
+
+    if (analysis := analyses.get(default_max_age)) is None:
+        analysis = analyses[default_max_age] = CacheControlAnalysis(
+            schema, default_max_age
+        )
+
+    return analysis
+
+
+def _get_default_store(
+    schema: GraphQLSchema, maxsize: int | None
+) -> InMemoryResolverCache:
+    stores = _default_stores.setdefault(schema, {})
+
+    if (store := stores.get(maxsize)) is None:
+        store = stores[maxsize] = InMemoryResolverCache(maxsize=maxsize)
+
+    return store
+
+
+class _ResponseCacheBase(SchemaExtension):
+    def __init__(
+        self,
+        *,
+        store: ResolverCacheStore | None = None,
+        default_max_age: int = 0,
+        principal: Callable[[Any], Hashable | None] | None = None,
+        maxsize: int | None = 1000,
+    ) -> None:
+        """Initialize the extension.
+
+        Args:
+            store: Where to keep the results, defaults to an in-memory LRU
+                store shared by every instance with the same `maxsize`.
+            default_max_age: The max age of root fields, and of fields
+                returning objects, interfaces or unions, without a
+                `CacheControl` hint.
+            principal: Returns a value identifying who private results belong
+                to from the context of the request, for example the current
+                user. Private results are only cached when it isn't `None`.
+            maxsize: The number of results the default store keeps.
+        """
+        super().__init__()
+        self._store = store
+        self.default_max_age = default_max_age
+        self.principal = principal
+        self.maxsize = maxsize
+        self.policy: CacheControlPolicy | None = None
+        self._cache_key: str | None = None
+        self._hit = False
+
+    @property
+    def store(self) -> ResolverCacheStore:
+        if self._store is None:
+            self._store = _get_default_store(
+                self.execution_context.schema._schema, self.maxsize
+            )
+
+        return self._store
+
+    def _start_execution(self) -> str | None:
+        """Return the key to look up in the store, if the result is cacheable."""
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+
+        if document is None or execution_context.result is not None:
+            return None
+
+        analysis = get_cache_control_analysis(
+            execution_context.schema._schema, self.default_max_age
+        )
+        policy = self.policy = analysis.get_policy(
+            document, execution_context.operation_name
+        )
+
+        if policy is None or policy.max_age <= 0:
+            return None
+
+        principal = None
+
+        if policy.is_private:
+            if self.principal is not None:
+                principal = self.principal(execution_context.context)
+
+            if principal is None:
+                return None
+
+        self._cache_key = get_operation_key(
+            document,
+            execution_context.operation_name,
+            execution_context.variables,
+            principal,
+        )
+
+        return self._cache_key
+
+    def _set_cached_result(self, cached: tuple[Any, str] | None) -> None:
+        if cached is None:
+            return
+
+        data, etag = cached
+        self._hit = True
+        self.execution_context.result = GraphQLExecutionResult(data=data, errors=None)
+
+        if (request := _conditional_request.get()) is not None:
+            request.etag = etag
+            request.not_modified = request.matches(etag)
+
+    def _get_result_to_store(self) -> tuple[Any, str] | None:
+        result = self.execution_context.result
+
+        if (
+            self._cache_key is None
+            or self._hit
+            or not isinstance(result, GraphQLExecutionResult)
+            or result.errors
+            or result.data is None
+        ):
+            return None
+
+        etag = get_etag(result.data)
+
+        if (request := _conditional_request.get()) is not None:
+            request.etag = etag
+
+        return (result.data, etag)
+
+    def get_results(self) -> dict[str, Any]:
+        if self.policy is None:
+            return {}
+
+        return {
+            "cacheControl": {
+                "maxAge": self.policy.max_age,
+                "scope": self.policy.scope.value,
+            }
+        }
+
+
+class ResponseCache(_ResponseCacheBase):
+    """Cache the results of queries, following their `CacheControl` hints.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.extensions import ResponseCache
+    from strawberry.schema_directives import CacheControl
+
+
+    @strawberry.type(directives=[CacheControl(max_age=60)])
+    class Book:
+        title: str
+
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(directives=[CacheControl(max_age=30)])
+        def books(self) -> list[Book]: ...
+
+
+    schema = strawberry.Schema(
+        Query,
+        extensions=[ResponseCache],
+    )
+    ```
+
+    Results with errors aren't cached, and mutations and subscriptions are
+    never cached.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        if cache_key := self._start_execution():
+            self._set_cached_result(await await_maybe(self.store.get(cache_key)))
+
+        yield
+
+        if (value := self._get_result_to_store()) is not None:
+            assert self._cache_key is not None
+            assert self.policy is not None
+
+            await await_maybe(
+                self.store.set(self._cache_key, value, self.policy.max_age)
+            )
+
+
+class ResponseCacheSync(_ResponseCacheBase):
+    """Synchronous version of `ResponseCache`, for `Schema.execute_sync`.
+
+    The store must be synchronous.
+    """
+
+    def on_execute(self) -> Iterator[None]:
+        if cache_key := self._start_execution():
+            self._set_cached_result(_ensure_sync(self.store.get(cache_key)))
+
+        yield
+
+        if (value := self._get_result_to_store()) is not None:
+            assert self._cache_key is not None
+            assert self.policy is not None
+
+            _ensure_sync(self.store.set(self._cache_key, value, self.policy.max_age))
+
+
+def _ensure_sync(value: Any) -> Any:
+    if isawaitable(value):
+        if iscoroutine(value):
+            value.close()
+
+        raise RuntimeError(
+            "ResponseCacheSync requires a synchronous store, "
+            "use ResponseCache with async stores"
+        )
+
+    return value
+
+
+__all__ = [
+    "CacheControlAnalysis",
+    "CacheControlPolicy",
+    "ConditionalRequest",
+    "ResponseCache",
+    "ResponseCacheSync",
+    "conditional_request",
+    "get_cache_control_analysis",
+    "get_etag",
+]
@@ -0,0 +1,175 @@
+"""Share the execution of identical concurrent queries.
+
+While a query is executing, requests for the same operation, with the same
+variables and in the same scope, wait for its result instead of executing the
+operation again. Each request still runs its own extensions and processes the
+errors of the shared result on its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from graphql import ExecutionResult as GraphQLExecutionResult
+
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.extensions.metrics import default_registry
+from strawberry.types.graphql import OperationType
+from strawberry.utils.operation import get_operation_key
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Hashable, Iterator
+
+    from graphql import GraphQLSchema
+
+    from strawberry.extensions.metrics import MetricsRegistry
+
+# The queries executing against each schema, by event loop and operation key.
+# The result is `None` when the query didn't produce a result to share.
+_in_flight: weakref.WeakKeyDictionary[
+    GraphQLSchema,
+    dict[tuple[int, str], asyncio.Future[GraphQLExecutionResult | None]],
+] = weakref.WeakKeyDictionary()
+
+
+class _SingleFlightBase(SchemaExtension):
+    def __init__(
+        self,
+        *,
+        scope: Callable[[Any], Hashable | None],
+        registry: MetricsRegistry | None = None,
+    ) -> None:
+        """Initialize the extension.
+
+        Args:
+            scope: Returns the scope of the request from its context, only
+                requests in the same scope share results. Requests whose scope
+                is `None` aren't coalesced. Returning the same value for every
+                request is only correct when results don't depend on who is
+                asking.
+            registry: Where the number of executed and coalesced operations is
+                recorded, defaults to the default registry of
+                `MetricsExtension`.
+        """
+        super().__init__()
+        self.scope = scope
+        self.registry = registry if registry is not None else default_registry
+
+    def _get_key(self) -> tuple[int, str] | None:
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+
+        if (
+            document is None
+            or execution_context.result is not None
+            or execution_context.pre_execution_errors
+        ):
+            return None
+
+        try:
+            if execution_context.operation_type != OperationType.QUERY:
+                return None
+        except RuntimeError:
+            # The operation can't be selected, execution reports the error
+            return None
+
+        scope = self.scope(execution_context.context)
+
+        if scope is None:
+            return None
+
+        key = get_operation_key(
+            document,
+            execution_context.operation_name,
+            execution_context.variables,
+            scope,
+        )
+
+        return id(asyncio.get_running_loop()), key
+
+
+class SingleFlight(_SingleFlightBase):
+    """Execute identical concurrent queries once.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.extensions import SingleFlight
+
+    schema = strawberry.Schema(
+        Query,
+        extensions=[
+            lambda: SingleFlight(scope=lambda context: context["user"].id),
+        ],
+    )
+    ```
+
+    Only queries are coalesced, with asynchronous execution; use
+    `SingleFlightSync` with `Schema.execute_sync`. The number of executed and
+    coalesced operations is recorded in the metrics registry.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        key = self._get_key()
+
+        if key is None:
+            yield
+            return
+
+        in_flight = _in_flight.setdefault(self.execution_context.schema._schema, {})
+
+        if (leader := in_flight.get(key)) is not None:
+            # Cancelling a request doesn't cancel the execution it waits for
+            result = await asyncio.shield(leader)
+
+            if result is not None:
+                self.registry.count_single_flight(coalesced=True)
+                # Extensions of this request may change the data
+                self.execution_context.result = GraphQLExecutionResult(
+                    data=copy.deepcopy(result.data),
+                    errors=list(result.errors) if result.errors else None,
+                )
+
+                yield
+                return
+
+            # The execution failed without a result, run this one on its own
+            self.registry.count_single_flight(coalesced=False)
+
+            yield
+            return
+
+        future: asyncio.Future[GraphQLExecutionResult | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        in_flight[key] = future
+        self.registry.count_single_flight(coalesced=False)
+
+        try:
+            yield
+        finally:
+            if in_flight.get(key) is future:
+                del in_flight[key]
+
+            result = self.execution_context.result
+            future.set_result(
+                result if isinstance(result, GraphQLExecutionResult) else None
+            )
+
+
+class SingleFlightSync(_SingleFlightBase):
+    """Synchronous version of `SingleFlight`, for `Schema.execute_sync`.
+
+    Synchronous executions have no event loop to wait for each other on, so
+    every operation is executed on its own.
+    """
+
+    def on_execute(self) -> Iterator[None]:
+        yield
+
+
+__all__ = ["SingleFlight", "SingleFlightSync"]
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any
 from strawberry.extensions import SchemaExtension
 from strawberry.extensions.utils import get_path_from_info
 
-from .utils import should_skip_tracing
+from .utils import TRACING_FIELD_FILTER, should_skip_tracing
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
@@ -82,6 +82,8 @@ class ApolloTracingStats:
 
 
 class ApolloTracingExtension(SchemaExtension):
+    resolve_filter = TRACING_FIELD_FILTER
+
     def __init__(self, *, execution_context: ExecutionContext | None = None) -> None:
         super().__init__(execution_context=execution_context)
         # ``execution_context`` is set by the schema right after construction;
@@ -71,7 +71,7 @@ from typing import TYPE_CHECKING, Any
 
 from strawberry.extensions import SchemaExtension
 
-from .utils import should_skip_tracing
+from .utils import TRACING_FIELD_FILTER, should_skip_tracing
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
@@ -293,6 +293,8 @@ class ApolloFederationTracingExtension(SchemaExtension):
     it in the response as a base64-encoded protobuf under extensions.ftv1.
     """
 
+    resolve_filter = TRACING_FIELD_FILTER
+
     def __init__(self, *, execution_context: ExecutionContext | None = None) -> None:
         super().__init__(execution_context=execution_context)
         # ``execution_context`` is set by the schema right after construction;
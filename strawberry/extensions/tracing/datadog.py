@@ -9,7 +9,10 @@ import ddtrace
 from packaging import version
 
 from strawberry.extensions import LifecycleStep, SchemaExtension
-from strawberry.extensions.tracing.utils import should_skip_tracing
+from strawberry.extensions.tracing.utils import (
+    TRACING_FIELD_FILTER,
+    should_skip_tracing,
+)
 
 parsed_ddtrace_version = version.parse(ddtrace.__version__)
 if parsed_ddtrace_version >= version.parse("3.0.0"):
@@ -27,6 +30,8 @@ if TYPE_CHECKING:
 
 
 class DatadogTracingExtension(SchemaExtension):
+    resolve_filter = TRACING_FIELD_FILTER
+
     def __init__(
         self,
         *,
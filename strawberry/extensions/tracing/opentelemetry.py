@@ -14,7 +14,7 @@ from opentelemetry.trace import SpanKind
 from strawberry.extensions import LifecycleStep, SchemaExtension
 from strawberry.extensions.utils import get_path_from_info
 
-from .utils import should_skip_tracing
+from .utils import TRACING_FIELD_FILTER, should_skip_tracing
 
 if TYPE_CHECKING:
     from collections.abc import Generator, Iterable
@@ -31,6 +31,8 @@ ArgFilter = Callable[[dict[str, Any], "GraphQLResolveInfo"], dict[str, Any]]
 
 
 class OpenTelemetryExtension(SchemaExtension):
+    resolve_filter = TRACING_FIELD_FILTER
+
     _arg_filter: ArgFilter | None
     _span_holder: dict[LifecycleStep, Span]
     _tracer: Tracer
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from strawberry.extensions.field_filter import FieldFilter
 from strawberry.extensions.utils import is_introspection_field
 from strawberry.resolvers import is_default_resolver
 
@@ -11,6 +12,10 @@ if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
 
 
+# Lets the executor skip the fields `should_skip_tracing` would skip
+TRACING_FIELD_FILTER = FieldFilter(skip_basic_fields=True, skip_introspection=True)
+
+
 def should_skip_tracing(resolver: Callable[..., Any], info: GraphQLResolveInfo) -> bool:
     if info.field_name not in info.parent_type.fields:
         return True
@@ -22,4 +27,4 @@ def should_skip_tracing(resolver: Callable[..., Any], info: GraphQLResolveInfo)
     )
 
 
-__all__ = ["should_skip_tracing"]
+__all__ = ["TRACING_FIELD_FILTER", "should_skip_tracing"]
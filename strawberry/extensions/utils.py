@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
@@ -37,4 +37,28 @@ def get_path_from_info(info: GraphQLResolveInfo) -> list[str]:
     return elements[::-1]
 
 
-__all__ = ["get_path_from_info", "is_introspection_field", "is_introspection_key"]
+def get_strawberry_definition(graphql_object: Any) -> Any:
+    """Return the Strawberry definition a GraphQL type or field was built from."""
+    extensions = getattr(graphql_object, "extensions", None) or {}
+
+    return extensions.get("strawberry-definition")
+
+
+def get_schema_directive(definition: Any, name: str) -> Any:
+    """Return the schema directive named `name` applied to `definition`."""
+    for directive in getattr(definition, "directives", None) or ():
+        schema_directive = getattr(directive, "__strawberry_directive__", None)
+
+        if schema_directive is not None and schema_directive.graphql_name == name:
+            return directive
+
+    return None
+
+
+__all__ = [
+    "get_path_from_info",
+    "get_schema_directive",
+    "get_strawberry_definition",
+    "is_introspection_field",
+    "is_introspection_key",
+]
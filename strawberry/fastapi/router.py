@@ -31,6 +31,7 @@ from strawberry.asgi import ASGIWebSocketAdapter
 from strawberry.exceptions import InvalidCustomContext
 from strawberry.fastapi.context import BaseContext, CustomContext
 from strawberry.http.async_base_view import AsyncBaseHTTPView
+from strawberry.http.disconnect import wait_for_asgi_disconnect
 from strawberry.http.typevars import RootValue
 from strawberry.subscriptions import GRAPHQL_TRANSPORT_WS_PROTOCOL, GRAPHQL_WS_PROTOCOL
 
@@ -64,6 +65,7 @@ class GraphQLRouter(
     allow_queries_via_get = True
     request_adapter_class = StarletteRequestAdapter
     websocket_adapter_class = ASGIWebSocketAdapter  # type: ignore
+    cancel_on_disconnect = True
 
     @staticmethod
     async def __get_root_value() -> None:
@@ -284,6 +286,15 @@ class GraphQLRouter(
 
         return response
 
+    async def wait_for_disconnect(self, request: Request) -> bool:
+        return await wait_for_asgi_disconnect(request.receive)
+
+    def create_not_modified_response(self, sub_response: Response) -> Response:
+        response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        response.headers.raw.extend(sub_response.headers.raw)
+
+        return response
+
     async def create_streaming_response(
         self,
         request: Request,
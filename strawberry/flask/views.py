@@ -58,6 +58,11 @@ class BaseGraphQLView:
 
         return sub_response
 
+    def create_not_modified_response(self, sub_response: Response) -> Response:
+        sub_response.status_code = 304
+
+        return sub_response
+
 
 class GraphQLView(
     BaseGraphQLView,
@@ -47,6 +47,8 @@ class GraphQLRequestData:
     operation_name: str | None
     extensions: dict[str, Any] | None
     protocol: GraphQLRequestProtocol = "http"
+    # the id of a trusted document, sent instead of the query
+    document_id: str | None = None
 
 
 __all__ = [
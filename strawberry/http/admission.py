@@ -0,0 +1,269 @@
+"""Admission control for the async HTTP views.
+
+At most `max_in_flight` requests execute at once in a worker. Further requests
+wait in a bounded queue, ordered by their priority, and are rejected with a
+`503 Service Unavailable` (or the configured status) and a `Retry-After` header
+when the queue is full or when they wait longer than `queue_timeout`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import heapq
+import itertools
+from typing import TYPE_CHECKING
+
+from graphql import GraphQLError
+from graphql.language import Lexer, Source, TokenKind
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+
+    from strawberry.http import GraphQLRequestData
+
+_OPERATION_TYPES = frozenset({"query", "mutation", "subscription"})
+
+
+class OperationRejectedError(Exception):
+    """The request wasn't admitted, the worker is overloaded."""
+
+    def __init__(self, reason: str, status_code: int, retry_after: int) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+@dataclasses.dataclass(frozen=True)
+class AdmissionStats:
+    """A snapshot of the activity of an `AdmissionController`."""
+
+    max_in_flight: int
+    max_queued: int
+    # Requests executing
+    in_flight: int
+    # Requests waiting for a free slot
+    queued: int
+    admitted: int
+    rejected: int
+    timed_out: int
+
+
+class AdmissionController:
+    """Limit the number of requests executing at once in a worker.
+
+    Requests are given a priority from the name or the type of their operation,
+    lower values are admitted first. When the queue is full, a request evicts
+    the queued request with the lowest priority if its own is higher, and is
+    rejected otherwise.
+
+    Each HTTP request takes one slot, a batch included. Subscriptions and
+    streamed responses only hold their slot until the response starts.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        *,
+        max_queued: int = 0,
+        queue_timeout: float = 1.0,
+        priorities: Mapping[str, int] | None = None,
+        default_priority: int = 0,
+        status_code: int = 503,
+        retry_after: int = 1,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            max_in_flight: The number of requests executing at once.
+            max_queued: The number of requests waiting for a slot, requests are
+                rejected right away when there are no free slots by default.
+            queue_timeout: The number of seconds a request waits for a slot
+                before being rejected.
+            priorities: The priority of operations, by operation name or by
+                operation type (`"query"`, `"mutation"` or `"subscription"`).
+                Names take precedence over types.
+            default_priority: The priority of operations not in `priorities`.
+            status_code: The status of rejected responses, e.g. `429`.
+            retry_after: The value of the `Retry-After` header of rejected
+                responses, in seconds.
+        """
+        if max_in_flight < 1:
+            raise ValueError("`max_in_flight` must be at least 1")
+
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.priorities = dict(priorities or {})
+        self.default_priority = default_priority
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self._in_flight = 0
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    def stats(self) -> AdmissionStats:
+        return AdmissionStats(
+            max_in_flight=self.max_in_flight,
+            max_queued=self.max_queued,
+            in_flight=self._in_flight,
+            queued=len(self._queue),
+            admitted=self._admitted,
+            rejected=self._rejected,
+            timed_out=self._timed_out,
+        )
+
+    def get_priority(
+        self, request_data: GraphQLRequestData | list[GraphQLRequestData]
+    ) -> int:
+        """Return the priority of a request, the highest of its operations."""
+        if isinstance(request_data, list):
+            return min(
+                (self.get_priority(data) for data in request_data),
+                default=self.default_priority,
+            )
+
+        if self.priorities:
+            operation_name = request_data.operation_name
+
+            if operation_name is not None and operation_name in self.priorities:
+                return self.priorities[operation_name]
+
+            operation_type = _get_operation_type(request_data.query, operation_name)
+
+            if operation_type is not None and operation_type in self.priorities:
+                return self.priorities[operation_type]
+
+        return self.default_priority
+
+    @contextlib.asynccontextmanager
+    async def admit(self, priority: int | None = None) -> AsyncIterator[None]:
+        """Hold a slot while the block runs.
+
+        Raises:
+            OperationRejectedError: When no slot is available in time.
+        """
+        await self.acquire(self.default_priority if priority is None else priority)
+
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: int) -> None:
+        if self._in_flight < self.max_in_flight and not self._queue:
+            self._in_flight += 1
+            self._admitted += 1
+            return
+
+        if len(self._queue) >= self.max_queued:
+            lowest = max(self._queue, default=None)
+
+            if lowest is None or lowest[0] <= priority:
+                raise self._reject("Server overloaded, try again later")
+
+            self._remove(lowest)
+            lowest[2].set_exception(
+                self._reject("Request evicted by a request with a higher priority")
+            )
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._counter), future)
+        heapq.heappush(self._queue, entry)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if self._granted(future):
+                self._admitted += 1
+                return
+
+            self._remove(entry)
+            self._timed_out += 1
+            raise self._reject("Timed out waiting for the server") from None
+        except asyncio.CancelledError:
+            if self._granted(future):
+                self.release()
+            else:
+                self._remove(entry)
+
+            raise
+
+        self._admitted += 1
+
+    def release(self) -> None:
+        """Free a slot, handing it to the next queued request if any."""
+        while self._queue:
+            _, _, future = heapq.heappop(self._queue)
+
+            if not future.done():
+                # The slot is handed over, `_in_flight` doesn't change
+                future.set_result(None)
+                return
+
+        self._in_flight -= 1
+
+    def _granted(self, future: asyncio.Future[None]) -> bool:
+        return future.done() and not future.cancelled() and future.exception() is None
+
+    def _remove(self, entry: tuple[int, int, asyncio.Future[None]]) -> None:
+        with contextlib.suppress(ValueError):
+            self._queue.remove(entry)
+            heapq.heapify(self._queue)
+
+    def _reject(self, reason: str) -> OperationRejectedError:
+        self._rejected += 1
+
+        return OperationRejectedError(reason, self.status_code, self.retry_after)
+
+
+def _get_operation_type(query: str | None, operation_name: str | None) -> str | None:
+    """Find the type of an operation without parsing the whole document."""
+    if not query:
+        return None
+
+    lexer = Lexer(Source(query))
+    depth = 0
+    first: str | None = None
+
+    try:
+        token = lexer.advance()
+
+        while token.kind != TokenKind.EOF:
+            if token.kind == TokenKind.BRACE_L:
+                if depth == 0 and first is None:
+                    # The query shorthand, `{ ... }`
+                    first = "query"
+
+                depth += 1
+            elif token.kind == TokenKind.BRACE_R:
+                depth -= 1
+            elif (
+                depth == 0
+                and token.kind == TokenKind.NAME
+                and token.value in _OPERATION_TYPES
+            ):
+                operation_type = token.value
+                token = lexer.advance()
+
+                if operation_name is None:
+                    return operation_type
+
+                if token.kind == TokenKind.NAME and token.value == operation_name:
+                    return operation_type
+
+                continue
+
+            token = lexer.advance()
+    except GraphQLError:
+        return None
+
+    return first if operation_name is None else None
+
+
+__all__ = ["AdmissionController", "AdmissionStats", "OperationRejectedError"]
@@ -1,7 +1,8 @@
 import abc
 import asyncio
+import contextlib
 import json
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Awaitable, Callable, Mapping, Sequence
 from datetime import timedelta
 from typing import (
     Any,
@@ -15,6 +16,7 @@ from cross_web import AsyncHTTPRequestAdapter, HTTPException
 from graphql import GraphQLError
 
 from strawberry.exceptions import MissingQueryError
+from strawberry.extensions.response_cache import conditional_request
 from strawberry.file_uploads.utils import replace_placeholders_with_files
 from strawberry.http import (
     GraphQLHTTPResponse,
@@ -22,6 +24,8 @@ from strawberry.http import (
     GraphQLRequestProtocol,
     process_result,
 )
+from strawberry.http.admission import OperationRejectedError
+from strawberry.http.disconnect import run_until_disconnected
 from strawberry.http.ides import GraphQL_IDE
 from strawberry.schema._graphql_core import (
     GraphQLIncrementalExecutionResults,
@@ -116,6 +120,9 @@ class AsyncBaseHTTPView(
         BaseGraphQLWSHandler[Context, RootValue]
     )
     multipart_transport_class: type[MultipartTransport] = MultipartTransport
+    # Cancel the operation when the client disconnects before it completes, for
+    # integrations implementing `wait_for_disconnect`
+    cancel_on_disconnect: bool = False
 
     @property
     @abc.abstractmethod
@@ -143,6 +150,45 @@ class AsyncBaseHTTPView(
         sub_response: SubResponse,
     ) -> Response: ...
 
+    def set_status_code(self, sub_response: SubResponse, status_code: int) -> None:
+        sub_response.status_code = status_code  # type: ignore[attr-defined]
+
+    def create_rejected_response(
+        self, error: OperationRejectedError, sub_response: SubResponse
+    ) -> Response:
+        """Return the response of a request rejected by the admission controller."""
+        self.set_status_code(sub_response, error.status_code)
+        sub_response.headers["Retry-After"] = str(error.retry_after)  # type: ignore[attr-defined]
+
+        return self.create_response(
+            response_data={
+                "data": None,
+                "errors": [
+                    {"message": error.reason, "extensions": {"code": "OVERLOADED"}}
+                ],
+            },
+            sub_response=sub_response,
+        )
+
+    async def wait_for_disconnect(self, request: Request) -> bool:
+        """Wait until the client of the request disconnects.
+
+        Called once the request body has been read, when `cancel_on_disconnect`
+        is set. Returns `False` when disconnects can't be detected, the
+        operation then runs to completion.
+        """
+        return False
+
+    def create_not_modified_response(
+        self, sub_response: SubResponse
+    ) -> Response | None:
+        """Return an empty `304 Not Modified` response with the sub response headers.
+
+        Integrations that can't build one return `None`, the full response is
+        sent instead.
+        """
+        return None
+
     @abc.abstractmethod
     async def render_graphql_ide(self, request: Request) -> Response: ...
 
@@ -200,20 +246,35 @@ class AsyncBaseHTTPView(
 
         if isinstance(request_data, list):
             # batch GraphQL requests
-            return await asyncio.gather(
-                *[
-                    self.execute_single(
-                        request=request,
-                        request_adapter=request_adapter,
-                        sub_response=sub_response,
-                        context=context,
-                        root_value=root_value,
-                        request_data=data,
-                    )
-                    for data in request_data
-                ]
+            operations = [
+                self.execute_single(
+                    request=request,
+                    request_adapter=request_adapter,
+                    sub_response=sub_response,
+                    context=context,
+                    root_value=root_value,
+                    request_data=data,
+                )
+                for data in request_data
+            ]
+            batching_config = self.schema.config.batching_config
+            max_concurrency = (
+                batching_config.get("max_concurrency") if batching_config else None
             )
 
+            if max_concurrency:
+                semaphore = asyncio.Semaphore(max_concurrency)
+
+                async def bounded(
+                    operation: Awaitable[ExecutionResult],
+                ) -> ExecutionResult:
+                    async with semaphore:
+                        return await operation
+
+                operations = [bounded(operation) for operation in operations]
+
+            return await asyncio.gather(*operations)
+
         if transport := self._get_stream_transport(request_data.protocol):
             return await self.schema.stream(
                 request_data.query,  # type: ignore
@@ -222,6 +283,7 @@ class AsyncBaseHTTPView(
                 root_value=root_value,
                 operation_name=request_data.operation_name,
                 operation_extensions=request_data.extensions,
+                document_id=request_data.document_id,
                 allowed_operation_types=transport.allowed_operation_types(
                     allowed_operation_types
                 ),
@@ -259,6 +321,8 @@ class AsyncBaseHTTPView(
                 operation_name=request_data.operation_name,
                 allowed_operation_types=allowed_operation_types,
                 operation_extensions=request_data.extensions,
+                document_id=request_data.document_id,
+                timeout=self.get_timeout(request_adapter),
             )
         except CannotGetOperationTypeError as e:
             raise HTTPException(400, e.as_http_error_reason()) from e
@@ -386,14 +450,36 @@ class AsyncBaseHTTPView(
         except KeyError as e:
             raise HTTPException(400, "File(s) missing in form data") from e
 
-        result = await self.execute_operation(
-            request=request,
-            request_adapter=request_adapter,
-            request_data=request_data,
-            context=context,
-            root_value=root_value,
-            sub_response=sub_response,
-        )
+        admission_controller = self.schema.config.admission_controller
+
+        try:
+            async with (
+                admission_controller.admit(
+                    admission_controller.get_priority(request_data)
+                )
+                if admission_controller is not None
+                else contextlib.nullcontext()
+            ):
+                with conditional_request(
+                    self._get_if_none_match(request_adapter)
+                ) as conditional:
+                    operation = self.execute_operation(
+                        request=request,
+                        request_adapter=request_adapter,
+                        request_data=request_data,
+                        context=context,
+                        root_value=root_value,
+                        sub_response=sub_response,
+                    )
+                    result = await (
+                        run_until_disconnected(
+                            operation, self.wait_for_disconnect(request)
+                        )
+                        if self.cancel_on_disconnect
+                        else operation
+                    )
+        except OperationRejectedError as e:
+            return self.create_rejected_response(e, sub_response)
 
         if isinstance(result, SubscriptionExecutionResult):
             # Only single (non-batch) operations stream; a batch with a
@@ -441,11 +527,25 @@ class AsyncBaseHTTPView(
                     self._handle_errors(execution_result.errors, processed_result)
                 response_data.append(processed_result)
         else:
+            # The stored result matched `If-None-Match`, it wasn't executed
+            if conditional.not_modified:
+                self._set_cache_headers(conditional, sub_response, result)
+                not_modified = self.create_not_modified_response(sub_response)
+
+                if not_modified is not None:
+                    return not_modified
+
             response_data = await self.process_result(request=request, result=result)
 
             if result.errors:
                 self._handle_errors(result.errors, response_data)
 
+            if self._set_cache_headers(conditional, sub_response, result):
+                not_modified = self.create_not_modified_response(sub_response)
+
+                if not_modified is not None:
+                    return not_modified
+
         return self.create_response(
             response_data=response_data, sub_response=sub_response
         )
@@ -594,6 +694,7 @@ class AsyncBaseHTTPView(
                     variables=item.get("variables"),
                     operation_name=item.get("operationName"),
                     extensions=item.get("extensions"),
+                    document_id=self._get_document_id(item),
                     protocol=protocol,
                 )
                 for item in data
@@ -625,6 +726,7 @@ class AsyncBaseHTTPView(
             variables=variables,
             operation_name=data.get("operationName"),
             extensions=extensions,
+            document_id=self._get_document_id(data),
             protocol=protocol,
         )
 
@@ -1,4 +1,5 @@
 import json
+import math
 from collections.abc import Mapping, Sequence
 from functools import cached_property
 from typing import Any, Generic
@@ -6,7 +7,11 @@ from typing_extensions import Protocol
 
 from cross_web import HTTPException
 
-from strawberry.http import GraphQLRequestData, GraphQLRequestProtocol
+from strawberry.extensions.response_cache import ConditionalRequest, get_etag
+from strawberry.http import (
+    GraphQLRequestData,
+    GraphQLRequestProtocol,
+)
 from strawberry.http.ides import GraphQL_IDE, get_graphql_ide_html
 from strawberry.http.types import HTTPMethod, QueryParams
 from strawberry.schema.base import BaseSchema
@@ -14,6 +19,7 @@ from strawberry.subscriptions import (
     GRAPHQL_SSE_PROTOCOL,
     MULTIPART_SUBSCRIPTION_PROTOCOL,
 )
+from strawberry.types import ExecutionResult
 
 from .streaming import HTTPStreamTransport, MultipartSubscriptionTransport, SSETransport
 from .typevars import Request
@@ -39,17 +45,43 @@ class BaseView(Generic[Request]):
         MULTIPART_SUBSCRIPTION_PROTOCOL: MultipartSubscriptionTransport,
         GRAPHQL_SSE_PROTOCOL: SSETransport,
     }
+    # The request header clients send the timeout of their operations in, in
+    # seconds. The schema's `execution_timeout` still applies when shorter.
+    timeout_header: str | None = None
 
     def should_render_graphql_ide(self, request: BaseRequestProtocol) -> bool:
         return (
             request.method == "GET"
             and request.query_params.get("query") is None
+            # Persisted queries and trusted documents are sent without a query
+            and request.query_params.get("extensions") is None
+            and request.query_params.get("documentId") is None
             and any(
                 supported_header in request.headers.get("accept", "")
                 for supported_header in ("text/html", "*/*")
             )
         )
 
+    def get_timeout(self, request: BaseRequestProtocol) -> float | None:
+        """Return the timeout sent in `timeout_header`, if any."""
+        if self.timeout_header is None:
+            return None
+
+        value = request.headers.get(self.timeout_header)
+
+        if value is None:
+            return None
+
+        try:
+            timeout = float(value)
+        except ValueError:
+            timeout = math.nan
+
+        if not math.isfinite(timeout) or timeout <= 0:
+            raise HTTPException(400, f"Invalid {self.timeout_header} header")
+
+        return timeout
+
     def is_request_allowed(self, request: BaseRequestProtocol) -> bool:
         return request.method in ("GET", "POST")
 
@@ -82,6 +114,62 @@ class BaseView(Generic[Request]):
 
         return params
 
+    def get_cache_headers(
+        self, result: ExecutionResult, etag: str | None = None
+    ) -> dict[str, str]:
+        """Return the HTTP caching headers of the response of an operation.
+
+        Built from the cache policy added to the response extensions by the
+        `ResponseCache` extension, responses without a policy get no headers.
+        `etag` is the ETag of the stored result, it is computed from the data
+        of the result when there's none.
+        """
+        cache_control = (result.extensions or {}).get("cacheControl")
+
+        if not cache_control:
+            return {}
+
+        max_age = cache_control["maxAge"]
+
+        if result.errors or max_age <= 0:
+            return {"Cache-Control": "no-store"}
+
+        scope = cache_control["scope"]
+        headers = {
+            "Cache-Control": f"{scope.lower()}, max-age={max_age}",
+            "Vary": "Accept" if scope == "PUBLIC" else "Accept, Authorization, Cookie",
+        }
+
+        headers["ETag"] = etag if etag is not None else get_etag(result.data)
+
+        return headers
+
+    def _get_if_none_match(self, request: BaseRequestProtocol) -> str | None:
+        if request.method != "GET":
+            return None
+
+        return request.headers.get("if-none-match")
+
+    def _set_cache_headers(
+        self,
+        conditional: ConditionalRequest,
+        sub_response: Any,
+        result: ExecutionResult,
+    ) -> bool:
+        """Set the caching headers of the response.
+
+        Returns whether the client already has the response, as told by the
+        `If-None-Match` header of a GET request.
+        """
+        headers = self.get_cache_headers(result, conditional.etag)
+
+        for name, value in headers.items():
+            sub_response.headers[name] = value
+
+        etag = headers.get("ETag")
+
+        return etag is not None and conditional.matches(etag)
+
     @property
     def graphql_ide_html(self) -> str:
         return get_graphql_ide_html(graphql_ide=self.graphql_ide)
@@ -130,6 +218,33 @@ class BaseView(Generic[Request]):
             None,
         )
 
+    def _get_document_id(self, data: Mapping[str, Any]) -> str | None:
+        """Return the trusted document id of a request, if any.
+
+        The id is sent as `documentId`, or as the hash of an automatic
+        persisted query.
+        """
+        document_id = data.get("documentId")
+
+        if document_id is None:
+            extensions = data.get("extensions")
+            persisted_query = (
+                extensions.get("persistedQuery")
+                if isinstance(extensions, Mapping)
+                else None
+            )
+
+            if isinstance(persisted_query, Mapping):
+                document_id = persisted_query.get("sha256Hash")
+
+        if not isinstance(document_id, (str, type(None))):
+            raise HTTPException(
+                400,
+                "The GraphQL operation's `documentId` must be a string or null, if provided.",
+            )
+
+        return document_id
+
     def _validate_batch_request(
         self, request_data: list[GraphQLRequestData], protocol: GraphQLRequestProtocol
     ) -> None:
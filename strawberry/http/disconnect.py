@@ -0,0 +1,68 @@
+"""Stop executing operations whose client has disconnected.
+
+The async views execute the operation of a request in a task, and cancel it
+when `AsyncBaseHTTPView.wait_for_disconnect` returns `True` first. Cancelling
+the task cancels the awaited resolvers and the `DataLoader` loads they wait
+for, batches whose loads are all cancelled are then skipped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from cross_web import HTTPException
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+
+T = TypeVar("T")
+
+# The status nginx logs for requests closed by the client, the response is
+# never sent
+CLIENT_CLOSED_REQUEST = 499
+
+
+async def wait_for_asgi_disconnect(
+    receive: Callable[[], Awaitable[Mapping[str, Any]]],
+) -> bool:
+    """Wait for the `http.disconnect` message of an ASGI request.
+
+    Other messages are discarded, so this must only be called once the body of
+    the request has been read.
+    """
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+    return True
+
+
+async def run_until_disconnected(
+    operation: Awaitable[T], disconnected: Awaitable[bool]
+) -> T:
+    """Await `operation`, cancelling it if `disconnected` returns `True` first.
+
+    Raises:
+        HTTPException: With a `499` status when the operation was cancelled.
+    """
+    task = asyncio.ensure_future(operation)
+    watcher = asyncio.ensure_future(disconnected)
+
+    try:
+        await asyncio.wait((task, watcher), return_when=asyncio.FIRST_COMPLETED)
+
+        if (
+            not task.done()
+            and not watcher.cancelled()
+            and watcher.exception() is None
+            and watcher.result()
+        ):
+            raise HTTPException(CLIENT_CLOSED_REQUEST, "Client disconnected")
+
+        return await task
+    finally:
+        task.cancel()
+        watcher.cancel()
+
+
+__all__ = ["run_until_disconnected", "wait_for_asgi_disconnect"]
@@ -7,6 +7,7 @@ from cross_web import HTTPException, SyncHTTPRequestAdapter
 from graphql import GraphQLError
 
 from strawberry.exceptions import MissingQueryError
+from strawberry.extensions.response_cache import conditional_request
 from strawberry.file_uploads.utils import replace_placeholders_with_files
 from strawberry.http import (
     GraphQLHTTPResponse,
@@ -59,6 +60,16 @@ class SyncBaseHTTPView(
         sub_response: SubResponse,
     ) -> Response: ...
 
+    def create_not_modified_response(
+        self, sub_response: SubResponse
+    ) -> Response | None:
+        """Return an empty `304 Not Modified` response with the sub response headers.
+
+        Integrations that can't build one return `None`, the full response is
+        sent instead.
+        """
+        return None
+
     @abc.abstractmethod
     def render_graphql_ide(self, request: Request) -> Response: ...
 
@@ -130,6 +141,8 @@ class SyncBaseHTTPView(
                 operation_name=request_data.operation_name,
                 allowed_operation_types=allowed_operation_types,
                 operation_extensions=request_data.extensions,
+                document_id=request_data.document_id,
+                timeout=self.get_timeout(request_adapter),
             )
         except CannotGetOperationTypeError as e:
             raise HTTPException(400, e.as_http_error_reason()) from e
@@ -190,6 +203,7 @@ class SyncBaseHTTPView(
                     variables=item.get("variables"),
                     operation_name=item.get("operationName"),
                     extensions=item.get("extensions"),
+                    document_id=self._get_document_id(item),
                 )
                 for item in data
             ]
@@ -220,6 +234,7 @@ class SyncBaseHTTPView(
             variables=variables,
             operation_name=data.get("operationName"),
             extensions=extensions,
+            document_id=self._get_document_id(data),
         )
 
     def _handle_errors(
@@ -251,12 +266,15 @@ class SyncBaseHTTPView(
         )
         root_value = self.get_root_value(request) if root_value is UNSET else root_value
 
-        result = self.execute_operation(
-            request=request,
-            context=context,
-            root_value=root_value,
-            sub_response=sub_response,
-        )
+        with conditional_request(
+            self._get_if_none_match(request_adapter)
+        ) as conditional:
+            result = self.execute_operation(
+                request=request,
+                context=context,
+                root_value=root_value,
+                sub_response=sub_response,
+            )
 
         response_data: GraphQLHTTPResponse | list[GraphQLHTTPResponse]
 
@@ -270,11 +288,25 @@ class SyncBaseHTTPView(
                     self._handle_errors(execution_result.errors, processed_result)
                 response_data.append(processed_result)
         else:
+            # The stored result matched `If-None-Match`, it wasn't executed
+            if conditional.not_modified:
+                self._set_cache_headers(conditional, sub_response, result)
+                not_modified = self.create_not_modified_response(sub_response)
+
+                if not_modified is not None:
+                    return not_modified
+
             response_data = self.process_result(request=request, result=result)
 
             if result.errors:
                 self._handle_errors(result.errors, response_data)
 
+            if self._set_cache_headers(conditional, sub_response, result):
+                not_modified = self.create_not_modified_response(sub_response)
+
+                if not_modified is not None:
+                    return not_modified
+
         return self.create_response(
             response_data=response_data, sub_response=sub_response
         )
@@ -32,7 +32,7 @@ from litestar.exceptions import (
     WebSocketDisconnect,
 )
 from litestar.response.streaming import Stream
-from litestar.status_codes import HTTP_200_OK
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
 from msgspec import Struct
 
 from strawberry.exceptions import InvalidCustomContext
@@ -40,6 +40,7 @@ from strawberry.http.async_base_view import (
     AsyncBaseHTTPView,
     AsyncWebSocketAdapter,
 )
+from strawberry.http.disconnect import wait_for_asgi_disconnect
 from strawberry.http.exceptions import (
     NonJsonMessageReceived,
     NonTextMessageReceived,
@@ -213,6 +214,7 @@ class GraphQLController(
 
     request_adapter_class = LitestarRequestAdapter
     websocket_adapter_class = LitestarWebSocketAdapter  # type: ignore
+    cancel_on_disconnect = True
 
     allow_queries_via_get: bool = True
     graphiql_allowed_accept: frozenset[str] = frozenset({"text/html", "*/*"})
@@ -290,6 +292,19 @@ class GraphQLController(
 
         return response
 
+    async def wait_for_disconnect(self, request: Request[Any, Any, Any]) -> bool:
+        return await wait_for_asgi_disconnect(request.receive)  # type: ignore[arg-type]
+
+    def create_not_modified_response(
+        self, sub_response: Response[bytes]
+    ) -> Response[bytes]:
+        response = Response(b"", status_code=HTTP_304_NOT_MODIFIED)
+
+        response.headers.update(sub_response.headers)
+        response.cookies.extend(sub_response.cookies)
+
+        return response
+
     async def create_streaming_response(
         self,
         request: Request,
@@ -117,6 +117,11 @@ class GraphQLView(
 
         return sub_response
 
+    def create_not_modified_response(self, sub_response: Response) -> Response:
+        sub_response.status_code = 304
+
+        return sub_response
+
     async def get_context(
         self, request: Request | Websocket, response: Response
     ) -> Context:
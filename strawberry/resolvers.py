@@ -7,4 +7,12 @@ def is_default_resolver(func: Callable[..., Any]) -> bool:
     return getattr(func, "_is_default", False)
 
 
-__all__ = ["is_default_resolver"]
+def is_basic_resolver(func: Callable[..., Any] | None) -> bool:
+    """Check whether the function only reads an attribute of the source object.
+
+    Basic resolvers are synchronous and don't use the resolve info.
+    """
+    return getattr(func, "_is_basic", False)
+
+
+__all__ = ["is_basic_resolver", "is_default_resolver"]
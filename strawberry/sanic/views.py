@@ -6,11 +6,13 @@ from typing import (
 )
 
 from cross_web import HTTPException, SanicHTTPRequestAdapter
+from sanic.models.asgi import MockTransport
 from sanic.request import Request
 from sanic.response import HTTPResponse, html
 from sanic.views import HTTPMethodView
 
 from strawberry.http.async_base_view import AsyncBaseHTTPView
+from strawberry.http.disconnect import wait_for_asgi_disconnect
 from strawberry.http.temporal_response import TemporalResponse
 from strawberry.http.typevars import (
     Context,
@@ -57,6 +59,7 @@ class GraphQLView(
 
     allow_queries_via_get = True
     request_adapter_class = SanicHTTPRequestAdapter
+    cancel_on_disconnect = True
 
     def __init__(
         self,
@@ -106,6 +109,19 @@ class GraphQLView(
             headers=sub_response.headers,
         )
 
+    async def wait_for_disconnect(self, request: Request) -> bool:
+        # Sanic's server cancels the handler when the connection is lost, only
+        # applications served by an ASGI server have to watch for it
+        if not isinstance(request.transport, MockTransport):
+            return False
+
+        return await wait_for_asgi_disconnect(request.transport.receive)
+
+    def create_not_modified_response(
+        self, sub_response: TemporalResponse
+    ) -> HTTPResponse:
+        return HTTPResponse(status=304, headers=sub_response.headers)
+
     async def post(self, request: Request) -> HTTPResponse:
         self.request = request
 
@@ -50,6 +50,9 @@ class BaseSchema(Protocol):
         operation_name: str | None = None,
         allowed_operation_types: Iterable[OperationType] | None = None,
         operation_extensions: dict[str, Any] | None = None,
+        document_id: str | None = None,
+        *,
+        timeout: float | None = None,
     ) -> ExecutionResult:
         raise NotImplementedError
 
@@ -63,6 +66,9 @@ class BaseSchema(Protocol):
         operation_name: str | None = None,
         allowed_operation_types: Iterable[OperationType] | None = None,
         operation_extensions: dict[str, Any] | None = None,
+        document_id: str | None = None,
+        *,
+        timeout: float | None = None,
     ) -> ExecutionResult:
         raise NotImplementedError
 
@@ -75,6 +81,7 @@ class BaseSchema(Protocol):
         root_value: Any | None = None,
         operation_name: str | None = None,
         operation_extensions: dict[str, Any] | None = None,
+        document_id: str | None = None,
     ) -> SubscriptionResult:
         raise NotImplementedError
 
@@ -88,6 +95,7 @@ class BaseSchema(Protocol):
         operation_name: str | None = None,
         operation_extensions: dict[str, Any] | None = None,
         allowed_operation_types: Iterable[OperationType] | None = None,
+        document_id: str | None = None,
     ) -> StreamResult:
         raise NotImplementedError
 
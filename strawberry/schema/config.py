@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import InitVar, dataclass, field
 from typing import TYPE_CHECKING, Any, TypedDict
+from typing_extensions import NotRequired
 
 from strawberry.types.info import Info
 
@@ -10,11 +11,20 @@ from .name_converter import NameConverter
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
 
+    from strawberry.execution.process_pool import ResolverProcessPool
+    from strawberry.execution.thread_pool import (
+        ResolverExecutor,
+        ResolverThreadPool,
+    )
+    from strawberry.extensions.field_cache import ResolverCacheStore
+    from strawberry.http.admission import AdmissionController
     from strawberry.types.scalar import ScalarDefinition
 
 
 class BatchingConfig(TypedDict):
     max_operations: int
+    # The number of operations of a batch executing at once, all by default
+    max_concurrency: NotRequired[int]
 
 
 @dataclass
@@ -34,6 +44,30 @@ class StrawberryConfig:
             any type (including NewType) to be used as a GraphQL scalar with
             proper type checking support.
         batching_config: Configuration for operation batching.
+        enable_execution_plan_cache: Compile each executed document into a
+            reusable execution plan, so repeated operations skip operation
+            lookup and field collection. Requires graphql-core 3.2.
+        enable_sync_subtree_execution: Complete selections made only of fields
+            without a custom resolver without checking whether their values
+            are awaitable, using `StrawberrySyncSubtreeExecutionContext`.
+        default_resolver_executor: Where synchronous resolvers are called under
+            async execution when their field doesn't set an `executor`:
+            `"inline"` on the event loop or `"thread"` in
+            `resolver_thread_pool`. `"process"` is only allowed per field.
+        resolver_thread_pool: The thread pool synchronous resolvers using the
+            `"thread"` executor run in, a default `ResolverThreadPool` is
+            created when needed.
+        resolver_process_pool: The process pool synchronous resolvers using the
+            `"process"` executor run in, a default `ResolverProcessPool` is
+            created when needed.
+        resolver_cache: Where fields with a `CachePolicy` store the results of
+            their resolver, a default `InMemoryResolverCache` is created when
+            needed.
+        admission_controller: Limits the number of requests the async HTTP
+            views execute at once, rejecting requests when overloaded.
+        execution_timeout: The number of seconds an operation can take, fields
+            not resolved in time resolve to `null` with an error. A shorter
+            timeout can be given per operation.
     """
 
     auto_camel_case: InitVar[bool] = None  # pyright: reportGeneralTypeIssues=false
@@ -47,6 +81,14 @@ class StrawberryConfig:
     _unsafe_disable_same_type_validation: bool = False
     scalar_map: Mapping[object, ScalarDefinition] = field(default_factory=dict)
     batching_config: BatchingConfig | None = None
+    enable_execution_plan_cache: bool = False
+    enable_sync_subtree_execution: bool = False
+    default_resolver_executor: ResolverExecutor = "inline"
+    resolver_thread_pool: ResolverThreadPool | None = None
+    resolver_process_pool: ResolverProcessPool | None = None
+    resolver_cache: ResolverCacheStore | None = None
+    admission_controller: AdmissionController | None = None
+    execution_timeout: float | None = None
 
     def __post_init__(
         self,
@@ -58,5 +100,11 @@ class StrawberryConfig:
         if not issubclass(self.info_class, Info):
             raise TypeError("`info_class` must be a subclass of strawberry.Info")
 
+        if self.default_resolver_executor == "process":
+            raise ValueError(
+                '`default_resolver_executor` can\'t be `"process"`, set'
+                ' `executor="process"` on each field instead'
+            )
+
 
 __all__ = ["StrawberryConfig"]
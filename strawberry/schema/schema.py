@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import warnings
 from asyncio import ensure_future
 from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable
@@ -31,21 +32,39 @@ from graphql import (
     OperationDefinitionNode,
     get_introspection_query,
     parse,
+    specified_rules,
     validate_schema,
 )
-from graphql.execution.middleware import MiddlewareManager
+from graphql.pyutils import Path, Undefined
 from graphql.type.directives import specified_directives
 from graphql.validation import validate
 
 from strawberry import relay
 from strawberry.annotation import StrawberryAnnotation
+from strawberry.dataloader import SyncFuture
 from strawberry.exceptions import MissingQueryError
 from strawberry.execution import optimized_is_awaitable
+from strawberry.execution.deadline import deadline_scope
+from strawberry.execution.deferred import (
+    PENDING,
+    PendingValue,
+    complete_pending_values,
+    executing_synchronously,
+)
+from strawberry.execution.middleware import ResolverIndex, StrawberryMiddlewareManager
+from strawberry.execution.plan import ExecutionPlanCache
+from strawberry.execution.sync_subtrees import (
+    SyncSelectionCache,
+    execute_sync_field,
+    execute_sync_fields,
+    get_sync_selection,
+)
 from strawberry.extensions import SchemaExtension
 from strawberry.extensions.directives import (
     DirectivesExtension,
     DirectivesExtensionSync,
 )
+from strawberry.extensions.field_cache import request_results_scope
 from strawberry.extensions.runner import SchemaExtensionsRunner
 from strawberry.printer import print_schema
 from strawberry.schema.schema_converter import GraphQLCoreConverter
@@ -81,13 +100,18 @@ from ._graphql_core import (
 from .base import BaseSchema
 from .config import StrawberryConfig
 from .exceptions import CannotGetOperationTypeError, InvalidOperationTypeError
+from .trusted_documents import (
+    TrustedDocumentNotFound,
+    TrustedDocuments,
+    UntrustedDocument,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
     from typing import TypeAlias
 
+    from graphql.execution.middleware import MiddlewareManager
     from graphql.language import DocumentNode
-    from graphql.pyutils import Path
     from graphql.type import GraphQLResolveInfo
     from graphql.validation import ASTValidationRule
 
@@ -153,6 +177,22 @@ def _run_validation(execution_context: ExecutionContext) -> None:
         and execution_context.pre_execution_errors is None
     ):
         assert execution_context.graphql_document
+
+        if (trusted_document := execution_context._trusted_document) is not None:
+            # The specified rules were checked when the schema was created, the
+            # rules added by extensions are validated once per rule set
+            rules = tuple(
+                rule
+                for rule in execution_context.validation_rules
+                if rule not in specified_rules
+            )
+            execution_context.pre_execution_errors = (
+                trusted_document.validate(execution_context.schema._schema, rules)
+                if rules
+                else []
+            )
+            return
+
         execution_context.pre_execution_errors = validate_document(
             execution_context.schema._schema,
             execution_context.graphql_document,
@@ -219,6 +259,60 @@ class StrawberryGraphQLCoreExecutionContext(GraphQLExecutionContext):
         super().__init__(*args, **kwargs)
 
         self.operation_extensions = operation_extensions
+        self.pending_values: list[PendingValue] = []
+
+    if IS_GQL_32:
+
+        def complete_value(
+            self,
+            return_type: GraphQLOutputType,
+            field_nodes: list[FieldNode],
+            info: GraphQLResolveInfo,
+            path: Path,
+            result: Any,
+        ) -> Any:
+            if isinstance(result, SyncFuture):
+                # Values loaded by a SyncDataLoader are completed once the whole
+                # level has been executed, see `build_response`
+                if executing_synchronously.get():
+                    self.pending_values.append(
+                        PendingValue(return_type, field_nodes, info, path, result)
+                    )
+                    return PENDING
+
+                return self._complete_future(
+                    return_type, field_nodes, info, path, result
+                )
+
+            return super().complete_value(return_type, field_nodes, info, path, result)
+
+        async def _complete_future(
+            self,
+            return_type: GraphQLOutputType,
+            field_nodes: list[FieldNode],
+            info: GraphQLResolveInfo,
+            path: Path,
+            future: SyncFuture,
+        ) -> Any:
+            # Let the other fields of the level load their keys first
+            await asyncio.sleep(0)
+
+            completed = super().complete_value(
+                return_type, field_nodes, info, path, future.result()
+            )
+
+            if self.is_awaitable(completed):
+                return await completed
+
+            return completed
+
+        def build_response(  # type: ignore[override]
+            self, data: dict[str, Any] | None, errors: list[GraphQLError]
+        ) -> GraphQLExecutionResult:
+            if self.pending_values:
+                data = complete_pending_values(self, data, self.pending_values)
+
+            return super().build_response(data, errors)
 
     if IS_GQL_33:
 
@@ -253,6 +347,79 @@ class StrawberryGraphQLCoreExecutionContext(GraphQLExecutionContext):
             )
 
 
+class StrawberrySyncSubtreeExecutionContext(StrawberryGraphQLCoreExecutionContext):
+    """Execute the fields that can't return awaitables without checking for them.
+
+    Selections made only of basic fields are completed by
+    `strawberry.execution.sync_subtrees.execute_sync_fields`, other selections
+    only check the values of the fields that may be awaitable.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._sync_selections: SyncSelectionCache = {}
+
+    if IS_GQL_32:
+
+        def execute_fields(
+            self,
+            parent_type: GraphQLObjectType,
+            source_value: Any,
+            path: Path | None,
+            fields: dict[str, list[FieldNode]],
+        ) -> Any:
+            selection = get_sync_selection(
+                self, parent_type, fields, self._sync_selections
+            )
+
+            if selection.is_sync:
+                return execute_sync_fields(self, selection, source_value, path)
+
+            if not selection.has_sync_fields:
+                return super().execute_fields(parent_type, source_value, path, fields)
+
+            results = {}
+            is_awaitable = self.is_awaitable
+            awaitable_fields: list[str] = []
+
+            for response_name, field_nodes, sync_field in selection.fields:
+                field_path = Path(path, response_name, parent_type.name)
+
+                if sync_field is not None:
+                    results[response_name] = execute_sync_field(
+                        self, sync_field, source_value, field_path
+                    )
+                    continue
+
+                result = self.execute_field(
+                    parent_type, source_value, field_nodes, field_path
+                )
+
+                if result is not Undefined:
+                    results[response_name] = result
+
+                    if is_awaitable(result):
+                        awaitable_fields.append(response_name)
+
+            if not awaitable_fields:
+                return results
+
+            async def get_results() -> dict[str, Any]:
+                results.update(
+                    zip(
+                        awaitable_fields,
+                        await asyncio.gather(
+                            *(results[field] for field in awaitable_fields)
+                        ),
+                        strict=True,
+                    )
+                )
+                return results
+
+            return get_results()
+
+
 class Schema(BaseSchema):
     def __init__(  # noqa: PLR0917
         self,
@@ -273,6 +440,7 @@ class Schema(BaseSchema):
         ) = None,
         schema_directives: Iterable[object] = (),
         exception_handlers: Iterable[ExceptionHandler[Any]] = (),
+        trusted_documents: TrustedDocuments | Mapping[str, str] | None = None,
     ) -> None:
         """Default Schema to be used in a Strawberry application.
 
@@ -297,6 +465,9 @@ class Schema(BaseSchema):
             schema_directives: A list of schema directives for the schema.
             exception_handlers: A list of handlers that can convert Python
                 exceptions into explicit GraphQL union return values.
+            trusted_documents: An allowlist of documents by id. When set, the
+                schema only executes these documents, requested by their id.
+                They are parsed and validated once, when the schema is created.
 
         Example:
         ```python
@@ -332,10 +503,12 @@ class Schema(BaseSchema):
                 DeprecationWarning,
                 stacklevel=2,
             )
-        self.execution_context_class = (
-            execution_context_class or StrawberryGraphQLCoreExecutionContext
-        )
         self.config = config or StrawberryConfig()
+        self.execution_context_class = execution_context_class or (
+            StrawberrySyncSubtreeExecutionContext
+            if self.config.enable_sync_subtree_execution
+            else StrawberryGraphQLCoreExecutionContext
+        )
         self.exception_handlers = tuple(exception_handlers)
 
         self.schema_converter = GraphQLCoreConverter(
@@ -427,6 +600,8 @@ class Schema(BaseSchema):
 
         # attach our schema to the GraphQL schema instance
         self._schema._strawberry_schema = self  # type: ignore
+        self._resolver_index = ResolverIndex(self._schema)
+        self.schema_converter.type_resolution_index.build()
 
         self._warn_for_federation_directives()
         self._resolve_node_ids()
@@ -439,6 +614,24 @@ class Schema(BaseSchema):
             formatted_errors = "\n\n".join(f"❌ {error.message}" for error in errors)
             raise ValueError(f"Invalid Schema. Errors:\n\n{formatted_errors}")
 
+        if trusted_documents is not None and not isinstance(
+            trusted_documents, TrustedDocuments
+        ):
+            trusted_documents = TrustedDocuments(trusted_documents)
+        self.trusted_documents = trusted_documents
+        if self.trusted_documents is not None:
+            self.trusted_documents.compile(self._schema)
+
+        # Execution plans rely on graphql-core 3.2's execution context internals
+        # and don't support incremental delivery.
+        self._execution_plans = (
+            ExecutionPlanCache(self._schema)
+            if self.config.enable_execution_plan_cache
+            and IS_GQL_32
+            and not self.config.enable_experimental_incremental_execution
+            else None
+        )
+
     def get_extensions(self, sync: bool = False) -> list[SchemaExtension]:
         # Deprecated instances are passed through as-is. The DeprecationWarning
         # is emitted once at ``Schema.__init__``; users are expected to migrate
@@ -481,8 +674,9 @@ class Schema(BaseSchema):
         # Build a fresh middleware manager per request: the manager holds
         # references to extension instances, which are now constructed
         # per-request to avoid concurrency leaks (see #4369).
-        return MiddlewareManager(
-            *(ext for ext in extensions if ext._implements_resolve())
+        return StrawberryMiddlewareManager(
+            *(ext for ext in extensions if ext._implements_resolve()),
+            index=self._resolver_index,
         )
 
     def _create_execution_context(  # noqa: PLR0917
@@ -494,6 +688,7 @@ class Schema(BaseSchema):
         root_value: Any | None = None,
         operation_name: str | None = None,
         operation_extensions: dict[str, Any] | None = None,
+        document_id: str | None = None,
     ) -> ExecutionContext:
         return ExecutionContext(
             query=query,
@@ -504,8 +699,37 @@ class Schema(BaseSchema):
             variables=variable_values,
             provided_operation_name=operation_name,
             operation_extensions=operation_extensions,
+            document_id=document_id,
         )
 
+    def _resolve_trusted_document(
+        self, context: ExecutionContext
+    ) -> list[GraphQLError] | None:
+        """Set the precompiled document when using trusted documents.
+
+        Returns the errors to respond with if the request isn't allowed.
+        """
+        if self.trusted_documents is None:
+            return None
+
+        if context.document_id is None:
+            return [UntrustedDocument()]
+
+        trusted_document = self.trusted_documents.get(context.document_id)
+
+        if trusted_document is None:
+            return [TrustedDocumentNotFound(context.document_id)]
+
+        if context.query is not None and context.query != trusted_document.query:
+            return [UntrustedDocument()]
+
+        context.query = trusted_document.query
+        context.graphql_document = trusted_document.document
+        context._document_operations = trusted_document.operations
+        context._trusted_document = trusted_document
+
+        return None
+
     @lru_cache
     def get_type_by_name(
         self, name: str
@@ -561,6 +785,10 @@ class Schema(BaseSchema):
         self, context: ExecutionContext, extensions_runner: SchemaExtensionsRunner
     ) -> PreExecutionError | None:
         """Parse, check the operation type, and validate before execution."""
+        if errors := self._resolve_trusted_document(context):
+            context.pre_execution_errors = errors
+            return PreExecutionError(data=None, errors=errors)
+
         if not context.query and context.graphql_document is None:
             raise MissingQueryError
 
@@ -599,6 +827,15 @@ class Schema(BaseSchema):
         self, context: ExecutionContext, extensions_runner: SchemaExtensionsRunner
     ) -> ExecutionResult | None:
         """Parse, check the operation type, and validate before execution."""
+        if errors := self._resolve_trusted_document(context):
+            context.pre_execution_errors = errors
+            self._process_errors(errors, context)
+            return ExecutionResult(
+                data=None,
+                errors=errors,
+                extensions=extensions_runner.get_extensions_results_sync(),
+            )
+
         if not context.query and context.graphql_document is None:
             raise MissingQueryError
 
@@ -676,6 +913,63 @@ class Schema(BaseSchema):
             return experimental_execute_incrementally
         return execute
 
+    def _request_results_scope(self) -> contextlib.AbstractContextManager[None]:
+        """Share the results of cached fields between the calls of a request."""
+        if self.schema_converter.has_cached_fields:
+            return request_results_scope()
+
+        return contextlib.nullcontext()
+
+    def _deadline_scope(
+        self, timeout: float | None
+    ) -> contextlib.AbstractContextManager[None]:
+        """Bound the time resolvers take by the timeout of the operation."""
+        if self.config.execution_timeout is not None:
+            timeout = (
+                self.config.execution_timeout
+                if timeout is None
+                else min(timeout, self.config.execution_timeout)
+            )
+
+        return deadline_scope(timeout)
+
+    def _execute_document(
+        self,
+        execution_context: ExecutionContext,
+        middleware_manager: MiddlewareManager,
+        execute_function: Callable[..., Any],
+        custom_context_kwargs: dict[str, Any],
+    ) -> Any:
+        """Execute the parsed document, using a cached execution plan if enabled."""
+        assert execution_context.graphql_document is not None
+
+        if self._execution_plans is not None and (
+            plan := self._execution_plans.get(
+                execution_context.graphql_document, execution_context.operation_name
+            )
+        ):
+            return plan.execute(
+                root_value=execution_context.root_value,
+                context_value=execution_context.context,
+                variable_values=execution_context.variables,
+                middleware=middleware_manager,
+                is_awaitable=optimized_is_awaitable,
+                execution_context_class=self.execution_context_class,
+            )
+
+        return execute_function(
+            self._schema,
+            execution_context.graphql_document,
+            root_value=execution_context.root_value,
+            middleware=middleware_manager,
+            variable_values=execution_context.variables,
+            operation_name=execution_context.operation_name,
+            context_value=execution_context.context,
+            is_awaitable=optimized_is_awaitable,
+            **execution_context_class_kwargs(self.execution_context_class),
+            **custom_context_kwargs,
+        )
+
     async def _execute_operation(
         self,
         execution_context: ExecutionContext,
@@ -683,25 +977,22 @@ class Schema(BaseSchema):
         middleware_manager: MiddlewareManager,
         execute_function: Callable[..., Any],
         custom_context_kwargs: dict[str, Any],
+        *,
+        timeout: float | None = None,
     ) -> ResultType:
         assert execution_context.graphql_document is not None
 
         async with extensions_runner.executing():
             if not execution_context.result:
-                result = await await_maybe(
-                    execute_function(
-                        self._schema,
-                        execution_context.graphql_document,
-                        root_value=execution_context.root_value,
-                        middleware=middleware_manager,
-                        variable_values=execution_context.variables,
-                        operation_name=execution_context.operation_name,
-                        context_value=execution_context.context,
-                        is_awaitable=optimized_is_awaitable,
-                        **execution_context_class_kwargs(self.execution_context_class),
-                        **custom_context_kwargs,
+                with self._request_results_scope(), self._deadline_scope(timeout):
+                    result = await await_maybe(
+                        self._execute_document(
+                            execution_context,
+                            middleware_manager,
+                            execute_function,
+                            custom_context_kwargs,
+                        )
                     )
-                )
                 execution_context.result = result
             else:
                 result = execution_context.result
@@ -731,6 +1022,9 @@ class Schema(BaseSchema):
         operation_name: str | None = None,
         allowed_operation_types: Iterable[OperationType] | None = None,
         operation_extensions: dict[str, Any] | None = None,
+        document_id: str | None = None,
+        *,
+        timeout: float | None = None,
     ) -> ExecutionResult:
         if allowed_operation_types is None:
             allowed_operation_types = DEFAULT_ALLOWED_OPERATION_TYPES
@@ -743,6 +1037,7 @@ class Schema(BaseSchema):
             root_value=root_value,
             operation_name=operation_name,
             operation_extensions=operation_extensions,
+            document_id=document_id,
         )
         extensions = self.get_extensions()
         # TODO (#3571): remove this when we implement execution context as parameter.
@@ -777,6 +1072,7 @@ class Schema(BaseSchema):
                     middleware_manager,
                     execute_function,
                     custom_context_kwargs,
+                    timeout=timeout,
                 )
 
         except (
@@ -805,6 +1101,9 @@ class Schema(BaseSchema):
         operation_name: str | None = None,
         allowed_operation_types: Iterable[OperationType] | None = None,
         operation_extensions: dict[str, Any] | None = None,
+        document_id: str | None = None,
+        *,
+        timeout: float | None = None,
     ) -> ExecutionResult:
         if allowed_operation_types is None:
             allowed_operation_types = DEFAULT_ALLOWED_OPERATION_TYPES
@@ -817,6 +1116,7 @@ class Schema(BaseSchema):
             root_value=root_value,
             operation_name=operation_name,
             operation_extensions=operation_extensions,
+            document_id=document_id,
         )
         extensions = self.get_extensions(sync=True)
         # TODO (#3571): remove this when we implement execution context as parameter.
@@ -848,20 +1148,21 @@ class Schema(BaseSchema):
                 assert execution_context.graphql_document is not None
                 with extensions_runner.executing():
                     if not execution_context.result:
-                        result = execute_function(
-                            self._schema,
-                            execution_context.graphql_document,
-                            root_value=execution_context.root_value,
-                            middleware=middleware_manager,
-                            variable_values=execution_context.variables,
-                            operation_name=execution_context.operation_name,
-                            context_value=execution_context.context,
-                            is_awaitable=optimized_is_awaitable,
-                            **execution_context_class_kwargs(
-                                self.execution_context_class
-                            ),
-                            **custom_context_kwargs,
-                        )
+                        token = executing_synchronously.set(True)
+
+                        try:
+                            with (
+                                self._request_results_scope(),
+                                self._deadline_scope(timeout),
+                            ):
+                                result = self._execute_document(
+                                    execution_context,
+                                    middleware_manager,
+                                    execute_function,
+                                    custom_context_kwargs,
+                                )
+                        finally:
+                            executing_synchronously.reset(token)
 
                         if isawaitable(result):
                             result = cast("Awaitable[GraphQLExecutionResult]", result)
@@ -1095,6 +1396,7 @@ class Schema(BaseSchema):
         root_value: Any | None = None,
         operation_name: str | None = None,
         operation_extensions: dict[str, Any] | None = None,
+        document_id: str | None = None,
     ) -> SubscriptionResult:
         """Execute a subscription and stream its results.
 
@@ -1114,6 +1416,7 @@ class Schema(BaseSchema):
                 operation_name=operation_name,
                 operation_extensions=operation_extensions,
                 allowed_operation_types=(OperationType.SUBSCRIPTION,),
+                document_id=document_id,
             ),
         )
 
@@ -1126,6 +1429,7 @@ class Schema(BaseSchema):
         operation_name: str | None = None,
         operation_extensions: dict[str, Any] | None = None,
         allowed_operation_types: Iterable[OperationType] | None = None,
+        document_id: str | None = None,
     ) -> StreamResult:
         """Execute an operation and stream its result(s).
 
@@ -1154,6 +1458,7 @@ class Schema(BaseSchema):
             root_value=root_value,
             operation_name=operation_name,
             operation_extensions=operation_extensions,
+            document_id=document_id,
         )
         extensions = self.get_extensions()
         # TODO (#3571): remove this when we implement execution context as parameter.
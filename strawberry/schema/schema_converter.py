@@ -4,7 +4,7 @@ import dataclasses
 import inspect
 import sys
 import typing
-from functools import partial, reduce
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -28,11 +28,9 @@ from graphql import (
     GraphQLInputObjectType,
     GraphQLInterfaceType,
     GraphQLList,
-    GraphQLNamedType,
     GraphQLNonNull,
     GraphQLObjectType,
     GraphQLScalarType,
-    GraphQLType,
     GraphQLUnionType,
     Undefined,
     ValueNode,
@@ -49,17 +47,37 @@ from strawberry.exceptions import (
     ScalarAlreadyRegisteredError,
     UnresolvedFieldTypeError,
 )
-from strawberry.extensions.field_extension import build_field_extension_resolvers
+from strawberry.execution.deadline import with_deadline
+from strawberry.execution.deferred import executing_synchronously
+from strawberry.execution.process_pool import ResolverProcessPool
+from strawberry.execution.thread_pool import ResolverThreadPool
+from strawberry.extensions.field_cache import (
+    InMemoryResolverCache,
+    ResolverCacheExtension,
+)
+from strawberry.extensions.field_extension import (
+    build_field_extension_resolvers,
+    compose_field_extension_resolvers,
+)
 from strawberry.relay.types import GlobalID
 from strawberry.schema.exception_handlers import (
     get_error_type,
     get_exception_types,
 )
+from strawberry.schema.type_resolution import (
+    AbstractTypeResolution,
+    TypeResolutionIndex,
+    mark_class_based_is_type_of,
+)
 from strawberry.schema.types.scalar import (
     DEFAULT_SCALAR_REGISTRY,
     _make_scalar_type,
 )
-from strawberry.types.arguments import StrawberryArgument, convert_arguments
+from strawberry.types.arguments import (
+    StrawberryArgument,
+    compile_arguments_converter,
+    convert_arguments,
+)
 from strawberry.types.base import (
     StrawberryList,
     StrawberryMaybe,
@@ -94,6 +112,7 @@ if TYPE_CHECKING:
     )
 
     from strawberry.directive import StrawberryDirective
+    from strawberry.extensions.field_cache import ResolverCacheStore
     from strawberry.schema.config import StrawberryConfig
     from strawberry.schema.exception_handlers import ExceptionHandler
     from strawberry.schema_directive import StrawberrySchemaDirective
@@ -348,13 +367,17 @@ def get_arguments(
     kwargs: Any,
     config: StrawberryConfig,
     scalar_registry: Mapping[object, ScalarWrapper | ScalarDefinition],
+    arguments_converter: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
 ) -> tuple[list[Any], dict[str, Any]]:
-    kwargs = convert_arguments(
-        kwargs,
-        field.arguments,
-        scalar_registry=scalar_registry,
-        config=config,
-    )
+    if arguments_converter is not None:
+        kwargs = arguments_converter(kwargs)
+    else:
+        kwargs = convert_arguments(
+            kwargs,
+            field.arguments,
+            scalar_registry=scalar_registry,
+            config=config,
+        )
 
     # Let field extensions reshape the converted arguments before the resolver
     # is called (e.g. ``InputMutationExtension`` unpacks its ``input`` object
@@ -403,9 +426,13 @@ class GraphQLCoreConverter:
         exception_handlers: Iterable[ExceptionHandler[Any]] = (),
     ) -> None:
         self.type_map: dict[str, ConcreteType] = {}
+        self.type_resolution_index = TypeResolutionIndex(self.type_map)
         self.config = config
         self.scalar_registry = self._get_scalar_registry(scalar_overrides, scalar_map)
         self.get_fields = get_fields
+        # Converters of input types, shared by the argument converters of every
+        # field
+        self._input_converters: dict[object, Callable[[Any], Any]] = {}
         self.exception_handlers = tuple(exception_handlers)
         # Resolving the exception and error types validates each handler, so a
         # misconfigured one fails at schema creation instead of silently never
@@ -416,6 +443,36 @@ class GraphQLCoreConverter:
             (get_exception_types(handler), get_error_type(handler), handler)
             for handler in self.exception_handlers
         )
+        self._resolver_thread_pool = config.resolver_thread_pool
+        self._resolver_process_pool = config.resolver_process_pool
+        self._resolver_cache = config.resolver_cache
+        # Whether a field uses the resolver cache, the results of cached
+        # fields are then shared between the calls of each request
+        self.has_cached_fields = False
+
+    @property
+    def resolver_thread_pool(self) -> ResolverThreadPool:
+        """The thread pool of resolvers using the `"thread"` executor."""
+        if self._resolver_thread_pool is None:
+            self._resolver_thread_pool = ResolverThreadPool()
+
+        return self._resolver_thread_pool
+
+    @property
+    def resolver_process_pool(self) -> ResolverProcessPool:
+        """The process pool of resolvers using the `"process"` executor."""
+        if self._resolver_process_pool is None:
+            self._resolver_process_pool = ResolverProcessPool()
+
+        return self._resolver_process_pool
+
+    @property
+    def resolver_cache(self) -> ResolverCacheStore:
+        """The store of the results of fields with a `CachePolicy`."""
+        if self._resolver_cache is None:
+            self._resolver_cache = InMemoryResolverCache()
+
+        return self._resolver_cache
 
     def _get_scalar_registry(
         self,
@@ -723,44 +780,29 @@ class GraphQLCoreConverter:
             if interface.resolve_type:
                 return interface.resolve_type
 
+            resolution = AbstractTypeResolution(self.type_resolution_index)
+
             def resolve_type(
                 obj: Any, info: GraphQLResolveInfo, abstract_type: GraphQLAbstractType
             ) -> Awaitable[str | None] | str | None:
                 if isinstance(obj, interface.origin):
+                    # Objects of generic types resolve to one of the concrete
+                    # types of the schema
+                    if (name := resolution.resolve_object(obj)) is not None:
+                        return name
+
                     type_definition = get_object_definition(obj, strict=True)
 
-                    # TODO: we should find the correct type here from the
-                    # generic
                     if not type_definition.is_graphql_generic:
                         return type_definition.name
 
-                    # here we don't all the implementations of the generic
-                    # we need to find a way to find them, for now maybe
-                    # we can follow the union's approach and iterate over
-                    # all the types in the schema, but we should probably
-                    # optimize this
-
-                    return_type: GraphQLType | None = None
-
-                    for possible_concrete_type in self.type_map.values():
-                        possible_type = possible_concrete_type.definition
-
-                        if not isinstance(
-                            possible_type, StrawberryObjectDefinition
-                        ):  # pragma: no cover
-                            continue
-
-                        if possible_type.is_implemented_by(obj):
-                            return_type = possible_concrete_type.implementation
-                            break
-
-                    if return_type:
-                        assert isinstance(return_type, GraphQLNamedType)
-
-                        return return_type.name
-
                 # Revert to calling is_type_of for cases where a direct subclass
                 # of the interface is not returned (i.e. an ORM object)
+                possible_types = info.schema.get_possible_types(abstract_type)
+
+                if resolution.has_class_based_is_type_of(possible_types):
+                    return resolution.resolve_with_is_type_of(obj, info, possible_types)
+
                 return default_type_resolver(obj, info, abstract_type)
 
             return resolve_type
@@ -828,7 +870,7 @@ class GraphQLCoreConverter:
 
                 return isinstance(obj, possible_types)
 
-            return is_type_of
+            return mark_class_based_is_type_of(is_type_of)
 
         graphql_object_type = GraphQLObjectType(
             name=object_type_name,
@@ -895,6 +937,7 @@ class GraphQLCoreConverter:
                 return field.get_result(_source, info=None, args=[], kwargs={})
 
             _get_basic_result._is_default = True  # type: ignore
+            _get_basic_result._is_basic = True  # type: ignore
 
             return _get_basic_result
 
@@ -904,12 +947,34 @@ class GraphQLCoreConverter:
                 _field=field,
             )
 
+        executor = field.executor or self.config.default_resolver_executor
+        # Only the resolver function runs in a worker process, it is checked
+        # here so that a resolver which can't be sent to a worker fails when
+        # the schema is created
+        call_in_process = (
+            self.resolver_process_pool.bind(field) if executor == "process" else None
+        )
+
+        cache_resolve: Callable[..., Any] | None = None
+
+        if field.cache is not None:
+            cache_extension = ResolverCacheExtension(field.cache, self.resolver_cache)
+            cache_resolve = (
+                cache_extension.resolve_async
+                if field.is_async
+                else cache_extension.resolve
+            )
+            self.has_cached_fields = True
+
         def _get_result(
             _source: Any,
             info: Info,
             field_args: list[Any],
             field_kwargs: dict[str, Any],
         ) -> Any:
+            if call_in_process is not None:
+                return call_in_process(field_args, field_kwargs)
+
             return field.get_result(
                 _source, info=info, args=field_args, kwargs=field_kwargs
             )
@@ -991,6 +1056,46 @@ class GraphQLCoreConverter:
             # that type-changing extensions are reflected before handlers are
             # matched; here we only need to build the resolver chain.
             extension_functions = build_field_extension_resolvers(field)
+            arguments_converter = compile_arguments_converter(
+                field.arguments,
+                self.scalar_registry,
+                self.config,
+                self._input_converters,
+            )
+
+            # The chain is composed once, so it can't hold the arguments of a
+            # call: the positional arguments are rebuilt from the source it
+            # receives, and ``info`` is put back in the keyword arguments if
+            # the resolver asked for it.
+            base_resolver = field.base_resolver
+            resolver_requested_self = bool(
+                base_resolver and base_resolver.self_parameter
+            )
+            resolver_requested_info = bool(
+                base_resolver
+                and base_resolver.info_parameter
+                and base_resolver.info_parameter.name == "info"
+            )
+
+            def get_result(_source: Any, info: Info, **kwargs: Any) -> Any:
+                if resolver_requested_info:
+                    kwargs["info"] = info
+
+                return _get_result(
+                    _source,
+                    info,
+                    field_args=[_source] if resolver_requested_self else [],
+                    field_kwargs=kwargs,
+                )
+
+            resolve_with_extensions = compose_field_extension_resolvers(
+                extension_functions,
+                # The other field extensions, permissions included, run on
+                # every call, so the cache sits between them and the resolver
+                partial(cache_resolve, get_result)
+                if cache_resolve is not None and extension_functions
+                else get_result,
+            )
 
             def extension_resolver(
                 _source: Any,
@@ -999,44 +1104,26 @@ class GraphQLCoreConverter:
             ) -> Any:
                 # parse field arguments into Strawberry input types and convert
                 # field names to Python equivalents
-                field_args, field_kwargs = get_arguments(
+                _, field_kwargs = get_arguments(
                     field=field,
                     source=_source,
                     info=info,
                     kwargs=kwargs,
                     config=self.config,
                     scalar_registry=self.scalar_registry,
+                    arguments_converter=arguments_converter,
                 )
 
-                resolver_requested_info = False
-                if "info" in field_kwargs:
-                    resolver_requested_info = True
+                if resolver_requested_info:
                     # remove info from field_kwargs because we're passing it
                     # explicitly to the extensions
                     field_kwargs.pop("info")
 
-                # `_get_result` expects `field_args` and `field_kwargs` as
-                # separate arguments so we have to wrap the function so that we
-                # can pass them in
-                def wrapped_get_result(_source: Any, info: Info, **kwargs: Any) -> Any:
-                    # if the resolver function requested the info object
-                    # then put it back in the kwargs dictionary
-                    if resolver_requested_info:
-                        kwargs["info"] = info
+                return resolve_with_extensions(_source, info, **field_kwargs)
 
-                    return _get_result(
-                        _source,
-                        info,
-                        field_args=field_args,
-                        field_kwargs=kwargs,
-                    )
-
-                # combine all the extension resolvers
-                return reduce(
-                    lambda chained_fn, next_fn: partial(next_fn, chained_fn),
-                    extension_functions,
-                    wrapped_get_result,
-                )(_source, info, **field_kwargs)
+            if cache_resolve is not None and not extension_functions:
+                # Cached results skip the conversion of the arguments
+                return partial(cache_resolve, extension_resolver)
 
             return extension_resolver
 
@@ -1086,11 +1173,38 @@ class GraphQLCoreConverter:
                 )
             )
 
+        if field.is_subscription:
+            # Subscriptions aren't bounded by the deadline of an operation
+            subscription_resolver = _async_resolver if field.is_async else _resolver
+            subscription_resolver._is_default = not field.base_resolver  # type: ignore
+            return subscription_resolver
+
         if field.is_async:
-            _async_resolver._is_default = not field.base_resolver  # type: ignore
-            return _async_resolver
-        _resolver._is_default = not field.base_resolver  # type: ignore
-        return _resolver
+            async_resolver = with_deadline(_async_resolver)
+            async_resolver._is_default = not field.base_resolver  # type: ignore
+            return async_resolver
+
+        if field.base_resolver is not None and executor in ("thread", "process"):
+            thread_pool = self.resolver_thread_pool
+
+            def _thread_pool_resolver(
+                _source: Any, info: GraphQLResolveInfo, **kwargs: Any
+            ) -> Any:
+                # Synchronous execution can't wait for the thread pool, a
+                # resolver using the process pool blocks until its result is
+                # sent back
+                if executing_synchronously.get():
+                    return _resolver(_source, info, **kwargs)
+
+                return thread_pool.run(_resolver, _source, info, **kwargs)
+
+            thread_pool_resolver = with_deadline(_thread_pool_resolver)
+            thread_pool_resolver._is_default = False  # type: ignore
+            return thread_pool_resolver
+
+        resolver = with_deadline(_resolver)
+        resolver._is_default = not field.base_resolver  # type: ignore
+        return resolver
 
     def from_scalar(self, scalar: type) -> GraphQLScalarType:
         from strawberry.relay.types import GlobalID
@@ -1241,7 +1355,9 @@ class GraphQLCoreConverter:
             name=union_name,
             types=graphql_types,
             description=union.description,
-            resolve_type=union.get_type_resolver(self.type_map),
+            resolve_type=union.get_type_resolver(
+                self.type_map, self.type_resolution_index
+            ),
             extensions={
                 GraphQLCoreConverter.DEFINITION_BACKREF: union,
             },
@@ -1275,7 +1391,7 @@ class GraphQLCoreConverter:
 
                 return isinstance(obj, object_type.origin)
 
-            return is_type_of
+            return mark_class_based_is_type_of(is_type_of)
 
         return None
 
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from graphql import GraphQLError, specified_rules
+
+from strawberry.extensions.document_cache import CachedDocument
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from graphql import GraphQLSchema
+
+
+class TrustedDocumentNotFound(GraphQLError):
+    def __init__(self, document_id: str) -> None:
+        super().__init__(
+            f"Trusted document '{document_id}' not found",
+            extensions={"code": "TRUSTED_DOCUMENT_NOT_FOUND"},
+        )
+
+
+class UntrustedDocument(GraphQLError):
+    def __init__(self) -> None:
+        super().__init__(
+            "Only trusted documents are allowed, send a document id instead of a query",
+            extensions={"code": "UNTRUSTED_DOCUMENT"},
+        )
+
+
+class TrustedDocuments:
+    """An allowlist of operations, identified by their document id.
+
+    Every document is parsed and validated once when the schema is created, so
+    requests only look up the precompiled document by its id.
+
+    ```python
+    import strawberry
+    from strawberry.schema.trusted_documents import TrustedDocuments
+
+    schema = strawberry.Schema(
+        Query,
+        trusted_documents=TrustedDocuments.from_file("trusted-documents.json"),
+    )
+    ```
+    """
+
+    def __init__(self, documents: Mapping[str, str]) -> None:
+        """Initialize the TrustedDocuments.
+
+        Args:
+            documents: A mapping of document ids to GraphQL documents.
+        """
+        self.documents = dict(documents)
+        self._compiled: dict[str, CachedDocument] = {}
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> TrustedDocuments:
+        """Load a JSON manifest mapping document ids to documents."""
+        documents = json.loads(data)
+
+        if not isinstance(documents, dict) or not all(
+            isinstance(key, str) and isinstance(value, str)
+            for key, value in documents.items()
+        ):
+            raise ValueError(
+                "The trusted documents manifest must be a JSON object mapping "
+                "document ids to documents"
+            )
+
+        return cls(documents)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> TrustedDocuments:
+        """Load a JSON manifest file mapping document ids to documents."""
+        return cls.from_json(Path(path).read_bytes())
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, document_id: str) -> bool:
+        return document_id in self.documents
+
+    def compile(self, schema: GraphQLSchema) -> None:
+        """Parse and validate every document against the schema.
+
+        Raises:
+            ValueError: If any of the documents is invalid.
+        """
+        rules = tuple(specified_rules)
+        compiled: dict[str, CachedDocument] = {}
+        errors: list[str] = []
+
+        for document_id, query in self.documents.items():
+            try:
+                cached_document = CachedDocument.from_query(query)
+            except GraphQLError as error:
+                errors.append(f"❌ {document_id}: {error.message}")
+                continue
+
+            errors.extend(
+                f"❌ {document_id}: {error.message}"
+                for error in cached_document.validate(schema, rules)
+            )
+            compiled[document_id] = cached_document
+
+        if errors:
+            formatted_errors = "\n\n".join(errors)
+            raise ValueError(f"Invalid trusted documents:\n\n{formatted_errors}")
+
+        self._compiled = compiled
+
+    def get(self, document_id: str) -> CachedDocument | None:
+        return self._compiled.get(document_id)
+
+
+__all__ = ["TrustedDocumentNotFound", "TrustedDocuments", "UntrustedDocument"]
@@ -0,0 +1,208 @@
+"""Resolve the runtime object type of values returned for interfaces and unions.
+
+Finding the GraphQL type of a Strawberry object used to mean checking every
+type of the schema, and objects without a Strawberry definition (ORM models,
+pydantic models...) were checked against the ``is_type_of`` of each possible
+type. `TypeResolutionIndex` maps each definition to the types implementing it
+once, and `AbstractTypeResolution` memoizes the result for each class returned
+for an interface or union.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from strawberry.types.base import StrawberryObjectDefinition
+from strawberry.types.cast import get_strawberry_type_cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from graphql import GraphQLObjectType, GraphQLResolveInfo
+
+    from strawberry.schema.types.concrete_type import ConcreteType, TypeMap
+
+__all__ = [
+    "AbstractTypeResolution",
+    "TypeResolutionIndex",
+    "is_class_based_is_type_of",
+    "mark_class_based_is_type_of",
+]
+
+_MISSING = object()
+
+
+def mark_class_based_is_type_of(
+    is_type_of: Callable[..., bool],
+) -> Callable[..., bool]:
+    """Mark an `is_type_of` whose result only depends on the class of objects.
+
+    Such functions may still check `strawberry.cast`, objects with a type cast
+    are never memoized.
+    """
+    is_type_of._is_class_based = True  # type: ignore[attr-defined]
+
+    return is_type_of
+
+
+def is_class_based_is_type_of(is_type_of: Callable[..., Any] | None) -> bool:
+    return is_type_of is None or getattr(is_type_of, "_is_class_based", False)
+
+
+class TypeResolutionIndex:
+    """Map the definitions of a schema to the object types implementing them.
+
+    The index is built from the type map of the schema converter the first time
+    it is used, or explicitly with `build` once the schema is created.
+    """
+
+    def __init__(self, type_map: TypeMap) -> None:
+        self.type_map = type_map
+        self._implementations: (
+            dict[StrawberryObjectDefinition, list[ConcreteType]] | None
+        ) = None
+
+    def build(self) -> None:
+        implementations: dict[StrawberryObjectDefinition, list[ConcreteType]] = {}
+
+        for concrete_type in self.type_map.values():
+            definition = concrete_type.definition
+
+            if not isinstance(definition, StrawberryObjectDefinition):
+                continue
+
+            implementations.setdefault(definition, []).append(concrete_type)
+
+            # Objects of a generic type are implemented by its concrete types
+            if definition.concrete_of is not None:
+                implementations.setdefault(definition.concrete_of, []).append(
+                    concrete_type
+                )
+
+        self._implementations = implementations
+
+    def implementations(
+        self, definition: StrawberryObjectDefinition
+    ) -> list[ConcreteType]:
+        """Return the types objects with `definition` may resolve to.
+
+        Types are in the order of the type map, the type whose definition is
+        `definition` is the only one matching objects that aren't generic.
+        """
+        if self._implementations is None:
+            self.build()
+            assert self._implementations is not None
+
+        return self._implementations.get(definition, [])
+
+
+class AbstractTypeResolution:
+    """Memoized type resolution for one interface or union."""
+
+    def __init__(self, index: TypeResolutionIndex) -> None:
+        self.index = index
+        # Definition -> the name of the only type it resolves to, or the types
+        # to check with `is_implemented_by`, preferred types first
+        self._definitions: dict[StrawberryObjectDefinition, str | list[Any]] = {}
+        # Class -> type name, for objects resolved through `is_type_of`
+        self._classes: dict[type, str | None] = {}
+        self._class_based: bool | None = None
+
+    def has_class_based_is_type_of(
+        self, possible_types: Iterable[GraphQLObjectType]
+    ) -> bool:
+        """Whether each of `possible_types` has a class based `is_type_of`.
+
+        Those are synchronous, so `resolve_with_is_type_of` can be used instead
+        of graphql-core's default type resolver.
+        """
+        if self._class_based is None:
+            self._class_based = all(
+                is_class_based_is_type_of(type_.is_type_of) for type_ in possible_types
+            )
+
+        return self._class_based
+
+    def resolve_object(
+        self, root: Any, preferred: Iterable[GraphQLObjectType] = ()
+    ) -> str | None:
+        """Return the name of the type a Strawberry object resolves to.
+
+        Generic types are checked in the order of `preferred` first, in case a
+        nested generic object matches more than one type.
+        """
+        definition = root.__strawberry_definition__
+        candidates = self._definitions.get(definition)
+
+        if candidates is None:
+            candidates = self._definitions[definition] = self._get_candidates(
+                definition, preferred
+            )
+
+        if isinstance(candidates, str):
+            return candidates
+
+        for concrete_type in candidates:
+            if concrete_type.definition.is_implemented_by(root):
+                return concrete_type.implementation.name
+
+        return None
+
+    def _get_candidates(
+        self,
+        definition: StrawberryObjectDefinition,
+        preferred: Iterable[GraphQLObjectType],
+    ) -> str | list[Any]:
+        implementations = self.index.implementations(definition)
+
+        if len(implementations) == 1 and implementations[0].definition is definition:
+            return implementations[0].implementation.name
+
+        by_name = {
+            concrete_type.implementation.name: concrete_type  # type: ignore[attr-defined]
+            for concrete_type in implementations
+        }
+        candidates = [
+            by_name[type_.name] for type_ in preferred if type_.name in by_name
+        ]
+
+        return candidates + [
+            concrete_type
+            for concrete_type in implementations
+            if concrete_type not in candidates
+        ]
+
+    def resolve_with_is_type_of(
+        self,
+        root: Any,
+        info: GraphQLResolveInfo,
+        possible_types: Iterable[GraphQLObjectType],
+    ) -> str | None:
+        """Return the first of `possible_types` whose `is_type_of` matches `root`.
+
+        `is_type_of` is called synchronously. The result is memoized for the
+        class of `root` when each `is_type_of` that was called only depends on
+        the class of objects, see `mark_class_based_is_type_of`.
+        """
+        cls = type(root)
+        memoizable = root.__class__ is cls and get_strawberry_type_cast(root) is None
+
+        if memoizable and (name := self._classes.get(cls, _MISSING)) is not _MISSING:
+            return name  # type: ignore[return-value]
+
+        name = None
+
+        for type_ in possible_types:
+            if type_.is_type_of is None:
+                continue
+
+            memoizable = memoizable and is_class_based_is_type_of(type_.is_type_of)
+
+            if type_.is_type_of(root, info):
+                name = type_.name
+                break
+
+        if memoizable:
+            self._classes[cls] = name
+
+        return name
@@ -1,8 +1,76 @@
+from enum import Enum
+
 from strawberry.schema_directive import Location, schema_directive
+from strawberry.types.enum import enum
+from strawberry.types.unset import UNSET
 
 
 @schema_directive(locations=[Location.INPUT_OBJECT], name="oneOf")
 class OneOf: ...
 
 
-__all__ = ["OneOf"]
+@schema_directive(
+    locations=[
+        Location.FIELD_DEFINITION,
+        Location.OBJECT,
+        Location.INTERFACE,
+        Location.SCALAR,
+        Location.ENUM,
+    ],
+    name="cost",
+)
+class Cost:
+    """The weight of a field, or of each value of a type.
+
+    Used by the `QueryCostLimiter` extension.
+    """
+
+    weight: int
+
+
+@schema_directive(locations=[Location.FIELD_DEFINITION], name="listSize")
+class ListSize:
+    """How many items a list field, or a connection field, returns.
+
+    Used by the `QueryCostLimiter` extension. `slicing_arguments` are the
+    arguments limiting the number of items, `assumed_size` is used when none of
+    them is passed and `sized_fields` are the list fields of a connection the
+    size applies to.
+    """
+
+    assumed_size: int | None = UNSET
+    slicing_arguments: list[str] | None = UNSET
+    sized_fields: list[str] | None = UNSET
+
+
+@enum
+class CacheControlScope(Enum):
+    PUBLIC = "PUBLIC"
+    PRIVATE = "PRIVATE"
+
+
+@schema_directive(
+    locations=[
+        Location.FIELD_DEFINITION,
+        Location.OBJECT,
+        Location.INTERFACE,
+        Location.UNION,
+    ],
+    name="cacheControl",
+)
+class CacheControl:
+    """How long the value of a field, or of a type, can be cached.
+
+    Used by the `ResponseCache` extension. Fields without a `max_age` returning
+    objects, interfaces or unions, and root fields, use the default max age of
+    the extension, other fields use the max age of their parent field.
+    `inherit_max_age` makes a field use the max age of its parent field
+    whatever it returns.
+    """
+
+    max_age: int | None = UNSET
+    scope: CacheControlScope | None = UNSET
+    inherit_max_age: bool | None = UNSET
+
+
+__all__ = ["CacheControl", "CacheControlScope", "Cost", "ListSize", "OneOf"]
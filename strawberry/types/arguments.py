@@ -25,7 +25,7 @@ from strawberry.types.maybe import Some
 from strawberry.types.unset import UNSET
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Iterable, Mapping
 
     from strawberry.schema.config import StrawberryConfig
     from strawberry.types.base import StrawberryType
@@ -265,6 +265,176 @@ def convert_argument(
     raise UnsupportedTypeError(type_)
 
 
+def compile_argument_converter(
+    type_: StrawberryType | type,
+    scalar_registry: Mapping[object, ScalarWrapper | ScalarDefinition],
+    config: StrawberryConfig,
+    cache: dict[object, Callable[[Any], Any]] | None = None,
+) -> Callable[[Any], Any]:
+    """Build a function converting values of `type_` like `convert_argument` does.
+
+    The type checks and the name conversion of input fields are done once here
+    instead of for every value. `cache` holds the converters of input types, so
+    they are shared between arguments and recursive input types are supported.
+    """
+    from strawberry.relay.types import GlobalID
+
+    if cache is None:
+        cache = {}
+
+    def compile_type(type_: StrawberryType | type) -> Callable[[Any], Any]:
+        return compile_argument_converter(type_, scalar_registry, config, cache)
+
+    if isinstance(type_, StrawberryMaybe):
+        convert_maybe = compile_type(type_.of_type)
+
+        # Maybe[T | None] allows null values
+        if isinstance(type_.of_type, StrawberryOptional):
+            return lambda value: Some(convert_maybe(value))
+
+        type_name = getattr(type_.of_type, "__name__", str(type_.of_type))
+
+        def convert_required_maybe(value: Any) -> Any:
+            if value is None:
+                from strawberry.exceptions import StrawberryGraphQLError
+
+                raise StrawberryGraphQLError(
+                    f"Expected value of type '{type_name}', found null. "
+                    f"Field of type 'Maybe[{type_name}]' cannot be explicitly set to null. "
+                    f"Use 'Maybe[{type_name} | None]' if you need to allow null values."
+                )
+
+            return Some(convert_maybe(value))
+
+        return convert_required_maybe
+
+    if isinstance(type_, StrawberryOptional):
+        return compile_type(type_.of_type)
+
+    if isinstance(type_, StrawberryList):
+        if _is_leaf_type(
+            type_.of_type, scalar_registry, skip_classes=(GlobalID,)
+        ) or _is_optional_leaf_type(
+            type_.of_type, scalar_registry, skip_classes=(GlobalID,)
+        ):
+            return _identity
+
+        convert_item = compile_type(type_.of_type)
+
+        def convert_list(value: Any) -> Any:
+            if value is None or value is UNSET:
+                return value
+
+            return [convert_item(item) for item in value]
+
+        return convert_list
+
+    if _is_leaf_type(type_, scalar_registry):
+        if type_ is GlobalID:
+            return _convert_global_id
+
+        return _identity
+
+    if isinstance(type_, LazyType):
+        return compile_type(type_.resolve_type())
+
+    if has_enum_definition(type_):
+        return compile_type(type_.__strawberry_definition__)
+
+    if has_object_definition(type_):
+        if (convert_object := cache.get(type_)) is not None:
+            return convert_object
+
+        input_type = cast("type", type_)
+        fields: list[tuple[str, str, Callable[[Any], Any]]] = []
+
+        def convert_input(value: Any) -> Any:
+            if value is None or value is UNSET:
+                return value
+
+            return input_type(
+                **{
+                    python_name: convert_field(value[graphql_name])
+                    for graphql_name, python_name, convert_field in fields
+                    if graphql_name in value
+                }
+            )
+
+        # Registered before compiling the fields, which can refer to this type
+        cache[type_] = convert_input
+
+        type_definition = type_.__strawberry_definition__
+        fields.extend(
+            (
+                config.name_converter.from_field(field),
+                field.python_name,
+                compile_type(field.resolve_type(type_definition=type_definition)),
+            )
+            for field in type_definition.fields
+        )
+
+        return convert_input
+
+    def convert_unsupported(value: Any) -> Any:
+        if value is None or value is UNSET:
+            return value
+
+        raise UnsupportedTypeError(type_)
+
+    return convert_unsupported
+
+
+def compile_arguments_converter(
+    arguments: list[StrawberryArgument],
+    scalar_registry: Mapping[object, ScalarWrapper | ScalarDefinition],
+    config: StrawberryConfig,
+    cache: dict[object, Callable[[Any], Any]] | None = None,
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Build a function converting arguments like `convert_arguments` does."""
+    if not arguments:
+        return lambda value: {}
+
+    if cache is None:
+        cache = {}
+
+    converters: list[tuple[str, str, Callable[[Any], Any]]] = []
+
+    for argument in arguments:
+        assert argument.python_name
+
+        converters.append(
+            (
+                config.name_converter.from_argument(argument),
+                argument.python_name,
+                compile_argument_converter(
+                    argument.type, scalar_registry, config, cache
+                ),
+            )
+        )
+
+    def convert(value: dict[str, Any]) -> dict[str, Any]:
+        return {
+            python_name: convert_value(value[name])
+            for name, python_name, convert_value in converters
+            if name in value
+        }
+
+    return convert
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _convert_global_id(value: Any) -> Any:
+    from strawberry.relay.types import GlobalID
+
+    if value is None or value is UNSET:
+        return value
+
+    return GlobalID.from_id(value)
+
+
 def convert_arguments(
     value: dict[str, Any],
     arguments: list[StrawberryArgument],
@@ -354,4 +524,6 @@ __all__ = [
     "StrawberryArgument",
     "StrawberryArgumentAnnotation",
     "argument",
+    "compile_argument_converter",
+    "compile_arguments_converter",
 ]
@@ -27,7 +27,7 @@ except ImportError:
         extensions: dict[str, Any] | None
 
 
-from strawberry.utils.operation import get_first_operation, get_operation_type
+from strawberry.utils.operation import DocumentOperations
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -37,6 +37,7 @@ if TYPE_CHECKING:
     from graphql.error.graphql_error import GraphQLError
     from graphql.language import DocumentNode, OperationDefinitionNode
 
+    from strawberry.extensions.document_cache import CachedDocument
     from strawberry.schema import Schema
     from strawberry.schema._graphql_core import GraphQLExecutionResult
 
@@ -72,8 +73,13 @@ class ExecutionContext:
 
     operation_extensions: dict[str, Any] | None = None
 
+    # The id of the trusted document requested, if any
+    document_id: str | None = None
+
     def __post_init__(self, provided_operation_name: str | None) -> None:
         self._provided_operation_name = provided_operation_name
+        self._document_operations: DocumentOperations | None = None
+        self._trusted_document: CachedDocument | None = None
 
     @property
     def operation_name(self) -> str | None:
@@ -91,18 +97,33 @@ class ExecutionContext:
 
     @property
     def operation_type(self) -> OperationType:
-        graphql_document = self.graphql_document
-        if not graphql_document:
+        operations = self._get_document_operations()
+        if not operations:
             raise RuntimeError("No GraphQL document available")
 
-        return get_operation_type(graphql_document, self.operation_name)
+        return operations.get_operation_type(self.operation_name)
 
     def _get_first_operation(self) -> OperationDefinitionNode | None:
+        operations = self._get_document_operations()
+        if not operations:
+            return None
+
+        return operations.first
+
+    def _get_document_operations(self) -> DocumentOperations | None:
         graphql_document = self.graphql_document
         if not graphql_document:
             return None
 
-        return get_first_operation(graphql_document)
+        # Index the operations once per document, extensions that cache
+        # documents (like `DocumentCache`) can also provide a prebuilt index.
+        operations = self._document_operations
+        if operations is None or operations.document is not graphql_document:
+            operations = self._document_operations = DocumentOperations(
+                graphql_document
+            )
+
+        return operations
 
 
 @dataclasses.dataclass
@@ -32,6 +32,8 @@ if TYPE_CHECKING:
     from typing import Literal
     from typing_extensions import Self
 
+    from strawberry.execution.thread_pool import ResolverExecutor
+    from strawberry.extensions.field_cache import CachePolicy
     from strawberry.extensions.field_extension import FieldExtension
     from strawberry.permission import BasePermission
     from strawberry.types.arguments import StrawberryArgument
@@ -96,6 +98,8 @@ class StrawberryField(dataclasses.Field):
         deprecation_reason: str | None = None,
         directives: Sequence[object] = (),
         extensions: list[FieldExtension] = (),  # type: ignore
+        executor: ResolverExecutor | None = None,
+        cache: CachePolicy | None = None,
     ) -> None:
         # basic fields are fields with no provided resolver
         is_basic_field = not base_resolver
@@ -164,6 +168,8 @@ class StrawberryField(dataclasses.Field):
                 PermissionExtension(permission_instances, use_directives=False)
             )
         self.deprecation_reason = deprecation_reason
+        self.executor = executor
+        self.cache = cache
 
     def __copy__(self) -> Self:
         new_field = type(self)(
@@ -185,6 +191,8 @@ class StrawberryField(dataclasses.Field):
             deprecation_reason=self.deprecation_reason,
             directives=self.directives[:] if self.directives is not None else [],
             extensions=self.extensions[:] if self.extensions is not None else [],
+            executor=self.executor,
+            cache=self.cache,
         )
         new_field._arguments = (
             self._arguments[:] if self._arguments is not None else None
@@ -416,6 +424,8 @@ def field(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
+    cache: CachePolicy | None = None,
 ) -> T: ...
 
 
@@ -435,6 +445,8 @@ def field(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
+    cache: CachePolicy | None = None,
 ) -> T: ...
 
 
@@ -453,6 +465,8 @@ def field(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
+    cache: CachePolicy | None = None,
 ) -> Any: ...
 
 
@@ -471,6 +485,8 @@ def field(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
+    cache: CachePolicy | None = None,
 ) -> StrawberryField: ...
 
 
@@ -489,6 +505,8 @@ def field(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
+    cache: CachePolicy | None = None,
 ) -> StrawberryField: ...
 
 
@@ -506,6 +524,8 @@ def field(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
+    cache: CachePolicy | None = None,
     # This init parameter is used by PyRight to determine whether this field
     # is added in the constructor or not. It is not used to change
     # any behavior at the moment.
@@ -527,6 +547,12 @@ def field(
         extensions: The extensions for the field.
         graphql_type: The GraphQL type for the field, useful when you want to use a
             different type in the resolver than the one in the schema.
+        executor: Where a synchronous resolver is called under async execution,
+            `"inline"` on the event loop or `"thread"` in the resolver thread
+            pool of the schema. `"process"` calls the resolver function in the
+            resolver process pool of the schema, also under sync execution.
+            Defaults to the `default_resolver_executor` of the schema config.
+        cache: How the result of the resolver is cached, see `CachePolicy`.
         init: This parameter is used by PyRight to determine whether this field is
             added in the constructor or not. It is not used to change any behavior
             at the moment.
@@ -566,6 +592,8 @@ def field(
         metadata=metadata,
         directives=directives or (),
         extensions=extensions or [],
+        executor=executor,
+        cache=cache,
     )
 
     if resolver:
@@ -9,12 +9,15 @@ from typing import (
 )
 from typing_extensions import TypeVar
 
+from strawberry.execution.deadline import get_deadline
+
 from .nodes import convert_selections
 
 if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo, OperationDefinitionNode
     from graphql.pyutils.path import Path
 
+    from strawberry.execution.deadline import Deadline
     from strawberry.schema import Schema
     from strawberry.types.arguments import StrawberryArgument
     from strawberry.types.field import FieldType, StrawberryField
@@ -141,6 +144,15 @@ class Info(Generic[ContextType, RootValueType]):
         """The path of the current field being resolved."""
         return self._raw_info.path
 
+    @property
+    def deadline(self) -> Deadline | None:
+        """The deadline of the operation, `None` when it has no timeout.
+
+        `deadline.remaining` is the number of seconds left, to pass as the
+        timeout of the I/O done by the resolver.
+        """
+        return get_deadline()
+
     # TODO: parent_type as strawberry types
 
     # Helper functions
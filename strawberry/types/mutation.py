@@ -21,6 +21,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Mapping, Sequence
     from typing import Literal
 
+    from strawberry.execution.thread_pool import ResolverExecutor
     from strawberry.extensions.field_extension import FieldExtension
     from strawberry.permission import BasePermission
 
@@ -43,6 +44,7 @@ def mutation(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
 ) -> T: ...
 
 
@@ -61,6 +63,7 @@ def mutation(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
 ) -> T: ...
 
 
@@ -78,6 +81,7 @@ def mutation(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
 ) -> Any: ...
 
 
@@ -95,6 +99,7 @@ def mutation(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
 ) -> StrawberryField: ...
 
 
@@ -112,6 +117,7 @@ def mutation(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
 ) -> StrawberryField: ...
 
 
@@ -128,6 +134,7 @@ def mutation(
     directives: Sequence[object] | None = (),
     extensions: list[FieldExtension] | None = None,
     graphql_type: Any | None = None,
+    executor: ResolverExecutor | None = None,
     # This init parameter is used by PyRight to determine whether this field
     # is added in the constructor or not. It is not used to change
     # any behavior at the moment.
@@ -148,6 +155,10 @@ def mutation(
         extensions: The extensions for the field.
         graphql_type: The GraphQL type for the field, useful when you want to use a
             different type in the resolver than the one in the schema.
+        executor: Where a synchronous resolver is called under async execution,
+            `"inline"` on the event loop or `"thread"` in the resolver thread
+            pool of the schema. `"process"` calls the resolver function in the
+            resolver process pool of the schema, also under sync execution.
         init: This parameter is used by PyRight to determine whether this field is
             added in the constructor or not. It is not used to change any behavior at
             the moment.
@@ -181,6 +192,7 @@ def mutation(
         directives=directives,
         extensions=extensions,
         graphql_type=graphql_type,
+        executor=executor,
     )
 
 
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import itertools
 import sys
-from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -13,7 +12,7 @@ from typing import (
     get_origin,
 )
 
-from graphql import GraphQLNamedType, GraphQLUnionType
+from graphql import GraphQLUnionType
 
 from strawberry.annotation import StrawberryAnnotation
 from strawberry.exceptions import (
@@ -35,10 +34,10 @@ if TYPE_CHECKING:
     from graphql import (
         GraphQLAbstractType,
         GraphQLResolveInfo,
-        GraphQLType,
         GraphQLTypeResolver,
     )
 
+    from strawberry.schema.type_resolution import TypeResolutionIndex
     from strawberry.schema.types.concrete_type import TypeMap
 
 
@@ -165,62 +164,60 @@ class StrawberryUnion(StrawberryType):
         """
         raise ValueError("Cannot use union type directly")
 
-    def get_type_resolver(self, type_map: TypeMap) -> GraphQLTypeResolver:
+    def get_type_resolver(
+        self,
+        type_map: TypeMap,
+        type_resolution_index: TypeResolutionIndex | None = None,
+    ) -> GraphQLTypeResolver:
+        from strawberry.schema.type_resolution import (
+            AbstractTypeResolution,
+            TypeResolutionIndex,
+        )
+
+        resolution = AbstractTypeResolution(
+            type_resolution_index or TypeResolutionIndex(type_map)
+        )
+        allowed_names: dict[str, bool] = {}
+
         def _resolve_union_type(
             root: Any, info: GraphQLResolveInfo, type_: GraphQLAbstractType
         ) -> str:
             assert isinstance(type_, GraphQLUnionType)
 
-            from strawberry.types.base import StrawberryObjectDefinition
-
             # If the type given is not an Object type, try resolving using `is_type_of`
             # defined on the union's inner types
             if not has_object_definition(root):
-                for inner_type in type_.types:
-                    if inner_type.is_type_of is not None and inner_type.is_type_of(
-                        root, info
-                    ):
-                        return inner_type.name
+                name = resolution.resolve_with_is_type_of(root, info, type_.types)
 
-                # Couldn't resolve using `is_type_of`
-                raise WrongReturnTypeForUnion(info.field_name, str(type(root)))
+                if name is None:
+                    # Couldn't resolve using `is_type_of`
+                    raise WrongReturnTypeForUnion(info.field_name, str(type(root)))
 
-            return_type: GraphQLType | None
+                return name
 
-            # Iterate over all of our known types and find the first concrete
-            # type that implements the type. We prioritise checking types named in the
-            # Union in case a nested generic object matches against more than one type.
-            concrete_types_for_union = (type_map[x.name] for x in type_.types)
-
-            for possible_concrete_type in chain(
-                concrete_types_for_union, type_map.values()
-            ):
-                possible_type = possible_concrete_type.definition
-                if not isinstance(possible_type, StrawberryObjectDefinition):
-                    continue
-                if possible_type.is_implemented_by(root):
-                    return_type = possible_concrete_type.implementation
-                    break
-            else:
-                return_type = None
+            # Find the concrete type that implements the type. We prioritise
+            # types named in the Union in case a nested generic object matches
+            # against more than one type.
+            name = resolution.resolve_object(root, type_.types)
 
             # If we couldn't resolve from type matching, try using is_type_of
-            if return_type is None:
-                for inner_type in type_.types:
-                    if inner_type.is_type_of is not None and inner_type.is_type_of(
-                        root, info
-                    ):
-                        return inner_type.name
+            if name is None and (
+                name := resolution.resolve_with_is_type_of(root, info, type_.types)
+            ):
+                return name
 
             # Make sure the found type is expected by the Union
-            if return_type is None or return_type not in type_.types:
+            if name is not None and (allowed := allowed_names.get(name)) is None:
+                allowed = allowed_names[name] = any(
+                    inner_type.name == name for inner_type in type_.types
+                )
+
+            if name is None or not allowed:
                 raise UnallowedReturnTypeForUnion(
                     info.field_name, str(type(root)), set(type_.types)
                 )
 
-            assert isinstance(return_type, GraphQLNamedType)
-
-            return return_type.name
+            return name
 
         return _resolve_union_type
 
@@ -0,0 +1,152 @@
+"""In-memory LRU cache with optional expiry and hit/miss counters."""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Generic, TypeVar, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+K = TypeVar("K", bound="Hashable")
+V = TypeVar("V")
+D = TypeVar("D")
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int | None
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """A mapping bounded by size and optionally by the age of its entries.
+
+    Least recently used entries are evicted first. Expired entries are dropped
+    lazily when they are looked up. Operations are guarded by a lock so the cache
+    can be shared between threads.
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = None,
+        ttl: float | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: The maximum number of entries, `None` means unbounded.
+            ttl: The default number of seconds an entry stays valid, `None`
+                means entries never expire.
+            timer: The clock used for expiry, mostly useful for testing.
+        """
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer or None")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[K, tuple[V, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return self._lookup(key) is not _MISSING
+
+    @overload
+    def get(self, key: K) -> V | None: ...
+
+    @overload
+    def get(self, key: K, default: D) -> V | D: ...
+
+    def get(self, key: K, default: object = None) -> object:
+        with self._lock:
+            value = self._lookup(key)
+
+            if value is _MISSING:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self._data.move_to_end(key)
+            return value
+
+    def peek(self, key: K) -> V | None:
+        """Return a value without updating its recency or the hit counters."""
+        with self._lock:
+            value = self._lookup(key)
+
+        return None if value is _MISSING else value  # type: ignore[return-value]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store a value, `ttl` overrides the default expiry of the cache."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self.timer() + ttl
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+
+    def delete(self, key: K) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._data),
+            maxsize=self.maxsize,
+        )
+
+    def _lookup(self, key: K) -> object:
+        entry = self._data.get(key)
+
+        if entry is None:
+            return _MISSING
+
+        value, expires_at = entry
+
+        if expires_at is not None and expires_at <= self.timer():
+            del self._data[key]
+            return _MISSING
+
+        return value
+
+
+_MISSING = object()
+
+
+__all__ = ["CacheStats", "LRUCache"]
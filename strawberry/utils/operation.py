@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hashlib
+import json
+import weakref
+from typing import TYPE_CHECKING, Any
 
-from graphql.language import OperationDefinitionNode
+from graphql.language import OperationDefinitionNode, print_ast
 
 from strawberry.types.graphql import OperationType
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from graphql.language import DocumentNode
 
+# Digests of the printed documents, computed once per parsed document
+_document_digests: weakref.WeakKeyDictionary[DocumentNode, str] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def get_first_operation(
     graphql_document: DocumentNode,
@@ -41,4 +51,70 @@ def get_operation_type(
     return OperationType(definition.operation.value)
 
 
-__all__ = ["get_first_operation", "get_operation_type"]
+class DocumentOperations:
+    """The operations of a document, indexed by name."""
+
+    __slots__ = ("by_name", "document", "first")
+
+    def __init__(self, graphql_document: DocumentNode) -> None:
+        self.document = graphql_document
+        self.first: OperationDefinitionNode | None = None
+        self.by_name: dict[str, OperationDefinitionNode] = {}
+
+        for definition in graphql_document.definitions:
+            if not isinstance(definition, OperationDefinitionNode):
+                continue
+
+            if self.first is None:
+                self.first = definition
+
+            if definition.name and definition.name.value not in self.by_name:
+                self.by_name[definition.name.value] = definition
+
+    def get(self, operation_name: str | None = None) -> OperationDefinitionNode | None:
+        if operation_name is None:
+            return self.first
+
+        return self.by_name.get(operation_name)
+
+    def get_operation_type(self, operation_name: str | None = None) -> OperationType:
+        definition = self.get(operation_name)
+
+        if not definition:
+            raise RuntimeError("Can't get GraphQL operation type")
+
+        return OperationType(definition.operation.value)
+
+
+def get_operation_key(
+    graphql_document: DocumentNode,
+    operation_name: str | None,
+    variables: dict[str, Any] | None,
+    scope: Hashable | None = None,
+) -> str:
+    """Return a key identifying an operation and its variables.
+
+    Documents are normalized by printing them, so formatting and comments
+    don't change the key. `scope` separates the keys of otherwise identical
+    operations, for example per user.
+    """
+    if (document_digest := _document_digests.get(graphql_document)) is None:
+        document_digest = _document_digests[graphql_document] = hashlib.sha256(
+            print_ast(graphql_document).encode()
+        ).hexdigest()
+
+    digest = hashlib.sha256(
+        json.dumps(
+            [operation_name, variables or {}, scope], sort_keys=True, default=repr
+        ).encode()
+    ).hexdigest()
+
+    return f"{document_digest}:{digest}"
+
+
+__all__ = [
+    "DocumentOperations",
+    "get_first_operation",
+    "get_operation_key",
+    "get_operation_type",
+]
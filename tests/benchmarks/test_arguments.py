@@ -1,9 +1,10 @@
 import pytest
 from pytest_codspeed import BenchmarkFixture
 
+import strawberry
 from strawberry.schema.config import StrawberryConfig
 from strawberry.schema.types.scalar import DEFAULT_SCALAR_REGISTRY
-from strawberry.types.arguments import convert_argument
+from strawberry.types.arguments import compile_argument_converter, convert_argument
 from strawberry.types.base import StrawberryList
 
 
@@ -19,3 +20,38 @@ def test_convert_argument_large_list(benchmark: BenchmarkFixture, ntypes):
         assert test_value == result
 
     benchmark(run)
+
+
+@strawberry.input
+class Item:
+    name: str
+    quantity: int
+    tags: list[str]
+
+
+@strawberry.input
+class Order:
+    reference: str
+    items: list[Item]
+
+
+@pytest.mark.parametrize("norders", [100, 1000])
+def test_compiled_converter_nested_inputs(benchmark: BenchmarkFixture, norders):
+    test_value = [
+        {
+            "reference": str(i),
+            "items": [
+                {"name": "item", "quantity": j, "tags": ["a", "b"]} for j in range(5)
+            ],
+        }
+        for i in range(norders)
+    ]
+    convert = compile_argument_converter(
+        StrawberryList(Order), DEFAULT_SCALAR_REGISTRY, StrawberryConfig()
+    )
+
+    def run():
+        result = convert(test_value)
+        assert len(result) == norders
+
+    benchmark(run)
@@ -2,13 +2,17 @@ import asyncio
 import datetime
 import random
 from datetime import date
-from typing import cast
+from typing import Annotated, Union, cast
 
 import pytest
 from pytest_codspeed.plugin import BenchmarkFixture
 
 import strawberry
 from strawberry.scalars import ID
+from strawberry.schema.schema import (
+    StrawberryGraphQLCoreExecutionContext,
+    StrawberrySyncSubtreeExecutionContext,
+)
 
 
 @pytest.mark.benchmark
@@ -109,3 +113,76 @@ def test_interface_performance(benchmark: BenchmarkFixture, ntypes: int):
         )
 
     benchmark(run)
+
+
+@pytest.mark.parametrize("ntypes", [2**k for k in (1, 4, 7)])
+def test_union_performance(benchmark: BenchmarkFixture, ntypes: int):
+    CONCRETE_TYPES: list[type] = [
+        strawberry.type(type(f"Item{i}", (), {"__annotations__": {"id": ID}}))
+        for i in range(ntypes)
+    ]
+    FeedItem = Annotated[Union[tuple(CONCRETE_TYPES)], strawberry.union("FeedItem")]
+
+    @strawberry.type
+    class Query:
+        items: list[FeedItem]  # type: ignore[valid-type]
+
+    schema = strawberry.Schema(query=Query)
+    query = "query { items { __typename } }"
+    root_value = Query(
+        items=[CONCRETE_TYPES[i % ntypes](id=cast("ID", i)) for i in range(5000)]
+    )
+
+    def run():
+        return schema.execute_sync(query, root_value=root_value)
+
+    result = benchmark(run)
+    assert result.errors is None
+
+
+@pytest.mark.parametrize(
+    "execution_context_class",
+    [StrawberryGraphQLCoreExecutionContext, StrawberrySyncSubtreeExecutionContext],
+    ids=["regular", "sync_subtrees"],
+)
+def test_execute_basic_fields(
+    benchmark: BenchmarkFixture, execution_context_class: type
+):
+    @strawberry.type
+    class Pet:
+        id: int
+        name: str
+
+    @strawberry.type
+    class Patron:
+        id: int
+        name: str
+        age: int
+        tags: list[str]
+        pets: list[Pet]
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def patrons(self) -> list[Patron]:
+            return [
+                Patron(
+                    id=i,
+                    name="Patrick",
+                    age=100,
+                    tags=["go", "ajax"],
+                    pets=[Pet(id=j, name="cat") for j in range(5)],
+                )
+                for i in range(1000)
+            ]
+
+    schema = strawberry.Schema(
+        query=Query, execution_context_class=execution_context_class
+    )
+    query = "{ patrons { id name age tags pets { id name } } }"
+
+    def run():
+        return asyncio.run(schema.execute(query))
+
+    result = benchmark(run)
+    assert result.errors is None
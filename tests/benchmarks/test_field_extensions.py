@@ -0,0 +1,88 @@
+from collections.abc import Iterable
+from typing import Any
+
+import pytest
+from pytest_codspeed.plugin import BenchmarkFixture
+
+import strawberry
+from strawberry import relay
+from strawberry.extensions import FieldExtension
+from strawberry.field_extensions import InputMutationExtension
+from strawberry.permission import BasePermission, PermissionExtension
+
+
+class IsAllowed(BasePermission):
+    def has_permission(self, source: Any, info: strawberry.Info, **kwargs: Any) -> bool:
+        return True
+
+
+class AuditExtension(FieldExtension):
+    def resolve(
+        self, next_: Any, source: Any, info: strawberry.Info, **kwargs: Any
+    ) -> Any:
+        return next_(source, info, **kwargs)
+
+
+def build_schema(extensions: int) -> strawberry.Schema:
+    def get_extensions(count: int) -> list[FieldExtension]:
+        # A permission check followed by auditing extensions
+        return [
+            PermissionExtension([IsAllowed()]),
+            *(AuditExtension() for _ in range(count - 1)),
+        ][:count]
+
+    @strawberry.type
+    class Tag(relay.Node):
+        id: relay.NodeID[int]
+
+    @strawberry.type
+    class Item:
+        index: int
+
+        @strawberry.field(extensions=get_extensions(extensions))
+        def value(self) -> int:
+            return self.index
+
+        @strawberry.field(
+            extensions=[InputMutationExtension(), *get_extensions(extensions - 1)]
+        )
+        def update(self, amount: int) -> int:
+            return self.index + amount
+
+        @relay.connection(
+            relay.ListConnection[Tag], extensions=get_extensions(extensions - 1)
+        )
+        def tags(self) -> Iterable[Tag]:
+            return [Tag(id=self.index)]
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def items(self, count: int) -> list[Item]:
+            return [Item(index=i) for i in range(count)]
+
+    return strawberry.Schema(query=Query)
+
+
+QUERIES = {
+    "permissions": "query ($count: Int!) { items(count: $count) { value } }",
+    "input_mutation": (
+        "query ($count: Int!) { items(count: $count) { update(input: {amount: 1}) } }"
+    ),
+    "connection": (
+        "query ($count: Int!) { items(count: $count) { tags { edges { node { id } } } } }"
+    ),
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("extensions", [1, 3, 5], ids=lambda x: f"extensions_{x}")
+@pytest.mark.parametrize("field", list(QUERIES))
+def test_field_extensions(benchmark: BenchmarkFixture, extensions: int, field: str):
+    schema = build_schema(extensions)
+
+    def run():
+        return schema.execute_sync(QUERIES[field], variable_values={"count": 1_000})
+
+    result = benchmark(run)
+    assert result.errors is None
@@ -0,0 +1,240 @@
+import asyncio
+import contextlib
+
+import pytest
+
+import strawberry
+from strawberry.http import GraphQLRequestData
+from strawberry.http.admission import AdmissionController, OperationRejectedError
+from strawberry.schema.config import StrawberryConfig
+from tests.http.clients.base import HttpClient
+from tests.views.schema import Query
+
+
+@pytest.fixture
+def admission_controller() -> AdmissionController:
+    return AdmissionController(max_in_flight=1, retry_after=5)
+
+
+@pytest.fixture
+def http_client(
+    http_client_class: type[HttpClient], admission_controller: AdmissionController
+) -> HttpClient:
+    with contextlib.suppress(ImportError):
+        from tests.http.clients.django import DjangoHttpClient
+
+        if http_client_class is DjangoHttpClient:
+            pytest.skip(reason="Admission control is only supported by async views")
+
+    with contextlib.suppress(ImportError):
+        from tests.http.clients.channels import SyncChannelsHttpClient
+
+        if http_client_class is SyncChannelsHttpClient:
+            pytest.skip(reason="Admission control is only supported by async views")
+
+    with contextlib.suppress(ImportError):
+        from tests.http.clients.flask import FlaskHttpClient
+
+        if http_client_class is FlaskHttpClient:
+            pytest.skip(reason="Admission control is only supported by async views")
+
+    with contextlib.suppress(ImportError):
+        from tests.http.clients.chalice import ChaliceHttpClient
+
+        if http_client_class is ChaliceHttpClient:
+            pytest.skip(reason="Admission control is only supported by async views")
+
+    return http_client_class(
+        schema=strawberry.Schema(
+            query=Query,
+            config=StrawberryConfig(
+                admission_controller=admission_controller,
+                batching_config={"max_operations": 10, "max_concurrency": 1},
+            ),
+        )
+    )
+
+
+async def test_requests_are_admitted(
+    http_client: HttpClient, admission_controller: AdmissionController
+):
+    response = await http_client.query("{ hello }")
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
+    assert admission_controller.stats().admitted == 1
+    assert admission_controller.stats().in_flight == 0
+
+
+async def test_overloaded_requests_are_rejected(
+    http_client: HttpClient, admission_controller: AdmissionController
+):
+    await admission_controller.acquire(0)
+
+    response = await http_client.query("{ hello }")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
+    assert response.json == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Server overloaded, try again later",
+                "extensions": {"code": "OVERLOADED"},
+            }
+        ],
+    }
+    assert admission_controller.stats().rejected == 1
+
+    admission_controller.release()
+
+    response = await http_client.query("{ hello }")
+
+    assert response.status_code == 200
+
+
+async def test_batch_with_bounded_concurrency(http_client: HttpClient):
+    response = await http_client.post(
+        url="/graphql",
+        json=[{"query": "{ hello }"}, {"query": '{ hello(name: "a") }'}],
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert [result["data"] for result in response.json] == [
+        {"hello": "Hello world"},
+        {"hello": "Hello a"},
+    ]
+
+
+def request_data(query: str, operation_name: str | None = None) -> GraphQLRequestData:
+    return GraphQLRequestData(
+        query=query, variables=None, operation_name=operation_name, extensions=None
+    )
+
+
+async def test_max_in_flight():
+    controller = AdmissionController(max_in_flight=2)
+
+    await controller.acquire(0)
+    await controller.acquire(0)
+
+    with pytest.raises(OperationRejectedError, match="Server overloaded"):
+        await controller.acquire(0)
+
+    controller.release()
+    await controller.acquire(0)
+
+    assert controller.stats().in_flight == 2
+    assert controller.stats().admitted == 3
+    assert controller.stats().rejected == 1
+
+
+async def test_queued_requests_are_admitted_by_priority():
+    controller = AdmissionController(max_in_flight=1, max_queued=3)
+    admitted: list[str] = []
+
+    async def run(name: str, priority: int) -> None:
+        async with controller.admit(priority):
+            admitted.append(name)
+
+    await controller.acquire(0)
+    tasks = [
+        asyncio.create_task(run(name, priority))
+        for name, priority in [("low", 2), ("high", 0), ("medium", 1)]
+    ]
+    await asyncio.sleep(0)
+
+    assert controller.stats().queued == 3
+
+    controller.release()
+    await asyncio.gather(*tasks)
+
+    assert admitted == ["high", "medium", "low"]
+    assert controller.stats().in_flight == 0
+
+
+async def test_queue_timeout():
+    controller = AdmissionController(max_in_flight=1, max_queued=1, queue_timeout=0)
+
+    await controller.acquire(0)
+
+    with pytest.raises(OperationRejectedError, match="Timed out"):
+        await controller.acquire(0)
+
+    assert controller.stats().queued == 0
+    assert controller.stats().timed_out == 1
+
+
+async def test_lower_priority_requests_are_evicted():
+    controller = AdmissionController(max_in_flight=1, max_queued=1)
+
+    await controller.acquire(0)
+    low = asyncio.create_task(controller.acquire(5))
+    await asyncio.sleep(0)
+
+    with pytest.raises(OperationRejectedError):
+        await controller.acquire(5)
+
+    high = asyncio.create_task(controller.acquire(1))
+    await asyncio.sleep(0)
+
+    with pytest.raises(OperationRejectedError, match="evicted"):
+        await low
+
+    controller.release()
+    await high
+
+    assert controller.stats().in_flight == 1
+
+
+async def test_cancelled_requests_leave_the_queue():
+    controller = AdmissionController(max_in_flight=1, max_queued=1)
+
+    await controller.acquire(0)
+    task = asyncio.create_task(controller.acquire(0))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert controller.stats().queued == 0
+
+    controller.release()
+
+    assert controller.stats().in_flight == 0
+
+
+@pytest.mark.parametrize(
+    ("query", "operation_name", "priority"),
+    [
+        ("{ hello }", None, 1),
+        ("query { hello }", None, 1),
+        ("mutation { hello }", None, 2),
+        ("query A { hello } mutation B { hello }", "B", 2),
+        ("query A { hello } mutation B { hello }", "A", 1),
+        ("query Important { hello }", "Important", 0),
+        ("subscription { hello }", None, 5),
+        ('{ "hello }', None, 5),
+    ],
+)
+def test_priorities(query: str, operation_name: str | None, priority: int):
+    controller = AdmissionController(
+        max_in_flight=1,
+        priorities={"query": 1, "mutation": 2, "Important": 0},
+        default_priority=5,
+    )
+
+    assert controller.get_priority(request_data(query, operation_name)) == priority
+
+
+def test_batch_priority():
+    controller = AdmissionController(max_in_flight=1, priorities={"mutation": 0})
+
+    assert (
+        controller.get_priority(
+            [request_data("{ hello }"), request_data("mutation { hello }")]
+        )
+        == 0
+    )
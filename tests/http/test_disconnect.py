@@ -0,0 +1,119 @@
+import asyncio
+from typing import Any
+
+import pytest
+from cross_web import HTTPException
+
+import strawberry
+from strawberry.dataloader import DataLoader, TimeWindowScheduler
+from strawberry.http.disconnect import run_until_disconnected, wait_for_asgi_disconnect
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    async def name(self, info: strawberry.Info, id: int) -> str:
+        return await info.context["loader"].load(id)
+
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+
+schema = strawberry.Schema(Query)
+
+
+async def disconnect_after(event: asyncio.Event) -> bool:
+    await event.wait()
+    return True
+
+
+async def test_operation_is_cancelled_when_the_client_disconnects():
+    loaded: list[list[int]] = []
+
+    async def load_names(keys: list[int]) -> list[str]:
+        loaded.append(keys)
+        return [str(key) for key in keys]
+
+    disconnected = asyncio.Event()
+    loader = DataLoader(load_names, scheduler=TimeWindowScheduler(window=0.05))
+
+    operation = schema.execute(
+        "{ a: name(id: 1) b: name(id: 2) }", context_value={"loader": loader}
+    )
+    execution = asyncio.ensure_future(
+        run_until_disconnected(operation, disconnect_after(disconnected))
+    )
+
+    await asyncio.sleep(0.01)
+    disconnected.set()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await execution
+
+    assert exc_info.value.status_code == 499
+
+    # The batch is skipped, nobody is waiting for its results
+    await asyncio.sleep(0.1)
+
+    futures = list(loader.cache_map.cache_map.values())
+
+    assert len(futures) == 2
+    assert all(future.cancelled() for future in futures)
+    assert loaded == []
+
+
+async def test_result_is_returned_when_the_client_stays():
+    result = await run_until_disconnected(
+        schema.execute("{ hello }"), disconnect_after(asyncio.Event())
+    )
+
+    assert result.data == {"hello": "world"}
+
+
+async def test_disconnects_that_cant_be_detected_are_ignored():
+    async def not_detected() -> bool:
+        return False
+
+    result = await run_until_disconnected(schema.execute("{ hello }"), not_detected())
+
+    assert result.data == {"hello": "world"}
+
+
+async def test_operation_is_cancelled_with_the_request():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def operation() -> None:
+        started.set()
+
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    request = asyncio.ensure_future(
+        run_until_disconnected(operation(), disconnect_after(asyncio.Event()))
+    )
+    await started.wait()
+    request.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await request
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+async def test_wait_for_asgi_disconnect():
+    messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    messages.put_nowait({"type": "http.request", "body": b"", "more_body": False})
+
+    waiter = asyncio.ensure_future(wait_for_asgi_disconnect(messages.get))
+    await asyncio.sleep(0)
+
+    assert not waiter.done()
+
+    messages.put_nowait({"type": "http.disconnect"})
+
+    assert await waiter is True
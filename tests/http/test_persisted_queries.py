@@ -0,0 +1,85 @@
+import hashlib
+import json
+from urllib.parse import urlencode
+
+import pytest
+
+import strawberry
+from strawberry.extensions import PersistedQueriesSync
+from strawberry.extensions import persisted_queries as _persisted_queries_module
+
+from .clients.base import HttpClient
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self, name: str = "world") -> str:
+        return f"Hello {name}"
+
+
+QUERY = "query Hello($name: String!) { hello(name: $name) }"
+EXTENSIONS = {
+    "persistedQuery": {
+        "version": 1,
+        "sha256Hash": hashlib.sha256(QUERY.encode()).hexdigest(),
+    }
+}
+
+
+@pytest.fixture
+def http_client(http_client_class: type[HttpClient]) -> HttpClient:
+    _persisted_queries_module._get_default_store.cache_clear()
+    _persisted_queries_module._get_document_cache.cache_clear()
+
+    schema = strawberry.Schema(query=Query, extensions=[PersistedQueriesSync])
+
+    return http_client_class(schema)
+
+
+async def test_persisted_query_via_post(http_client: HttpClient):
+    response = await http_client.post(
+        url="/graphql",
+        json={"variables": {"name": "a"}, "extensions": EXTENSIONS},
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["errors"] == [
+        {
+            "message": "PersistedQueryNotFound",
+            "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+        }
+    ]
+
+    response = await http_client.query(
+        QUERY, variables={"name": "a"}, extensions=EXTENSIONS
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello a"}
+
+    response = await http_client.post(
+        url="/graphql",
+        json={"variables": {"name": "b"}, "extensions": EXTENSIONS},
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello b"}
+
+
+async def test_persisted_query_via_get(http_client: HttpClient):
+    response = await http_client.query(
+        QUERY, variables={"name": "a"}, extensions=EXTENSIONS
+    )
+
+    assert response.status_code == 200
+
+    params = urlencode(
+        {"variables": json.dumps({"name": "b"}), "extensions": json.dumps(EXTENSIONS)}
+    )
+    response = await http_client.get(url=f"/graphql?{params}")
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello b"}
@@ -0,0 +1,90 @@
+from collections import Counter
+
+import pytest
+
+import strawberry
+from strawberry.extensions import ResponseCacheSync
+from strawberry.extensions.response_cache import get_etag
+from strawberry.schema_directives import CacheControl, CacheControlScope
+
+from .clients.base import HttpClient
+
+
+@pytest.fixture
+def calls() -> Counter[str]:
+    return Counter()
+
+
+@pytest.fixture
+def http_client(http_client_class: type[HttpClient], calls: Counter[str]) -> HttpClient:
+    @strawberry.type
+    class Query:
+        @strawberry.field(directives=[CacheControl(max_age=60)])
+        def hello(self, name: str = "world") -> str:
+            calls[name] += 1
+            return f"Hello {name}"
+
+        @strawberry.field(
+            directives=[CacheControl(max_age=60, scope=CacheControlScope.PRIVATE)]
+        )
+        def me(self) -> str:
+            return "me"
+
+        @strawberry.field
+        def now(self) -> str:
+            return "now"
+
+    schema = strawberry.Schema(query=Query, extensions=[ResponseCacheSync])
+
+    return http_client_class(schema)
+
+
+async def test_cache_headers(http_client: HttpClient):
+    response = await http_client.query("{ hello }", method="get")
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
+    assert response.json["extensions"] == {
+        "cacheControl": {"maxAge": 60, "scope": "PUBLIC"}
+    }
+    assert response.headers["cache-control"] == "public, max-age=60"
+    assert response.headers["vary"] == "Accept"
+    assert response.headers["etag"] == get_etag({"hello": "Hello world"})
+
+
+async def test_private_cache_headers(http_client: HttpClient):
+    response = await http_client.query("{ me }")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, max-age=60"
+    assert response.headers["vary"] == "Accept, Authorization, Cookie"
+
+
+async def test_uncacheable_responses(http_client: HttpClient):
+    response = await http_client.query("{ hello now }")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-store"
+    assert "etag" not in response.headers
+
+
+async def test_not_modified(http_client: HttpClient, calls: Counter[str]):
+    response = await http_client.query("{ hello }", method="get")
+    etag = response.headers["etag"]
+
+    response = await http_client.query(
+        "{ hello }", method="get", headers={"If-None-Match": etag}
+    )
+
+    # Answered from the stored ETag, without executing the operation
+    assert response.status_code == 304
+    assert calls["world"] == 1
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+    response = await http_client.query(
+        '{ hello(name: "a") }', method="get", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello a"}
@@ -0,0 +1,39 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import pytest
+from cross_web import HTTPException
+
+from strawberry.http.base import BaseView
+from strawberry.http.types import HTTPMethod
+
+
+@dataclass
+class FakeRequest:
+    headers: Mapping[str, str] = field(default_factory=dict)
+    query_params: Mapping[str, str] = field(default_factory=dict)
+    method: HTTPMethod = "POST"
+
+
+class View(BaseView):
+    timeout_header = "x-request-timeout"
+
+
+def test_timeout_header_is_disabled_by_default():
+    request = FakeRequest(headers={"x-request-timeout": "1"})
+
+    assert BaseView().get_timeout(request) is None
+
+
+def test_timeout_header():
+    assert View().get_timeout(FakeRequest()) is None
+    assert View().get_timeout(FakeRequest({"x-request-timeout": "2.5"})) == 2.5
+
+
+@pytest.mark.parametrize("value", ["soon", "0", "-1", "inf", "nan"])
+def test_invalid_timeout_header(value: str):
+    with pytest.raises(HTTPException) as exc_info:
+        View().get_timeout(FakeRequest({"x-request-timeout": value}))
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.reason == "Invalid x-request-timeout header"
@@ -0,0 +1,94 @@
+import json
+from typing import Any, Literal
+from urllib.parse import urlencode
+
+import pytest
+
+import strawberry
+
+from .clients.base import HttpClient
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self, name: str = "world") -> str:
+        return f"Hello {name}"
+
+
+@pytest.fixture
+def http_client(http_client_class: type[HttpClient]) -> HttpClient:
+    schema = strawberry.Schema(
+        query=Query,
+        trusted_documents={
+            "hello": "query Hello($name: String!) { hello(name: $name) }"
+        },
+    )
+
+    return http_client_class(schema)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"documentId": "hello"},
+        {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "hello"}}},
+    ],
+)
+async def test_trusted_document_via_post(data: dict[str, Any], http_client: HttpClient):
+    response = await http_client.post(
+        url="/graphql",
+        json={**data, "variables": {"name": "a"}},
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello a"}
+
+
+async def test_id_is_not_a_document_id(http_client: HttpClient):
+    response = await http_client.post(
+        url="/graphql",
+        json={"id": "hello", "variables": {"name": "a"}},
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] is None
+    assert response.json["errors"][0]["extensions"] == {"code": "UNTRUSTED_DOCUMENT"}
+
+
+async def test_trusted_document_via_get(http_client: HttpClient):
+    params = urlencode({"documentId": "hello", "variables": json.dumps({"name": "a"})})
+    response = await http_client.get(url=f"/graphql?{params}")
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello a"}
+
+
+@pytest.mark.parametrize("method", ["get", "post"])
+async def test_queries_are_rejected(
+    method: Literal["get", "post"], http_client: HttpClient
+):
+    response = await http_client.query(method=method, query="{ hello }")
+
+    assert response.status_code == 200
+    assert response.json["data"] is None
+    assert response.json["errors"] == [
+        {
+            "message": "Only trusted documents are allowed, send a document id "
+            "instead of a query",
+            "extensions": {"code": "UNTRUSTED_DOCUMENT"},
+        }
+    ]
+
+
+async def test_invalid_document_id(http_client: HttpClient):
+    response = await http_client.post(
+        url="/graphql",
+        json={"documentId": 1},
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 400
+    assert "`documentId` must be a string" in response.text
@@ -0,0 +1,242 @@
+from unittest.mock import patch
+
+import pytest
+from graphql import ValidationRule, parse, validate
+
+import strawberry
+from strawberry.extensions import (
+    AddValidationRules,
+    DocumentCache,
+    MaxTokensLimiter,
+    QueryDepthLimiter,
+)
+from strawberry.extensions import document_cache as _document_cache_module
+
+
+@pytest.fixture(autouse=True)
+def _clear_document_caches():
+    # ``DocumentCache`` shares its cache module-level keyed by its arguments;
+    # clear between tests so patched call counts and stats stay independent.
+    _document_cache_module._get_document_cache.cache_clear()
+    yield
+    _document_cache_module._get_document_cache.cache_clear()
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+    @strawberry.field
+    def ping(self) -> str:
+        return "pong"
+
+
+@patch("strawberry.schema.schema.validate", wraps=validate)
+@patch("strawberry.extensions.document_cache.parse", wraps=parse)
+def test_document_cache_extension(mock_parse, mock_validate):
+    schema = strawberry.Schema(query=Query, extensions=[DocumentCache])
+
+    for _ in range(3):
+        result = schema.execute_sync("query { hello }")
+
+        assert not result.errors
+        assert result.data == {"hello": "world"}
+
+    assert mock_parse.call_count == 1
+    assert mock_validate.call_count == 1
+
+    result = schema.execute_sync("query { ping }")
+
+    assert not result.errors
+    assert result.data == {"ping": "pong"}
+
+    assert mock_parse.call_count == 2
+    assert mock_validate.call_count == 2
+
+    stats = DocumentCache().stats
+    assert (stats.hits, stats.misses, stats.size) == (2, 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_document_cache_extension_async():
+    schema = strawberry.Schema(query=Query, extensions=[DocumentCache])
+
+    for _ in range(2):
+        result = await schema.execute("query Hello { hello }")
+
+        assert not result.errors
+        assert result.data == {"hello": "world"}
+
+    assert DocumentCache().stats.hits == 1
+
+
+@patch("strawberry.schema.schema.validate", wraps=validate)
+def test_validation_is_cached_per_rule_set(mock_validate):
+    class NoopRule(ValidationRule):
+        pass
+
+    schema = strawberry.Schema(query=Query, extensions=[DocumentCache])
+    schema_with_rules = strawberry.Schema(
+        query=Query,
+        extensions=[lambda: AddValidationRules([NoopRule]), DocumentCache],
+    )
+
+    for _ in range(2):
+        assert not schema.execute_sync("{ hello }").errors
+        assert not schema_with_rules.execute_sync("{ hello }").errors
+
+    assert mock_validate.call_count == 2
+    assert DocumentCache().stats.misses == 1
+
+
+@patch("strawberry.schema.schema.validate", wraps=validate)
+def test_per_request_rules_reuse_validation(mock_validate):
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            lambda: QueryDepthLimiter(max_depth=3),
+            lambda: DocumentCache(maxsize=10),
+        ],
+    )
+
+    for _ in range(50):
+        assert not schema.execute_sync("{ hello }").errors
+
+    cached_document = DocumentCache(maxsize=10).get_document("{ hello }")
+
+    assert len(cached_document.validation_errors) == 1
+    assert mock_validate.call_count == 1
+
+
+def test_per_request_limiter_callback_runs_for_every_request():
+    depths = []
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            lambda: QueryDepthLimiter(max_depth=3, callback=depths.append),
+            lambda: DocumentCache(maxsize=10),
+        ],
+    )
+
+    for _ in range(3):
+        assert not schema.execute_sync("{ hello }").errors
+
+    assert depths == [{"anonymous": 0}] * 3
+
+
+def test_validation_memo_is_bounded():
+    schema = strawberry.Schema(query=Query, extensions=[DocumentCache])
+    cached_document = DocumentCache().get_document("{ hello }")
+
+    for _ in range(50):
+
+        class NoopRule(ValidationRule):
+            pass
+
+        assert not cached_document.validate(schema._schema, (NoopRule,))
+
+    assert (
+        len(cached_document.validation_errors)
+        == _document_cache_module.MAX_VALIDATIONS_PER_DOCUMENT
+    )
+
+
+def test_validation_errors_are_cached():
+    schema = strawberry.Schema(query=Query, extensions=[DocumentCache])
+
+    for _ in range(2):
+        result = schema.execute_sync("{ unknown }")
+
+        assert result.errors
+        assert result.errors[0].message == (
+            "Cannot query field 'unknown' on type 'Query'."
+        )
+
+    assert DocumentCache().stats.hits == 1
+
+
+@patch("strawberry.extensions.document_cache.parse", wraps=parse)
+def test_syntax_errors_are_not_cached(mock_parse):
+    schema = strawberry.Schema(query=Query, extensions=[DocumentCache])
+
+    for _ in range(2):
+        result = schema.execute_sync("{ hello")
+
+        assert result.errors
+        assert result.errors[0].message == "Syntax Error: Expected Name, found <EOF>."
+
+    assert mock_parse.call_count == 2
+    assert len(DocumentCache().cache) == 0
+
+
+def test_parse_options_are_part_of_the_key():
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[lambda: MaxTokensLimiter(max_token_count=3), DocumentCache],
+    )
+    schema_without_limit = strawberry.Schema(query=Query, extensions=[DocumentCache])
+
+    query = "{ hello ping }"
+
+    assert not schema_without_limit.execute_sync(query).errors
+
+    result = schema.execute_sync(query)
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "Syntax Error: Document contains more than 3 tokens. Parsing aborted."
+    )
+
+
+def test_operation_lookup_uses_cached_operations():
+    schema = strawberry.Schema(query=Query, extensions=[DocumentCache])
+    query = "query A { hello } query B { ping }"
+
+    result = schema.execute_sync(query, operation_name="B")
+
+    assert not result.errors
+    assert result.data == {"ping": "pong"}
+
+    cached_document = DocumentCache().get_document(query)
+
+    with patch(
+        "strawberry.types.execution.DocumentOperations",
+        side_effect=AssertionError("operations should come from the cache"),
+    ):
+        result = schema.execute_sync(query, operation_name="A")
+
+    assert not result.errors
+    assert result.data == {"hello": "world"}
+    assert (
+        cached_document.operations.get("A") is cached_document.document.definitions[0]
+    )
+
+
+@patch("strawberry.schema.schema.validate", wraps=validate)
+@patch("strawberry.extensions.document_cache.parse", wraps=parse)
+def test_warm_up(mock_parse, mock_validate):
+    schema = strawberry.Schema(query=Query, extensions=[DocumentCache])
+
+    DocumentCache().warm_up(schema, ["{ hello }", "{ ping }"])
+
+    assert mock_parse.call_count == 2
+    assert mock_validate.call_count == 2
+
+    assert schema.execute_sync("{ hello }").data == {"hello": "world"}
+    assert schema.execute_sync("{ ping }").data == {"ping": "pong"}
+
+    assert mock_parse.call_count == 2
+    assert mock_validate.call_count == 2
+
+
+def test_maxsize_and_ttl():
+    extension = DocumentCache(maxsize=1, ttl=60)
+
+    first = extension.get_document("{ hello }")
+    extension.get_document("{ ping }")
+
+    assert extension.get_document("{ hello }") is not first
+    assert extension.stats.evictions == 2
+    assert extension.cache.ttl == 60
@@ -0,0 +1,136 @@
+from typing import Any
+
+import pytest
+
+import strawberry
+from strawberry.extensions import (
+    FieldFilter,
+    MetricsExtension,
+    MetricsRegistry,
+    SchemaExtension,
+)
+from strawberry.schema_directive import Location
+
+
+@strawberry.schema_directive(locations=[Location.FIELD_DEFINITION])
+class Audited:
+    pass
+
+
+@strawberry.type
+class User:
+    name: str
+
+    @strawberry.field
+    def email(self) -> str:
+        return f"{self.name}@example.com"
+
+    @strawberry.field(directives=[Audited()])
+    def password_hash(self) -> str:
+        return "hash"
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def users(self) -> list[User]:
+        return [User(name="alice"), User(name="bob")]
+
+
+QUERY = "{ __typename users { __typename name email passwordHash } }"
+
+
+def make_extension(field_filter: FieldFilter | None, seen: list[str]) -> type:
+    class RecordingExtension(SchemaExtension):
+        resolve_filter = field_filter
+
+        def resolve(self, _next, root, info, *args: Any, **kwargs: Any) -> Any:
+            seen.append(f"{info.parent_type.name}.{info.field_name}")
+            return _next(root, info, *args, **kwargs)
+
+    return RecordingExtension
+
+
+@pytest.mark.parametrize(
+    ("field_filter", "expected"),
+    [
+        (
+            None,
+            [
+                "Query.__typename",
+                "Query.users",
+                "User.__typename",
+                "User.name",
+                "User.email",
+                "User.passwordHash",
+            ],
+        ),
+        (
+            FieldFilter(skip_basic_fields=True),
+            [
+                "Query.__typename",
+                "Query.users",
+                "User.__typename",
+                "User.email",
+                "User.passwordHash",
+            ],
+        ),
+        (
+            FieldFilter(skip_basic_fields=True, skip_introspection=True),
+            ["Query.users", "User.email", "User.passwordHash"],
+        ),
+        (
+            FieldFilter(types={"User"}, skip_introspection=True),
+            ["User.name", "User.email", "User.passwordHash"],
+        ),
+        (FieldFilter(fields={"User.email"}), ["User.email"]),
+        (FieldFilter(directives=[Audited]), ["User.passwordHash"]),
+    ],
+)
+def test_resolve_filter(field_filter, expected):
+    seen: list[str] = []
+    schema = strawberry.Schema(
+        query=Query, extensions=[make_extension(field_filter, seen)]
+    )
+
+    result = schema.execute_sync(QUERY)
+
+    assert not result.errors
+    assert sorted(set(seen)) == sorted(expected)
+
+
+def test_filters_apply_to_each_extension():
+    all_fields: list[str] = []
+    some_fields: list[str] = []
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            make_extension(None, all_fields),
+            make_extension(FieldFilter(fields={"Query.users"}), some_fields),
+        ],
+    )
+
+    result = schema.execute_sync("{ users { name } }")
+
+    assert not result.errors
+    assert all_fields == ["Query.users", "User.name", "User.name"]
+    assert some_fields == ["Query.users"]
+
+
+def test_resolve_filter_with_metrics_extension():
+    seen: list[str] = []
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            lambda: MetricsExtension(MetricsRegistry()),
+            make_extension(FieldFilter(fields={"User.email"}), seen),
+        ],
+    )
+
+    # The filter of each extension only applies to its own `resolve`
+    for _ in range(2):
+        result = schema.execute_sync("{ users { name email } }")
+
+        assert not result.errors
+
+    assert seen == ["User.email"] * 4
@@ -0,0 +1,184 @@
+import asyncio
+
+import pytest
+
+import strawberry
+from strawberry.extensions import MetricsExtension, MetricsRegistry
+from strawberry.extensions.metrics import OVERFLOW_FIELD, Histogram
+
+
+@strawberry.type
+class User:
+    name: str
+
+    @strawberry.field
+    def email(self) -> str:
+        return f"{self.name}@example.com"
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def users(self) -> list[User]:
+        return [User(name="alice"), User(name="bob")]
+
+    @strawberry.field
+    async def slow(self) -> str:
+        await asyncio.sleep(0.01)
+        return "done"
+
+    @strawberry.field
+    def fail(self) -> str | None:
+        raise ValueError("nope")
+
+
+def test_records_resolvers_phases_and_errors():
+    registry = MetricsRegistry()
+    schema = strawberry.Schema(
+        query=Query, extensions=[lambda: MetricsExtension(registry)]
+    )
+
+    result = schema.execute_sync("{ users { name email } fail }")
+
+    assert result.data == {
+        "users": [
+            {"name": "alice", "email": "alice@example.com"},
+            {"name": "bob", "email": "bob@example.com"},
+        ],
+        "fail": None,
+    }
+
+    # Fields without a resolver are not timed
+    assert set(registry.resolvers) == {"Query.users", "User.email", "Query.fail"}
+    assert registry.resolvers["User.email"].count == 2
+    assert registry.resolver_errors == {
+        "Query.users": 0,
+        "User.email": 0,
+        "Query.fail": 1,
+    }
+    assert {phase: h.count for phase, h in registry.phases.items()} == {
+        "parse": 1,
+        "validate": 1,
+        "execute": 1,
+    }
+    assert registry.errors == {"parse": 0, "validate": 0, "execute": 1}
+
+    schema.execute_sync("{ users { unknown } }")
+
+    assert registry.errors["validate"] == 1
+    assert registry.phases["execute"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_times_async_resolvers():
+    registry = MetricsRegistry()
+    schema = strawberry.Schema(
+        query=Query, extensions=[lambda: MetricsExtension(registry)]
+    )
+
+    result = await schema.execute("{ slow }")
+
+    assert result.data == {"slow": "done"}
+    assert registry.resolvers["Query.slow"].count == 1
+    assert registry.resolvers["Query.slow"].sum >= 10_000_000
+
+
+def test_sampling():
+    registry = MetricsRegistry(sample_rate=0)
+    schema = strawberry.Schema(
+        query=Query, extensions=[lambda: MetricsExtension(registry)]
+    )
+
+    schema.execute_sync("{ users { email } fail }")
+
+    assert registry.resolvers == {}
+    assert registry.phases["execute"].count == 1
+    assert registry.errors["execute"] == 1
+
+
+def test_schema_resolvers_are_not_replaced():
+    registry = MetricsRegistry()
+    schema = strawberry.Schema(
+        query=Query, extensions=[lambda: MetricsExtension(registry)]
+    )
+    fields = schema._schema.query_type.fields
+    resolvers = {name: field.resolve for name, field in fields.items()}
+
+    schema.execute_sync("{ users { email } }")
+
+    assert registry.resolvers["Query.users"].count == 1
+    assert {name: field.resolve for name, field in fields.items()} == resolvers
+
+
+def test_max_fields():
+    registry = MetricsRegistry(max_fields=1)
+    schema = strawberry.Schema(
+        query=Query, extensions=[lambda: MetricsExtension(registry)]
+    )
+
+    schema.execute_sync("{ users { email } }")
+
+    assert registry.resolvers["Query.users"].count == 1
+    assert registry.resolvers[OVERFLOW_FIELD].count == 2
+
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+
+    for value in range(1, 1001):
+        histogram.observe(value * 1000)
+
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(500_000, rel=0.07)
+    assert histogram.percentile(99) == pytest.approx(990_000, rel=0.07)
+    assert list(histogram.cumulative_counts([0, 100_000, 10**9])) == [
+        0,
+        pytest.approx(100, abs=7),
+        1000,
+    ]
+
+
+def test_render():
+    registry = MetricsRegistry(buckets=[0.001, 0.1])
+    registry.observe_resolver("Query.user", 2_000_000)
+    registry.observe_resolver("Query.user", 200_000_000, error=True)
+    registry.observe_phase("parse", 500_000)
+
+    text = registry.render()
+
+    assert "# TYPE strawberry_resolver_duration_seconds histogram" in text
+    assert (
+        'strawberry_resolver_duration_seconds_bucket{field="Query.user",le="0.001"} 0'
+        in text
+    )
+    assert (
+        'strawberry_resolver_duration_seconds_bucket{field="Query.user",le="0.1"} 1'
+        in text
+    )
+    assert (
+        'strawberry_resolver_duration_seconds_bucket{field="Query.user",le="+Inf"} 2'
+        in text
+    )
+    assert 'strawberry_resolver_duration_seconds_sum{field="Query.user"} 0.202' in text
+    assert 'strawberry_resolver_errors_total{field="Query.user"} 1' in text
+    assert 'strawberry_operation_phase_duration_seconds_count{phase="parse"} 1' in text
+    assert 'strawberry_operation_errors_total{phase="execute"} 0' in text
+
+
+@pytest.mark.asyncio
+async def test_asgi_app():
+    registry = MetricsRegistry()
+    registry.observe_phase("execute", 1000)
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await registry.asgi_app()({"type": "http"}, None, send)
+
+    assert messages[0]["status"] == 200
+    assert (
+        b"content-type",
+        b"text/plain; version=0.0.4; charset=utf-8",
+    ) in messages[0]["headers"]
+    assert messages[1]["body"] == registry.render().encode()
@@ -0,0 +1,260 @@
+import hashlib
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from graphql import parse, validate
+
+import strawberry
+from strawberry.extensions import (
+    MaxTokensLimiter,
+    PersistedQueries,
+    PersistedQueriesSync,
+)
+from strawberry.extensions import persisted_queries as _persisted_queries_module
+from strawberry.extensions.persisted_queries import InMemoryPersistedQueryStore
+
+
+@pytest.fixture(autouse=True)
+def _clear_persisted_query_caches():
+    # The default store and the parsed documents are shared module-level, clear
+    # them so that tests stay independent.
+    _persisted_queries_module._get_default_store.cache_clear()
+    _persisted_queries_module._get_document_cache.cache_clear()
+    yield
+    _persisted_queries_module._get_default_store.cache_clear()
+    _persisted_queries_module._get_document_cache.cache_clear()
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self, name: str = "world") -> str:
+        return f"Hello {name}"
+
+
+QUERY = "query Hello($name: String!) { hello(name: $name) }"
+QUERY_HASH = hashlib.sha256(QUERY.encode()).hexdigest()
+
+
+def _extensions(sha256_hash: str = QUERY_HASH, version: int = 1) -> dict[str, Any]:
+    return {"persistedQuery": {"version": version, "sha256Hash": sha256_hash}}
+
+
+class AsyncStore:
+    def __init__(self) -> None:
+        self.queries: dict[str, str] = {}
+        self.get_calls = 0
+
+    async def get(self, sha256_hash: str) -> str | None:
+        self.get_calls += 1
+        return self.queries.get(sha256_hash)
+
+    async def set(self, sha256_hash: str, query: str) -> None:
+        self.queries[sha256_hash] = query
+
+
+@pytest.mark.asyncio
+async def test_unknown_hash_returns_not_found():
+    schema = strawberry.Schema(query=Query, extensions=[PersistedQueries])
+
+    result = await schema.execute(None, operation_extensions=_extensions())
+
+    assert result.data is None
+    assert result.errors
+    assert result.errors[0].message == "PersistedQueryNotFound"
+    assert result.errors[0].extensions == {"code": "PERSISTED_QUERY_NOT_FOUND"}
+
+
+@pytest.mark.asyncio
+async def test_register_and_execute_by_hash():
+    schema = strawberry.Schema(query=Query, extensions=[PersistedQueries])
+
+    result = await schema.execute(
+        QUERY, variable_values={"name": "a"}, operation_extensions=_extensions()
+    )
+
+    assert not result.errors
+    assert result.data == {"hello": "Hello a"}
+
+    result = await schema.execute(
+        None, variable_values={"name": "b"}, operation_extensions=_extensions()
+    )
+
+    assert not result.errors
+    assert result.data == {"hello": "Hello b"}
+
+
+@pytest.mark.asyncio
+@patch("strawberry.schema.schema.validate", wraps=validate)
+@patch("strawberry.extensions.document_cache.parse", wraps=parse)
+async def test_hits_skip_parsing_and_validation(mock_parse, mock_validate):
+    schema = strawberry.Schema(query=Query, extensions=[PersistedQueries])
+
+    await schema.execute(
+        QUERY, variable_values={"name": "a"}, operation_extensions=_extensions()
+    )
+
+    for _ in range(3):
+        result = await schema.execute(
+            None, variable_values={"name": "b"}, operation_extensions=_extensions()
+        )
+        assert not result.errors
+
+    assert mock_parse.call_count == 1
+    assert mock_validate.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_store():
+    store = AsyncStore()
+    schema = strawberry.Schema(
+        query=Query, extensions=[lambda: PersistedQueries(store=store)]
+    )
+
+    result = await schema.execute(None, operation_extensions=_extensions())
+
+    assert result.errors
+    assert result.errors[0].message == "PersistedQueryNotFound"
+
+    await schema.execute(
+        QUERY, variable_values={"name": "a"}, operation_extensions=_extensions()
+    )
+
+    assert store.queries == {QUERY_HASH: QUERY}
+
+    # Documents for known hashes are kept in memory, the store is only used
+    # when the document isn't cached.
+    _persisted_queries_module._get_document_cache.cache_clear()
+
+    for _ in range(2):
+        result = await schema.execute(
+            None, variable_values={"name": "b"}, operation_extensions=_extensions()
+        )
+
+        assert not result.errors
+        assert result.data == {"hello": "Hello b"}
+
+    assert store.get_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_hash_mismatch():
+    schema = strawberry.Schema(query=Query, extensions=[PersistedQueries])
+
+    result = await schema.execute(
+        "{ hello }", operation_extensions=_extensions("not-the-hash")
+    )
+
+    assert result.errors
+    assert result.errors[0].message == "provided sha does not match query"
+
+    result = await schema.execute(None, operation_extensions=_extensions())
+
+    assert result.errors
+    assert result.errors[0].message == "PersistedQueryNotFound"
+
+
+@pytest.mark.asyncio
+async def test_unsupported_version():
+    schema = strawberry.Schema(query=Query, extensions=[PersistedQueries])
+
+    result = await schema.execute(QUERY, operation_extensions=_extensions(version=2))
+
+    assert result.errors
+    assert result.errors[0].message == "Unsupported persisted query version"
+
+
+@pytest.mark.asyncio
+async def test_invalid_queries_are_not_persisted():
+    query = "{ unknown }"
+    sha256_hash = hashlib.sha256(query.encode()).hexdigest()
+    schema = strawberry.Schema(query=Query, extensions=[PersistedQueries])
+
+    result = await schema.execute(query, operation_extensions=_extensions(sha256_hash))
+
+    assert result.errors
+    assert result.errors[0].message == "Cannot query field 'unknown' on type 'Query'."
+
+    assert _persisted_queries_module._get_default_store(1000).get(sha256_hash) is None
+
+
+@pytest.mark.asyncio
+async def test_requests_without_persisted_queries():
+    schema = strawberry.Schema(query=Query, extensions=[PersistedQueries])
+
+    result = await schema.execute("{ hello }")
+
+    assert not result.errors
+    assert result.data == {"hello": "Hello world"}
+
+
+def test_sync():
+    schema = strawberry.Schema(query=Query, extensions=[PersistedQueriesSync])
+
+    result = schema.execute_sync(None, operation_extensions=_extensions())
+
+    assert result.errors
+    assert result.errors[0].message == "PersistedQueryNotFound"
+
+    schema.execute_sync(
+        QUERY, variable_values={"name": "a"}, operation_extensions=_extensions()
+    )
+
+    result = schema.execute_sync(
+        None, variable_values={"name": "b"}, operation_extensions=_extensions()
+    )
+
+    assert not result.errors
+    assert result.data == {"hello": "Hello b"}
+
+
+def test_sync_requires_sync_store():
+    schema = strawberry.Schema(
+        query=Query, extensions=[lambda: PersistedQueriesSync(store=AsyncStore())]
+    )
+
+    result = schema.execute_sync(None, operation_extensions=_extensions())
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "PersistedQueriesSync requires a synchronous store, "
+        "use PersistedQueries with async stores"
+    )
+
+
+def test_parse_options_are_respected():
+    query = "{ hello }"
+    sha256_hash = hashlib.sha256(query.encode()).hexdigest()
+
+    schema = strawberry.Schema(query=Query, extensions=[PersistedQueriesSync])
+    limited_schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            PersistedQueriesSync,
+            lambda: MaxTokensLimiter(max_token_count=2),
+        ],
+    )
+
+    assert not schema.execute_sync(
+        query, operation_extensions=_extensions(sha256_hash)
+    ).errors
+
+    result = limited_schema.execute_sync(
+        None, operation_extensions=_extensions(sha256_hash)
+    )
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "Syntax Error: Document contains more than 2 tokens. Parsing aborted."
+    )
+
+
+def test_in_memory_store_is_size_bounded():
+    store = InMemoryPersistedQueryStore(maxsize=1)
+
+    store.set("a", "{ a }")
+    store.set("b", "{ b }")
+
+    assert store.get("a") is None
+    assert store.get("b") == "{ b }"
@@ -0,0 +1,236 @@
+from typing import Annotated, Any
+
+import pytest
+from graphql import parse
+from pytest_mock import MockerFixture
+
+import strawberry
+from strawberry.extensions import ParserCache, QueryCostLimiter
+from strawberry.extensions.query_cost import (
+    CostOptions,
+    _CostCalculator,
+    get_query_cost_analysis,
+)
+from strawberry.schema_directives import Cost, ListSize
+
+resolved: list[str] = []
+
+
+@strawberry.type
+class Comment:
+    text: str
+
+
+@strawberry.type(directives=[Cost(weight=3)])
+class Post:
+    title: str
+
+    @strawberry.field(directives=[ListSize(assumed_size=5)])
+    def comments(self) -> list[Comment]:
+        return [Comment(text="nice")]
+
+    @strawberry.field(directives=[Cost(weight=10)])
+    def word_count(self) -> int:
+        return 2
+
+
+@strawberry.type
+class PostEdge:
+    node: Post
+
+
+@strawberry.type
+class PostConnection:
+    edges: list[PostEdge]
+
+
+@strawberry.type
+class User:
+    name: str
+
+
+@strawberry.type
+class Tree:
+    value: int
+
+    @strawberry.field
+    def left(self) -> "Tree":
+        return Tree(value=1)
+
+    @strawberry.field
+    def right(self) -> "Tree":
+        return Tree(value=2)
+
+
+SearchResult = Annotated[Post | User, strawberry.union("SearchResult")]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def posts(self, first: int | None = None) -> list[Post]:
+        resolved.append("posts")
+        return [Post(title="hello")]
+
+    @strawberry.field
+    def feed(self, first: int = 10) -> PostConnection:
+        return PostConnection(edges=[PostEdge(node=Post(title="hello"))])
+
+    @strawberry.field(directives=[ListSize(slicing_arguments=["limit"])])
+    def users(self, limit: int = 10) -> list[User]:
+        return [User(name="Jane")]
+
+    @strawberry.field
+    def search(self) -> list[SearchResult]:
+        return [User(name="Jane")]
+
+
+def make_schema(max_cost: int = 1000, **kwargs: Any) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        extensions=[ParserCache(), lambda: QueryCostLimiter(max_cost, **kwargs)],
+    )
+
+
+@pytest.mark.parametrize(
+    ("query", "cost"),
+    [
+        # Posts weigh 3, lists have 10 items by default
+        ("{ posts { title } }", 30),
+        ("{ posts(first: 2) { title } }", 6),
+        # Each post also costs the weight of wordCount
+        ("{ posts(first: 2) { wordCount } }", 26),
+        # Each post has 5 comments
+        ("{ posts(first: 2) { comments { text } } }", 16),
+        # The slicing argument of the connection sets the number of edges
+        ("{ feed(first: 4) { edges { node { title } } } }", 17),
+        ("{ users(limit: 7) { name } }", 7),
+        # The most expensive type of the union
+        ("{ search { ... on Post { wordCount } ... on User { name } } }", 130),
+        ("{ posts { __typename } }", 30),
+    ],
+)
+def test_cost(query: str, cost: int):
+    result = make_schema().execute_sync(query)
+
+    assert not result.errors
+    assert result.extensions == {"cost": {"requested": cost, "maximum": 1000}}
+
+
+async def test_cost_async():
+    result = await make_schema().execute("{ posts(first: 2) { title } }")
+
+    assert not result.errors
+    assert result.extensions == {"cost": {"requested": 6, "maximum": 1000}}
+
+
+def test_rejects_operations_before_resolvers_run():
+    resolved.clear()
+
+    result = make_schema(max_cost=20).execute_sync("{ posts { title } }")
+
+    assert result.data is None
+    assert result.errors
+    assert result.errors[0].message == (
+        "Query cost of 30 exceeds the maximum cost of 20."
+    )
+    assert result.extensions == {"cost": {"requested": 30, "maximum": 20}}
+    assert resolved == []
+
+
+async def test_rejects_operations_before_resolvers_run_async():
+    resolved.clear()
+
+    result = await make_schema(max_cost=20).execute("{ posts { title } }")
+
+    assert result.data is None
+    assert result.errors
+    assert result.errors[0].message == (
+        "Query cost of 30 exceeds the maximum cost of 20."
+    )
+    assert resolved == []
+
+
+def test_variables():
+    schema = make_schema()
+    query = """
+        query ($first: Int, $withComments: Boolean!) {
+            posts(first: $first) {
+                title
+                comments @include(if: $withComments) { text }
+            }
+        }
+    """
+
+    def get_cost(variables: dict[str, Any]) -> int:
+        result = schema.execute_sync(query, variable_values=variables)
+        assert not result.errors
+        assert result.extensions
+        return result.extensions["cost"]["requested"]
+
+    assert get_cost({"first": 2, "withComments": False}) == 6
+    assert get_cost({"first": 2, "withComments": True}) == 16
+    assert get_cost({"first": 1, "withComments": True}) == 8
+    assert get_cost({"withComments": False}) == 30
+
+
+def test_options():
+    result = make_schema(
+        default_scalar_cost=1, default_list_size=2, slicing_arguments=()
+    ).execute_sync("{ posts(first: 5) { title } }")
+
+    # Two posts with a title costing 1
+    assert result.extensions == {"cost": {"requested": 8, "maximum": 1000}}
+
+
+def test_costs_are_cached_per_document_and_variables():
+    schema = make_schema()
+    analysis = get_query_cost_analysis(
+        schema._schema, CostOptions(1, 0, 10, ("first", "last"))
+    )
+    document = parse(
+        "query ($first: Int, $name: String) { posts(first: $first) { title } }"
+    )
+
+    assert analysis.get_cost(document, None, {"first": 2, "name": "a"}) == 6
+    assert analysis.get_cost(document, None, {"first": 2, "name": "b"}) == 6
+    assert analysis.get_cost(document, None, {"first": 3}) == 9
+
+    # Variables that don't change the cost aren't part of the key
+    assert analysis._documents[document].costs == {(None, 2): 6, (None, 3): 9}
+
+
+def test_invalid_variables_are_reported_by_execution():
+    result = make_schema().execute_sync(
+        "query ($first: Int) { posts(first: $first) { title } }",
+        variable_values={"first": "many"},
+    )
+
+    assert result.errors
+    assert "Variable '$first'" in result.errors[0].message
+    assert not result.extensions
+
+
+def test_fragments_are_costed_once(mocker: MockerFixture):
+    @strawberry.type
+    class TreeQuery:
+        @strawberry.field
+        def tree(self) -> Tree:
+            return Tree(value=0)
+
+    fragments = ["fragment F0 on Tree { value }"] + [
+        f"fragment F{i} on Tree {{ left {{ ...F{i - 1} }} right {{ ...F{i - 1} }} }}"
+        for i in range(1, 31)
+    ]
+    schema = strawberry.Schema(
+        query=TreeQuery, extensions=[lambda: QueryCostLimiter(max_cost=1)]
+    )
+    selection_cost = mocker.spy(_CostCalculator, "selection_cost")
+
+    result = schema.execute_sync(" ".join(["{ tree { ...F30 } }", *fragments]))
+
+    assert result.errors
+    assert result.errors[0].message.startswith("Query cost of ")
+    # The operation, `tree`, and the `left` and `right` fields of each fragment,
+    # instead of the 2 ** 30 spreads of `F0`
+    assert selection_cost.call_count == 62
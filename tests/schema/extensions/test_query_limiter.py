@@ -0,0 +1,195 @@
+from typing import Any
+
+import pytest
+from graphql import get_introspection_query
+
+import strawberry
+from strawberry.extensions import IgnoreContext, QueryDepthLimiter, QueryLimiter
+from strawberry.extensions.query_limiter import OperationMetrics
+
+
+@strawberry.type
+class Human:
+    name: str
+    email: str
+
+    @strawberry.field
+    def friends(self) -> list["Human"]:
+        return []
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def user(self, name: str | None = None) -> Human:
+        return Human(name="Jane Doe", email="jane@example.com")
+
+    @strawberry.field
+    def version(self) -> str:
+        return "1"
+
+
+def run(query: str, **kwargs: Any) -> tuple[strawberry.types.ExecutionResult, dict]:
+    metrics: dict[str, OperationMetrics] = {}
+
+    schema = strawberry.Schema(
+        Query, extensions=[QueryLimiter(callback=metrics.update, **kwargs)]
+    )
+    result = schema.execute_sync(query)
+
+    return result, metrics
+
+
+def test_metrics():
+    query = """
+    query Read {
+      version
+      jane: user(name: "jane") { ...UserFields friends { ...UserFields } }
+      matt: user(name: "matt") { ... on Human { name } }
+    }
+
+    fragment UserFields on Human {
+      name
+      mail: email
+      friends { name }
+    }
+    """
+
+    result, metrics = run(query)
+
+    assert not result.errors
+    assert metrics == {
+        "Read": OperationMetrics(
+            depth=3,
+            alias_count=4,
+            field_count=13,
+            root_field_count=3,
+            fragment_spread_count=2,
+        )
+    }
+
+
+def test_root_fields_through_fragments():
+    query = """
+    query { ...Root ... on Query { user { name } } }
+    fragment Root on Query { version other: version }
+    """
+
+    _, metrics = run(query)
+
+    assert metrics["anonymous"].root_field_count == 3
+
+
+@pytest.mark.parametrize(
+    ("limit", "value", "message"),
+    [
+        ("max_depth", 2, "'Read' exceeds maximum operation depth of 2"),
+        ("max_alias_count", 1, "'Read' exceeds maximum alias count of 1"),
+        ("max_field_count", 4, "'Read' exceeds maximum field count of 4"),
+        ("max_root_field_count", 1, "'Read' exceeds maximum root field count of 1"),
+        (
+            "max_fragment_spread_count",
+            1,
+            "'Read' exceeds maximum fragment spread count of 1",
+        ),
+    ],
+)
+def test_limits(limit: str, value: int, message: str):
+    query = """
+    query Read {
+      a: user { ...F }
+      b: user { ...F }
+    }
+    fragment F on Human { friends { friends { name } } }
+    """
+
+    result, _ = run(query, **{limit: value})
+
+    assert result.errors
+    assert [error.message for error in result.errors] == [message]
+
+    result, _ = run(query, **{limit: value + 10})
+
+    assert not result.errors
+
+
+def test_same_depth_as_query_depth_limiter():
+    query = """
+    query A { user { friends { ...F } } }
+    query B { user { name } __schema { types { fields { name } } } }
+    fragment F on Human { friends { friends { name } } }
+    """
+    depths: dict[str, int] = {}
+
+    strawberry.Schema(
+        Query, extensions=[QueryDepthLimiter(max_depth=100, callback=depths.update)]
+    ).execute_sync(query, operation_name="A")
+    _, metrics = run(query)
+
+    assert {name: value.depth for name, value in metrics.items()} == depths
+
+
+def test_should_ignore():
+    def should_ignore(ignore: IgnoreContext) -> bool:
+        return ignore.field_args.get("name") == "matt"
+
+    query = """
+    query Read {
+      user(name: "matt") { friends { friends { name } } }
+    }
+    """
+
+    result, metrics = run(query, max_depth=2, should_ignore=should_ignore)
+
+    assert not result.errors
+    assert metrics["Read"].depth == 0
+
+
+def test_should_ignore_must_be_callable():
+    with pytest.raises(TypeError, match="must be a callable"):
+        QueryLimiter(should_ignore="user")  # type: ignore[arg-type]
+
+
+def test_introspection_query():
+    result, _ = run(get_introspection_query(), max_depth=2)
+
+    assert not result.errors
+
+
+def test_fragment_cycles_are_reported_by_validation():
+    query = """
+    query { user { ...A } }
+    fragment A on Human { friends { ...B } }
+    fragment B on Human { friends { ...A } }
+    """
+
+    result, metrics = run(query)
+
+    assert result.errors
+    assert "Cannot spread fragment" in result.errors[0].message
+    assert metrics["anonymous"].fragment_spread_count == 3
+
+
+def test_fragments_are_analysed_once():
+    levels = 40
+    fragments = "\n".join(
+        f"fragment F{i} on Human {{ a{i}: friends {{ ...F{i + 1} }}"
+        f" b{i}: friends {{ ...F{i + 1} }} }}"
+        for i in range(levels)
+    )
+    query = f"""
+    query {{ user {{ ...F0 }} }}
+    {fragments}
+    fragment F{levels} on Human {{ name }}
+    """
+
+    # Expanding the fragments would mean analysing trillions of fields
+    result, metrics = run(query, max_field_count=1000)
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "'anonymous' exceeds maximum field count of 1000"
+    )
+    assert metrics["anonymous"].field_count == 3 * 2**levels - 1
+    assert metrics["anonymous"].alias_count == 2 ** (levels + 1) - 2
+    assert metrics["anonymous"].depth == levels + 1
@@ -0,0 +1,288 @@
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+import strawberry
+from strawberry.extensions import ResponseCache, ResponseCacheSync
+from strawberry.extensions.response_cache import conditional_request, get_etag
+from strawberry.schema_directives import CacheControl, CacheControlScope
+
+
+@strawberry.type(directives=[CacheControl(max_age=120)])
+class Author:
+    name: str
+
+    @strawberry.field(directives=[CacheControl(max_age=10)])
+    def followers(self) -> int:
+        return 3
+
+
+@strawberry.type
+class Book:
+    title: str
+
+    @strawberry.field(directives=[CacheControl(inherit_max_age=True)])
+    def author(self) -> Author:
+        return Author(name="Jane")
+
+
+@strawberry.interface
+class Node:
+    id: strawberry.ID
+
+
+@strawberry.type(directives=[CacheControl(max_age=50)])
+class Store(Node):
+    name: str
+
+
+@strawberry.type(directives=[CacheControl(max_age=20)])
+class Shelf(Node):
+    size: int
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    def update(self) -> str:
+        return "updated"
+
+
+@pytest.fixture
+def calls() -> Counter[str]:
+    return Counter()
+
+
+@pytest.fixture
+def query_type(calls: Counter[str]) -> type:
+    @strawberry.type
+    class Query:
+        @strawberry.field(directives=[CacheControl(max_age=60)])
+        def books(self) -> list[Book]:
+            calls["books"] += 1
+            return [Book(title="The book")]
+
+        @strawberry.field
+        def author(self) -> Author:
+            return Author(name="Jane")
+
+        @strawberry.field
+        def node(self) -> Node:
+            return Store(id=strawberry.ID("1"), name="store")
+
+        @strawberry.field(
+            directives=[CacheControl(max_age=30, scope=CacheControlScope.PRIVATE)]
+        )
+        def me(self, info: strawberry.Info) -> str:
+            calls["me"] += 1
+            return info.context["user"]
+
+        @strawberry.field(directives=[CacheControl(max_age=60)])
+        def fail(self) -> str | None:
+            calls["fail"] += 1
+            raise ValueError("failed")
+
+        @strawberry.field
+        def now(self) -> str:
+            calls["now"] += 1
+            return "now"
+
+    return Query
+
+
+@pytest.fixture
+def create_schema(query_type: type) -> Callable[..., strawberry.Schema]:
+    def create_schema(**kwargs: Any) -> strawberry.Schema:
+        return strawberry.Schema(
+            query_type,
+            Mutation,
+            types=[Store, Shelf],
+            extensions=[lambda: ResponseCacheSync(**kwargs)],
+        )
+
+    return create_schema
+
+
+@pytest.mark.parametrize(
+    ("query", "max_age"),
+    [
+        ("{ books { title } }", 60),
+        ("{ books { title author { name } } }", 60),
+        ("{ books { author { followers } } }", 10),
+        ("{ author { name } }", 120),
+        ("{ books { title } author { followers } }", 10),
+        ("{ node { id } }", 20),
+        ("{ books { title } now }", 0),
+        ("{ __typename }", 0),
+        ("query { ...Fields } fragment Fields on Query { books { title } }", 60),
+    ],
+)
+def test_policy(
+    query: str, max_age: int, create_schema: Callable[..., strawberry.Schema]
+):
+    result = create_schema().execute_sync(query)
+
+    assert not result.errors
+    assert result.extensions == {"cacheControl": {"maxAge": max_age, "scope": "PUBLIC"}}
+
+
+def test_default_max_age(create_schema: Callable[..., strawberry.Schema]):
+    result = create_schema(default_max_age=5).execute_sync("{ books { title } now }")
+
+    assert result.extensions == {"cacheControl": {"maxAge": 5, "scope": "PUBLIC"}}
+
+
+def test_results_are_cached(
+    create_schema: Callable[..., strawberry.Schema], calls: Counter[str]
+):
+    schema = create_schema()
+
+    for _ in range(2):
+        result = schema.execute_sync("{ books { title } }")
+
+        assert result.data == {"books": [{"title": "The book"}]}
+
+    assert calls["books"] == 1
+
+    schema.execute_sync("{ books { title author { name } } }")
+
+    assert calls["books"] == 2
+
+
+async def test_async_extension(query_type: type, calls: Counter[str]):
+    schema = strawberry.Schema(query_type, extensions=[ResponseCache])
+
+    for _ in range(2):
+        result = await schema.execute("{ books { title } }")
+
+        assert result.data == {"books": [{"title": "The book"}]}
+
+    assert calls["books"] == 1
+
+
+def test_conditional_request(
+    create_schema: Callable[..., strawberry.Schema], calls: Counter[str]
+):
+    schema = create_schema()
+
+    with conditional_request(None) as request:
+        schema.execute_sync("{ books { title } }")
+
+    etag = get_etag({"books": [{"title": "The book"}]})
+
+    assert request.etag == etag
+    assert not request.not_modified
+
+    with conditional_request(f'"other", {etag}') as request:
+        result = schema.execute_sync("{ books { title } }")
+
+    assert request.not_modified
+    assert result.extensions == {"cacheControl": {"maxAge": 60, "scope": "PUBLIC"}}
+    assert calls["books"] == 1
+
+    with conditional_request('"other"') as request:
+        result = schema.execute_sync("{ books { title } }")
+
+    assert request.etag == etag
+    assert not request.not_modified
+    assert result.data == {"books": [{"title": "The book"}]}
+
+
+def test_conditional_request_without_stored_result(
+    create_schema: Callable[..., strawberry.Schema],
+):
+    schema = create_schema()
+
+    with conditional_request("*") as request:
+        result = schema.execute_sync("{ books { title } now }")
+
+    assert request.etag is None
+    assert not request.not_modified
+    assert result.data == {"books": [{"title": "The book"}], "now": "now"}
+
+
+def test_variables_are_part_of_the_key(
+    create_schema: Callable[..., strawberry.Schema], calls: Counter[str]
+):
+    schema = create_schema()
+    query = "query ($skip: Boolean!) { books { title } now @skip(if: $skip) }"
+
+    result = schema.execute_sync(query, variable_values={"skip": True})
+
+    # `@skip` is ignored by the policy
+    assert result.extensions == {"cacheControl": {"maxAge": 0, "scope": "PUBLIC"}}
+
+    query = "query ($skip: Boolean!) { books { title @skip(if: $skip) } }"
+
+    for skip in [True, False, True]:
+        schema.execute_sync(query, variable_values={"skip": skip})
+
+    assert calls["books"] == 3
+
+
+def test_private_results(
+    create_schema: Callable[..., strawberry.Schema], calls: Counter[str]
+):
+    schema = create_schema(principal=lambda context: context.get("user"))
+
+    for user in ["jane", "matt", "jane"]:
+        result = schema.execute_sync("{ me }", context_value={"user": user})
+
+        assert result.data == {"me": user}
+        assert result.extensions == {"cacheControl": {"maxAge": 30, "scope": "PRIVATE"}}
+
+    assert calls["me"] == 2
+
+
+def test_private_results_without_principal_are_not_cached(
+    create_schema: Callable[..., strawberry.Schema], calls: Counter[str]
+):
+    schema = create_schema()
+
+    for _ in range(2):
+        schema.execute_sync("{ me }", context_value={"user": "jane"})
+
+    assert calls["me"] == 2
+
+
+def test_errors_are_not_cached(
+    create_schema: Callable[..., strawberry.Schema], calls: Counter[str]
+):
+    schema = create_schema()
+
+    for _ in range(2):
+        result = schema.execute_sync("{ fail }")
+
+        assert result.errors
+
+    assert calls["fail"] == 2
+
+
+def test_mutations_are_not_cached(create_schema: Callable[..., strawberry.Schema]):
+    result = create_schema().execute_sync("mutation { update }")
+
+    assert result.data == {"update": "updated"}
+    assert not result.extensions
+
+
+def test_sync_extension_requires_sync_store(
+    create_schema: Callable[..., strawberry.Schema],
+):
+    class AsyncStore:
+        async def get(self, key: str) -> Any | None:
+            return None
+
+        async def set(self, key: str, value: Any, ttl: float) -> None:
+            pass
+
+    schema = create_schema(store=AsyncStore())
+
+    result = schema.execute_sync("{ books { title } }")
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "ResponseCacheSync requires a synchronous store, "
+        "use ResponseCache with async stores"
+    )
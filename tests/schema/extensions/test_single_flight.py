@@ -0,0 +1,225 @@
+import asyncio
+from collections import Counter
+from typing import Any
+
+import pytest
+
+import strawberry
+from strawberry.extensions import MetricsRegistry, SingleFlight, SingleFlightSync
+
+
+@pytest.fixture
+def calls() -> Counter[str]:
+    return Counter()
+
+
+@pytest.fixture
+def release() -> asyncio.Event:
+    return asyncio.Event()
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def types(calls: Counter[str], release: asyncio.Event) -> tuple[type, type]:
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        async def slow(self, value: int = 1) -> int:
+            calls["slow"] += 1
+            await release.wait()
+            return value
+
+        @strawberry.field
+        async def fail(self) -> str | None:
+            calls["fail"] += 1
+            await release.wait()
+            raise ValueError("failed")
+
+        @strawberry.field
+        def me(self, info: strawberry.Info) -> str:
+            calls["me"] += 1
+            return info.context["user"]
+
+        @strawberry.field
+        def fast(self) -> int:
+            calls["fast"] += 1
+            return 1
+
+    @strawberry.type
+    class Mutation:
+        @strawberry.mutation
+        async def update(self) -> int:
+            calls["update"] += 1
+            await release.wait()
+            return 1
+
+    return Query, Mutation
+
+
+@pytest.fixture
+def schema(types: tuple[type, type], registry: MetricsRegistry) -> strawberry.Schema:
+    return strawberry.Schema(
+        *types,
+        extensions=[
+            lambda: SingleFlight(scope=lambda context: "public", registry=registry)
+        ],
+    )
+
+
+async def run_concurrently(
+    schema: strawberry.Schema, release: asyncio.Event, queries: list[str]
+) -> list[Any]:
+    tasks = [asyncio.create_task(schema.execute(query)) for query in queries]
+
+    await asyncio.sleep(0)
+    release.set()
+
+    return await asyncio.gather(*tasks)
+
+
+async def test_identical_queries_are_executed_once(
+    schema: strawberry.Schema,
+    release: asyncio.Event,
+    calls: Counter[str],
+    registry: MetricsRegistry,
+):
+    results = await run_concurrently(
+        schema,
+        release,
+        ["{ slow }", "{ slow }", "query {\n  slow\n}", "{ slow(value: 2) }"],
+    )
+
+    assert [result.data for result in results] == [
+        {"slow": 1},
+        {"slow": 1},
+        {"slow": 1},
+        {"slow": 2},
+    ]
+    assert calls["slow"] == 2
+    assert registry.single_flight == {"executed": 2, "coalesced": 2}
+    assert registry.coalescing_ratio == 0.5
+
+
+async def test_each_request_gets_its_own_data(
+    schema: strawberry.Schema, release: asyncio.Event
+):
+    first, second = await run_concurrently(schema, release, ["{ slow }", "{ slow }"])
+
+    assert first.data == second.data == {"slow": 1}
+    assert first.data is not second.data
+
+    first.data["slow"] = 2
+
+    assert second.data == {"slow": 1}
+
+
+def test_scope_is_required():
+    with pytest.raises(TypeError):
+        SingleFlight()  # type: ignore[call-arg]
+
+
+async def test_errors_are_shared(
+    schema: strawberry.Schema, release: asyncio.Event, calls: Counter[str]
+):
+    results = await run_concurrently(schema, release, ["{ fail }", "{ fail }"])
+
+    for result in results:
+        assert result.data == {"fail": None}
+        assert result.errors
+        assert result.errors[0].message == "failed"
+
+    assert calls["fail"] == 1
+
+
+async def test_sequential_queries_are_not_coalesced(
+    schema: strawberry.Schema,
+    release: asyncio.Event,
+    calls: Counter[str],
+    registry: MetricsRegistry,
+):
+    release.set()
+
+    for _ in range(2):
+        result = await schema.execute("{ slow }")
+
+        assert result.data == {"slow": 1}
+
+    assert calls["slow"] == 2
+    assert registry.coalescing_ratio == 0
+
+
+async def test_mutations_are_not_coalesced(
+    schema: strawberry.Schema, release: asyncio.Event, calls: Counter[str]
+):
+    results = await run_concurrently(schema, release, ["mutation { update }"] * 2)
+
+    assert [result.data for result in results] == [{"update": 1}] * 2
+    assert calls["update"] == 2
+
+
+async def test_scope(
+    types: tuple[type, type],
+    release: asyncio.Event,
+    calls: Counter[str],
+    registry: MetricsRegistry,
+):
+    schema = strawberry.Schema(
+        *types,
+        extensions=[
+            lambda: SingleFlight(
+                scope=lambda context: context.get("user"), registry=registry
+            )
+        ],
+    )
+
+    async def me(user: str | None) -> Any:
+        return await schema.execute("{ me slow }", context_value={"user": user})
+
+    tasks = [asyncio.create_task(me(user)) for user in ["jane", "matt", "jane"]]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert [result.data["me"] for result in results] == ["jane", "matt", "jane"]
+    assert calls["me"] == 2
+
+
+async def test_cancelled_execution(
+    schema: strawberry.Schema, release: asyncio.Event, calls: Counter[str]
+):
+    leader = asyncio.create_task(schema.execute("{ slow }"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(schema.execute("{ slow }"))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    result = await follower
+
+    assert result.data == {"slow": 1}
+    assert calls["slow"] == 2
+
+
+def test_sync_execution(
+    types: tuple[type, type], calls: Counter[str], registry: MetricsRegistry
+):
+    schema = strawberry.Schema(
+        *types,
+        extensions=[
+            lambda: SingleFlightSync(scope=lambda context: "public", registry=registry)
+        ],
+    )
+
+    for _ in range(2):
+        result = schema.execute_sync("{ fast }")
+
+        assert not result.errors
+        assert result.data == {"fast": 1}
+
+    assert calls["fast"] == 2
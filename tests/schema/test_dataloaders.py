@@ -3,7 +3,7 @@ from dataclasses import dataclass
 import pytest
 
 import strawberry
-from strawberry.dataloader import DataLoader
+from strawberry.dataloader import DataLoader, SyncDataLoader
 
 
 @pytest.mark.asyncio
@@ -43,3 +43,131 @@ async def test_can_use_dataloaders(mocker):
     }
 
     mock_loader.assert_called_once_with(["1", "2"])
+
+
+@strawberry.type
+class Author:
+    id: int
+
+    @strawberry.field
+    def friends(self, info: strawberry.Info) -> list["Author"]:
+        return info.context["loader"].load_many([self.id * 10, self.id * 10 + 1])
+
+    @strawberry.field
+    def best_friend(self, info: strawberry.Info) -> "Author":
+        return info.context["loader"].load(-self.id)
+
+    @strawberry.field
+    def maybe_friend(self, info: strawberry.Info) -> "Author | None":
+        return info.context["loader"].load(-self.id)
+
+    @strawberry.field
+    async def name(self) -> str:
+        return "Author"
+
+
+@strawberry.type
+class AuthorQuery:
+    @strawberry.field
+    def authors(self, info: strawberry.Info) -> list[Author]:
+        return [info.context["loader"].load(key) for key in (1, 2)]
+
+    @strawberry.field
+    def author(self, info: strawberry.Info) -> Author | None:
+        return info.context["loader"].load(3)
+
+
+def _load_authors(keys: list[int]) -> list[Author | ValueError]:
+    return [
+        ValueError(f"No author {key}") if key < 0 else Author(id=key) for key in keys
+    ]
+
+
+def test_sync_dataloader_batches_each_level(mocker):
+    mock_loader = mocker.Mock(side_effect=_load_authors)
+    schema = strawberry.Schema(query=AuthorQuery)
+
+    result = schema.execute_sync(
+        "{ authors { id friends { id friends { id } } } author { id } }",
+        context_value={"loader": SyncDataLoader(load_fn=mock_loader)},
+    )
+
+    assert not result.errors
+    assert result.data["authors"][1] == {
+        "id": 2,
+        "friends": [
+            {"id": 20, "friends": [{"id": 200}, {"id": 201}]},
+            {"id": 21, "friends": [{"id": 210}, {"id": 211}]},
+        ],
+    }
+    assert result.data["author"] == {"id": 3}
+    assert [call.args[0] for call in mock_loader.call_args_list] == [
+        [1, 2, 3],
+        [10, 11, 20, 21],
+        [100, 101, 110, 111, 200, 201, 210, 211],
+    ]
+
+
+def test_sync_dataloader_errors():
+    schema = strawberry.Schema(query=AuthorQuery)
+
+    result = schema.execute_sync(
+        "{ authors { id maybeFriend { id } } author { bestFriend { id } } }",
+        context_value={"loader": SyncDataLoader(load_fn=_load_authors)},
+    )
+
+    assert result.data == {
+        "authors": [{"id": 1, "maybeFriend": None}, {"id": 2, "maybeFriend": None}],
+        # bestFriend is not nullable, the error nulls its parent
+        "author": None,
+    }
+    assert result.errors
+    assert [(error.message, error.path) for error in result.errors] == [
+        ("No author -1", ["authors", 0, "maybeFriend"]),
+        ("No author -2", ["authors", 1, "maybeFriend"]),
+        ("No author -3", ["author", "bestFriend"]),
+    ]
+
+
+def test_sync_dataloader_errors_propagate_through_lists():
+    schema = strawberry.Schema(query=AuthorQuery)
+
+    result = schema.execute_sync(
+        "{ authors { id bestFriend { id } } }",
+        context_value={"loader": SyncDataLoader(load_fn=_load_authors)},
+    )
+
+    assert result.data is None
+    assert result.errors
+    assert result.errors[0].path == ["authors", 0, "bestFriend"]
+
+
+@pytest.mark.asyncio
+async def test_sync_dataloader_with_async_execution(mocker):
+    mock_loader = mocker.Mock(side_effect=_load_authors)
+    schema = strawberry.Schema(query=AuthorQuery)
+
+    result = await schema.execute(
+        "{ authors { id name friends { id name } } }",
+        context_value={"loader": SyncDataLoader(load_fn=mock_loader)},
+    )
+
+    assert not result.errors
+    assert result.data == {
+        "authors": [
+            {
+                "id": 1,
+                "name": "Author",
+                "friends": [{"id": 10, "name": "Author"}, {"id": 11, "name": "Author"}],
+            },
+            {
+                "id": 2,
+                "name": "Author",
+                "friends": [{"id": 20, "name": "Author"}, {"id": 21, "name": "Author"}],
+            },
+        ]
+    }
+    assert [call.args[0] for call in mock_loader.call_args_list] == [
+        [1, 2],
+        [10, 11, 20, 21],
+    ]
@@ -0,0 +1,159 @@
+import asyncio
+import time
+
+import strawberry
+from strawberry.dataloader import DataLoader
+from strawberry.execution.deadline import deadline_scope, get_deadline
+from strawberry.schema.config import StrawberryConfig
+from strawberry.types.info import Info
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def fast(self) -> str:
+        return "fast"
+
+    @strawberry.field
+    async def slow(self) -> str | None:
+        await asyncio.sleep(10)
+        return "slow"
+
+    @strawberry.field
+    async def required_slow(self) -> str:
+        await asyncio.sleep(10)
+        return "slow"
+
+    @strawberry.field
+    async def timing_out(self) -> str | None:
+        raise asyncio.TimeoutError("Upstream timed out")
+
+    @strawberry.field
+    async def name(self, info: Info, id: int) -> str | None:
+        return await info.context["loader"].load(id)
+
+    @strawberry.field
+    def remaining(self, info: Info) -> float | None:
+        return info.deadline.remaining if info.deadline else None
+
+    @strawberry.field
+    def blocking(self) -> str:
+        time.sleep(0.05)
+        return "blocking"
+
+
+schema = strawberry.Schema(Query)
+
+
+async def test_partial_data_with_errors_on_timed_out_fields():
+    result = await schema.execute("{ fast slow }", timeout=0.01)
+
+    assert result.data == {"fast": "fast", "slow": None}
+    assert result.errors
+    assert len(result.errors) == 1
+    assert result.errors[0].message == "Deadline exceeded"
+    assert result.errors[0].path == ["slow"]
+    assert result.errors[0].extensions == {"code": "DEADLINE_EXCEEDED"}
+
+
+async def test_non_null_fields_propagate_to_their_parent():
+    result = await schema.execute("{ fast requiredSlow }", timeout=0.01)
+
+    assert result.data is None
+    assert result.errors
+    assert result.errors[0].path == ["requiredSlow"]
+
+
+async def test_resolver_timeouts_before_the_deadline_are_kept():
+    result = await schema.execute("{ fast timingOut }", timeout=10)
+
+    assert result.data == {"fast": "fast", "timingOut": None}
+    assert result.errors
+    assert len(result.errors) == 1
+    assert result.errors[0].message == "Upstream timed out"
+    assert not result.errors[0].extensions
+
+
+async def test_dataloader_batches_are_cancelled():
+    loads: list[str] = []
+
+    async def load_names(keys: list[int]) -> list[str]:
+        loads.append("started")
+
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            loads.append("cancelled")
+            raise
+
+        return [str(key) for key in keys]
+
+    loader = DataLoader(load_names)
+
+    result = await schema.execute(
+        "{ a: name(id: 1) b: name(id: 2) }",
+        context_value={"loader": loader},
+        timeout=0.05,
+    )
+
+    assert result.data == {"a": None, "b": None}
+    assert result.errors
+    assert {tuple(error.path) for error in result.errors} == {("a",), ("b",)}
+
+    await asyncio.sleep(0)
+
+    assert loads == ["started", "cancelled"]
+
+
+async def test_schema_execution_timeout():
+    schema = strawberry.Schema(Query, config=StrawberryConfig(execution_timeout=0.01))
+
+    result = await schema.execute("{ fast slow }")
+
+    assert result.data == {"fast": "fast", "slow": None}
+    assert result.errors
+
+
+async def test_operation_timeout_cant_exceed_the_schema_timeout():
+    schema = strawberry.Schema(Query, config=StrawberryConfig(execution_timeout=5))
+
+    result = await schema.execute("{ remaining }", timeout=60)
+
+    assert result.data
+    assert 0 < result.data["remaining"] <= 5
+
+
+async def test_info_deadline():
+    result = await schema.execute("{ remaining }")
+
+    assert result.data == {"remaining": None}
+
+    result = await schema.execute("{ remaining }", timeout=10)
+
+    assert result.data
+    assert 9 < result.data["remaining"] <= 10
+
+
+def test_sync_execution_checks_the_deadline_before_each_resolver():
+    result = schema.execute_sync("{ blocking fast }", timeout=0.01)
+
+    assert result.data is None
+    assert result.errors
+    assert result.errors[0].path == ["fast"]
+
+
+def test_nested_deadlines_keep_the_earliest():
+    with deadline_scope(1):
+        outer = get_deadline()
+
+        with deadline_scope(10):
+            assert get_deadline() is outer
+
+        with deadline_scope(0.5):
+            inner = get_deadline()
+
+            assert inner is not None
+            assert inner is not outer
+            assert inner.remaining <= 0.5
+
+    assert get_deadline() is None
@@ -0,0 +1,181 @@
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from graphql import parse
+
+import strawberry
+from strawberry.execution import plan as execution_plan
+from strawberry.extensions import ParserCache
+from strawberry.schema.config import StrawberryConfig
+from strawberry.utils import IS_GQL_33
+
+pytestmark = pytest.mark.skipif(
+    IS_GQL_33, reason="Execution plans are only supported on graphql-core 3.2"
+)
+
+
+@strawberry.type
+class Pet:
+    id: int
+    name: str
+
+
+@strawberry.type
+class Person:
+    id: int
+    name: str
+
+    @strawberry.field
+    def pets(self) -> list[Pet]:
+        return [Pet(id=self.id * 10 + i, name=f"pet {i}") for i in range(2)]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def people(self, limit: int = 3) -> list[Person]:
+        return [Person(id=i, name=f"person {i}") for i in range(limit)]
+
+    @strawberry.field
+    async def async_people(self) -> list[Person]:
+        return [Person(id=i, name=f"person {i}") for i in range(2)]
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    def rename(self, name: str) -> Person:
+        return Person(id=1, name=name)
+
+
+def _make_schema(**kwargs: Any) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        mutation=Mutation,
+        config=StrawberryConfig(enable_execution_plan_cache=True),
+        **kwargs,
+    )
+
+
+QUERY = """
+    query People($limit: Int!, $withPets: Boolean!) {
+        people(limit: $limit) {
+            ...PersonFields
+            pets @include(if: $withPets) { id name }
+        }
+    }
+
+    fragment PersonFields on Person { id name }
+"""
+
+
+def test_plan_results_match_regular_execution():
+    schema = _make_schema()
+    regular = strawberry.Schema(query=Query, mutation=Mutation)
+
+    for variables in (
+        {"limit": 2, "withPets": True},
+        {"limit": 3, "withPets": False},
+        {"limit": 1, "withPets": True},
+    ):
+        result = schema.execute_sync(QUERY, variable_values=variables)
+        expected = regular.execute_sync(QUERY, variable_values=variables)
+
+        assert not result.errors
+        assert result.data == expected.data
+
+
+def test_plan_is_shared_between_equal_documents():
+    schema = _make_schema()
+    plans = schema._execution_plans
+    assert plans is not None
+
+    document = parse(QUERY)
+    equal_document = parse(QUERY)
+
+    first = plans.get(document, "People")
+    second = plans.get(equal_document, "People")
+
+    assert first is not None
+    assert first is second
+
+    del document, equal_document
+
+    assert not plans._plans
+
+
+def test_fields_are_collected_once_per_conditional_variables():
+    schema = _make_schema(extensions=[ParserCache])
+
+    with patch.object(
+        execution_plan, "collect_fields", wraps=execution_plan.collect_fields
+    ) as collect_fields:
+        for limit in range(3):
+            result = schema.execute_sync(
+                QUERY, variable_values={"limit": limit, "withPets": True}
+            )
+            assert not result.errors
+
+        assert collect_fields.call_count == 1
+
+        result = schema.execute_sync(
+            QUERY, variable_values={"limit": 1, "withPets": False}
+        )
+
+        assert not result.errors
+        assert result.data == {"people": [{"id": 0, "name": "person 0"}]}
+        assert collect_fields.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_plan_async_execution():
+    schema = _make_schema()
+    query = "{ asyncPeople { name pets { name } } }"
+
+    for _ in range(2):
+        result = await schema.execute(query)
+
+        assert not result.errors
+        assert result.data == {
+            "asyncPeople": [
+                {"name": "person 0", "pets": [{"name": "pet 0"}, {"name": "pet 1"}]},
+                {"name": "person 1", "pets": [{"name": "pet 0"}, {"name": "pet 1"}]},
+            ]
+        }
+
+
+def test_plan_mutation():
+    schema = _make_schema()
+
+    result = schema.execute_sync(
+        'mutation { first: rename(name: "a") { name } second: rename(name: "b") { name } }'
+    )
+
+    assert not result.errors
+    assert result.data == {"first": {"name": "a"}, "second": {"name": "b"}}
+
+
+def test_plan_variable_errors():
+    schema = _make_schema()
+
+    result = schema.execute_sync(QUERY, variable_values={"limit": "nope"})
+
+    assert result.data is None
+    assert result.errors
+    assert [error.message for error in result.errors] == [
+        (
+            "Variable '$limit' got invalid value 'nope'; Int cannot represent "
+            "non-integer value: 'nope'"
+        ),
+        "Variable '$withPets' of required type 'Boolean!' was not provided.",
+    ]
+
+
+def test_no_plan_for_ambiguous_operations():
+    schema = _make_schema()
+    document = parse("query A { people { id } } query B { people { name } }")
+
+    assert execution_plan.ExecutionPlan.compile(schema._schema, document, None) is None
+    assert execution_plan.ExecutionPlan.compile(schema._schema, document, "C") is None
+    assert execution_plan.ExecutionPlan.compile(schema._schema, document, "B")
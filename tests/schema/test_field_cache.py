@@ -0,0 +1,240 @@
+import asyncio
+from collections import Counter
+from typing import Any
+
+import pytest
+
+import strawberry
+from strawberry.extensions import CachePolicy, InMemoryResolverCache
+from strawberry.permission import BasePermission
+from strawberry.schema.config import StrawberryConfig
+from strawberry.types.info import Info
+
+
+def current_user(info: Info) -> str | None:
+    return info.context.get("user")
+
+
+class IsAuthenticated(BasePermission):
+    message = "Not authenticated"
+
+    def has_permission(self, source: Any, info: Info, **kwargs: Any) -> bool:
+        return info.context.get("user") is not None
+
+
+@strawberry.input
+class Filter:
+    prefix: str
+    tags: list[str] = strawberry.field(default_factory=list)
+
+
+@pytest.fixture
+def calls() -> Counter[str]:
+    return Counter()
+
+
+@pytest.fixture
+def query_type(calls: Counter[str]) -> type:
+    @strawberry.type
+    class Book:
+        id: strawberry.ID
+        title: str
+
+        @strawberry.field(cache=CachePolicy(ttl=60))
+        def reviews(self, limit: int = 10) -> int:
+            calls[f"reviews:{self.id}"] += 1
+            return len(self.title) * limit
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(cache=CachePolicy(ttl=60))
+        def price(self, book_id: int, currency: str = "EUR") -> str:
+            calls["price"] += 1
+            return f"{book_id * 10} {currency}"
+
+        @strawberry.field(cache=CachePolicy(ttl=60))
+        def search(self, filter: Filter) -> list[str]:
+            calls["search"] += 1
+            return [filter.prefix, *filter.tags]
+
+        @strawberry.field(cache=CachePolicy(ttl=60))
+        async def slow_price(self, book_id: int) -> str:
+            calls["slow_price"] += 1
+            await asyncio.sleep(0)
+            return str(book_id)
+
+        @strawberry.field(cache=CachePolicy(ttl=60, scope="private", key=current_user))
+        def me(self, info: Info) -> str:
+            calls["me"] += 1
+            return info.context.get("user") or "anonymous"
+
+        @strawberry.field(
+            cache=CachePolicy(ttl=60), permission_classes=[IsAuthenticated]
+        )
+        def secret(self) -> str:
+            calls["secret"] += 1
+            return "secret"
+
+        @strawberry.field
+        def books(self) -> list[Book]:
+            return [
+                Book(id=strawberry.ID("1"), title="a"),
+                Book(id=strawberry.ID("2"), title="bb"),
+            ]
+
+        @strawberry.field(cache=CachePolicy(ttl=60))
+        def fail(self) -> str:
+            calls["fail"] += 1
+            raise ValueError("failed")
+
+    return Query
+
+
+@pytest.fixture
+def cache() -> InMemoryResolverCache:
+    return InMemoryResolverCache()
+
+
+@pytest.fixture
+def schema(query_type: type, cache: InMemoryResolverCache) -> strawberry.Schema:
+    return strawberry.Schema(query_type, config=StrawberryConfig(resolver_cache=cache))
+
+
+def test_results_are_cached_between_requests(
+    schema: strawberry.Schema, calls: Counter[str]
+):
+    for _ in range(2):
+        result = schema.execute_sync("{ price(bookId: 1) }")
+
+        assert not result.errors
+        assert result.data == {"price": "10 EUR"}
+
+    result = schema.execute_sync('{ price(bookId: 1, currency: "USD") }')
+
+    assert result.data == {"price": "10 USD"}
+    assert calls["price"] == 2
+
+
+def test_aliases_are_resolved_once(schema: strawberry.Schema, calls: Counter[str]):
+    result = schema.execute_sync(
+        '{ a: price(bookId: 2) b: price(bookId: 2, currency: "EUR") c: price(bookId: 3) }'
+    )
+
+    assert result.data == {"a": "20 EUR", "b": "20 EUR", "c": "30 EUR"}
+    assert calls["price"] == 2
+
+
+async def test_async_resolvers(schema: strawberry.Schema, calls: Counter[str]):
+    result = await schema.execute("{ a: slowPrice(bookId: 1) b: slowPrice(bookId: 1) }")
+
+    assert result.data == {"a": "1", "b": "1"}
+    assert calls["slow_price"] == 1
+
+    result = await schema.execute("{ slowPrice(bookId: 1) }")
+
+    assert result.data == {"slowPrice": "1"}
+    assert calls["slow_price"] == 1
+
+
+def test_input_arguments_are_normalized(schema: strawberry.Schema, calls: Counter[str]):
+    query = """
+    query ($filter: Filter!) {
+      a: search(filter: {prefix: "a", tags: ["x"]})
+      b: search(filter: $filter)
+    }
+    """
+    result = schema.execute_sync(
+        query, variable_values={"filter": {"tags": ["x"], "prefix": "a"}}
+    )
+
+    assert result.data == {"a": ["a", "x"], "b": ["a", "x"]}
+    assert calls["search"] == 1
+
+
+def test_parent_identity(schema: strawberry.Schema, calls: Counter[str]):
+    for _ in range(2):
+        result = schema.execute_sync("{ books { reviews(limit: 2) } }")
+
+        assert result.data == {"books": [{"reviews": 2}, {"reviews": 4}]}
+
+    assert calls == {"reviews:1": 1, "reviews:2": 1}
+
+
+def test_private_scope(schema: strawberry.Schema, calls: Counter[str]):
+    for user in ["jane", "matt", "jane", None, None]:
+        result = schema.execute_sync("{ me }", context_value={"user": user})
+
+        assert result.data == {"me": user or "anonymous"}
+
+    # Anonymous requests aren't cached between requests
+    assert calls["me"] == 4
+
+
+def test_permissions_run_on_cached_fields(
+    schema: strawberry.Schema, calls: Counter[str]
+):
+    result = schema.execute_sync("{ secret }", context_value={"user": "jane"})
+
+    assert result.data == {"secret": "secret"}
+
+    result = schema.execute_sync("{ secret }", context_value={"user": None})
+
+    assert result.errors
+    assert result.errors[0].message == "Not authenticated"
+    assert calls["secret"] == 1
+
+
+def test_errors_are_not_cached(
+    schema: strawberry.Schema, cache: InMemoryResolverCache, calls: Counter[str]
+):
+    for _ in range(2):
+        result = schema.execute_sync("{ fail }")
+
+        assert result.errors
+
+    assert calls["fail"] == 2
+    assert cache.stats.size == 0
+
+
+def test_ttl(
+    schema: strawberry.Schema, cache: InMemoryResolverCache, calls: Counter[str]
+):
+    now = 0.0
+    cache.cache.timer = lambda: now
+
+    schema.execute_sync("{ price(bookId: 1) }")
+    now = 61
+    schema.execute_sync("{ price(bookId: 1) }")
+
+    assert calls["price"] == 2
+
+
+async def test_async_store(query_type: type, calls: Counter[str]):
+    class AsyncStore:
+        def __init__(self) -> None:
+            self.values: dict[str, Any] = {}
+
+        async def get(self, key: str) -> Any | None:
+            return self.values.get(key)
+
+        async def set(self, key: str, value: Any, ttl: float) -> None:
+            self.values[key] = value
+
+    store = AsyncStore()
+    schema = strawberry.Schema(
+        query_type, config=StrawberryConfig(resolver_cache=store)
+    )
+
+    for _ in range(2):
+        result = await schema.execute("{ price(bookId: 1) slowPrice(bookId: 2) }")
+
+        assert not result.errors
+        assert result.data == {"price": "10 EUR", "slowPrice": "2"}
+
+    assert calls == {"price": 1, "slow_price": 1}
+    assert len(store.values) == 2
+
+
+def test_private_policy_needs_a_key():
+    with pytest.raises(ValueError, match="needs a `key`"):
+        CachePolicy(ttl=10, scope="private")
@@ -0,0 +1,170 @@
+import os
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+import strawberry
+from strawberry.execution.process_pool import (
+    ResolverProcessPool,
+    ResolverResultTooLargeError,
+)
+from strawberry.extensions import FieldExtension
+from strawberry.schema.config import StrawberryConfig
+from strawberry.types.info import Info
+
+
+@strawberry.type
+class Stats:
+    pid: int
+    total: int
+
+
+class DoubleExtension(FieldExtension):
+    def resolve(self, next_: Any, source: Any, info: Any, **kwargs: Any) -> Any:
+        result = next_(source, info, **kwargs)
+        return Stats(pid=result.pid, total=result.total * 2)
+
+
+def get_sum_squares(n: int) -> Stats:
+    return Stats(pid=os.getpid(), total=sum(i * i for i in range(n)))
+
+
+def get_repeated(size: int) -> str:
+    return "x" * size
+
+
+def get_failure() -> str:
+    raise ValueError("failed in the worker")
+
+
+@strawberry.type
+class Query:
+    sum_squares: Stats = strawberry.field(resolver=get_sum_squares, executor="process")
+    doubled: Stats = strawberry.field(
+        resolver=get_sum_squares, executor="process", extensions=[DoubleExtension()]
+    )
+    repeat: str = strawberry.field(resolver=get_repeated, executor="process")
+    fail: str = strawberry.field(resolver=get_failure, executor="process")
+
+
+@pytest.fixture(scope="module")
+def process_pool() -> Iterator[ResolverProcessPool]:
+    process_pool = ResolverProcessPool(max_workers=1, max_result_size=1000)
+
+    yield process_pool
+
+    process_pool.shutdown()
+
+
+@pytest.fixture(scope="module")
+def schema(process_pool: ResolverProcessPool) -> strawberry.Schema:
+    return strawberry.Schema(
+        Query, config=StrawberryConfig(resolver_process_pool=process_pool)
+    )
+
+
+QUERY = "{ sumSquares(n: 10) { pid total } doubled(n: 10) { total } }"
+
+
+def test_sync_execution(schema: strawberry.Schema):
+    result = schema.execute_sync(QUERY)
+
+    assert not result.errors
+    assert result.data
+    assert result.data["sumSquares"]["pid"] != os.getpid()
+    assert result.data["sumSquares"]["total"] == 285
+    assert result.data["doubled"] == {"total": 570}
+
+
+async def test_async_execution(schema: strawberry.Schema):
+    result = await schema.execute(QUERY)
+
+    assert not result.errors
+    assert result.data
+    assert result.data["sumSquares"]["pid"] != os.getpid()
+    assert result.data["sumSquares"]["total"] == 285
+    assert result.data["doubled"] == {"total": 570}
+
+
+def test_max_result_size(schema: strawberry.Schema):
+    result = schema.execute_sync(
+        "{ small: repeat(size: 10) large: repeat(size: 2000) }"
+    )
+
+    assert result.data is None
+    assert result.errors
+    assert result.errors[0].path == ["large"]
+    assert result.errors[0].message.startswith("The result of the resolver is")
+    assert isinstance(result.errors[0].original_error, ResolverResultTooLargeError)
+
+
+def test_exceptions_are_raised(schema: strawberry.Schema):
+    result = schema.execute_sync("{ fail }")
+
+    assert result.errors
+    assert result.errors[0].message == "failed in the worker"
+
+
+def test_warm_up(process_pool: ResolverProcessPool, schema: strawberry.Schema):
+    assert __name__ in process_pool.modules
+
+    process_pool.warm_up()
+
+    result = schema.execute_sync("{ sumSquares(n: 3) { total } }")
+
+    assert result.data == {"sumSquares": {"total": 5}}
+
+
+def test_resolver_must_be_defined_at_the_top_level():
+    def get_local() -> str:
+        return "local"
+
+    @strawberry.type
+    class Query:
+        local: str = strawberry.field(resolver=get_local, executor="process")
+
+    with pytest.raises(TypeError, match="must be defined at the top level"):
+        strawberry.Schema(Query)
+
+
+def test_types_must_be_defined_at_the_top_level():
+    @strawberry.type
+    class Local:
+        name: str
+
+    @strawberry.type
+    class Query:
+        local: Local = strawberry.field(
+            resolver=get_repeated, executor="process", graphql_type=Local
+        )
+
+    with pytest.raises(TypeError, match=r"`.*Local` must be defined at the top level"):
+        strawberry.Schema(Query)
+
+
+def test_resolver_cant_use_info():
+    @strawberry.type
+    class Query:
+        @strawberry.field(executor="process")
+        def name(self, info: Info) -> str:
+            return "name"
+
+    with pytest.raises(TypeError, match="can't use `Info`"):
+        strawberry.Schema(Query)
+
+
+def test_async_resolver_cant_run_in_a_process():
+    @strawberry.type
+    class Query:
+        @strawberry.field(executor="process")
+        async def name(self) -> str:
+            return "name"
+
+    with pytest.raises(TypeError, match="Async resolver of `name`"):
+        strawberry.Schema(Query)
+
+
+def test_process_default_resolver_executor():
+    with pytest.raises(ValueError, match='can\'t be `"process"`'):
+        StrawberryConfig(default_resolver_executor="process")
@@ -0,0 +1,187 @@
+import asyncio
+import contextvars
+import threading
+from typing import Any
+
+import pytest
+
+import strawberry
+from strawberry.execution.thread_pool import (
+    ResolverThreadPool,
+    ResolverThreadPoolStats,
+)
+from strawberry.extensions import FieldExtension
+from strawberry.schema.config import StrawberryConfig
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+class ThreadNameExtension(FieldExtension):
+    def resolve(self, next_: Any, source: Any, info: Any, **kwargs: Any) -> Any:
+        return f"{next_(source, info, **kwargs)} {threading.current_thread().name}"
+
+
+@strawberry.type
+class Query:
+    @strawberry.field(executor="thread")
+    def threaded(self) -> str:
+        return threading.current_thread().name
+
+    @strawberry.field
+    def default(self) -> str:
+        return threading.current_thread().name
+
+    @strawberry.field(executor="inline")
+    def inline(self) -> str:
+        return threading.current_thread().name
+
+    @strawberry.field(executor="thread")
+    def request_id(self) -> str:
+        return request_id.get()
+
+    @strawberry.field(executor="thread", extensions=[ThreadNameExtension()])
+    def extended(self) -> str:
+        return "resolver"
+
+    @strawberry.field(executor="thread")
+    def wait(self, name: str) -> str:
+        barrier.wait(timeout=5)
+        return name
+
+    @strawberry.field(executor="thread")
+    async def asynchronous(self) -> str:
+        return threading.current_thread().name
+
+
+barrier = threading.Barrier(2)
+
+
+def is_pool_thread(name: str) -> bool:
+    return name.startswith("strawberry-resolver")
+
+
+async def test_thread_executor():
+    schema = strawberry.Schema(Query)
+
+    result = await schema.execute("{ threaded default inline asynchronous }")
+
+    assert not result.errors
+    assert result.data
+    assert is_pool_thread(result.data["threaded"])
+    assert result.data["default"] == threading.current_thread().name
+    assert result.data["inline"] == threading.current_thread().name
+    assert result.data["asynchronous"] == threading.current_thread().name
+
+
+async def test_default_resolver_executor():
+    thread_pool = ResolverThreadPool(max_workers=2, thread_name_prefix="pool")
+    schema = strawberry.Schema(
+        Query,
+        config=StrawberryConfig(
+            default_resolver_executor="thread", resolver_thread_pool=thread_pool
+        ),
+    )
+
+    result = await schema.execute("{ threaded default inline }")
+
+    assert not result.errors
+    assert result.data
+    assert result.data["threaded"].startswith("pool")
+    assert result.data["default"].startswith("pool")
+    assert result.data["inline"] == threading.current_thread().name
+    assert thread_pool.stats().completed == 2
+
+    thread_pool.shutdown()
+
+
+def test_sync_execution_runs_inline():
+    schema = strawberry.Schema(Query)
+
+    result = schema.execute_sync("{ threaded }")
+
+    assert not result.errors
+    assert result.data == {"threaded": threading.current_thread().name}
+
+
+async def test_context_variables_are_propagated():
+    schema = strawberry.Schema(Query)
+    request_id.set("abc")
+
+    result = await schema.execute("{ requestId }")
+
+    assert not result.errors
+    assert result.data == {"requestId": "abc"}
+
+
+async def test_field_extensions_run_in_the_thread():
+    schema = strawberry.Schema(Query)
+
+    result = await schema.execute("{ extended }")
+
+    assert not result.errors
+    assert result.data
+    resolver_result, thread_name = result.data["extended"].split(" ")
+    assert resolver_result == "resolver"
+    assert is_pool_thread(thread_name)
+
+
+async def test_resolvers_run_concurrently():
+    schema = strawberry.Schema(
+        Query,
+        config=StrawberryConfig(resolver_thread_pool=ResolverThreadPool(max_workers=2)),
+    )
+
+    # Each resolver waits for the other one, which only works if both run
+    # at the same time without blocking the event loop
+    result = await schema.execute('{ a: wait(name: "a") b: wait(name: "b") }')
+
+    assert not result.errors
+    assert result.data == {"a": "a", "b": "b"}
+
+
+async def test_max_pending():
+    thread_pool = ResolverThreadPool(max_workers=1, max_pending=2)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking(value: int) -> int:
+        started.set()
+        release.wait(timeout=5)
+        return value
+
+    tasks = [asyncio.ensure_future(thread_pool.run(blocking, i)) for i in range(4)]
+
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+    await asyncio.sleep(0)
+
+    assert thread_pool.stats() == ResolverThreadPoolStats(
+        max_workers=1, max_pending=2, running=1, queued=1, waiting=2, completed=0
+    )
+
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [0, 1, 2, 3]
+    assert thread_pool.stats() == ResolverThreadPoolStats(
+        max_workers=1, max_pending=2, running=0, queued=0, waiting=0, completed=4
+    )
+
+    thread_pool.shutdown()
+
+
+async def test_exceptions_are_raised():
+    thread_pool = ResolverThreadPool()
+
+    def fail() -> None:
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        await thread_pool.run(fail)
+
+    assert thread_pool.stats().completed == 1
+
+    thread_pool.shutdown()
+
+
+def test_max_pending_lower_than_max_workers():
+    with pytest.raises(ValueError, match="can't be lower than `max_workers`"):
+        ResolverThreadPool(max_workers=4, max_pending=2)
@@ -0,0 +1,208 @@
+from typing import Any
+
+import pytest
+from graphql import GraphQLObjectType, parse
+from graphql.execution.collect_fields import collect_fields
+
+import strawberry
+from strawberry.execution.sync_subtrees import get_sync_selection
+from strawberry.extensions import FieldFilter, SchemaExtension
+from strawberry.schema.config import StrawberryConfig
+from strawberry.schema.schema import (
+    StrawberryGraphQLCoreExecutionContext,
+    StrawberrySyncSubtreeExecutionContext,
+)
+from strawberry.utils import IS_GQL_33
+
+pytestmark = pytest.mark.skipif(
+    IS_GQL_33, reason="Sync subtrees are only supported on graphql-core 3.2"
+)
+
+
+@strawberry.interface
+class Node:
+    id: int
+
+
+@strawberry.type
+class Pet(Node):
+    name: str
+    nickname: str | None = None
+
+
+@strawberry.type
+class Person(Node):
+    name: str
+    pets: list[Pet]
+    best_friend: Pet | None = None
+    scores: list[list[int | None]] | None = None
+
+    @strawberry.field
+    def first_pet(self) -> Pet:
+        return self.pets[0]
+
+    @strawberry.field
+    async def async_name(self) -> str:
+        return self.name
+
+
+def make_person(index: int) -> Person:
+    return Person(
+        id=index,
+        name=f"person {index}",
+        pets=[Pet(id=index * 10 + i, name=f"pet {i}") for i in range(2)],
+        scores=[[1, None], [index]],
+    )
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def people(self) -> list[Person]:
+        return [make_person(i) for i in range(3)]
+
+    @strawberry.field
+    def broken_people(self) -> list[Person]:
+        person = make_person(0)
+        person.pets = [Pet(id=1, name=None)]  # type: ignore[arg-type]
+        person.best_friend = Pet(id=2, name=None)  # type: ignore[arg-type]
+        return [person]
+
+    @strawberry.field
+    def node(self) -> Node:
+        return make_person(1)
+
+
+QUERIES = [
+    "{ people { id name scores pets { id name nickname __typename } } }",
+    "{ people { name firstPet { name } pets { id } } }",
+    "{ people { asyncName pets { name } } }",
+    "{ brokenPeople { id pets { id name } } }",
+    "{ brokenPeople { id bestFriend { id name } } }",
+    "{ node { id ... on Person { pets { id } } } }",
+]
+
+
+def make_schema(execution_context_class: type, **kwargs: Any) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query, execution_context_class=execution_context_class, **kwargs
+    )
+
+
+def test_default_execution_context():
+    assert (
+        strawberry.Schema(query=Query).execution_context_class
+        is StrawberryGraphQLCoreExecutionContext
+    )
+
+
+def test_sync_subtree_execution_is_opt_in():
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(enable_sync_subtree_execution=True)
+    )
+
+    assert schema.execution_context_class is StrawberrySyncSubtreeExecutionContext
+
+
+@pytest.mark.parametrize("query", QUERIES)
+async def test_same_result_as_regular_execution(query: str):
+    expected = await make_schema(StrawberryGraphQLCoreExecutionContext).execute(query)
+    result = await make_schema(StrawberrySyncSubtreeExecutionContext).execute(query)
+
+    assert result.data == expected.data
+    assert result.errors == expected.errors
+
+
+@pytest.mark.parametrize("query", [q for q in QUERIES if "asyncName" not in q])
+def test_same_result_as_regular_execution_sync(query: str):
+    expected = make_schema(StrawberryGraphQLCoreExecutionContext).execute_sync(query)
+    result = make_schema(StrawberrySyncSubtreeExecutionContext).execute_sync(query)
+
+    assert result.data == expected.data
+    assert result.errors == expected.errors
+
+
+def test_null_in_non_null_basic_field():
+    schema = make_schema(StrawberrySyncSubtreeExecutionContext)
+
+    result = schema.execute_sync("{ brokenPeople { bestFriend { name } } }")
+
+    assert result.data == {"brokenPeople": [{"bestFriend": None}]}
+    assert result.errors
+    assert result.errors[0].message == (
+        "Cannot return null for non-nullable field Pet.name."
+    )
+    assert result.errors[0].path == ["brokenPeople", 0, "bestFriend", "name"]
+
+
+def test_selections():
+    schema = make_schema(StrawberrySyncSubtreeExecutionContext)
+    context = StrawberrySyncSubtreeExecutionContext.build(
+        schema._schema, parse("{ people { id firstPet { name } pets { id name } } }")
+    )
+    assert isinstance(context, StrawberrySyncSubtreeExecutionContext)
+
+    query_type = schema._schema.query_type
+    assert query_type is not None
+    root_fields = collect_fields(
+        context.schema,
+        context.fragments,
+        context.variable_values,
+        query_type,
+        context.operation.selection_set,
+    )
+    root = get_sync_selection(context, query_type, root_fields, {})
+
+    assert not root.is_sync
+    assert not root.has_sync_fields
+
+    person_type = schema._schema.get_type("Person")
+    assert isinstance(person_type, GraphQLObjectType)
+    person_fields = context.collect_subfields(person_type, root_fields["people"])
+    person = get_sync_selection(context, person_type, person_fields, {})
+
+    assert not person.is_sync
+    assert person.has_sync_fields
+    assert {name: field is not None for name, _, field in person.fields} == {
+        "id": True,
+        "firstPet": False,
+        "pets": True,
+    }
+
+
+def test_fields_wrapped_by_extensions_use_the_regular_execution():
+    seen: list[str] = []
+
+    class RecordingExtension(SchemaExtension):
+        def resolve(self, _next, root, info, *args: Any, **kwargs: Any) -> Any:
+            seen.append(f"{info.parent_type.name}.{info.field_name}")
+            return _next(root, info, *args, **kwargs)
+
+    schema = make_schema(
+        StrawberrySyncSubtreeExecutionContext, extensions=[RecordingExtension]
+    )
+
+    result = schema.execute_sync("{ people { id pets { name } } }")
+
+    assert not result.errors
+    assert sorted(set(seen)) == ["Person.id", "Person.pets", "Pet.name", "Query.people"]
+
+
+def test_fields_skipped_by_extensions_use_sync_subtrees():
+    seen: list[str] = []
+
+    class RecordingExtension(SchemaExtension):
+        resolve_filter = FieldFilter(skip_basic_fields=True)
+
+        def resolve(self, _next, root, info, *args: Any, **kwargs: Any) -> Any:
+            seen.append(f"{info.parent_type.name}.{info.field_name}")
+            return _next(root, info, *args, **kwargs)
+
+    schema = make_schema(
+        StrawberrySyncSubtreeExecutionContext, extensions=[RecordingExtension]
+    )
+
+    result = schema.execute_sync("{ people { id pets { name } } }")
+
+    assert not result.errors
+    assert seen == ["Query.people"]
@@ -0,0 +1,201 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from graphql import parse, validate
+
+import strawberry
+from strawberry.extensions import QueryDepthLimiter
+from strawberry.schema.trusted_documents import TrustedDocuments
+
+
+@strawberry.type
+class User:
+    name: str
+
+    @strawberry.field
+    def friends(self) -> list["User"]:
+        return [User(name=f"{self.name}'s friend")]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self, name: str = "world") -> str:
+        return f"Hello {name}"
+
+    @strawberry.field
+    def user(self) -> User:
+        return User(name="Patrick")
+
+
+@strawberry.type
+class Subscription:
+    @strawberry.subscription
+    async def count(self) -> strawberry.scalars.JSON:  # pragma: no cover
+        yield 1
+
+
+DOCUMENTS = {
+    "hello": "query Hello($name: String!) { hello(name: $name) }",
+    "friends": "query Friends { user { friends { friends { name } } } }",
+}
+
+
+def test_execute_trusted_document():
+    schema = strawberry.Schema(query=Query, trusted_documents=DOCUMENTS)
+
+    result = schema.execute_sync(
+        None, document_id="hello", variable_values={"name": "a"}
+    )
+
+    assert not result.errors
+    assert result.data == {"hello": "Hello a"}
+
+
+@pytest.mark.asyncio
+async def test_execute_trusted_document_async():
+    schema = strawberry.Schema(query=Query, trusted_documents=DOCUMENTS)
+
+    result = await schema.execute(
+        None, document_id="hello", variable_values={"name": "a"}
+    )
+
+    assert not result.errors
+    assert result.data == {"hello": "Hello a"}
+
+
+@patch("strawberry.schema.schema.validate", wraps=validate)
+@patch("strawberry.extensions.document_cache.parse", wraps=parse)
+def test_documents_are_compiled_once(mock_parse, mock_validate):
+    schema = strawberry.Schema(query=Query, trusted_documents=DOCUMENTS)
+
+    assert mock_parse.call_count == 2
+    assert mock_validate.call_count == 2
+
+    for name in ("a", "b", "c"):
+        result = schema.execute_sync(
+            None, document_id="hello", variable_values={"name": name}
+        )
+        assert not result.errors
+
+    assert mock_parse.call_count == 2
+    assert mock_validate.call_count == 2
+
+
+def test_queries_are_rejected():
+    schema = strawberry.Schema(query=Query, trusted_documents=DOCUMENTS)
+
+    result = schema.execute_sync("{ hello }")
+
+    assert result.data is None
+    assert result.errors
+    assert result.errors[0].message == (
+        "Only trusted documents are allowed, send a document id instead of a query"
+    )
+    assert result.errors[0].extensions == {"code": "UNTRUSTED_DOCUMENT"}
+
+
+def test_query_must_match_the_trusted_document():
+    schema = strawberry.Schema(query=Query, trusted_documents=DOCUMENTS)
+
+    result = schema.execute_sync(
+        DOCUMENTS["hello"], document_id="hello", variable_values={"name": "a"}
+    )
+
+    assert not result.errors
+
+    result = schema.execute_sync("{ user { name } }", document_id="hello")
+
+    assert result.errors
+    assert result.errors[0].extensions == {"code": "UNTRUSTED_DOCUMENT"}
+
+
+def test_unknown_document_id():
+    schema = strawberry.Schema(query=Query, trusted_documents=DOCUMENTS)
+
+    result = schema.execute_sync(None, document_id="unknown")
+
+    assert result.data is None
+    assert result.errors
+    assert result.errors[0].message == "Trusted document 'unknown' not found"
+    assert result.errors[0].extensions == {"code": "TRUSTED_DOCUMENT_NOT_FOUND"}
+
+
+def test_invalid_documents_fail_at_startup():
+    with pytest.raises(ValueError, match="Invalid trusted documents") as exc_info:
+        strawberry.Schema(
+            query=Query,
+            trusted_documents={
+                "valid": "{ hello }",
+                "unknown-field": "{ unknown }",
+                "syntax": "{ hello",
+            },
+        )
+
+    assert str(exc_info.value) == (
+        "Invalid trusted documents:\n\n"
+        "❌ unknown-field: Cannot query field 'unknown' on type 'Query'.\n\n"
+        "❌ syntax: Syntax Error: Expected Name, found <EOF>."
+    )
+
+
+@patch("strawberry.schema.schema.validate", wraps=validate)
+def test_validation_rules_from_extensions_are_run_once(mock_validate):
+    schema = strawberry.Schema(
+        query=Query,
+        trusted_documents=DOCUMENTS,
+        extensions=[lambda: QueryDepthLimiter(max_depth=2)],
+    )
+
+    for _ in range(3):
+        result = schema.execute_sync(None, document_id="friends")
+
+        assert result.data is None
+        assert result.errors
+        assert (
+            result.errors[0].message == "'Friends' exceeds maximum operation depth of 2"
+        )
+
+    result = schema.execute_sync(
+        None, document_id="hello", variable_values={"name": "a"}
+    )
+
+    assert not result.errors
+    assert mock_validate.call_count == 4
+
+
+def test_from_file(tmp_path: Path):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps(DOCUMENTS))
+
+    trusted_documents = TrustedDocuments.from_file(manifest)
+
+    assert len(trusted_documents) == 2
+    assert "hello" in trusted_documents
+
+    schema = strawberry.Schema(query=Query, trusted_documents=trusted_documents)
+
+    assert schema.execute_sync(None, document_id="friends").data == {
+        "user": {"friends": [{"friends": [{"name": "Patrick's friend's friend"}]}]}
+    }
+
+
+def test_from_json_requires_a_mapping():
+    with pytest.raises(ValueError, match="must be a JSON object mapping"):
+        TrustedDocuments.from_json('["{ hello }"]')
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_require_a_document_id():
+    schema = strawberry.Schema(
+        query=Query, subscription=Subscription, trusted_documents=DOCUMENTS
+    )
+
+    result = await schema.subscribe("subscription { count }")
+
+    async for item in result:
+        assert item.errors
+        assert item.errors[0].extensions == {"code": "UNTRUSTED_DOCUMENT"}
+        break
@@ -1,12 +1,22 @@
 import asyncio
+import logging
 from asyncio.futures import Future
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Hashable, Mapping
 from typing import Any, Optional, cast
 
 import pytest
 from pytest_mock import MockerFixture
 
-from strawberry.dataloader import AbstractCache, DataLoader
+from strawberry.dataloader import (
+    AbstractCache,
+    BatchSizeHistogram,
+    BoundedCache,
+    DataLoader,
+    InMemorySharedCache,
+    LevelScheduler,
+    SyncDataLoader,
+    TimeWindowScheduler,
+)
 from strawberry.exceptions import WrongNumberOfResultsReturned
 
 IDXType = Callable[[list[int]], Awaitable[list[int]]]
@@ -609,6 +619,479 @@ async def test_cache_override():
     assert await custom_cache.get((1, 2, 3)) == data  # type: ignore
 
 
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_bounded_cache_evicts_least_recently_used(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    cache = BoundedCache[int, int](maxsize=2)
+    loader = DataLoader(load_fn=mock_loader, cache_map=cache)
+
+    assert await loader.load_many([1, 2]) == [1, 2]
+    assert await loader.load(1) == 1
+    assert await loader.load(3) == 3
+    assert await loader.load_many([1, 2]) == [1, 2]
+
+    assert [call.args[0] for call in mock_loader.call_args_list] == [[1, 2], [3], [2]]
+    assert cache.stats.hits == 2
+    assert cache.stats.evictions == 2
+    assert cache.stats.size == 2
+
+
+@pytest.mark.asyncio
+async def test_bounded_cache_ttl(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    timer = FakeTimer()
+    loader = DataLoader(
+        load_fn=mock_loader, cache_map=BoundedCache(ttl=10, timer=timer)
+    )
+
+    assert await loader.load(1) == 1
+    timer.now = 9
+    assert await loader.load(1) == 1
+    assert mock_loader.call_count == 1
+
+    timer.now = 10
+    assert await loader.load(1) == 1
+    assert mock_loader.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bounded_cache_errors(mocker: MockerFixture):
+    async def fail(keys: list[int]) -> list[ValueError]:
+        return [ValueError(key) for key in keys]
+
+    mock_loader = mocker.Mock(side_effect=fail)
+    loader = DataLoader(load_fn=mock_loader, cache_map=BoundedCache())
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await loader.load(1)
+
+    assert mock_loader.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_cache_without_negative_caching(mocker: MockerFixture):
+    async def fail_odd(keys: list[int]) -> list[int | ValueError]:
+        return [ValueError(key) if key % 2 else key for key in keys]
+
+    mock_loader = mocker.Mock(side_effect=fail_odd)
+    loader = DataLoader(load_fn=mock_loader, cache_map=BoundedCache(cache_errors=False))
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await loader.load(1)
+
+        assert await loader.load(2) == 2
+
+    assert [call.args[0] for call in mock_loader.call_args_list] == [[1], [2], [1]]
+
+
+@pytest.mark.asyncio
+async def test_bounded_cache_error_ttl(mocker: MockerFixture):
+    async def fail_odd(keys: list[int]) -> list[int | ValueError]:
+        return [ValueError(key) if key % 2 else key for key in keys]
+
+    mock_loader = mocker.Mock(side_effect=fail_odd)
+    timer = FakeTimer()
+    loader = DataLoader(
+        load_fn=mock_loader,
+        cache_map=BoundedCache(ttl=60, error_ttl=1, timer=timer),
+    )
+
+    with pytest.raises(ValueError):
+        await loader.load(1)
+
+    assert await loader.load(2) == 2
+
+    timer.now = 1
+
+    with pytest.raises(ValueError):
+        await loader.load(1)
+
+    assert await loader.load(2) == 2
+
+    assert [call.args[0] for call in mock_loader.call_args_list] == [[1], [2], [1]]
+
+
+@pytest.mark.asyncio
+async def test_bounded_cache_replaced_keys_are_not_dropped():
+    async def fail(keys: list[int]) -> list[ValueError]:
+        return [ValueError(key) for key in keys]
+
+    cache = BoundedCache[int, int](cache_errors=False)
+    loader = DataLoader(load_fn=fail, cache_map=cache)
+
+    future = loader.load(1)
+
+    primed: Future[int] = loader.loop.create_future()
+    primed.set_result(10)
+    cache.set(1, primed)
+
+    with pytest.raises(ValueError):
+        await future
+
+    assert await loader.load(1) == 10
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_across_loaders(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    shared_cache = InMemorySharedCache()
+
+    loader = DataLoader(load_fn=mock_loader, shared_cache=shared_cache)
+    assert await loader.load_many([1, 2]) == [1, 2]
+
+    # A new loader (e.g. for the next request) only loads the missing keys
+    loader = DataLoader(load_fn=mock_loader, shared_cache=shared_cache)
+    assert await loader.load_many([1, 2, 3]) == [1, 2, 3]
+
+    loader = DataLoader(load_fn=mock_loader, shared_cache=shared_cache)
+    assert await loader.load_many([3, 2, 1]) == [3, 2, 1]
+
+    assert [call.args[0] for call in mock_loader.call_args_list] == [[1, 2], [3]]
+    assert shared_cache.stats.hits == 5
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_uses_one_round_trip_per_batch(mocker: MockerFixture):
+    shared_cache = InMemorySharedCache()
+    mget = mocker.spy(shared_cache, "mget")
+    mset = mocker.spy(shared_cache, "mset")
+
+    loader = DataLoader(load_fn=idx, shared_cache=shared_cache)
+    assert await loader.load_many([1, 2, 3]) == [1, 2, 3]
+
+    mget.assert_called_once_with([1, 2, 3])
+    mset.assert_called_once_with({1: 1, 2: 2, 3: 3})
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_does_not_store_errors(mocker: MockerFixture):
+    async def fail_odd(keys: list[int]) -> list[int | ValueError]:
+        return [ValueError(key) if key % 2 else key for key in keys]
+
+    mock_loader = mocker.Mock(side_effect=fail_odd)
+    shared_cache = InMemorySharedCache()
+
+    for _ in range(2):
+        loader = DataLoader(load_fn=mock_loader, shared_cache=shared_cache)
+
+        with pytest.raises(ValueError):
+            await loader.load(1)
+
+        assert await loader.load(2) == 2
+
+    assert [call.args[0] for call in mock_loader.call_args_list] == [[1], [2], [1]]
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_write_errors_are_logged(caplog: pytest.LogCaptureFixture):
+    class FailingSharedCache(InMemorySharedCache):
+        async def mset(self, items: Mapping[Hashable, Any]) -> None:
+            raise ConnectionError("cache is down")
+
+    loader = DataLoader(load_fn=idx, shared_cache=FailingSharedCache())
+
+    with caplog.at_level(logging.ERROR, logger="strawberry.dataloader"):
+        assert await loader.load_many([1, 2]) == [1, 2]
+        await asyncio.sleep(0)
+
+    assert caplog.records[0].message == (
+        "Failed to write loaded values to the shared cache"
+    )
+    assert isinstance(caplog.records[0].exc_info[1], ConnectionError)
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_invalidation(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    shared_cache = InMemorySharedCache()
+
+    loader = DataLoader(
+        load_fn=mock_loader, shared_cache=shared_cache, cache_key_fn=str
+    )
+    assert await loader.load_many([1, 2]) == [1, 2]
+    assert len(shared_cache.cache) == 2
+
+    await loader.invalidate(1)
+
+    assert "1" not in shared_cache.cache
+    assert await loader.load_many([1, 2]) == [1, 2]
+
+    await loader.invalidate_many([1, 2])
+    assert len(shared_cache.cache) == 0
+
+    assert [call.args[0] for call in mock_loader.call_args_list] == [[1, 2], [1]]
+
+
+async def load_after_ticks(loader: DataLoader[int, int], key: int) -> int:
+    for _ in range(key):
+        await asyncio.sleep(0)
+
+    return await loader.load(key)
+
+
+@pytest.mark.asyncio
+async def test_next_tick_scheduler_with_spread_loads(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(load_fn=mock_loader)
+
+    values = await asyncio.gather(*(load_after_ticks(loader, key) for key in range(5)))
+
+    assert values == [0, 1, 2, 3, 4]
+    assert mock_loader.call_count > 1
+
+
+@pytest.mark.asyncio
+async def test_time_window_scheduler(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(load_fn=mock_loader, scheduler=TimeWindowScheduler(0.01))
+
+    values = await asyncio.gather(*(load_after_ticks(loader, key) for key in range(3)))
+
+    assert values == [0, 1, 2]
+    mock_loader.assert_called_once_with([0, 1, 2])
+
+
+@pytest.mark.asyncio
+async def test_time_window_scheduler_max_wait(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(
+        load_fn=mock_loader,
+        scheduler=TimeWindowScheduler(window=0.02, max_wait=0.05),
+    )
+
+    async def load_later(key: int) -> int:
+        await asyncio.sleep(key * 0.01)
+        return await loader.load(key)
+
+    # Every key restarts the window, until the batch waited for `max_wait`
+    values = await asyncio.gather(*(load_later(key) for key in range(10)))
+
+    assert values == list(range(10))
+    first_batch = mock_loader.call_args_list[0].args[0]
+    assert first_batch[:3] == [0, 1, 2]
+    assert len(first_batch) < 10
+
+
+@pytest.mark.asyncio
+async def test_full_batches_are_dispatched_without_waiting(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(
+        load_fn=mock_loader, max_batch_size=2, scheduler=TimeWindowScheduler(10)
+    )
+
+    values = await asyncio.wait_for(asyncio.gather(loader.load(1), loader.load(2)), 1)
+
+    assert values == [1, 2]
+    mock_loader.assert_called_once_with([1, 2])
+
+
+@pytest.mark.asyncio
+async def test_level_scheduler(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(load_fn=mock_loader, scheduler=LevelScheduler())
+
+    values = await asyncio.gather(*(load_after_ticks(loader, key) for key in range(3)))
+
+    assert values == [0, 1, 2]
+    mock_loader.assert_called_once_with([0, 1, 2])
+
+
+@pytest.mark.asyncio
+async def test_level_scheduler_max_ticks(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(load_fn=mock_loader, scheduler=LevelScheduler(max_ticks=2))
+
+    values = await asyncio.gather(*(load_after_ticks(loader, key) for key in range(5)))
+
+    assert values == [0, 1, 2, 3, 4]
+    assert mock_loader.call_args_list[0].args[0] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_batch_size_histogram():
+    histogram = BatchSizeHistogram(buckets=[1, 5])
+    loader = DataLoader(load_fn=idx, max_batch_size=6, batch_size_histogram=histogram)
+
+    await loader.load_many(range(10))
+    await loader.load(10)
+
+    assert histogram.count == 3
+    assert histogram.sum == 11
+    assert histogram.as_dict() == {"1": 1, "5": 2, "+Inf": 3}
+
+    histogram.reset()
+    assert histogram.count == 0
+    assert histogram.mean == 0
+
+
+@pytest.mark.asyncio
+async def test_split_batches(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    histogram = BatchSizeHistogram()
+    loader = DataLoader(
+        load_fn=mock_loader,
+        max_batch_size=4,
+        split_batches=True,
+        batch_size_histogram=histogram,
+    )
+
+    assert await loader.load_many(range(10)) == list(range(10))
+
+    assert [call.args[0] for call in mock_loader.call_args_list] == [
+        [0, 1, 2, 3],
+        [4, 5, 6, 7],
+        [8, 9],
+    ]
+    assert histogram.count == 3
+
+
+@pytest.mark.asyncio
+async def test_split_batches_max_concurrency():
+    running = 0
+    max_running = 0
+
+    async def load(keys: list[int]) -> list[int]:
+        nonlocal running, max_running
+
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+        return keys
+
+    loader = DataLoader(
+        load_fn=load, max_batch_size=2, split_batches=True, max_concurrent_batches=2
+    )
+
+    assert await loader.load_many(range(10)) == list(range(10))
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_split_batches_errors_only_fail_their_chunk():
+    async def load(keys: list[int]) -> list[int]:
+        if 3 in keys:
+            raise ValueError("chunk failed")
+
+        if 5 in keys:
+            return []
+
+        return keys
+
+    loader = DataLoader(load_fn=load, max_batch_size=2, split_batches=True)
+
+    results = await asyncio.gather(
+        *(loader.load(key) for key in range(6)), return_exceptions=True
+    )
+
+    assert results[:2] == [0, 1]
+    assert [str(result) for result in results[2:4]] == ["chunk failed"] * 2
+    assert all(
+        isinstance(result, WrongNumberOfResultsReturned) for result in results[4:]
+    )
+
+
+def test_sync_dataloader(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=lambda keys: keys)
+    loader = SyncDataLoader(load_fn=mock_loader)
+
+    a = loader.load(1)
+    b = loader.load(2)
+    many = loader.load_many([1, 2, 3])
+
+    assert not a.done()
+    assert not many.done()
+    mock_loader.assert_not_called()
+
+    assert a.result() == 1
+    assert b.done()
+    assert many.result() == [1, 2, 3]
+
+    mock_loader.assert_called_once_with([1, 2, 3])
+
+    assert loader.load(1) is a
+    assert mock_loader.call_count == 1
+
+
+def test_sync_dataloader_errors():
+    def load(keys: list[int]) -> list[int | ValueError]:
+        return [ValueError(key) if key % 2 else key for key in keys]
+
+    loader = SyncDataLoader(load_fn=load)
+
+    odd, even = loader.load(1), loader.load(2)
+
+    with pytest.raises(ValueError):
+        odd.result()
+
+    assert even.result() == 2
+
+    failing = SyncDataLoader(load_fn=lambda keys: [])
+
+    with pytest.raises(WrongNumberOfResultsReturned):
+        failing.load(1).result()
+
+
+def test_sync_dataloader_max_batch_size(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=lambda keys: keys)
+    loader = SyncDataLoader(load_fn=mock_loader, max_batch_size=2)
+
+    assert loader.load_many([1, 2, 3]).result() == [1, 2, 3]
+    mock_loader.assert_has_calls([mocker.call([1, 2]), mocker.call([3])])
+
+
+def test_sync_dataloader_prime_and_clear(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=lambda keys: keys)
+    loader = SyncDataLoader(load_fn=mock_loader)
+
+    pending = loader.load(1)
+    loader.prime_many({1: 10, 2: 20})
+
+    assert pending.result() == 10
+    assert loader.load(2).result() == 20
+    mock_loader.assert_not_called()
+
+    loader.prime(2, 30)
+    assert loader.load(2).result() == 20
+
+    loader.prime(2, 30, force=True)
+    assert loader.load(2).result() == 30
+
+    loader.clear(2)
+    assert loader.load(2).result() == 2
+
+    loader.clear_many([1, 2])
+    loader.clear_all()
+    assert loader.load_many([1, 2]).result() == [1, 2]
+    mock_loader.assert_has_calls([mocker.call([2]), mocker.call([1, 2])])
+
+
+def test_sync_dataloader_prime_with_cache_key_fn(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=lambda keys: [key[0] for key in keys])
+    loader = SyncDataLoader(
+        load_fn=mock_loader, cache=False, cache_key_fn=lambda key: key[0]
+    )
+
+    pending = loader.load((1, "a"))
+    other = loader.load((2, "a"))
+    loader.prime_many({(1, "b"): 10})
+
+    assert pending.result() == 10
+    assert other.result() == 2
+    mock_loader.assert_called_once_with([(2, "a")])
+
+
 @pytest.mark.asyncio
 async def test_custom_cache_key_fn():
     def custom_cache_key(key: list[int]) -> str:
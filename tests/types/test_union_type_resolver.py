@@ -5,6 +5,7 @@ Directly tests the _resolve_union_type inner function, covering:
 - Fallback to is_type_of when the object has no strawberry definition.
 - WrongReturnTypeForUnion raised when neither strategy resolves the type.
 - UnallowedReturnTypeForUnion raised when the resolved type is not in the union.
+- Memoization of the types resolved through class based is_type_of.
 """
 
 from dataclasses import dataclass
@@ -15,6 +16,7 @@ import pytest
 
 import strawberry
 from strawberry.exceptions import UnallowedReturnTypeForUnion, WrongReturnTypeForUnion
+from strawberry.schema.type_resolution import mark_class_based_is_type_of
 
 
 def _mock_info(field_name: str = "animal"):
@@ -183,3 +185,87 @@ def test_resolver_raises_unallowed_return_type_for_unrelated_strawberry_object()
 
     with pytest.raises(UnallowedReturnTypeForUnion):
         resolver(Fish(name="Nemo"), _mock_info(), gql_union)
+
+
+def test_resolver_calls_is_type_of_for_each_object():
+    """Custom is_type_of may depend on the object, its result isn't memoized."""
+
+    @dataclass
+    class AnimalData:
+        kind: str
+
+    @strawberry.type
+    class Cat:
+        kind: str
+
+        @classmethod
+        def is_type_of(cls, obj, _info) -> bool:
+            return obj.kind == "cat"
+
+    @strawberry.type
+    class Dog:
+        kind: str
+
+        @classmethod
+        def is_type_of(cls, obj, _info) -> bool:
+            return obj.kind == "dog"
+
+    Animal = Annotated[Cat | Dog, strawberry.union("Animal")]
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def animal(self) -> Animal:
+            return Cat(kind="cat")
+
+    schema = strawberry.Schema(query=Query)
+    resolver = _get_union_resolver(schema, "Animal")
+    gql_union = _gql_union(schema, "Animal")
+
+    assert resolver(AnimalData("cat"), _mock_info(), gql_union) == "Cat"
+    assert resolver(AnimalData("dog"), _mock_info(), gql_union) == "Dog"
+    assert resolver(AnimalData("cat"), _mock_info(), gql_union) == "Cat"
+
+
+def test_resolver_memoizes_class_based_is_type_of():
+    @dataclass
+    class CatData:
+        name: str
+
+    calls: list[object] = []
+
+    @strawberry.type
+    class Cat:
+        name: str
+
+        @classmethod
+        @mark_class_based_is_type_of
+        def is_type_of(cls, obj, _info) -> bool:
+            calls.append(obj)
+            return isinstance(obj, (cls, CatData))
+
+    @strawberry.type
+    class Dog:
+        name: str
+
+    Animal = Annotated[Cat | Dog, strawberry.union("Animal")]
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def animal(self) -> Animal:
+            return Cat(name="Whiskers")
+
+    schema = strawberry.Schema(query=Query)
+    resolver = _get_union_resolver(schema, "Animal")
+    gql_union = _gql_union(schema, "Animal")
+
+    for name in ("Whiskers", "Tom"):
+        assert resolver(CatData(name=name), _mock_info(), gql_union) == "Cat"
+
+    assert len(calls) == 1
+
+    # Cast objects are resolved every time
+    cast_cat = strawberry.cast(Cat, CatData(name="Felix"))
+    assert resolver(cast_cat, _mock_info(), gql_union) == "Cat"
+    assert len(calls) == 2
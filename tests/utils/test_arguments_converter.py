@@ -8,7 +8,12 @@ from strawberry.annotation import StrawberryAnnotation
 from strawberry.exceptions import UnsupportedTypeError
 from strawberry.schema.config import StrawberryConfig
 from strawberry.schema.types.scalar import DEFAULT_SCALAR_REGISTRY
-from strawberry.types.arguments import StrawberryArgument, convert_arguments
+from strawberry.types.arguments import (
+    StrawberryArgument,
+    compile_arguments_converter,
+    convert_arguments,
+)
+from strawberry.types.maybe import Maybe, Some
 from strawberry.types.unset import UNSET
 
 
@@ -439,3 +444,96 @@ def test_fails_when_passing_non_strawberry_classes():
         )
         == {}
     )
+
+
+@strawberry.enum
+class Color(Enum):
+    RED = "red"
+
+
+@strawberry.input
+class Tag:
+    name: str
+    color: Color | None = None
+
+
+@strawberry.input
+class Filter:
+    tags: list[Tag]
+    and_: list["Filter"] | None = strawberry.field(name="and", default=UNSET)
+    rename: Maybe[str]
+    description: Maybe[str | None]
+
+
+def test_compiled_converter():
+    arguments = [
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="filter",
+            type_annotation=StrawberryAnnotation(Filter),
+        ),
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="limit",
+            type_annotation=StrawberryAnnotation(int | None),
+        ),
+    ]
+
+    args = {
+        "filter": {
+            "tags": [{"name": "a", "color": Color.RED}, {"name": "b"}],
+            "and": [
+                {"tags": [], "and": [{"tags": [], "rename": "x"}], "description": None}
+            ],
+            "rename": "y",
+        },
+        "limit": None,
+    }
+
+    convert = compile_arguments_converter(
+        arguments, DEFAULT_SCALAR_REGISTRY, StrawberryConfig()
+    )
+    expected = convert_arguments(
+        args,
+        arguments,
+        scalar_registry=DEFAULT_SCALAR_REGISTRY,
+        config=StrawberryConfig(),
+    )
+
+    assert convert(args) == expected
+    assert expected == {
+        "filter": Filter(
+            tags=[Tag(name="a", color=Color.RED), Tag(name="b")],
+            and_=[
+                Filter(
+                    tags=[],
+                    and_=[Filter(tags=[], rename=Some("x"))],
+                    description=Some(None),
+                )
+            ],
+            rename=Some("y"),
+        ),
+        "limit": None,
+    }
+    assert convert({}) == {}
+
+
+def test_compiled_converter_rejects_null_maybe():
+    @strawberry.input
+    class Input:
+        rename: Maybe[str]
+
+    arguments = [
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="input",
+            type_annotation=StrawberryAnnotation(Input),
+        ),
+    ]
+
+    convert = compile_arguments_converter(
+        arguments, DEFAULT_SCALAR_REGISTRY, StrawberryConfig()
+    )
+
+    with pytest.raises(strawberry.exceptions.StrawberryGraphQLError):
+        convert({"input": {"rename": None}})
@@ -0,0 +1,83 @@
+import pytest
+
+from strawberry.utils.cache import LRUCache
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_and_set():
+    cache: LRUCache[str, int] = LRUCache()
+
+    assert cache.get("a") is None
+    assert cache.get("a", 0) == 0
+
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert len(cache) == 1
+
+    cache.delete("a")
+
+    assert "a" not in cache
+
+
+def test_evicts_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats.evictions == 1
+
+
+def test_ttl():
+    timer = FakeTimer()
+    cache: LRUCache[str, int] = LRUCache(ttl=10, timer=timer)
+
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30)
+
+    timer.now = 10
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    timer.now = 30
+
+    assert cache.get("b") is None
+    assert len(cache) == 0
+
+
+def test_stats():
+    cache: LRUCache[str, int] = LRUCache(maxsize=10)
+
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    stats = cache.stats
+
+    assert (stats.hits, stats.misses, stats.size, stats.maxsize) == (2, 1, 1, 10)
+    assert stats.hit_rate == pytest.approx(2 / 3)
+
+    cache.reset_stats()
+
+    assert cache.stats.hits == 0
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError, match="maxsize must be a positive integer"):
+        LRUCache(maxsize=0)
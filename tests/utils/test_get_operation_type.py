@@ -2,7 +2,7 @@ import pytest
 from graphql import parse
 
 from strawberry.types.graphql import OperationType
-from strawberry.utils.operation import get_operation_type
+from strawberry.utils.operation import DocumentOperations, get_operation_type
 
 mutation_collision = parse("""
 fragment UserAgent on UserAgentType {
@@ -108,3 +108,23 @@ def test_get_operation_type_only_fragments():
         get_operation_type(only_fragments)
 
     assert "Can't get GraphQL operation type" in str(excinfo.value)
+
+
+def test_document_operations():
+    document = parse(
+        """
+        query Query1 { hello }
+        mutation Mutation1 { hello }
+        fragment Fragment1 on Query { hello }
+        """
+    )
+
+    operations = DocumentOperations(document)
+
+    assert operations.get() is document.definitions[0]
+    assert operations.get("Mutation1") is document.definitions[1]
+    assert operations.get("Fragment1") is None
+    assert operations.get_operation_type("Mutation1") == OperationType.MUTATION
+
+    with pytest.raises(RuntimeError):
+        operations.get_operation_type("Fragment1")